@@ -1,9 +1,9 @@
-import math
 import time
 import argparse
 
 from ingeniamotion import MotionController
 from ingeniamotion.enums import OperationMode
+from ingeniamotion.excitation import ExcitationGenerator
 
 
 def main(args):
@@ -14,21 +14,16 @@ def main(args):
     target_register = "CL_POS_SET_POINT_VALUE"
     # Frequency divider to set disturbance frequency
     divider = 25
-    # Calculate time between disturbance samples
-    sample_period = divider / mc.configuration.get_position_and_velocity_loop_rate()
+    # Create a signal generator with the disturbance frequency, the register data type
+    # and the disturbance buffer size
+    generator = ExcitationGenerator.from_disturbance_config(mc, target_register, divider)
     # The disturbance signal will be a simple harmonic motion (SHM) with frequency 0.5Hz and 2000 counts of amplitude
     signal_frequency = 0.5
     signal_amplitude = 2000
-    # Calculate number of samples to load a complete oscillation
-    n_samples = int(1 / (signal_frequency * sample_period))
-    # Generate a SHM with the formula x(t)=A*sin(t*w) where:
-    # A = signal_amplitude (Amplitude)
-    # t = sample_period*i (time)
-    # w = signal_frequency*2*math.pi (angular frequency)
-    data = [
-        int(signal_amplitude * math.sin(sample_period * i * signal_frequency * 2 * math.pi))
-        for i in range(n_samples)
-    ]
+    # Generate a complete oscillation. The signal is rounded to the register data type and its
+    # size is checked against the disturbance buffer. Chirps, PRBS, multisines and steps can be
+    # generated too.
+    data = generator.sine_sweep([signal_frequency], signal_amplitude, cycles=1)
 
     # Call function create_disturbance to configure a disturbance
     dist = mc.capture.create_disturbance(target_register, data, divider)
@@ -0,0 +1,15 @@
+from ingeniamotion.process_data.benchmark import find_max_channels, run_benchmarks
+
+
+def main() -> None:
+    """Run the process data benchmarks on a loopback network and print the results.
+
+    No drive is needed, the process data cycles are run on the local machine.
+    """
+    for result in run_benchmarks():
+        print(result)
+    print(f"Max channels at 1 kHz: {find_max_channels()}")
+
+
+if __name__ == "__main__":
+    main()
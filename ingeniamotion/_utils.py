@@ -2,6 +2,23 @@ import functools
 import weakref
 from typing import Any, Callable
 
+import numpy as np
+from ingenialink.enums.register import RegDtype
+
+REG_DTYPE_TO_NUMPY: dict[RegDtype, np.dtype[Any]] = {
+    RegDtype.U8: np.dtype("<u1"),
+    RegDtype.S8: np.dtype("<i1"),
+    RegDtype.U16: np.dtype("<u2"),
+    RegDtype.S16: np.dtype("<i2"),
+    RegDtype.U32: np.dtype("<u4"),
+    RegDtype.S32: np.dtype("<i4"),
+    RegDtype.U64: np.dtype("<u8"),
+    RegDtype.S64: np.dtype("<i8"),
+    RegDtype.FLOAT: np.dtype("<f4"),
+    RegDtype.BOOL: np.dtype(np.bool_),
+}
+"""NumPy data type of each register data type with a fixed-size numeric representation."""
+
 
 def weak_lru(maxsize: int = 128, typed: bool = False) -> Callable[..., Any]:
     """Decorator that allows safe use of lru_cache in class methods.
@@ -30,3 +47,18 @@ def weak_lru(maxsize: int = 128, typed: bool = False) -> Callable[..., Any]:
         return wrapper
 
     return decorator
+
+
+def reg_dtype_to_numpy(dtype: RegDtype) -> np.dtype[Any]:
+    """Get the NumPy data type used to store the values of a register data type.
+
+    Registers without a fixed-size numeric representation (strings, byte arrays) are stored as
+    Python objects.
+
+    Args:
+        dtype: register data type.
+
+    Returns:
+        NumPy data type.
+    """
+    return REG_DTYPE_TO_NUMPY.get(dtype, np.dtype(object))
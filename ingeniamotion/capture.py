@@ -20,6 +20,8 @@ from ingeniamotion.exceptions import (
 )
 from ingeniamotion.metaclass import DEFAULT_AXIS, DEFAULT_SERVO
 from ingeniamotion.monitoring.base_monitoring import Monitoring
+from ingeniamotion.monitoring.config_cache import MonitoringConfigCache
+from ingeniamotion.monitoring.monitoring_group import MonitoringGroup
 from ingeniamotion.monitoring.monitoring_v1 import MonitoringV1
 from ingeniamotion.monitoring.monitoring_v3 import MonitoringV3
 from ingeniamotion.pdo import PDONetworkManager
@@ -59,6 +61,7 @@ class Capture:
     def __init__(self, motion_controller: "MotionController") -> None:
         self.mc = motion_controller
         self.pdo = PDONetworkManager(self.mc)
+        self.__monitoring_config_caches: dict[str, MonitoringConfigCache] = {}
 
     def create_poller(
         self,
@@ -152,7 +155,7 @@ class Capture:
             NotImplementedError: If an wrong monitoring version is requested.
 
         """
-        version = self._check_version(servo)
+        version = self._get_monitoring_version(servo)
         if version == MonitoringVersion.MONITORING_V3:
             return MonitoringV3(self.mc, servo)
         elif version == MonitoringVersion.MONITORING_V1:
@@ -228,7 +231,8 @@ class Capture:
              trigger_signal or trigger_value are None.
 
         """
-        self.clean_monitoring(servo=servo)
+        # The mapped registers are only removed by map_registers if they change
+        self.disable_monitoring(servo=servo)
         monitoring = self.create_empty_monitoring(servo)
         monitoring.set_frequency(prescaler)
         monitoring.map_registers(registers)
@@ -243,6 +247,74 @@ class Capture:
             self.enable_monitoring(servo=servo)
         return monitoring
 
+    def create_monitoring_group(
+        self,
+        servos: list[str],
+        registers: list[dict[str, Union[int, str]]],
+        prescaler: int,
+        sample_time: float,
+        trigger_delay: float = 0,
+        trigger_mode: MonitoringSoCType = MonitoringSoCType.TRIGGER_EVENT_AUTO,
+        trigger_config: Optional[MonitoringSoCConfig] = None,
+        trigger_signal: Optional[dict[str, Union[int, str]]] = None,
+        trigger_value: Union[float, int, None] = None,
+        start: bool = False,
+    ) -> MonitoringGroup:
+        """Returns a MonitoringGroup instance with the same configuration in several servos.
+
+        .. code-block:: python
+
+            group = mc.capture.create_monitoring_group(
+                ["axis_1", "axis_2"], registers, prescaler=10, sample_time=0.5, start=True
+            )
+            group_data = group.read_monitoring_data()
+
+        Args:
+            servos: servo aliases.
+            registers: list of registers to add to the monitoring of each servo.
+                See :func:`create_monitoring`.
+            prescaler : determines monitoring frequency. It must be ``1`` or higher.
+            sample_time : sample time in seconds.
+            trigger_delay : trigger delay in seconds. Value should be between
+                ``-sample_time/2`` and ``sample_time/2`` . ``0`` by default.
+            trigger_mode : monitoring start of condition type.
+                ``TRIGGER_EVENT_NONE`` by default.
+            trigger_config : monitoring edge condition.
+                ``None`` by default.
+            trigger_signal : dict with name and axis of trigger signal
+                for rising or falling edge trigger.
+            trigger_value : value for rising or falling edge trigger.
+            start : if ``True``, function enables the monitoring of all the servos, if
+                ``False`` it should be enabled after. ``False`` by default.
+
+        Returns:
+            Instance of monitoring group configured.
+
+        Raises:
+            ValueError: If there are no servos.
+
+        """
+        if not servos:
+            raise ValueError("A monitoring group needs at least one servo.")
+        monitorings = {
+            servo: self.create_monitoring(
+                registers,
+                prescaler,
+                sample_time,
+                trigger_delay=trigger_delay,
+                trigger_mode=trigger_mode,
+                trigger_config=trigger_config,
+                trigger_signal=trigger_signal,
+                trigger_value=trigger_value,
+                servo=servo,
+            )
+            for servo in servos
+        }
+        monitoring_group = MonitoringGroup(self.mc, monitorings)
+        if start:
+            monitoring_group.enable()
+        return monitoring_group
+
     def create_disturbance(
         self,
         register: str,
@@ -285,6 +357,58 @@ class Capture:
             self.enable_disturbance(servo=servo)
         return disturbance
 
+    def _get_monitoring_config_cache(self, servo: str = DEFAULT_SERVO) -> MonitoringConfigCache:
+        """Get the monitoring configuration cache of a servo.
+
+        A new cache is created if the servo has been reconnected since the last call.
+
+        Args:
+            servo : servo alias to reference it. ``default`` by default.
+
+        Returns:
+            The monitoring configuration cache of the servo.
+
+        """
+        drive = self.mc._get_drive(servo)
+        config_cache = self.__monitoring_config_caches.get(servo)
+        if config_cache is None or config_cache.drive is not drive:
+            if config_cache is not None:
+                config_cache.clear()
+            config_cache = MonitoringConfigCache(drive)
+            self.__monitoring_config_caches[servo] = config_cache
+        return config_cache
+
+    def clear_monitoring_config_cache(self, servo: str = DEFAULT_SERVO) -> None:
+        """Discard the cached monitoring configuration of a servo.
+
+        The monitoring and disturbance writes only the configuration registers that change,
+        based on the last configuration read or written. The cache is discarded when the
+        servo is disconnected or reconnected. Use this function if the drive configuration
+        could have changed otherwise, e.g. after a power cycle without disconnecting.
+
+        Args:
+            servo : servo alias to reference it. ``default`` by default.
+
+        """
+        config_cache = self.__monitoring_config_caches.pop(servo, None)
+        if config_cache is not None:
+            config_cache.clear()
+
+    def _get_monitoring_version(self, servo: str = DEFAULT_SERVO) -> MonitoringVersion:
+        """Get the version of the monitoring of a servo, checking it only once.
+
+        Args:
+            servo : servo alias to reference it. ``default`` by default.
+
+        Returns:
+            MonitoringVersion: The version of the monitoring.
+
+        """
+        config_cache = self._get_monitoring_config_cache(servo)
+        if config_cache.version is None:
+            config_cache.version = self._check_version(servo)
+        return config_cache.version
+
     def _check_version(self, servo: str) -> MonitoringVersion:
         """Checks the version of the monitoring based on a given servo.
 
@@ -371,7 +495,7 @@ class Capture:
         """
         drive = self.mc._get_drive(servo)
         if version is None:
-            version = self._check_version(servo)
+            version = self._get_monitoring_version(servo)
         if version < MonitoringVersion.MONITORING_V3:
             return self.enable_monitoring(servo=servo)
         drive.disturbance_enable()
@@ -402,7 +526,7 @@ class Capture:
         """
         drive = self.mc._get_drive(servo)
         if version is None:
-            version = self._check_version(servo)
+            version = self._get_monitoring_version(servo)
         if not self.is_monitoring_enabled(servo=servo):
             return
         drive.monitoring_disable()
@@ -422,7 +546,7 @@ class Capture:
         """
         drive = self.mc._get_drive(servo)
         if version is None:
-            version = self._check_version(servo)
+            version = self._get_monitoring_version(servo)
         if not self.is_disturbance_enabled(servo, version):
             return
         if version < MonitoringVersion.MONITORING_V3:
@@ -491,7 +615,7 @@ class Capture:
 
         """
         if version is None:
-            version = self._check_version(servo)
+            version = self._get_monitoring_version(servo)
         if version < MonitoringVersion.MONITORING_V3:
             disturbance_status = self.mc.communication.get_register(
                 self.MONITORING_STATUS_REGISTER, servo=servo, axis=0
@@ -558,7 +682,7 @@ class Capture:
 
         """
         if version is None:
-            version = self._check_version(servo=servo)
+            version = self._get_monitoring_version(servo)
         monitor_status = self.mc.capture.get_monitoring_status(servo=servo)
         mask = self.MONITORING_STATUS_PROCESS_STAGE_BITS[version]
         masked_value = monitor_status & mask
@@ -582,7 +706,7 @@ class Capture:
 
         """
         if version is None:
-            version = self._check_version(servo=servo)
+            version = self._get_monitoring_version(servo)
         monitor_status = self.mc.capture.get_monitoring_status(servo=servo)
         mask = self.MONITORING_AVAILABLE_FRAME_BIT[version]
         return (monitor_status & mask) != 0
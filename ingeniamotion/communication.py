@@ -104,6 +104,8 @@ class Communication:
         if isinstance(network, VirtualNetwork) and self.__virtual_drive:
             self.__virtual_drive.stop()
             self.__virtual_drive = None
+        self.mc.capture.clear_monitoring_config_cache(alias)
+        self.mc.capture.pdo.invalidate_pdo_mapping_cache(alias)
         del self.mc.servos[alias]
         net_name = self.mc.servo_net.pop(alias)
         servo_count = list(self.mc.servo_net.values()).count(net_name)
@@ -1055,6 +1057,11 @@ class Communication:
     ) -> Union[int, float, str]:
         """Return the value of a target register.
 
+        While the PDOs are active, if the register is mapped in a TPDO map of the servo, the last
+        received value is returned instead of reading the register, as long as it is not older
+        than the maximum age set with
+        :func:`ingeniamotion.pdo.PDONetworkManager.set_tpdo_read_max_age`.
+
         Args:
             register : register UID.
             servo : servo alias to reference it. ``default`` by default.
@@ -1071,7 +1078,9 @@ class Communication:
         """
         drive = self.mc._get_drive(servo)
         register_dtype = self.mc.info.register_type(register, axis, servo=servo)
-        value = drive.read(register, subnode=axis)
+        # Serve the last cyclic value if the register is mapped in an active TPDO map
+        pdo_value = self.mc.capture.pdo.get_tpdo_value(register, servo=servo, axis=axis)
+        value = drive.read(register, subnode=axis) if pdo_value is None else pdo_value
         if register_dtype.value <= RegDtype.S64.value and isinstance(value, int):
             return int(value)
         if not isinstance(value, (int, float, str)):
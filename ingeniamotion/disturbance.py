@@ -1,5 +1,9 @@
+import threading
+import time
+from collections.abc import Sequence, Sized
+from dataclasses import dataclass
 from functools import wraps
-from typing import TYPE_CHECKING, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
 import ingenialogger
 import numpy as np
@@ -8,6 +12,7 @@ from ingenialink.exceptions import ILValueError
 from numpy import ndarray
 from numpy.typing import NDArray
 
+from ingeniamotion._utils import reg_dtype_to_numpy
 from ingeniamotion.enums import MonitoringVersion
 from ingeniamotion.exceptions import IMDisturbanceError, IMStatusWordError
 from ingeniamotion.metaclass import DEFAULT_AXIS, DEFAULT_SERVO
@@ -21,10 +26,10 @@ TYPE_MAPPED_REGISTERS_NAME_AXIS = dict[str, Union[str, int, RegDtype]]
 TYPE_MAPPED_REGISTERS_DATA = dict[str, list[Union[int, float]]]
 TYPE_MAPPED_REGISTERS_DATA_NO_KEY = list[Union[int, float]]
 
+_T = TypeVar("_T")
 
-def check_disturbance_disabled(
-    func: Callable[..., Union[int, float, None]],
-) -> Callable[..., Union[int, float, None]]:
+
+def check_disturbance_disabled(func: Callable[..., _T]) -> Callable[..., _T]:
     """Decorator that checks if disturbance is disabled before calling a function.
 
     Args:
@@ -47,6 +52,21 @@ def check_disturbance_disabled(
     return wrapper
 
 
+@dataclass(frozen=True)
+class DisturbanceStreamResult:
+    """Result of a disturbance stream."""
+
+    chunks: int
+    """Number of chunks written to the drive."""
+    samples: int
+    """Number of samples written to the drive."""
+    reload_times: list[float]
+    """Time the disturbance was disabled to reload each chunk after the first one, in
+    seconds."""
+    stopped: bool
+    """True if the stream was stopped before all the chunks were played."""
+
+
 class Disturbance:
     """Class to configure a disturbance in a servo.
 
@@ -80,9 +100,10 @@ class Disturbance:
         self.servo = servo
         self.mapped_registers: list[TYPE_MAPPED_REGISTERS_NAME_AXIS] = []
         self.sampling_freq: Optional[float] = None
-        self._version = mc.capture._check_version(servo)
+        self._version = mc.capture._get_monitoring_version(servo)
         self.logger = ingenialogger.get_logger(__name__, drive=mc.servo_name(servo))
         self.max_sample_number = mc.capture.disturbance_max_sample_size(servo)
+        self.__stop_stream = threading.Event()
         if self._version < MonitoringVersion.MONITORING_V3:
             try:
                 self.mc.capture.mcb_synchronization(servo=servo)
@@ -214,6 +235,126 @@ class Disturbance:
                 "Registers data adapter doesn't have the correct type for its input argument"
             )
 
+    @staticmethod
+    def __is_array_data(registers_data: object) -> bool:
+        return isinstance(registers_data, ndarray) or (
+            isinstance(registers_data, list)
+            and len(registers_data) > 0
+            and all(isinstance(data, ndarray) for data in registers_data)
+        )
+
+    def __registers_arrays_adapter(
+        self, registers_data: Union[NDArray[Any], list[NDArray[Any]]]
+    ) -> list[NDArray[Any]]:
+        """Get the data of each mapped register from the NumPy data.
+
+        Args:
+            registers_data: an array for each register, or a single array. A 2-D array holds
+                the data of a register on each row.
+
+        Returns:
+            A 1-D array for each mapped register.
+
+        Raises:
+            IMDisturbanceError: If the number of arrays does not match the number of mapped
+                registers, or if they are not 1-D arrays of the same length.
+        """
+        if isinstance(registers_data, ndarray):
+            registers_data = list(np.atleast_2d(registers_data))
+        if len(registers_data) != len(self.mapped_registers):
+            raise IMDisturbanceError(
+                f"There is data for {len(registers_data)} registers, but"
+                f" {len(self.mapped_registers)} registers are mapped."
+            )
+        if any(data.ndim != 1 or len(data) != len(registers_data[0]) for data in registers_data):
+            raise IMDisturbanceError(
+                "The data of each register must be 1-D arrays of the same length."
+            )
+        return registers_data
+
+    def __registers_data_to_lists(
+        self, registers_data: list[NDArray[Any]]
+    ) -> list[TYPE_MAPPED_REGISTERS_DATA_NO_KEY]:
+        """Cast the data of the mapped registers to their data types.
+
+        Each array is checked and cast once to the data type of its register with vectorized
+        operations. The values are converted to Python objects only to hand them to
+        ``disturbance_write_data``, which builds the payload.
+
+        Args:
+            registers_data: a 1-D array for each mapped register.
+
+        Returns:
+            The values of each mapped register, as they are written to the drive.
+
+        Raises:
+            IMDisturbanceError: If some value can not be represented with the data type of its
+                register.
+        """
+        self.__check_registers_data_dtypes(registers_data)
+        return [
+            data.astype(reg_dtype_to_numpy(RegDtype(register["dtype"])), copy=False).tolist()
+            for register, data in zip(self.mapped_registers, registers_data)
+        ]
+
+    def __check_registers_data_dtypes(self, registers_data: list[NDArray[Any]]) -> None:
+        """Check that the data of the mapped registers fits their data types.
+
+        Args:
+            registers_data: a 1-D array for each mapped register.
+
+        Raises:
+            IMDisturbanceError: If some value can not be represented with the data type of its
+                register.
+        """
+        for register, data in zip(self.mapped_registers, registers_data):
+            dtype = RegDtype(register["dtype"])
+            if not self.__fits_dtype(data, reg_dtype_to_numpy(dtype)):
+                raise IMDisturbanceError(
+                    f"The data of register {register['name']} can not be written as {dtype.name}."
+                )
+
+    @staticmethod
+    def __fits_dtype(data: NDArray[Any], dtype: np.dtype[Any]) -> bool:
+        """Check if the values of an array can be cast to a data type without losing them.
+
+        Args:
+            data: values.
+            dtype: target data type.
+
+        Returns:
+            True if the integer data types get integer values within their range and the
+            floating point data types get finite values within their range, False otherwise.
+        """
+        if len(data) == 0:
+            return True
+        if np.issubdtype(dtype, np.integer):
+            limits = np.iinfo(dtype)
+            is_integer = np.issubdtype(data.dtype, np.integer) or bool(
+                np.all(np.trunc(data) == data)
+            )
+            return is_integer and bool(limits.min <= data.min() and data.max() <= limits.max)
+        return bool(np.all(np.abs(data) <= np.finfo(dtype).max))
+
+    def __write_registers_data(
+        self, registers_data: list[TYPE_MAPPED_REGISTERS_DATA_NO_KEY]
+    ) -> None:
+        """Write the data of the mapped registers to the drive.
+
+        Args:
+            registers_data: the values of each mapped register.
+
+        Raises:
+            IMDisturbanceError: If the data can not be written with the data types of the
+                registers.
+        """
+        idx_list = list(range(len(registers_data)))
+        dtype_list = [RegDtype(x["dtype"]) for x in self.mapped_registers]
+        try:
+            self.mc.servos[self.servo].disturbance_write_data(idx_list, dtype_list, registers_data)
+        except ILValueError as e:
+            raise IMDisturbanceError(e)
+
     @check_disturbance_disabled
     def write_disturbance_data(
         self,
@@ -233,30 +374,244 @@ class Disturbance:
     ) -> None:
         """Write data in mapped registers. Disturbance must be disabled.
 
+        NumPy data is checked and cast once to the data type of each register with vectorized
+        operations, instead of converting each value to check it.
+
         Args:
             registers_data :
                 data to write in disturbance. Registers should have same order
-                as in :func:`map_registers`.
+                as in :func:`map_registers`. It can be a list of values for each register, a
+                single list, an array for each register, a single array or a 2-D array with
+                the data of a register on each row.
 
         Raises:
             IMDisturbanceError: If there are no mapped registers or the sampling frequency is not
                 set yet.
             IMDisturbanceError: If buffer size is not enough for all the
                 registers and samples.
+            IMDisturbanceError: If the NumPy data does not match the mapped registers, or can
+                not be represented with their data types.
         """
         if len(self.mapped_registers) == 0 or self.sampling_freq is None:
             raise IMDisturbanceError("Disturbance is not correctly configured yet")
-        adapted_registers_data = self.__registers_data_adapter(registers_data)
-        drive = self.mc.servos[self.servo]
-        self.__check_buffer_size_is_enough(adapted_registers_data)
-        idx_list = list(range(len(adapted_registers_data)))
-        dtype_list = [RegDtype(x["dtype"]) for x in self.mapped_registers]
+        if self.__is_array_data(registers_data):
+            registers_arrays = self.__registers_arrays_adapter(
+                registers_data  # type: ignore [arg-type]
+            )
+            self.__check_buffer_size_is_enough(registers_arrays)
+            adapted_registers_data = self.__registers_data_to_lists(registers_arrays)
+        else:
+            adapted_registers_data = self.__registers_data_adapter(registers_data)
+            self.__check_buffer_size_is_enough(adapted_registers_data)
         if self._version >= MonitoringVersion.MONITORING_V3:
-            drive.disturbance_remove_data()
+            self.mc.servos[self.servo].disturbance_remove_data()
+        self.__write_registers_data(adapted_registers_data)
+
+    @check_disturbance_disabled
+    def stream_disturbance_data(
+        self,
+        registers_data: Union[
+            list[
+                Union[
+                    int,
+                    float,
+                    NDArray[np.int32],
+                    NDArray[np.float32],
+                    TYPE_MAPPED_REGISTERS_DATA_NO_KEY,
+                ]
+            ],
+            NDArray[np.int32],
+            NDArray[np.float32],
+        ],
+        chunk_samples: Optional[int] = None,
+        disable: bool = True,
+    ) -> DisturbanceStreamResult:
+        """Blocking function that plays data longer than the disturbance buffer.
+
+        The data is split into chunks that fit in the disturbance buffer. All the chunks but the
+        last one have ``chunk_samples`` samples, and the last one holds the remaining samples.
+        Each chunk is written while the disturbance is disabled, and the disturbance is enabled
+        once the whole chunk is stored, so the drive never plays a buffer that is being
+        rewritten. The chunk is played from its first sample, and the disturbance is disabled
+        after a pass of its number of samples divided by the disturbance frequency, timed with
+        the host clock, to reload the next chunk.
+
+        No disturbance is injected between two chunks, while the next chunk is written. The
+        duration of each of these gaps is returned in the result. The next chunk is cast to the
+        data types of the registers while the current one plays, so only the bus writes are
+        left for the reload. If the disturbance is disabled later than the end of the pass, the
+        drive plays the first samples of the chunk again until it is disabled.
+
+        Only available for monitoring V3, which removes the stored data with
+        ``disturbance_remove_data`` before each chunk is written.
+
+        Args:
+            registers_data: data to write in disturbance, as in :func:`write_disturbance_data`.
+            chunk_samples: number of samples of each chunk. By default, the highest number of
+                samples that fits in the disturbance buffer.
+            disable: if ``True``, the disturbance is disabled once the last chunk is played a
+                single time. If ``False``, the drive keeps playing the last chunk. The
+                disturbance is always disabled if the stream is stopped or fails. ``True`` by
+                default.
+
+        Returns:
+            Number of written chunks and samples, and the duration of the reload gaps.
+
+        Raises:
+            IMDisturbanceError: If there are no mapped registers or the sampling frequency is not
+                set yet.
+            IMDisturbanceError: If the monitoring version is lower than V3.
+            IMDisturbanceError: If the number of samples of the chunks does not fit in the
+                buffer, or there is no data.
+            IMDisturbanceError: If the data does not match the mapped registers, or can not be
+                represented with their data types.
+            IMDisturbanceError: If the disturbance is disabled while a chunk is played.
+        """
+        if len(self.mapped_registers) == 0 or self.sampling_freq is None:
+            raise IMDisturbanceError("Disturbance is not correctly configured yet")
+        if self._version < MonitoringVersion.MONITORING_V3:
+            raise IMDisturbanceError("Disturbance streaming is only available for monitoring V3")
+        chunks = self.__split_stream_data(registers_data, chunk_samples)
+        self.__stop_stream.clear()
+        reload_times = []
+        written_samples = 0
+        is_stopped, is_finished = False, False
+        next_data = self.__registers_data_to_lists(chunks[0])
         try:
-            drive.disturbance_write_data(idx_list, dtype_list, adapted_registers_data)
-        except ILValueError as e:
-            raise IMDisturbanceError(e)
+            for index, chunk in enumerate(chunks):
+                reload_start_time = time.perf_counter()
+                if index > 0:
+                    # The buffer is not rewritten while the drive plays it
+                    self.mc.capture.disable_disturbance(servo=self.servo, version=self._version)
+                self.__load_disturbance_data(next_data)
+                written_samples += len(chunk[0])
+                self.mc.capture.enable_disturbance(servo=self.servo, version=self._version)
+                start_time = time.perf_counter()
+                if index > 0:
+                    reload_times.append(start_time - reload_start_time)
+                if index + 1 < len(chunks):
+                    next_data = self.__registers_data_to_lists(chunks[index + 1])
+                elif not disable:
+                    break
+                pass_end_time = start_time + len(chunk[0]) / self.sampling_freq
+                if not self.__play_stream_chunk(pass_end_time):
+                    is_stopped = True
+                    break
+            is_finished = not is_stopped
+        finally:
+            if disable or not is_finished:
+                self.mc.capture.disable_disturbance(servo=self.servo, version=self._version)
+        return DisturbanceStreamResult(
+            chunks=len(chunks),
+            samples=written_samples,
+            reload_times=reload_times,
+            stopped=is_stopped,
+        )
+
+    def __split_stream_data(
+        self,
+        registers_data: Union[
+            list[
+                Union[
+                    int,
+                    float,
+                    NDArray[np.int32],
+                    NDArray[np.float32],
+                    TYPE_MAPPED_REGISTERS_DATA_NO_KEY,
+                ]
+            ],
+            NDArray[np.int32],
+            NDArray[np.float32],
+        ],
+        chunk_samples: Optional[int],
+    ) -> list[list[NDArray[Any]]]:
+        """Split the data of a disturbance stream into chunks that fit in the buffer.
+
+        Args:
+            registers_data: data to write in disturbance.
+            chunk_samples: number of samples of each chunk. If ``None``, the highest number of
+                samples that fits in the disturbance buffer.
+
+        Returns:
+            The data of each chunk, with an array for each mapped register.
+
+        Raises:
+            IMDisturbanceError: If the number of samples of the chunks does not fit in the
+                buffer, or there is no data.
+            IMDisturbanceError: If the data does not match the mapped registers, or can not be
+                represented with their data types.
+        """
+        if self.__is_array_data(registers_data):
+            registers_arrays = self.__registers_arrays_adapter(
+                registers_data  # type: ignore [arg-type]
+            )
+        else:
+            registers_arrays = self.__registers_arrays_adapter([
+                np.asarray(data) for data in self.__registers_data_adapter(registers_data)
+            ])
+        self.__check_registers_data_dtypes(registers_arrays)
+        sample_size = sum(
+            self.__data_type_size[RegDtype(register["dtype"])] for register in self.mapped_registers
+        )
+        max_chunk_samples = self.max_sample_number // sample_size
+        if chunk_samples is None:
+            chunk_samples = max_chunk_samples
+        if not 1 <= chunk_samples <= max_chunk_samples:
+            raise IMDisturbanceError(
+                f"Chunks of {chunk_samples} samples do not fit in the buffer. "
+                f"Chunks must have between 1 and {max_chunk_samples} samples."
+            )
+        number_samples = len(registers_arrays[0])
+        if number_samples == 0:
+            raise IMDisturbanceError("There is no data to stream.")
+        return [
+            [data[start : start + chunk_samples] for data in registers_arrays]
+            for start in range(0, number_samples, chunk_samples)
+        ]
+
+    def stop_streaming(self) -> None:
+        """Stops stream_disturbance_data function. The disturbance is disabled."""
+        self.__stop_stream.set()
+
+    def __load_disturbance_data(
+        self, registers_data: list[TYPE_MAPPED_REGISTERS_DATA_NO_KEY]
+    ) -> None:
+        """Replace the stored disturbance data. The disturbance must be disabled.
+
+        Args:
+            registers_data: the values of each mapped register.
+        """
+        self.mc.servos[self.servo].disturbance_remove_data()
+        self.__write_registers_data(registers_data)
+
+    def __play_stream_chunk(self, pass_end_time: float) -> bool:
+        """Wait until a chunk of the stream is played a single time.
+
+        Args:
+            pass_end_time: value of ``time.perf_counter`` when the pass of the chunk ends.
+
+        Returns:
+            True if the chunk is played, False if the stream is stopped.
+
+        Raises:
+            IMDisturbanceError: If the disturbance is disabled while the chunk is played.
+        """
+        if not self.__wait_stream(pass_end_time):
+            return False
+        if not self.mc.capture.is_disturbance_enabled(servo=self.servo, version=self._version):
+            raise IMDisturbanceError("The disturbance was disabled while streaming.")
+        return True
+
+    def __wait_stream(self, deadline: float) -> bool:
+        """Wait until a time of the host clock unless the stream is stopped.
+
+        Args:
+            deadline: value of ``time.perf_counter`` to wait for.
+
+        Returns:
+            True if the deadline is reached, False if the stream is stopped.
+        """
+        return not self.__stop_stream.wait(max(deadline - time.perf_counter(), 0))
 
     def map_registers_and_write_data(
         self, registers: Union[TYPE_MAPPED_REGISTERS_ALL, list[TYPE_MAPPED_REGISTERS_ALL]]
@@ -294,9 +649,7 @@ class Disturbance:
         self.map_registers(registers_keys)
         self.write_disturbance_data(registers_data)
 
-    def __check_buffer_size_is_enough(
-        self, registers: list[TYPE_MAPPED_REGISTERS_DATA_NO_KEY]
-    ) -> None:
+    def __check_buffer_size_is_enough(self, registers: Sequence[Sized]) -> None:
         total_buffer_size = 0
         for ch_idx, data in enumerate(registers):
             dtype = self.mapped_registers[ch_idx]["dtype"]
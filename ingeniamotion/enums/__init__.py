@@ -346,6 +346,44 @@ class STOAbnormalLatchedStatus(IntEnum, metaclass=MetaEnum):
     UNDETERMINATED = 2
 
 
+@export
+class PDOBackpressureMode(IntEnum, metaclass=MetaEnum):
+    """Behavior of a PDO stream when its queue is full."""
+
+    DROP_OLDEST = 0
+    """Discard the oldest queued batch to make room for the new one."""
+    DROP_NEWEST = 1
+    """Discard the new batch."""
+    BLOCK = 2
+    """Block the PDO thread until there is room for the new batch."""
+
+
+@export
+class PDODispatchMode(IntEnum, metaclass=MetaEnum):
+    """Thread on which a PDO subscriber callback is called."""
+
+    INLINE = 0
+    """Call the callback on the PDO thread, on each process data cycle."""
+    THREAD = 1
+    """Queue the sample and call the callback on a worker thread of the subscriber."""
+
+
+@export
+class PDOTriggerMode(IntEnum, metaclass=MetaEnum):
+    """Condition of a PDO trigger on its channel."""
+
+    RISING_EDGE = 0
+    """The channel crosses the level upwards."""
+    FALLING_EDGE = 1
+    """The channel crosses the level downwards."""
+    RISING_OR_FALLING_EDGE = 2
+    """The channel crosses the level in any direction."""
+    ABOVE_LEVEL = 3
+    """The channel is higher than the level."""
+    BELOW_LEVEL = 4
+    """The channel is lower than the level."""
+
+
 # WARNING: Deprecated aliases
 _DEPRECATED = {
     "COMMUNICATION_TYPE": "CommunicationType",
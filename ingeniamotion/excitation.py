@@ -0,0 +1,471 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+from ingenialink.enums.register import RegDtype
+from numpy.typing import ArrayLike, NDArray
+
+from ingeniamotion._utils import reg_dtype_to_numpy
+from ingeniamotion.exceptions import IMDisturbanceError
+from ingeniamotion.metaclass import DEFAULT_AXIS, DEFAULT_SERVO
+
+if TYPE_CHECKING:
+    from ingeniamotion.disturbance import Disturbance
+    from ingeniamotion.motion_controller import MotionController
+
+__all__ = ["ExcitationGenerator", "crest_factor"]
+
+# Taps of a maximum length linear feedback shift register for each PRBS order
+PRBS_TAPS = {
+    2: (2, 1),
+    3: (3, 2),
+    4: (4, 3),
+    5: (5, 3),
+    6: (6, 5),
+    7: (7, 6),
+    8: (8, 6, 5, 4),
+    9: (9, 5),
+    10: (10, 7),
+    11: (11, 9),
+    12: (12, 11, 10, 4),
+    13: (13, 12, 11, 8),
+    14: (14, 13, 12, 2),
+    15: (15, 14),
+    16: (16, 15, 13, 4),
+    17: (17, 14),
+    18: (18, 11),
+}
+
+
+def crest_factor(signal: ArrayLike) -> float:
+    """Get the crest factor of a signal: its peak value divided by its RMS value.
+
+    Args:
+        signal: signal values.
+
+    Returns:
+        The crest factor.
+    """
+    values = np.asarray(signal, dtype=np.float64)
+    values = values - values.mean()
+    return float(np.max(np.abs(values)) / np.sqrt(np.mean(values**2)))
+
+
+class ExcitationGenerator:
+    """Generate excitation signals for a disturbance.
+
+    The signals are generated with vectorized NumPy operations at the disturbance frequency
+    and returned with the data type of the target register, so they can be passed straight to
+    :func:`ingeniamotion.capture.Capture.create_disturbance` or
+    :func:`ingeniamotion.disturbance.Disturbance.write_disturbance_data`. The integer signals
+    are rounded to the nearest integer.
+
+    The number of samples of each signal is checked against the disturbance buffer before it
+    is generated, so a signal that does not fit fails without any communication with the
+    drive.
+
+    Args:
+        sampling_freq: disturbance frequency, in Hz.
+        dtype: data type of the target register. ``RegDtype.FLOAT`` by default.
+        max_size: size of the disturbance buffer, in bytes. If ``None``, the size of the signals
+            is not checked.
+
+    Raises:
+        ValueError: If the sampling frequency is not positive.
+        ValueError: If the data type is not supported by the disturbance.
+    """
+
+    def __init__(
+        self,
+        sampling_freq: float,
+        dtype: RegDtype = RegDtype.FLOAT,
+        max_size: Optional[int] = None,
+    ) -> None:
+        if sampling_freq <= 0:
+            raise ValueError("The sampling frequency must be positive.")
+        numpy_dtype = reg_dtype_to_numpy(dtype)
+        if numpy_dtype == np.dtype(object) or numpy_dtype == np.bool_:
+            raise ValueError(f"The data type {dtype.name} is not supported.")
+        self.__sampling_freq = sampling_freq
+        self.__dtype = dtype
+        self.__numpy_dtype = numpy_dtype
+        self.__max_size = max_size
+
+    @classmethod
+    def from_disturbance_config(
+        cls,
+        mc: "MotionController",
+        register: str,
+        freq_divider: int,
+        servo: str = DEFAULT_SERVO,
+        axis: int = DEFAULT_AXIS,
+    ) -> "ExcitationGenerator":
+        """Create a generator for a disturbance that is not created yet.
+
+        The arguments are the same as in :func:`ingeniamotion.capture.Capture.create_disturbance`.
+
+        Args:
+            mc: MotionController instance.
+            register: target register UID.
+            freq_divider: disturbance frequency divider. It must be ``1`` or higher.
+            servo: servo alias to reference it. ``default`` by default.
+            axis: servo axis. ``1`` by default.
+
+        Returns:
+            A generator with the frequency that the divider sets, the data type of the
+            register and the size of the disturbance buffer.
+
+        Raises:
+            ValueError: If freq_divider is less than ``1``.
+        """
+        if freq_divider < 1:
+            raise ValueError("divider must be 1 or higher")
+        position_velocity_loop_rate = mc.configuration.get_position_and_velocity_loop_rate(
+            servo=servo
+        )
+        return cls(
+            sampling_freq=round(position_velocity_loop_rate / freq_divider, 2),
+            dtype=mc.info.register_info(register, axis, servo=servo).dtype,
+            max_size=mc.capture.disturbance_max_sample_size(servo),
+        )
+
+    @classmethod
+    def from_disturbance(cls, disturbance: "Disturbance") -> "ExcitationGenerator":
+        """Create a generator for the single register mapped to a disturbance.
+
+        Args:
+            disturbance: disturbance with the frequency set and a register mapped.
+
+        Returns:
+            A generator with the frequency, register data type and buffer size of the
+            disturbance.
+
+        Raises:
+            IMDisturbanceError: If the frequency is not set or there is not a single mapped
+                register.
+        """
+        if disturbance.sampling_freq is None or len(disturbance.mapped_registers) != 1:
+            raise IMDisturbanceError(
+                "The disturbance must have the frequency set and a single register mapped."
+            )
+        return cls(
+            sampling_freq=disturbance.sampling_freq,
+            dtype=RegDtype(disturbance.mapped_registers[0]["dtype"]),
+            max_size=disturbance.max_sample_number,
+        )
+
+    def chirp(
+        self,
+        duration: float,
+        start_freq: float,
+        end_freq: float,
+        amplitude: float,
+        offset: float = 0,
+        logarithmic: bool = False,
+    ) -> NDArray[Any]:
+        """Generate a sine whose frequency changes continuously from a start to an end value.
+
+        Args:
+            duration: signal duration, in seconds.
+            start_freq: frequency at the start, in Hz.
+            end_freq: frequency at the end, in Hz.
+            amplitude: sine amplitude.
+            offset: signal offset. ``0`` by default.
+            logarithmic: if ``True``, the frequency changes exponentially, so each decade
+                takes the same time. If ``False``, it changes linearly. ``False`` by default.
+
+        Returns:
+            The signal.
+
+        Raises:
+            ValueError: If a frequency is not positive or is above the Nyquist frequency.
+            IMDisturbanceError: If the signal does not fit in the disturbance buffer.
+        """
+        self.__check_frequencies([start_freq, end_freq])
+        time = np.arange(self.__number_samples(duration)) / self.__sampling_freq
+        if logarithmic and start_freq != end_freq:
+            # Time that the frequency takes to grow by a factor e
+            time_constant = duration / np.log(end_freq / start_freq)
+            phase = 2 * np.pi * start_freq * time_constant * np.expm1(time / time_constant)
+        else:
+            phase = (
+                2 * np.pi * (start_freq + (end_freq - start_freq) * time / (2 * duration)) * time
+            )
+        return self.quantize(offset + amplitude * np.sin(phase))
+
+    def prbs(
+        self,
+        order: int,
+        amplitude: float,
+        offset: float = 0,
+        samples_per_bit: int = 1,
+        periods: int = 1,
+    ) -> NDArray[Any]:
+        """Generate a maximum length pseudo-random binary sequence.
+
+        The sequence has ``2 ** order - 1`` bits and switches between ``offset - amplitude``
+        and ``offset + amplitude``. Its spectrum is flat up to about a third of the bit
+        frequency, the disturbance frequency divided by ``samples_per_bit``.
+
+        Args:
+            order: order of the sequence, between 2 and 18.
+            amplitude: signal amplitude.
+            offset: signal offset. ``0`` by default.
+            samples_per_bit: number of samples that each bit is held. ``1`` by default.
+            periods: number of repetitions of the sequence. ``1`` by default.
+
+        Returns:
+            The signal.
+
+        Raises:
+            ValueError: If the order is not supported, or the samples per bit or the periods
+                are lower than 1.
+            IMDisturbanceError: If the signal does not fit in the disturbance buffer.
+        """
+        if order not in PRBS_TAPS:
+            raise ValueError(
+                f"The PRBS order must be between {min(PRBS_TAPS)} and {max(PRBS_TAPS)}."
+            )
+        if samples_per_bit < 1 or periods < 1:
+            raise ValueError("The samples per bit and the periods must be 1 or higher.")
+        length = 2**order - 1
+        self.__check_footprint(length * samples_per_bit * periods)
+        taps = PRBS_TAPS[order]
+        bits = np.ones(length, dtype=np.uint8)
+        # Each bit depends on the bits a tap behind it, so the bits are generated in blocks as
+        # long as the shortest tap
+        block_size = min(taps)
+        for start in range(order, length, block_size):
+            end = min(start + block_size, length)
+            block = np.zeros(end - start, dtype=np.uint8)
+            for tap in taps:
+                block ^= bits[start - tap : end - tap]
+            bits[start:end] = block
+        levels = offset + amplitude * (2 * bits.astype(np.float64) - 1)
+        return self.quantize(np.tile(np.repeat(levels, samples_per_bit), periods))
+
+    def multisine(
+        self,
+        frequencies: Sequence[float],
+        amplitude: float,
+        period: float,
+        offset: float = 0,
+        periods: int = 1,
+        crest_factor_iterations: int = 100,
+    ) -> NDArray[Any]:
+        """Generate a periodic sum of sines of the same amplitude, with a low crest factor.
+
+        Each frequency is rounded to the nearest multiple of ``1 / period``, so every period
+        holds a whole number of cycles of each sine and there is no leakage. The phases start
+        as Schroeder phases and are improved by iteratively clipping the peaks of the signal
+        and keeping the phases of its spectrum, so the signal has more power for the same
+        peak value.
+
+        Args:
+            frequencies: frequency of each sine, in Hz.
+            amplitude: peak value of the sum of sines.
+            period: signal period, in seconds.
+            offset: signal offset. ``0`` by default.
+            periods: number of repetitions of the period. ``1`` by default.
+            crest_factor_iterations: number of iterations of the crest factor optimization.
+                ``0`` to keep the Schroeder phases. ``100`` by default.
+
+        Returns:
+            The signal.
+
+        Raises:
+            ValueError: If there are no frequencies, or they are not between ``1 / period``
+                and the Nyquist frequency.
+            ValueError: If the periods are lower than 1.
+            IMDisturbanceError: If the signal does not fit in the disturbance buffer.
+        """
+        if len(frequencies) == 0:
+            raise ValueError("There are no frequencies.")
+        if periods < 1:
+            raise ValueError("The periods must be 1 or higher.")
+        self.__check_frequencies(frequencies)
+        period_samples = self.__number_samples(period)
+        self.__check_footprint(period_samples * periods)
+        bins = np.unique(
+            np.rint(np.asarray(frequencies) * period_samples / self.__sampling_freq).astype(int)
+        )
+        if bins[0] < 1 or 2 * bins[-1] >= period_samples:
+            raise ValueError(
+                "The frequencies must be between 1 / period and the Nyquist frequency."
+            )
+        lines = np.arange(len(bins))
+        phases = -np.pi * lines * (lines + 1) / len(bins)
+        spectrum = np.zeros(period_samples // 2 + 1, dtype=np.complex128)
+        spectrum[bins] = np.exp(1j * phases)
+        signal = np.fft.irfft(spectrum, period_samples)
+        best_signal, best_crest_factor = signal, crest_factor(signal)
+        for _ in range(crest_factor_iterations):
+            clip_level = 0.9 * np.max(np.abs(signal))
+            clipped_spectrum = np.fft.rfft(np.clip(signal, -clip_level, clip_level))
+            spectrum[bins] = np.exp(1j * np.angle(clipped_spectrum[bins]))
+            signal = np.fft.irfft(spectrum, period_samples)
+            signal_crest_factor = crest_factor(signal)
+            if signal_crest_factor < best_crest_factor:
+                best_signal, best_crest_factor = signal, signal_crest_factor
+        best_signal = amplitude * best_signal / np.max(np.abs(best_signal))
+        return self.quantize(np.tile(offset + best_signal, periods))
+
+    def steps(self, levels: Sequence[float], step_duration: float) -> NDArray[Any]:
+        """Generate a sequence of steps.
+
+        Args:
+            levels: value of each step.
+            step_duration: time that each step is held, in seconds.
+
+        Returns:
+            The signal.
+
+        Raises:
+            ValueError: If there are no levels.
+            IMDisturbanceError: If the signal does not fit in the disturbance buffer.
+        """
+        if len(levels) == 0:
+            raise ValueError("There are no levels.")
+        step_samples = self.__number_samples(step_duration)
+        self.__check_footprint(step_samples * len(levels))
+        return self.quantize(np.repeat(np.asarray(levels, dtype=np.float64), step_samples))
+
+    def sine_sweep(
+        self,
+        frequencies: Sequence[float],
+        amplitude: float,
+        cycles: int = 5,
+        offset: float = 0,
+    ) -> NDArray[Any]:
+        """Generate a stepped sine sweep: a number of whole cycles of a sine at each frequency.
+
+        Args:
+            frequencies: frequency of each step of the sweep, in Hz.
+            amplitude: sine amplitude.
+            cycles: number of cycles at each frequency. ``5`` by default.
+            offset: signal offset. ``0`` by default.
+
+        Returns:
+            The signal.
+
+        Raises:
+            ValueError: If there are no frequencies, or they are not positive or are above the
+                Nyquist frequency.
+            ValueError: If the cycles are lower than 1.
+            IMDisturbanceError: If the signal does not fit in the disturbance buffer.
+        """
+        if len(frequencies) == 0:
+            raise ValueError("There are no frequencies.")
+        if cycles < 1:
+            raise ValueError("The cycles must be 1 or higher.")
+        self.__check_frequencies(frequencies)
+        step_frequencies = np.asarray(frequencies, dtype=np.float64)
+        step_samples = np.rint(cycles * self.__sampling_freq / step_frequencies).astype(int)
+        self.__check_footprint(int(step_samples.sum()))
+        step_starts = np.cumsum(step_samples) - step_samples
+        sample_frequencies = np.repeat(step_frequencies, step_samples)
+        step_indexes = np.arange(step_samples.sum()) - np.repeat(step_starts, step_samples)
+        phase = 2 * np.pi * sample_frequencies * step_indexes / self.__sampling_freq
+        return self.quantize(offset + amplitude * np.sin(phase))
+
+    def quantize(self, signal: ArrayLike) -> NDArray[Any]:
+        """Convert a signal to the data type of the target register.
+
+        Args:
+            signal: signal values.
+
+        Returns:
+            The signal with the data type of the register. The integer signals are rounded to
+            the nearest integer.
+
+        Raises:
+            ValueError: If some value is out of the range of the data type.
+        """
+        values = np.asarray(signal, dtype=np.float64)
+        if np.issubdtype(self.__numpy_dtype, np.integer):
+            values = np.rint(values)
+            limits: Any = np.iinfo(self.__numpy_dtype)
+        else:
+            limits = np.finfo(self.__numpy_dtype)
+        if len(values) > 0 and (values.min() < limits.min or values.max() > limits.max):
+            raise ValueError(f"The signal is out of the range of {self.__dtype.name}.")
+        return values.astype(self.__numpy_dtype)
+
+    def buffer_footprint(self, number_samples: int) -> int:
+        """Get the size that a signal takes in the disturbance buffer.
+
+        Args:
+            number_samples: number of samples of the signal.
+
+        Returns:
+            Size of the signal, in bytes.
+        """
+        return number_samples * self.__numpy_dtype.itemsize
+
+    def __number_samples(self, duration: float) -> int:
+        """Get the number of samples of a duration, and check that they fit in the buffer.
+
+        Args:
+            duration: duration, in seconds.
+
+        Returns:
+            The number of samples, rounded to the nearest integer.
+
+        Raises:
+            ValueError: If the duration is shorter than a sample.
+            IMDisturbanceError: If the samples do not fit in the disturbance buffer.
+        """
+        number_samples = round(duration * self.__sampling_freq)
+        if number_samples < 1:
+            raise ValueError("The duration must be at least one sample long.")
+        self.__check_footprint(number_samples)
+        return number_samples
+
+    def __check_footprint(self, number_samples: int) -> None:
+        """Check that a signal fits in the disturbance buffer.
+
+        Args:
+            number_samples: number of samples of the signal.
+
+        Raises:
+            IMDisturbanceError: If the signal does not fit in the disturbance buffer.
+        """
+        footprint = self.buffer_footprint(number_samples)
+        if self.__max_size is not None and footprint > self.__max_size:
+            raise IMDisturbanceError(
+                "Number of samples is too high. "
+                f"Demanded size: {footprint} bytes, "
+                f"buffer max size: {self.__max_size} bytes."
+            )
+
+    def __check_frequencies(self, frequencies: Sequence[float]) -> None:
+        """Check that some frequencies can be generated at the disturbance frequency.
+
+        Args:
+            frequencies: frequencies, in Hz.
+
+        Raises:
+            ValueError: If a frequency is not positive or is above the Nyquist frequency.
+        """
+        if any(not 0 < frequency <= self.__sampling_freq / 2 for frequency in frequencies):
+            raise ValueError(
+                "The frequencies must be positive and not above the Nyquist frequency "
+                f"({self.__sampling_freq / 2} Hz)."
+            )
+
+    @property
+    def sampling_freq(self) -> float:
+        """Disturbance frequency, in Hz."""
+        return self.__sampling_freq
+
+    @property
+    def dtype(self) -> RegDtype:
+        """Data type of the target register."""
+        return self.__dtype
+
+    @property
+    def max_samples(self) -> Optional[int]:
+        """Maximum number of samples of a signal. ``None`` if it is not limited."""
+        if self.__max_size is None:
+            return None
+        return self.__max_size // self.__numpy_dtype.itemsize
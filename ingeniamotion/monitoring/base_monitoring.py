@@ -1,13 +1,21 @@
+import asyncio
 import struct
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Generator
 from functools import wraps
-from typing import TYPE_CHECKING, Callable, Optional, Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
 import ingenialogger
 import numpy as np
 from ingenialink.enums.register import RegCyclicType, RegDtype
+from ingenialink.register import Register
+from ingenialink.servo import Servo
+from numpy.typing import NDArray
 
+from ingeniamotion._utils import reg_dtype_to_numpy
 from ingeniamotion.enums import (
     MonitoringProcessStage,
     MonitoringSoCConfig,
@@ -16,10 +24,31 @@ from ingeniamotion.enums import (
 )
 from ingeniamotion.exceptions import IMMonitoringError
 from ingeniamotion.metaclass import DEFAULT_AXIS, DEFAULT_SERVO
+from ingeniamotion.monitoring.monitoring_data import MonitoringData, monitoring_metadata
+from ingeniamotion.process_data.sink import PDOStreamReader, PDOStreamSink
 
 if TYPE_CHECKING:
     from ingeniamotion.motion_controller import MotionController
 
+_T = TypeVar("_T")
+
+
+def _next_poll(polls: Generator[float, None, _T]) -> tuple[bool, Any]:
+    """Run the next poll of a polling generator.
+
+    Args:
+        polls: polling generator.
+
+    Returns:
+        ``(False, poll_interval)`` after a poll, or ``(True, result)`` once the polling
+        generator finishes.
+
+    """
+    try:
+        return False, next(polls)
+    except StopIteration as stop:
+        return True, stop.value
+
 
 def check_monitoring_disabled(func: Callable[..., None]) -> Callable[..., None]:
     """Decorator that checks if monitoring is disabled before calling a function.
@@ -54,6 +83,11 @@ class Monitoring(ABC):
     REGISTER_MAP_OFFSET = 0x800
     ESTIMATED_MAX_TIME_FOR_SAMPLE = 0.003
 
+    DEFAULT_MIN_POLL_INTERVAL = 0.001
+    DEFAULT_MAX_POLL_INTERVAL = 0.1
+    DEFAULT_POLL_WINDOW_FRACTION = 0.1
+    POLL_BACKOFF_FACTOR = 2
+
     _data_type_size = {
         RegDtype.U8: 1,
         RegDtype.S8: 1,
@@ -88,6 +122,11 @@ class Monitoring(ABC):
         self.max_sample_number = mc.capture.monitoring_max_sample_size(servo)
         self.data = None
         self._version: Optional[MonitoringVersion] = None
+        self.__min_poll_interval = self.DEFAULT_MIN_POLL_INTERVAL
+        self.__max_poll_interval = self.DEFAULT_MAX_POLL_INTERVAL
+        self.__poll_window_fraction = self.DEFAULT_POLL_WINDOW_FRACTION
+        self.__use_register_updates = False
+        self.__poll_event = threading.Event()
 
     @check_monitoring_disabled
     def set_frequency(self, prescaler: int) -> None:
@@ -108,13 +147,29 @@ class Monitoring(ABC):
         """
         if prescaler < 1:
             raise ValueError("prescaler must be 1 or higher")
-        position_velocity_loop_rate = self.mc.configuration.get_position_and_velocity_loop_rate(
-            servo=self.servo, axis=DEFAULT_AXIS
-        )
-        self.sampling_freq = round(position_velocity_loop_rate / prescaler, 2)
-        self.mc.communication.set_register(
-            self.MONITORING_FREQUENCY_DIVIDER_REGISTER, prescaler, servo=self.servo, axis=0
-        )
+        config_cache = self.mc.capture._get_monitoring_config_cache(self.servo)
+        if config_cache.position_velocity_loop_rate is None:
+            config_cache.position_velocity_loop_rate = (
+                self.mc.configuration.get_position_and_velocity_loop_rate(
+                    servo=self.servo, axis=DEFAULT_AXIS
+                )
+            )
+        self.sampling_freq = round(config_cache.position_velocity_loop_rate / prescaler, 2)
+        self._set_config_register(self.MONITORING_FREQUENCY_DIVIDER_REGISTER, prescaler)
+
+    def _set_config_register(self, register: str, value: Union[int, float]) -> None:
+        """Write a monitoring configuration register, unless it already has that value.
+
+        Args:
+            register: register UID, of axis ``0``.
+            value: register value.
+
+        """
+        config_cache = self.mc.capture._get_monitoring_config_cache(self.servo)
+        if config_cache.has_value(register, value):
+            return
+        self.mc.communication.set_register(register, value, servo=self.servo, axis=0)
+        config_cache.set_value(register, value)
 
     def __set_registers_dtype(
         self, registers: list[dict[str, Union[int, str, RegDtype]]]
@@ -175,13 +230,12 @@ class Monitoring(ABC):
 
         """
         drive = self.mc.servos[self.servo]
-        drive.monitoring_remove_all_mapped_registers()
         registers = self.__set_registers_dtype(registers=registers)
         self._check_buffer_size_is_enough(
             self.samples_number, self.trigger_delay_samples, registers
         )
-
-        for ch_idx, channel in enumerate(registers):
+        mapping = []
+        for channel in registers:
             subnode = channel.get("axis", DEFAULT_AXIS)
             if not isinstance(subnode, int):
                 raise TypeError("Subnode has to be an integer")
@@ -190,9 +244,16 @@ class Monitoring(ABC):
                 raise TypeError("Register has to be a string")
             if not isinstance(channel["dtype"], RegDtype):
                 raise TypeError("dtype has to be of type RegDtype")
-            dtype = channel["dtype"]
+            mapping.append((register, subnode, self._data_type_size[channel["dtype"]]))
+        config_cache = self.mc.capture._get_monitoring_config_cache(self.servo)
+        if config_cache.mapping == mapping:
+            self.mapped_registers = registers
+            return
+
+        drive.monitoring_remove_all_mapped_registers()
+        for ch_idx, (register, subnode, size) in enumerate(mapping):
             drive.monitoring_set_mapped_register(
-                channel=ch_idx, uid=register, size=self._data_type_size[dtype], axis=subnode
+                channel=ch_idx, uid=register, size=size, axis=subnode
             )
 
         num_mon_reg = self.mc.communication.get_register(
@@ -202,6 +263,7 @@ class Monitoring(ABC):
             raise TypeError("Number of mapped registers value has to be an integer")
         if num_mon_reg < 1:
             raise IMMonitoringError("Map Monitoring registers fails")
+        config_cache.mapping = mapping
         self.mapped_registers = registers
 
     @abstractmethod
@@ -348,10 +410,12 @@ class Monitoring(ABC):
         self,
         current_len: int,
         progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]],
+        monitoring_status: int,
     ) -> None:
-        process_stage = self.mc.capture.get_monitoring_process_stage(
-            servo=self.servo, version=self._version
-        )
+        if self._version is None:
+            raise TypeError("Monitoring version has to be set")
+        mask = self.mc.capture.MONITORING_STATUS_PROCESS_STAGE_BITS[self._version]
+        process_stage = MonitoringProcessStage(monitoring_status & mask)
         current_progress = current_len / self.samples_number
         if process_stage in [
             MonitoringProcessStage.DATA_ACQUISITION,
@@ -366,8 +430,98 @@ class Monitoring(ABC):
         pass
 
     @abstractmethod
-    def _check_data_is_ready(self) -> bool:
-        pass
+    def _check_data_is_ready(self, monitoring_status: int) -> bool:
+        """Check if there is monitoring data to be read.
+
+        Args:
+            monitoring_status: last value of the monitoring status register.
+
+        Returns:
+            True if there is data to be read, False otherwise.
+
+        """
+
+    def configure_readiness_polling(
+        self,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        window_fraction: float = DEFAULT_POLL_WINDOW_FRACTION,
+        use_register_updates: bool = False,
+    ) -> None:
+        """Configure how the drive is polled while waiting for monitoring data.
+
+        Each poll reads the monitoring status register once. While there is no data, the
+        interval between polls starts at ``min_interval`` and is doubled after each poll, up
+        to a fraction of the monitoring window duration, bounded by ``min_interval`` and
+        ``max_interval``. It goes back to ``min_interval`` as soon as there is data.
+
+        If ``use_register_updates`` is True, the wait between polls ends as soon as any
+        read of the monitoring status register (e.g. by another thread) reports an
+        available frame.
+
+        Args:
+            min_interval: minimum time between polls, in seconds. ``0.001`` by default.
+            max_interval: maximum time between polls, in seconds. ``0.1`` by default.
+            window_fraction: fraction of the monitoring window duration that the time
+                between polls can reach. ``0.1`` by default.
+            use_register_updates: True to subscribe to the monitoring status register
+                updates while waiting. ``False`` by default.
+
+        Raises:
+            ValueError: If the intervals are negative, or the minimum interval is higher
+                than the maximum interval.
+
+        """
+        if min_interval < 0 or max_interval < min_interval:
+            raise ValueError(
+                "The poll intervals have to be positive, and the minimum interval can not be"
+                " higher than the maximum interval."
+            )
+        self.__min_poll_interval = min_interval
+        self.__max_poll_interval = max_interval
+        self.__poll_window_fraction = window_fraction
+        self.__use_register_updates = use_register_updates
+
+    def _max_poll_interval(self) -> float:
+        """Get the maximum time between polls for the configured monitoring window.
+
+        Returns:
+            Maximum time between polls, in seconds.
+
+        """
+        if not self.sampling_freq or not self.samples_number:
+            return self.__max_poll_interval
+        window_duration = self.samples_number / self.sampling_freq
+        return min(
+            max(window_duration * self.__poll_window_fraction, self.__min_poll_interval),
+            self.__max_poll_interval,
+        )
+
+    def _status_register_update_callback(
+        self,
+        alias: str,
+        servo: Servo,  # noqa: ARG002
+        register: Register,
+        value: Union[int, float, str, bytes],
+    ) -> None:
+        """Wake the readiness polling when a monitoring status read reports a frame.
+
+        Args:
+            alias: servo alias.
+            servo: servo instance.
+            register: read or written register.
+            value: register value.
+
+        """
+        if (
+            alias != self.servo
+            or register.identifier != self.mc.capture.MONITORING_STATUS_REGISTER
+            or not isinstance(value, int)
+            or self._version is None
+        ):
+            return
+        if value & self.mc.capture.MONITORING_AVAILABLE_FRAME_BIT[self._version]:
+            self.__poll_event.set()
 
     def read_monitoring_data(
         self,
@@ -387,28 +541,468 @@ class Monitoring(ABC):
         Returns:
             Data of monitoring. Each element of the list is a different register data.
 
+        """
+        drive = self.mc.servos[self.servo]
+        data_array: list[list[Union[int, float]]] = [[] for _ in self.mapped_registers]
+
+        def read_frame() -> int:
+            drive.monitoring_read_data()
+            self._fill_data(data_array)
+            return len(data_array[0])
+
+        self._read_monitoring_frames(read_frame, timeout, progress_callback)
+        return data_array
+
+    def read_monitoring_data_as_arrays(
+        self,
+        timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]] = None,
+    ) -> MonitoringData:
+        """Blocking function that read the monitoring data into NumPy arrays.
+
+        An array with the data type of each mapped register is allocated for the configured
+        number of samples, and the samples of each frame are copied into them as they are read.
+
+        Args:
+            timeout : maximum time trigger is waited, in seconds.
+                ``None`` by default.
+            progress_callback : callback with progress.
+
+        Raises:
+            IMMonitoringError: If monitoring is disabled.
+            TypeError: If the sampling frequency is not set.
+
+        Returns:
+            Data of monitoring, with the time of each sample relative to the trigger. If the
+            read process finishes early, the arrays only hold the read samples.
+
+        """
+        monitoring_data, _ = self._read_monitoring_arrays(timeout, progress_callback)
+        return monitoring_data
+
+    def _read_monitoring_arrays(
+        self,
+        timeout: Optional[float],
+        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]],
+    ) -> tuple[MonitoringData, Optional[float]]:
+        """Read the monitoring data into NumPy arrays.
+
+        Args:
+            timeout: maximum time trigger is waited, in seconds.
+            progress_callback: callback with progress.
+
+        Returns:
+            Data of monitoring and the time at which the data was found ready, or ``None`` if
+            no data was read.
+
+        """
+        return self._run_polls(self._poll_monitoring_arrays(timeout, progress_callback))
+
+    def _poll_monitoring_arrays(
+        self,
+        timeout: Optional[float],
+        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]],
+    ) -> Generator[float, None, tuple[MonitoringData, Optional[float]]]:
+        """Poll the drive and read the monitoring data into NumPy arrays.
+
+        Args:
+            timeout: maximum time trigger is waited, in seconds.
+            progress_callback: callback with progress.
+
+        Yields:
+            Time to wait before the next poll, in seconds.
+
+        Raises:
+            TypeError: If the sampling frequency is not set.
+
+        Returns:
+            Data of monitoring and the time at which the data was found ready, or ``None`` if
+            no data was read.
+
+        """
+        if self.sampling_freq is None:
+            raise TypeError("Sampling frequency has to be set before reading the monitoring data")
+        frame_dtype = self._frame_dtype()
+        channels = [
+            np.empty(self.samples_number, dtype=frame_dtype[index])
+            for index in range(len(self.mapped_registers))
+        ]
+        current_len = 0
+
+        def read_frame() -> int:
+            nonlocal current_len
+            current_len = self._read_frame_into_arrays(frame_dtype, channels, current_len)
+            return current_len
+
+        ready_time = yield from self._poll_monitoring_frames(read_frame, timeout, progress_callback)
+        monitoring_data = MonitoringData(
+            mapped_registers=list(self.mapped_registers),
+            time=(np.arange(current_len) - self.trigger_delay_samples) / self.sampling_freq,
+            channels=[channel[:current_len] for channel in channels],
+            sampling_freq=self.sampling_freq,
+            trigger_delay_samples=self.trigger_delay_samples,
+            units=self._channel_units(),
+        )
+        return monitoring_data, ready_time
+
+    def read_monitoring_data_to_file(
+        self,
+        directory: Union[str, Path],
+        timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]] = None,
+    ) -> PDOStreamReader:
+        """Blocking function that streams the monitoring data to a directory.
+
+        Each frame is written to disk while the next one is read from the drive, so the
+        capture is never held in memory as a whole. The files have the format of
+        :class:`~ingeniamotion.process_data.sink.PDOStreamSink`, with the time of each sample
+        relative to the trigger as its timestamp, the sample index as its cycle count and the
+        monitoring metadata (sampling frequency, trigger position and the name, axis, data
+        type and units of each register). They can be read lazily with the returned reader,
+        or as a :class:`MonitoringData` with :meth:`MonitoringData.load`.
+
+        Args:
+            directory: directory where the files are written. The files of a previous
+                capture in the directory are replaced.
+            timeout : maximum time trigger is waited, in seconds.
+                ``None`` by default.
+            progress_callback : callback with progress.
+
+        Raises:
+            IMMonitoringError: If monitoring is disabled.
+            TypeError: If the sampling frequency is not set.
+
+        Returns:
+            Reader of the written files.
+
+        """
+        if self.sampling_freq is None:
+            raise TypeError("Sampling frequency has to be set before reading the monitoring data")
+        sampling_freq = self.sampling_freq
+        frame_dtype = self._frame_dtype()
+        sink = PDOStreamSink(
+            directory,
+            metadata=monitoring_metadata(
+                list(self.mapped_registers),
+                sampling_freq,
+                self.trigger_delay_samples,
+                self._channel_units(),
+            ),
+        )
+        sink.open(
+            [str(register["name"]) for register in self.mapped_registers],
+            [frame_dtype[index] for index in range(len(self.mapped_registers))],
+        )
+        current_len = 0
+
+        def read_frame() -> int:
+            nonlocal current_len
+            samples = self._read_frame_samples(frame_dtype, self.samples_number - current_len)
+            if len(samples) > 0:
+                sample_indexes = np.arange(current_len, current_len + len(samples))
+                sink.put(
+                    (sample_indexes - self.trigger_delay_samples) / sampling_freq,
+                    [samples[f"channel_{index}"] for index in range(len(self.mapped_registers))],
+                    block=True,
+                    cycle_counts=sample_indexes.astype(np.uint64),
+                )
+            current_len += len(samples)
+            return current_len
+
+        try:
+            self._read_monitoring_frames(read_frame, timeout, progress_callback)
+        finally:
+            sink.close()
+        return PDOStreamReader(directory)
+
+    def _channel_units(self) -> list[Optional[str]]:
+        """Get the units of the mapped registers.
+
+        Raises:
+            TypeError: If the axis of some mapped register is not an integer.
+
+        Returns:
+            The units of each mapped register, ``None`` if unknown.
+
+        """
+        units = []
+        for channel in self.mapped_registers:
+            axis = channel.get("axis", DEFAULT_AXIS)
+            if not isinstance(axis, int):
+                raise TypeError("Subnode has to be an integer")
+            register = self.mc.info.register_info(str(channel["name"]), axis, servo=self.servo)
+            units.append(register.units)
+        return units
+
+    async def read_monitoring_data_async(
+        self,
+        timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]] = None,
+    ) -> MonitoringData:
+        """Read the monitoring data without blocking the event loop.
+
+        Same as :meth:`read_monitoring_data_as_arrays`, but the drive is polled in the default
+        executor of the event loop and the waits between polls are ``asyncio`` sleeps, so
+        several captures can be gathered:
+
+        .. code-block:: python
+
+            results = await asyncio.gather(
+                *(monitoring.read_monitoring_data_async() for monitoring in monitorings)
+            )
+
+        If the task is cancelled, the read process is stopped once the poll in progress, if
+        any, finishes.
+
+        Args:
+            timeout : maximum time trigger is waited, in seconds.
+                ``None`` by default.
+            progress_callback : callback with progress. It is called from the executor.
+
+        Raises:
+            IMMonitoringError: If monitoring is disabled.
+            TypeError: If the sampling frequency is not set.
+
+        Returns:
+            Data of monitoring, with the time of each sample relative to the trigger.
+
+        """
+        monitoring_data, _ = await self._run_polls_async(
+            self._poll_monitoring_arrays(timeout, progress_callback)
+        )
+        return monitoring_data
+
+    def _read_monitoring_frames(
+        self,
+        read_frame: Callable[[], int],
+        timeout: Optional[float],
+        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]],
+    ) -> Optional[float]:
+        """Read monitoring frames until the read process is finished.
+
+        Args:
+            read_frame: function that reads the available frame and returns the number of
+                samples read so far.
+            timeout: maximum time trigger is waited, in seconds.
+            progress_callback: callback with progress.
+
+        Returns:
+            Time at which the data was found ready, or ``None`` if no data was read.
+
+        """
+        return self._run_polls(self._poll_monitoring_frames(read_frame, timeout, progress_callback))
+
+    def _poll_monitoring_frames(
+        self,
+        read_frame: Callable[[], int],
+        timeout: Optional[float],
+        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]],
+    ) -> Generator[float, None, Optional[float]]:
+        """Poll the drive and read the monitoring frames until the read process is finished.
+
+        Each iteration polls the drive once. The waits between polls are left to the caller,
+        so the same polling serves the blocking and the ``asyncio`` readers.
+
+        Args:
+            read_frame: function that reads the available frame and returns the number of
+                samples read so far.
+            timeout: maximum time trigger is waited, in seconds.
+            progress_callback: callback with progress.
+
+        Yields:
+            Time to wait before the next poll, in seconds.
+
+        Raises:
+            IMMonitoringError: If monitoring is disabled.
+
+        Returns:
+            Time at which the data was found ready, or ``None`` if no data was read.
+
         """
         if not self.mc.capture.is_monitoring_enabled(servo=self.servo):
             raise IMMonitoringError("Cannot read monitoring data. Monitoring is disabled.")
-        drive = self.mc.servos[self.servo]
         self._read_process_finished = False
         is_ready, result_text = self._check_monitoring_is_ready()
-        data_array: list[list[Union[int, float]]] = [[] for _ in self.mapped_registers]
         self.logger.debug("Waiting for data")
         init_read_time, init_time = None, time.time()
         current_len = 0
+        max_poll_interval = self._max_poll_interval()
+        poll_interval = self.__min_poll_interval
+        if self.__use_register_updates:
+            self.mc.communication.subscribe_register_update(
+                self._status_register_update_callback, servo=self.servo
+            )
+        try:
+            while not self._read_process_finished:
+                monitoring_status = self.mc.capture.get_monitoring_status(servo=self.servo)
+                data_is_ready = self._check_data_is_ready(monitoring_status)
+                if data_is_ready:
+                    init_read_time = init_read_time or time.time()
+                    current_len = read_frame()
+                    poll_interval = self.__min_poll_interval
+                elif not is_ready:
+                    self.logger.warning(result_text)
+                    self._read_process_finished = True
+                self._update_read_process_finished(init_read_time, current_len, init_time, timeout)
+                self._show_current_process(current_len, progress_callback, monitoring_status)
+                if not data_is_ready and not self._read_process_finished:
+                    yield poll_interval
+                    poll_interval = min(poll_interval * self.POLL_BACKOFF_FACTOR, max_poll_interval)
+        finally:
+            if self.__use_register_updates:
+                self.mc.communication.unsubscribe_register_update(
+                    self._status_register_update_callback, servo=self.servo
+                )
+        return init_read_time
+
+    def _poll_data_ready(self, timeout: Optional[float]) -> Generator[float, None, Optional[float]]:
+        """Poll the drive until there is monitoring data to be read, without reading it.
+
+        It lets the caller wait for the data of several servos at once and read it afterwards.
+
+        Args:
+            timeout: maximum time trigger is waited, in seconds.
+
+        Yields:
+            Time to wait before the next poll, in seconds.
+
+        Raises:
+            IMMonitoringError: If monitoring is disabled.
+
+        Returns:
+            Time at which the data was found ready, or ``None`` if the trigger was not reached
+            or the read process was stopped.
+
+        """
+        if not self.mc.capture.is_monitoring_enabled(servo=self.servo):
+            raise IMMonitoringError("Cannot read monitoring data. Monitoring is disabled.")
+        self._read_process_finished = False
+        is_ready, result_text = self._check_monitoring_is_ready()
+        init_time = time.time()
+        max_poll_interval = self._max_poll_interval()
+        poll_interval = self.__min_poll_interval
         while not self._read_process_finished:
-            if self._check_data_is_ready():
-                init_read_time = init_read_time or time.time()
-                drive.monitoring_read_data()
-                self._fill_data(data_array)
-                current_len = len(data_array[0])
-            elif not is_ready:
+            monitoring_status = self.mc.capture.get_monitoring_status(servo=self.servo)
+            if self._check_data_is_ready(monitoring_status):
+                return time.time()
+            if not is_ready:
                 self.logger.warning(result_text)
-                self._read_process_finished = True
-            self._update_read_process_finished(init_read_time, current_len, init_time, timeout)
-            self._show_current_process(current_len, progress_callback)
-        return data_array
+                return None
+            self._check_trigger_timeout(init_time, timeout)
+            if not self._read_process_finished:
+                yield poll_interval
+                poll_interval = min(poll_interval * self.POLL_BACKOFF_FACTOR, max_poll_interval)
+        return None
+
+    def _run_polls(self, polls: Generator[float, None, _T]) -> _T:
+        """Run a polling generator, blocking the calling thread between polls.
+
+        Args:
+            polls: polling generator.
+
+        Returns:
+            The result of the polling.
+
+        """
+        self.__poll_event.clear()
+        while True:
+            is_finished, value = _next_poll(polls)
+            if is_finished:
+                result: _T = value
+                return result
+            self.__poll_event.wait(value)
+            self.__poll_event.clear()
+
+    async def _run_polls_async(self, polls: Generator[float, None, _T]) -> _T:
+        """Run a polling generator in the default executor, sleeping between polls.
+
+        Args:
+            polls: polling generator.
+
+        Raises:
+            CancelledError: If the task is cancelled. The polling is stopped.
+
+        Returns:
+            The result of the polling.
+
+        """
+        loop = asyncio.get_running_loop()
+        poll: Optional[asyncio.Future[tuple[bool, Any]]] = None
+        try:
+            while True:
+                poll = loop.run_in_executor(None, _next_poll, polls)
+                is_finished, value = await asyncio.shield(poll)
+                if is_finished:
+                    result: _T = value
+                    return result
+                await asyncio.sleep(value)
+        except asyncio.CancelledError:
+            self.stop_reading_data()
+            # A generator can not be closed while it runs in the executor
+            if poll is not None and not poll.done():
+                poll.add_done_callback(lambda _: polls.close())
+            else:
+                polls.close()
+            raise
+
+    def _frame_dtype(self) -> np.dtype[Any]:
+        """Get the structured data type of a monitoring sample.
+
+        Returns:
+            A data type with a field for each mapped register.
+
+        Raises:
+            TypeError: If some mapped register dtype has a wrong type.
+
+        """
+        fields: list[tuple[str, np.dtype[Any]]] = []
+        for channel in self.mapped_registers:
+            dtype = channel["dtype"]
+            if not isinstance(dtype, RegDtype):
+                raise TypeError("dtype has to be of type RegDtype")
+            fields.append((f"channel_{len(fields)}", reg_dtype_to_numpy(dtype)))
+        return np.dtype(fields)
+
+    def _read_frame_into_arrays(
+        self, frame_dtype: np.dtype[Any], channels: list[NDArray[Any]], current_len: int
+    ) -> int:
+        """Read the available monitoring frame and decode it into the channel arrays.
+
+        Args:
+            frame_dtype: structured data type of a monitoring sample.
+            channels: array of each channel.
+            current_len: number of samples already stored in the arrays.
+
+        Returns:
+            Number of samples stored in the arrays.
+
+        """
+        samples = self._read_frame_samples(frame_dtype, self.samples_number - current_len)
+        for index, channel in enumerate(channels):
+            channel[current_len : current_len + len(samples)] = samples[f"channel_{index}"]
+        return current_len + len(samples)
+
+    def _read_frame_samples(self, frame_dtype: np.dtype[Any], max_samples: int) -> NDArray[Any]:
+        """Read the available monitoring frame and store its samples in an array.
+
+        Args:
+            frame_dtype: structured data type of a monitoring sample.
+            max_samples: maximum number of samples to store. The rest are discarded.
+
+        Returns:
+            A structured array with a sample of the frame on each element.
+
+        """
+        drive = self.mc.servos[self.servo]
+        drive.monitoring_read_data()
+        channels_data = [
+            drive.monitoring_channel_data(index) for index in range(len(self.mapped_registers))
+        ]
+        number_samples = min((len(data) for data in channels_data), default=0)
+        samples = np.empty(min(number_samples, max(max_samples, 0)), dtype=frame_dtype)
+        for index, data in enumerate(channels_data):
+            samples[f"channel_{index}"] = data[: len(samples)]
+        return samples
 
     def _fill_data(self, data_array: list[list[Union[int, float]]]) -> None:
         drive = self.mc.servos[self.servo]
@@ -419,6 +1013,7 @@ class Monitoring(ABC):
     def stop_reading_data(self) -> None:
         """Stops read_monitoring_data function."""
         self._read_process_finished = True
+        self.__poll_event.set()
 
     @abstractmethod
     def rearm_monitoring(self) -> None:
@@ -496,14 +1091,59 @@ class Monitoring(ABC):
             and final_time > time.time()
             and mon_process_stage != MonitoringProcessStage.WAITING_FOR_TRIGGER
         ):
-            mon_process_stage = self.mc.capture.get_monitoring_process_stage(
-                servo=self.servo, version=self._version
-            )
-            self.mc.communication.set_register(
-                self.MONITORING_FORCE_TRIGGER_REGISTER, 1, servo=self.servo, axis=0
-            )
+            mon_process_stage = self._force_trigger()
         return mon_process_stage >= MonitoringProcessStage.WAITING_FOR_TRIGGER
 
+    async def raise_forced_trigger_async(self, blocking: bool = False, timeout: float = 5) -> bool:
+        """Raise trigger for Forced Trigger type without blocking the event loop.
+
+        Same as :meth:`raise_forced_trigger`, but the drive is accessed in the default executor
+        of the event loop, with an ``asyncio`` sleep of the minimum poll interval between tries.
+        See :meth:`configure_readiness_polling`.
+
+        Args:
+            blocking : if ``True``, functions wait until trigger is forced
+                (or until the timeout) If ``False``, function try to raise the
+                trigger only once.
+            timeout : blocking timeout in seconds. ``5`` by default.
+
+        Raises:
+            IMMonitoringError: If monitoring trigger type is not Forced Trigger.
+
+        Returns:
+            Return ``True`` if trigger is raised, else ``False``.
+
+        """
+        loop = asyncio.get_running_loop()
+        trigger_mode = await loop.run_in_executor(None, self.get_trigger_type)
+        if trigger_mode != MonitoringSoCType.TRIGGER_EVENT_FORCED:
+            raise IMMonitoringError("Monitoring trigger type is not Forced Trigger")
+        final_time = time.time() + timeout
+        mon_process_stage = await loop.run_in_executor(None, self._force_trigger)
+        while (
+            blocking
+            and final_time > time.time()
+            and mon_process_stage != MonitoringProcessStage.WAITING_FOR_TRIGGER
+        ):
+            await asyncio.sleep(self.__min_poll_interval)
+            mon_process_stage = await loop.run_in_executor(None, self._force_trigger)
+        return mon_process_stage >= MonitoringProcessStage.WAITING_FOR_TRIGGER
+
+    def _force_trigger(self) -> MonitoringProcessStage:
+        """Read the monitoring process stage and force the trigger.
+
+        Returns:
+            Monitoring process stage before forcing the trigger.
+
+        """
+        mon_process_stage = self.mc.capture.get_monitoring_process_stage(
+            servo=self.servo, version=self._version
+        )
+        self.mc.communication.set_register(
+            self.MONITORING_FORCE_TRIGGER_REGISTER, 1, servo=self.servo, axis=0
+        )
+        return mon_process_stage
+
     def read_monitoring_data_forced_trigger(
         self, trigger_timeout: float = 5
     ) -> list[list[Union[int, float]]]:
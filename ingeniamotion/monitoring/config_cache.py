@@ -0,0 +1,106 @@
+import re
+from typing import TYPE_CHECKING, Optional, Union
+
+from ingenialink.register import Register
+from ingenialink.servo import Servo
+
+if TYPE_CHECKING:
+    from ingeniamotion.enums import MonitoringVersion
+
+# Registers that map each monitoring channel, e.g. MON_CFG_REG0_MAP. From the tenth channel on,
+# the dictionaries name them MON_CFG_REFG<channel>_MAP.
+MAPPING_REGISTER_PATTERN = re.compile(r"MON_CFG_REF?G\d+_MAP")
+
+
+class MonitoringConfigCache:
+    """Last monitoring configuration of a servo, to skip the writes that do not change it.
+
+    The cache keeps the monitoring version, the position and velocity loop rate, the mapped
+    registers and the value of the configuration registers written through it. It is
+    subscribed to the register updates of the drive, so the cached values follow any other
+    read or write of those registers, and the cached mapping is discarded as soon as the
+    number of mapped registers or the value of a mapping register changes.
+
+    Args:
+        drive: servo instance.
+
+    """
+
+    def __init__(self, drive: Servo) -> None:
+        self.drive = drive
+        self.version: Optional[MonitoringVersion] = None
+        self.position_velocity_loop_rate: Optional[float] = None
+        self.mapping: Optional[list[tuple[str, int, int]]] = None
+        """Name, axis and size of the mapped registers. ``None`` if unknown."""
+        self.__registers: dict[str, Union[int, float, str, bytes]] = {}
+        self.__mapping_registers: dict[str, Union[int, float, str, bytes]] = {}
+        self.__is_subscribed = True
+        drive.register_update_subscribe(self._register_update_callback)
+
+    def has_value(self, register: str, value: Union[int, float]) -> bool:
+        """Check if a configuration register is known to have a value.
+
+        Args:
+            register: register UID, of axis ``0``.
+            value: register value.
+
+        Returns:
+            True if the last value read or written is the same, False otherwise.
+
+        """
+        return register in self.__registers and self.__registers[register] == value
+
+    def set_value(self, register: str, value: Union[int, float]) -> None:
+        """Store the value written to a configuration register.
+
+        Args:
+            register: register UID, of axis ``0``.
+            value: register value.
+
+        """
+        self.__registers[register] = value
+
+    def clear(self) -> None:
+        """Discard the cached configuration and unsubscribe from the drive."""
+        self.version = None
+        self.position_velocity_loop_rate = None
+        self.mapping = None
+        self.__registers.clear()
+        self.__mapping_registers.clear()
+        if self.__is_subscribed:
+            self.drive.register_update_unsubscribe(self._register_update_callback)
+            self.__is_subscribed = False
+
+    def _register_update_callback(
+        self,
+        servo: Servo,  # noqa: ARG002
+        register: Register,
+        value: Union[int, float, str, bytes],
+    ) -> None:
+        """Follow the updates of the cached registers.
+
+        Args:
+            servo: servo instance.
+            register: read or written register.
+            value: register value.
+
+        """
+        if register.subnode != 0:
+            return
+        identifier = register.identifier
+        if identifier == self.drive.MONITORING_NUMBER_MAPPED_REGISTERS:
+            if self.mapping is not None and value != len(self.mapping):
+                self.mapping = None
+        elif identifier in (
+            self.drive.MONITORING_REMOVE_REGISTERS_OLD,
+            self.drive.MONITORING_ADD_REGISTERS_OLD,
+        ):
+            self.mapping = None
+        elif identifier is not None and MAPPING_REGISTER_PATTERN.fullmatch(identifier):
+            # The values are tracked even while the mapping is unknown, so the mapping written
+            # afterwards is only discarded if they change
+            if self.__mapping_registers.get(identifier) != value:
+                self.mapping = None
+            self.__mapping_registers[identifier] = value
+        elif identifier in self.__registers:
+            self.__registers[identifier] = value
@@ -0,0 +1,184 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+from ingenialink.enums.register import RegDtype
+from numpy.typing import NDArray
+
+from ingeniamotion.metaclass import DEFAULT_AXIS
+from ingeniamotion.process_data.sink import TIMESTAMP_FIELD, PDOStreamReader, PDOStreamSink
+
+# Key of the monitoring metadata in the metadata of the capture files
+MONITORING_METADATA_KEY = "monitoring"
+
+
+@dataclass(frozen=True)
+class MonitoringData:
+    """Monitoring capture, with an array of samples for each mapped register."""
+
+    mapped_registers: list[dict[str, Union[int, str, RegDtype]]]
+    """Mapped registers, with their ``name``, ``axis`` and ``dtype``."""
+    time: NDArray[np.float64]
+    """Time of each sample relative to the trigger, in seconds."""
+    channels: list[NDArray[Any]]
+    """An array of samples for each mapped register, with the data type of the register."""
+    sampling_freq: float
+    """Monitoring sampling frequency, in Hz."""
+    trigger_delay_samples: int
+    """Number of samples before the trigger."""
+    units: list[Optional[str]] = field(default_factory=list)
+    """Units of each mapped register, ``None`` if unknown."""
+
+    def __len__(self) -> int:
+        """Get the number of samples.
+
+        Returns:
+            The number of samples of each channel.
+        """
+        return len(self.time)
+
+    def channel(self, name: str, axis: int = DEFAULT_AXIS) -> NDArray[Any]:
+        """Get the samples of a mapped register.
+
+        Args:
+            name: register name.
+            axis: register axis. ``1`` by default.
+
+        Returns:
+            The samples of the register.
+
+        Raises:
+            ValueError: If the register is not mapped.
+        """
+        for register, channel in zip(self.mapped_registers, self.channels):
+            if register["name"] == name and register.get("axis", DEFAULT_AXIS) == axis:
+                return channel
+        raise ValueError(f"Register {name} of axis {axis} is not mapped.")
+
+    def metadata(self) -> dict[str, Any]:
+        """Get the metadata of the capture, as stored in the capture files.
+
+        Returns:
+            The sampling frequency, the trigger position and the name, axis, data type and
+            units of each mapped register.
+        """
+        return monitoring_metadata(
+            self.mapped_registers, self.sampling_freq, self.trigger_delay_samples, self.units
+        )
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Write the capture to a directory, in the format of :class:`PDOStreamSink`.
+
+        The time of each sample is stored as its timestamp and the sample index as its cycle
+        count. The capture can be read back with :meth:`load`.
+
+        Args:
+            directory: directory where the files are written. The files of a previous
+                capture in the directory are replaced.
+        """
+        sink = PDOStreamSink(directory, chunk_size=max(len(self), 1), metadata=self.metadata())
+        sink.open(
+            [str(register["name"]) for register in self.mapped_registers],
+            [channel.dtype for channel in self.channels],
+        )
+        sink.put(
+            self.time,
+            self.channels,
+            block=True,
+            cycle_counts=np.arange(len(self), dtype=np.uint64),
+        )
+        sink.close()
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> "MonitoringData":
+        """Read a capture from a directory.
+
+        The capture can be written by :meth:`save` or streamed by
+        :meth:`~ingeniamotion.monitoring.base_monitoring.Monitoring.read_monitoring_data_to_file`.
+        If the capture is stored in a single chunk, the arrays are memory-mapped, so the
+        samples are only read from disk when they are accessed.
+
+        Args:
+            directory: directory of the capture files.
+
+        Returns:
+            The capture.
+
+        Raises:
+            ValueError: If the directory does not contain a monitoring capture.
+        """
+        reader = PDOStreamReader(directory)
+        metadata = reader.metadata.get(MONITORING_METADATA_KEY)
+        if metadata is None:
+            raise ValueError(f"There is no monitoring capture in {reader.directory}.")
+        if len(reader) == 1:
+            chunk = reader.chunk(0)
+            time = chunk[TIMESTAMP_FIELD]
+            channels = [chunk[f"channel_{index}"] for index in range(len(reader.channel_names))]
+        else:
+            time = reader.timestamps()
+            channels = [reader.channel(index) for index in range(len(reader.channel_names))]
+        return cls(
+            mapped_registers=[
+                {
+                    "name": register["name"],
+                    "axis": register["axis"],
+                    "dtype": RegDtype[register["dtype"]],
+                }
+                for register in metadata["registers"]
+            ],
+            time=time,
+            channels=channels,
+            sampling_freq=metadata["sampling_freq"],
+            trigger_delay_samples=metadata["trigger_delay_samples"],
+            units=[register["units"] for register in metadata["registers"]],
+        )
+
+
+def monitoring_metadata(
+    mapped_registers: list[dict[str, Union[int, str, RegDtype]]],
+    sampling_freq: float,
+    trigger_delay_samples: int,
+    units: list[Optional[str]],
+) -> dict[str, Any]:
+    """Get the metadata of a monitoring capture, to store it in the capture files.
+
+    Args:
+        mapped_registers: mapped registers, with their ``name``, ``axis`` and ``dtype``.
+        sampling_freq: monitoring sampling frequency, in Hz.
+        trigger_delay_samples: number of samples before the trigger.
+        units: units of each mapped register.
+
+    Returns:
+        The monitoring metadata, under the monitoring key.
+    """
+    registers = []
+    for index, register in enumerate(mapped_registers):
+        dtype = register["dtype"]
+        registers.append({
+            "name": register["name"],
+            "axis": register.get("axis", DEFAULT_AXIS),
+            "dtype": dtype.name if isinstance(dtype, RegDtype) else str(dtype),
+            "units": units[index] if index < len(units) else None,
+        })
+    return {
+        MONITORING_METADATA_KEY: {
+            "sampling_freq": sampling_freq,
+            "trigger_delay_samples": trigger_delay_samples,
+            "registers": registers,
+        }
+    }
+
+
+@dataclass(frozen=True)
+class MonitoringFrame:
+    """Frame of a continuous monitoring acquisition."""
+
+    sequence_number: int
+    """Position of the frame in the acquisition, starting at ``0``."""
+    dead_time: float
+    """Time between the previous frame being ready and the monitoring being rearmed for this
+    frame, in seconds. No samples are captured during this time. ``0`` for the first frame."""
+    data: MonitoringData
+    """Data of the frame."""
@@ -0,0 +1,188 @@
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import ingenialogger
+
+from ingeniamotion.monitoring.base_monitoring import Monitoring, _next_poll
+from ingeniamotion.monitoring.monitoring_data import MonitoringData
+
+if TYPE_CHECKING:
+    from ingeniamotion.motion_controller import MotionController
+
+
+@dataclass(frozen=True)
+class MonitoringGroupData:
+    """Data of a monitoring group capture."""
+
+    data: dict[str, MonitoringData]
+    """Data of each servo. The time axis of each one is relative to its own trigger."""
+    trigger_timestamps: dict[str, float]
+    """Estimated time of the trigger of each servo, in seconds since the epoch."""
+
+    def trigger_offsets(self) -> dict[str, float]:
+        """Get the trigger time of each servo relative to the earliest trigger.
+
+        Adding the offset to the time axis of a servo aligns its data with the rest of servos.
+
+        Returns:
+            The trigger offset of each servo, in seconds.
+        """
+        if not self.trigger_timestamps:
+            return {}
+        first_trigger = min(self.trigger_timestamps.values())
+        return {
+            servo: trigger_timestamp - first_trigger
+            for servo, trigger_timestamp in self.trigger_timestamps.items()
+        }
+
+
+class MonitoringGroup:
+    """Monitoring of the same event in several servos.
+
+    The servos are enabled one after another, so they are armed within a few communication
+    round trips. Their data is read concurrently, with a worker for each network, so the
+    readout takes about the time of the slowest network instead of the sum of all the servos.
+    The servos of the same network are polled together until their data is ready, so the
+    readiness of each one is seen regardless of the rest, and then they are read one after
+    another, as they share the channel.
+
+    Args:
+        mc: MotionController instance.
+        monitorings: monitoring of each servo.
+
+    Raises:
+        ValueError: If there are no monitorings.
+
+    """
+
+    def __init__(self, mc: "MotionController", monitorings: dict[str, Monitoring]) -> None:
+        if not monitorings:
+            raise ValueError("A monitoring group needs at least one servo.")
+        self.mc = mc
+        self.monitorings = monitorings
+        self.logger = ingenialogger.get_logger(__name__)
+        self.__stop_reading = threading.Event()
+
+    def enable(self) -> None:
+        """Enable the monitoring of all the servos."""
+        for servo in self.monitorings:
+            self.mc.capture.enable_monitoring(servo=servo)
+
+    def disable(self) -> None:
+        """Disable the monitoring of all the servos."""
+        for servo in self.monitorings:
+            self.mc.capture.disable_monitoring(servo=servo)
+
+    def raise_forced_trigger(self, blocking: bool = False, timeout: float = 5) -> bool:
+        """Raise the trigger of all the servos, for Forced Trigger type.
+
+        Args:
+            blocking : if ``True``, functions wait until trigger is forced
+                (or until the timeout) If ``False``, function try to raise the
+                trigger only once.
+            timeout : blocking timeout in seconds for each servo. ``5`` by default.
+
+        Returns:
+            Return ``True`` if the trigger of all the servos is raised, else ``False``.
+
+        """
+        triggers_raised = [
+            monitoring.raise_forced_trigger(blocking, timeout)
+            for monitoring in self.monitorings.values()
+        ]
+        return all(triggers_raised)
+
+    def read_monitoring_data(self, timeout: Optional[float] = None) -> MonitoringGroupData:
+        """Blocking function that reads the monitoring data of all the servos.
+
+        The trigger timestamps are estimated from the time at which the data of each servo is
+        found ready, so they are accurate to the polling interval. The data of a servo is only
+        read once all the servos of its network have their data ready or have timed out.
+
+        Args:
+            timeout : maximum time trigger is waited, in seconds. It is shared by all the
+                servos. ``None`` by default.
+
+        Returns:
+            Data of each servo, with its trigger timestamp. The servos whose trigger was not
+            reached have no trigger timestamp.
+
+        """
+        self.__stop_reading.clear()
+        servos_by_network: dict[str, list[str]] = defaultdict(list)
+        for servo in self.monitorings:
+            servos_by_network[self.mc.servo_net[servo]].append(servo)
+
+        def read_network(
+            servos: list[str],
+        ) -> list[tuple[str, MonitoringData, Optional[float]]]:
+            ready_times = self.__wait_data_ready(servos, timeout)
+            results = []
+            for servo in servos:
+                # The data is ready or the trigger timed out, so the trigger is not waited again
+                monitoring = self.monitorings[servo]
+                monitoring_data, read_time = monitoring._read_monitoring_arrays(0, None)
+                ready_time = ready_times[servo] if ready_times[servo] is not None else read_time
+                results.append((servo, monitoring_data, ready_time))
+            return results
+
+        data: dict[str, MonitoringData] = {}
+        trigger_timestamps: dict[str, float] = {}
+        with ThreadPoolExecutor(
+            max_workers=len(servos_by_network), thread_name_prefix="MonitoringGroup"
+        ) as executor:
+            futures = [
+                executor.submit(read_network, servos) for servos in servos_by_network.values()
+            ]
+            for future in futures:
+                for servo, monitoring_data, ready_time in future.result():
+                    data[servo] = monitoring_data
+                    if ready_time is None:
+                        self.logger.warning(f"No monitoring data was read from servo {servo}.")
+                        continue
+                    post_trigger_time = (
+                        len(monitoring_data) - monitoring_data.trigger_delay_samples
+                    ) / monitoring_data.sampling_freq
+                    trigger_timestamps[servo] = ready_time - post_trigger_time
+        return MonitoringGroupData(
+            data={servo: data[servo] for servo in self.monitorings},
+            trigger_timestamps=trigger_timestamps,
+        )
+
+    def __wait_data_ready(
+        self, servos: list[str], timeout: Optional[float]
+    ) -> dict[str, Optional[float]]:
+        """Poll several servos in turns until all of them have monitoring data to be read.
+
+        Args:
+            servos: servo aliases.
+            timeout: maximum time trigger is waited, in seconds.
+
+        Returns:
+            Time at which the data of each servo was found ready, or ``None`` if the trigger was
+            not reached.
+
+        """
+        polls = {servo: self.monitorings[servo]._poll_data_ready(timeout) for servo in servos}
+        ready_times: dict[str, Optional[float]] = {}
+        while polls:
+            poll_intervals = []
+            for servo, servo_polls in list(polls.items()):
+                is_finished, value = _next_poll(servo_polls)
+                if is_finished:
+                    ready_times[servo] = value
+                    del polls[servo]
+                else:
+                    poll_intervals.append(value)
+            if poll_intervals:
+                self.__stop_reading.wait(min(poll_intervals))
+        return ready_times
+
+    def stop_reading_data(self) -> None:
+        """Stops read_monitoring_data function."""
+        self.__stop_reading.set()
+        for monitoring in self.monitorings.values():
+            monitoring.stop_reading_data()
@@ -32,7 +32,7 @@ class MonitoringV1(Monitoring):
 
     def __init__(self, mc: "MotionController", servo: str = DEFAULT_SERVO) -> None:
         super().__init__(mc, servo)
-        self._version = mc.capture._check_version(servo)
+        self._version = mc.capture._get_monitoring_version(servo)
         self.logger = ingenialogger.get_logger(__name__, drive=mc.servo_name(servo))
         try:
             self.mc.capture.mcb_synchronization(servo=servo)
@@ -68,19 +68,13 @@ class MonitoringV1(Monitoring):
                 trigger_signal, trigger_value
             )
             self.__rising_or_falling_edge_trigger(edge_condition, index_reg, level_edge)
-        self.mc.communication.set_register(
-            self.MONITOR_START_CONDITION_TYPE_REGISTER, trigger_mode, servo=self.servo, axis=0
-        )
+        self._set_config_register(self.MONITOR_START_CONDITION_TYPE_REGISTER, trigger_mode)
 
     def __rising_or_falling_edge_trigger(
         self, edge_condition: MonitoringSoCConfig, index_reg: int, level_edge: int
     ) -> None:
-        self.mc.communication.set_register(
-            self.MONITORING_INDEX_CHECKER_REGISTER, index_reg, servo=self.servo, axis=0
-        )
-        self.mc.communication.set_register(
-            self.EDGE_CONDITION_REGISTER[edge_condition], level_edge, servo=self.servo, axis=0
-        )
+        self._set_config_register(self.MONITORING_INDEX_CHECKER_REGISTER, index_reg)
+        self._set_config_register(self.EDGE_CONDITION_REGISTER[edge_condition], level_edge)
 
     @check_monitoring_disabled
     @override
@@ -97,21 +91,13 @@ class MonitoringV1(Monitoring):
         if trigger_delay_samples == total_num_samples:
             trigger_delay_samples = total_num_samples - 1
         window_samples = total_num_samples - trigger_delay_samples
-        self.mc.communication.set_register(
-            self.MONITOR_END_CONDITION_TYPE_REGISTER,
-            self.EOC_TRIGGER_NUMBER_SAMPLES,
-            servo=self.servo,
-            axis=0,
-        )
-        self.mc.communication.set_register(
-            self.MONITORING_TRIGGER_DELAY_SAMPLES_REGISTER,
-            trigger_delay_samples,
-            servo=self.servo,
-            axis=0,
+        self._set_config_register(
+            self.MONITOR_END_CONDITION_TYPE_REGISTER, self.EOC_TRIGGER_NUMBER_SAMPLES
         )
-        self.mc.communication.set_register(
-            self.MONITORING_WINDOW_NUMBER_SAMPLES_REGISTER, window_samples, servo=self.servo, axis=0
+        self._set_config_register(
+            self.MONITORING_TRIGGER_DELAY_SAMPLES_REGISTER, trigger_delay_samples
         )
+        self._set_config_register(self.MONITORING_WINDOW_NUMBER_SAMPLES_REGISTER, window_samples)
         self.samples_number = total_num_samples
         self.trigger_delay_samples = trigger_delay_samples
 
@@ -131,16 +117,17 @@ class MonitoringV1(Monitoring):
             )
         return is_ready, result_text
 
-    def _check_data_is_ready(self) -> bool:
+    def _check_data_is_ready(self, monitoring_status: int) -> bool:
+        if self._version == MonitoringVersion.MONITORING_V2:
+            frame_bit = self.mc.capture.MONITORING_AVAILABLE_FRAME_BIT[self._version]
+            if not monitoring_status & frame_bit:
+                return False
         monit_nmb_blocks = self.mc.communication.get_register(
             self.MONITORING_ACTUAL_NUMBER_SAMPLES_REGISTER, servo=self.servo, axis=0
         )
         if not isinstance(monit_nmb_blocks, int):
             raise TypeError("Actual number of monitoring samples value has to be an integer")
-        data_is_ready = monit_nmb_blocks > 0
-        if self._version == MonitoringVersion.MONITORING_V2:
-            data_is_ready &= self.mc.capture.is_frame_available(self.servo, version=self._version)
-        return data_is_ready
+        return monit_nmb_blocks > 0
 
     @override
     def rearm_monitoring(self) -> None:
@@ -1,3 +1,5 @@
+import time
+from collections.abc import Generator, Iterator
 from typing import TYPE_CHECKING, Callable, Optional, Union
 
 import ingenialogger
@@ -16,6 +18,7 @@ if TYPE_CHECKING:
     from ingeniamotion.motion_controller import MotionController
 
 from ingeniamotion.monitoring.base_monitoring import Monitoring, check_monitoring_disabled
+from ingeniamotion.monitoring.monitoring_data import MonitoringFrame
 
 
 class MonitoringV3(Monitoring):
@@ -28,6 +31,7 @@ class MonitoringV3(Monitoring):
     def __init__(self, mc: "MotionController", servo: str = DEFAULT_SERVO) -> None:
         super().__init__(mc, servo)
         self._version = MonitoringVersion.MONITORING_V3
+        self.__continuous_acquisition_stopped = False
         self.logger = ingenialogger.get_logger(__name__, drive=mc.servo_name(servo))
 
     @check_monitoring_disabled
@@ -39,9 +43,7 @@ class MonitoringV3(Monitoring):
         trigger_signal: Optional[dict[str, str]] = None,
         trigger_value: Union[int, float, None] = None,
     ) -> None:
-        self.mc.communication.set_register(
-            self.MONITOR_START_CONDITION_TYPE_REGISTER, trigger_mode, servo=self.servo, axis=0
-        )
+        self._set_config_register(self.MONITOR_START_CONDITION_TYPE_REGISTER, trigger_mode)
         if trigger_mode == MonitoringSoCType.TRIGGER_EVENT_EDGE:
             if trigger_signal is None or trigger_value is None:
                 raise TypeError("trigger_signal or trigger_value are None")
@@ -55,15 +57,9 @@ class MonitoringV3(Monitoring):
     def __rising_or_falling_edge_trigger(
         self, edge_condition: MonitoringSoCConfig, index_reg: int, level_edge: int
     ) -> None:
-        self.mc.communication.set_register(
-            self.MONITOR_START_CONDITION_CONFIG_REGISTER, edge_condition, servo=self.servo, axis=0
-        )
-        self.mc.communication.set_register(
-            self.MONITORING_TRIGGER_THRESHOLD_REGISTER, level_edge, servo=self.servo, axis=0
-        )
-        self.mc.communication.set_register(
-            self.MONITORING_INDEX_CHECKER_REGISTER, index_reg, servo=self.servo, axis=0
-        )
+        self._set_config_register(self.MONITOR_START_CONDITION_CONFIG_REGISTER, edge_condition)
+        self._set_config_register(self.MONITORING_TRIGGER_THRESHOLD_REGISTER, level_edge)
+        self._set_config_register(self.MONITORING_INDEX_CHECKER_REGISTER, index_reg)
 
     @check_monitoring_disabled
     @override
@@ -76,18 +72,10 @@ class MonitoringV3(Monitoring):
             total_num_samples, trigger_delay_samples, self.mapped_registers
         )
 
-        self.mc.communication.set_register(
-            self.MONITORING_TRIGGER_DELAY_SAMPLES_REGISTER,
-            trigger_delay_samples,
-            servo=self.servo,
-            axis=0,
-        )
-        self.mc.communication.set_register(
-            self.MONITORING_WINDOW_NUMBER_SAMPLES_REGISTER,
-            total_num_samples,
-            servo=self.servo,
-            axis=0,
+        self._set_config_register(
+            self.MONITORING_TRIGGER_DELAY_SAMPLES_REGISTER, trigger_delay_samples
         )
+        self._set_config_register(self.MONITORING_WINDOW_NUMBER_SAMPLES_REGISTER, total_num_samples)
         self.samples_number = total_num_samples
         self.trigger_delay_samples = trigger_delay_samples
 
@@ -106,28 +94,111 @@ class MonitoringV3(Monitoring):
         return is_ready, result_text
 
     @override
-    def read_monitoring_data(
+    def _poll_monitoring_frames(
         self,
-        timeout: Optional[float] = None,
-        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]] = None,
-    ) -> list[list[Union[int, float]]]:
+        read_frame: Callable[[], int],
+        timeout: Optional[float],
+        progress_callback: Optional[Callable[[MonitoringProcessStage, float], None]],
+    ) -> Generator[float, None, Optional[float]]:
         drive = self.mc.servos[self.servo]
-        data_array = super().read_monitoring_data(
-            timeout=timeout, progress_callback=progress_callback
+        ready_time = yield from super()._poll_monitoring_frames(
+            read_frame, timeout, progress_callback
         )
         drive.monitoring_remove_data()
-        return data_array
+        return ready_time
+
+    def read_continuous_frames(
+        self, n_frames: Optional[int] = None, timeout: Optional[float] = None
+    ) -> Iterator[MonitoringFrame]:
+        """Continuous acquisition: read monitoring frames back to back.
+
+        The monitoring is rearmed right after each frame is read and before it is yielded, so
+        the drive captures the next frame while the current one is processed. Use an
+        auto trigger (``MonitoringSoCType.TRIGGER_EVENT_AUTO``) to get quasi-continuous data.
+
+        .. code-block:: python
+
+            for frame in monitoring.read_continuous_frames():
+                process(frame.data)
+
+        The acquisition ends after ``n_frames`` frames, if a frame is not completely read (e.g.
+        because of the ``timeout``) or when :meth:`stop_continuous_acquisition` is called.
+
+        Args:
+            n_frames: number of frames to read. ``None`` by default, read frames until the
+                acquisition is stopped.
+            timeout: maximum time trigger is waited for each frame, in seconds.
+                ``None`` by default.
+
+        Yields:
+            Each frame, with its sequence number and the dead time before it.
+
+        """
+        self.__continuous_acquisition_stopped = False
+        sequence_number = 0
+        dead_time = 0.0
+        while not self.__continuous_acquisition_stopped and (
+            n_frames is None or sequence_number < n_frames
+        ):
+            monitoring_data, ready_time = self._read_monitoring_arrays(timeout, None)
+            if self.__continuous_acquisition_stopped:
+                return
+            if ready_time is None or len(monitoring_data) < self.samples_number:
+                self.logger.warning(
+                    f"Continuous acquisition stopped, frame {sequence_number} is incomplete."
+                )
+                return
+            self.rearm_monitoring()
+            rearm_time = time.time()
+            yield MonitoringFrame(
+                sequence_number=sequence_number, dead_time=dead_time, data=monitoring_data
+            )
+            dead_time = rearm_time - ready_time
+            sequence_number += 1
+
+    def run_continuous_acquisition(
+        self,
+        callback: Callable[[MonitoringFrame], None],
+        n_frames: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """Blocking continuous acquisition that calls a function with each frame.
+
+        See :meth:`read_continuous_frames`.
+
+        Args:
+            callback: function called with each frame.
+            n_frames: number of frames to read. ``None`` by default, read frames until the
+                acquisition is stopped.
+            timeout: maximum time trigger is waited for each frame, in seconds.
+                ``None`` by default.
+
+        Returns:
+            Number of frames read.
+
+        """
+        frames_read = 0
+        for frame in self.read_continuous_frames(n_frames, timeout):
+            callback(frame)
+            frames_read += 1
+        return frames_read
+
+    def stop_continuous_acquisition(self) -> None:
+        """Stops the continuous acquisition. The frame being read is discarded."""
+        self.__continuous_acquisition_stopped = True
+        self.stop_reading_data()
 
     @override
-    def _check_data_is_ready(self) -> bool:
+    def _check_data_is_ready(self, monitoring_status: int) -> bool:
+        frame_bit = self.mc.capture.MONITORING_AVAILABLE_FRAME_BIT[MonitoringVersion.MONITORING_V3]
+        if not monitoring_status & frame_bit:
+            return False
         monit_nmb_blocks = self.mc.communication.get_register(
             self.MONITORING_ACTUAL_NUMBER_SAMPLES_REGISTER, servo=self.servo, axis=0
         )
         if not isinstance(monit_nmb_blocks, int):
             raise TypeError("Actual number of monitoring samples value has to be an integer")
-        data_is_ready = monit_nmb_blocks > 0
-        data_is_ready &= self.mc.capture.is_frame_available(self.servo, version=self._version)
-        return data_is_ready
+        return monit_nmb_blocks > 0
 
     @override
     def rearm_monitoring(self) -> None:
@@ -1,85 +1,83 @@
 import time
-from collections import defaultdict, deque
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Optional, Union
-
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
+
+import numpy as np
+from ingenialink.enums.register import RegDtype
 from ingenialink.ethercat.network import EthercatNetwork
 from ingenialink.ethercat.servo import EthercatServo
 from ingenialink.exceptions import ILError
-from ingenialink.pdo import PDOMap, RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
+from ingenialink.pdo import PDOMap, PDOMapItem, RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
 from ingenialogger import get_logger
+from numpy.typing import NDArray
 
-from ingeniamotion.enums import CommunicationType
+from ingeniamotion.enums import CommunicationType, PDOBackpressureMode, PDODispatchMode
 from ingeniamotion.exceptions import IMError
 from ingeniamotion.metaclass import DEFAULT_AXIS, DEFAULT_SERVO
+from ingeniamotion.process_data.buffer import PDOBuffer
+from ingeniamotion.process_data.decoder import TPDOMapDecoder
+from ingeniamotion.process_data.dispatch import PDOSample, PDOSubscriber
+from ingeniamotion.process_data.planner import PDOMapPlan, PDOMapPlanner
+from ingeniamotion.process_data.setpoints import PDOSetpointStreamer
+from ingeniamotion.process_data.sink import PDOSink
+from ingeniamotion.process_data.stats import PDOCycleStats
+from ingeniamotion.process_data.stream import PDOStream
 
 if TYPE_CHECKING:
     from ingeniamotion.motion_controller import MotionController
 
 logger = get_logger(__name__)
 
+PDO_MAP_TYPE = TypeVar("PDO_MAP_TYPE", bound=PDOMap)
 
-class PDOPoller:
-    """Poll register values using PDOs."""
+
+class _BasePDOPoller:
+    """Buffer, timestamps and sink hand-off shared by the PDO pollers.
+
+    The pollers map the registers to the PDOs of their servos and call
+    :func:`_store_sample` with the values read on each process data cycle.
+    """
 
     def __init__(
         self,
         mc: "MotionController",
-        servo: str,
         refresh_time: float,
         watchdog_timeout: Optional[float],
         buffer_size: int,
+        sink: Optional[PDOSink],
+        monotonic_timestamps: bool,
     ) -> None:
         """Constructor.
 
         Args:
             mc: MotionController instance
-            servo: drive alias.
             refresh_time: PDO values refresh time.
-            watchdog_timeout: The PDO watchdog time. If not provided it will be set proportional
-             to the refresh rate.
+            watchdog_timeout: The PDO watchdog time.
             buffer_size: Maximum number of register readings to store.
+            sink: If provided, the readings are handed in chunks to the sink.
+            monotonic_timestamps: If ``True``, the readings are timestamped with
+             ``time.perf_counter_ns``, with ``time.time`` otherwise.
 
         """
-        super().__init__()
-        self.__mc = mc
-        self.__servo = servo
+        self._mc = mc
+        self._channel_names: list[str] = []
         self.__refresh_time = refresh_time
         self.__watchdog_timeout = watchdog_timeout
-        self.__buffer_size = buffer_size
-        self.__buffer: deque[tuple[float, list[Union[int, float, bytes]]]] = deque(
-            maxlen=self.__buffer_size
+        self.__sink = sink
+        self.__sink_error: Optional[Exception] = None
+        self.__buffer_size = buffer_size if sink is None else max(buffer_size, sink.chunk_size)
+        self.__monotonic_timestamps = monotonic_timestamps
+        self.__timestamp_dtype = np.int64 if monotonic_timestamps else np.float64
+        self.__buffer = PDOBuffer(
+            dtypes=[], size=self.__buffer_size, timestamp_dtype=self.__timestamp_dtype
         )
         self.__start_time: Optional[float] = None
-        self.__tpdo_map: TPDOMap = TPDOMap()
-        self.__rpdo_map: RPDOMap = RPDOMap()
-        self.__fill_rpdo_map()
+        self.__start_time_ns = 0
         self.__exception_callbacks: list[Callable[[ILError], None]] = []
 
-    def start(self) -> None:
-        """Start the poller."""
-        self.__mc.capture.pdo.set_pdo_maps_to_slave(
-            rpdo_maps=self.__rpdo_map, tpdo_maps=self.__tpdo_map, servo=self.__servo
-        )
-        self.__tpdo_map.subscribe_to_process_data_event(self._new_data_available)
-        for callback in self.__exception_callbacks:
-            self.__mc.capture.pdo.subscribe_to_exceptions(callback, servo=self.__servo)
-        self.__start_time = time.time()
-        self.__mc.capture.pdo.start_pdos(
-            refresh_rate=self.__refresh_time,
-            watchdog_timeout=self.__watchdog_timeout,
-            servo=self.__servo,
-        )
-
-    def stop(self) -> None:
-        """Stop the poller."""
-        self.__mc.capture.pdo.stop_pdos(servo=self.__servo)
-        self.__tpdo_map.unsubscribe_to_process_data_event()
-        for callback in self.__exception_callbacks:
-            self.__mc.capture.pdo.unsubscribe_to_exceptions(callback, servo=self.__servo)
-        self.__mc.capture.pdo.remove_rpdo_map(servo=self.__servo, rpdo_map=self.__rpdo_map)
-        self.__mc.capture.pdo.remove_tpdo_map(servo=self.__servo, tpdo_map=self.__tpdo_map)
-
     @property
     def data(self) -> tuple[list[float], list[list[Union[int, float, bytes]]]]:
         """Get the poller data. After the data is retrieved, the data buffers are cleared.
@@ -89,24 +87,46 @@ class PDOPoller:
             the readings values.
 
         """
-        time_stamps = []
-        data: list[list[Union[int, float, bytes]]] = [[] for _ in range(len(self.__tpdo_map.items))]
-        for _ in range(len(self.__buffer)):
-            time_stamp, data_sample = self.__buffer.popleft()
-            time_stamps.append(time_stamp)
-            for item_index in range(len(self.__tpdo_map.items)):
-                data[item_index].append(data_sample[item_index])
+        time_stamps, data = self.__buffer.pop()
+        return time_stamps.tolist(), [channel_data.tolist() for channel_data in data]
 
-        return time_stamps, data
+    def data_as_arrays(self, copy: bool = True) -> tuple[NDArray[Any], list[NDArray[Any]]]:
+        """Get the poller data as NumPy arrays. After the data is retrieved, the buffer is cleared.
 
-    def add_channels(self, registers: list[dict[str, Union[int, str]]]) -> None:
-        """Configure the PDOs with the registers to be read.
+        Each channel is returned in an array with the data type of its register.
 
         Args:
-            registers : list of registers to add to the Poller.
+            copy: if ``True`` the returned arrays are copies of the poller buffer. If ``False``,
+                views of the buffer are returned whenever possible. Views are overwritten once the
+                poller stores ``buffer_size`` new readings. ``True`` by default.
+
+        Returns:
+            A tuple with an array of the readings timestamps and a list with an array of
+            readings values for each channel. The timestamps are ``int64`` nanoseconds with
+            monotonic timestamps, ``float64`` seconds otherwise.
+
+        """
+        return self.__buffer.pop(copy=copy)
+
+    def data_with_cycle_counts(
+        self, copy: bool = True
+    ) -> tuple[NDArray[Any], NDArray[np.uint64], list[NDArray[Any]]]:
+        """Get the poller data as NumPy arrays, with the process data cycle of each reading.
+
+        After the data is retrieved, the buffer is cleared. The cycle counts are consecutive
+        unless process data cycles were lost.
+
+        Args:
+            copy: if ``True`` the returned arrays are copies of the poller buffer. If ``False``,
+                views of the buffer are returned whenever possible. Views are overwritten once the
+                poller stores ``buffer_size`` new readings. ``True`` by default.
+
+        Returns:
+            A tuple with an array of the readings timestamps, an array of the readings cycle
+            counts and a list with an array of readings values for each channel.
 
         """
-        self.__fill_tpdo_map(registers)
+        return self.__buffer.pop_with_cycle_counts(copy=copy)
 
     def subscribe_to_exceptions(self, callback: Callable[[ILError], None]) -> None:
         """Get notified when an exception occurs on the PDO thread.
@@ -117,8 +137,155 @@ class PDOPoller:
         """
         self.__exception_callbacks.append(callback)
 
-    def _new_data_available(self) -> None:
-        """Add readings to the buffers.
+    @staticmethod
+    def _parse_register(register: dict[str, Union[int, str]]) -> tuple[str, int]:
+        """Get the name and axis of a register to be polled.
+
+        Args:
+            register: register description, with the ``name`` and ``axis`` fields.
+
+        Returns:
+            The register name and axis. ``DEFAULT_AXIS`` if the axis is missing.
+
+        Raises:
+            ValueError: If there is a type mismatch when retrieving the register UID.
+            ValueError: If there is a type mismatch when retrieving the register axis.
+
+        """
+        name = register.get("name", DEFAULT_SERVO)
+        if not isinstance(name, str):
+            raise ValueError(f"Wrong type for the 'name' field. Expected 'str', got: {type(name)}")
+        axis = register.get("axis", DEFAULT_AXIS)
+        if not isinstance(axis, int):
+            raise ValueError(f"Wrong type for the 'axis' field. Expected 'int', got: {type(axis)}")
+        return name, axis
+
+    @staticmethod
+    def _create_rpdo_map() -> RPDOMap:
+        """Create the RPDO map of a polled servo, which only holds padding.
+
+        Returns:
+            The RPDO map.
+
+        """
+        rpdo_map = RPDOMap()
+        padding_rpdo_item = RPDOMapItem(size_bits=8)
+        padding_rpdo_item.raw_data_bytes = int.to_bytes(0, 1, "little")
+        rpdo_map.add_item(padding_rpdo_item)
+        return rpdo_map
+
+    def _set_channel_dtypes(self, channel_dtypes: list[np.dtype[Any]]) -> None:
+        """Create the buffer for the readings.
+
+        Args:
+            channel_dtypes: data type of each channel.
+
+        """
+        self.__buffer = PDOBuffer(
+            dtypes=channel_dtypes, size=self.__buffer_size, timestamp_dtype=self.__timestamp_dtype
+        )
+
+    def _set_pdo_maps_to_slave(
+        self, servo: str, rpdo_map: RPDOMap, tpdo_map: TPDOMap
+    ) -> tuple[RPDOMap, TPDOMap]:
+        """Set the PDO maps of a polled servo to the slave.
+
+        The maps of a previous poller that the slave holds are reused, so they are not written
+        again.
+
+        Args:
+            servo: servo alias.
+            rpdo_map: RPDO map of the servo.
+            tpdo_map: TPDO map of the servo.
+
+        Returns:
+            The RPDO and TPDO maps set to the slave.
+
+        """
+        rpdo_map = self._mc.capture.pdo.reuse_pdo_map(rpdo_map, servo=servo)
+        tpdo_map = self._mc.capture.pdo.reuse_pdo_map(tpdo_map, servo=servo)
+        self._mc.capture.pdo.set_pdo_maps_to_slave(
+            rpdo_maps=rpdo_map, tpdo_maps=tpdo_map, servo=servo
+        )
+        return rpdo_map, tpdo_map
+
+    def _start_pdos(self, servo: str) -> None:
+        """Open the sink and start the PDOs of the network of a servo.
+
+        Args:
+            servo: servo alias.
+
+        """
+        if self.__sink is not None:
+            self.__sink_error = None
+            self.__sink.open(
+                self._channel_names,
+                self.__buffer.channel_dtypes,
+                timestamp_dtype=self.__timestamp_dtype,
+            )
+        for callback in self.__exception_callbacks:
+            self._mc.capture.pdo.subscribe_to_exceptions(callback, servo=servo)
+        self.__start_time = time.time()
+        self.__start_time_ns = time.perf_counter_ns()
+        self._mc.capture.pdo.start_pdos(
+            refresh_rate=self.__refresh_time,
+            watchdog_timeout=self.__watchdog_timeout,
+            servo=servo,
+        )
+
+    def _stop_pdos(self, servo: str) -> None:
+        """Stop the PDOs of the network of a servo.
+
+        Args:
+            servo: servo alias.
+
+        """
+        self._mc.capture.pdo.stop_pdos(servo=servo)
+        for callback in self.__exception_callbacks:
+            self._mc.capture.pdo.unsubscribe_to_exceptions(callback, servo=servo)
+
+    def _remove_pdo_maps(self, servo: str, rpdo_map: RPDOMap, tpdo_map: TPDOMap) -> None:
+        """Remove the PDO maps of a polled servo.
+
+        Args:
+            servo: servo alias.
+            rpdo_map: RPDO map of the servo.
+            tpdo_map: TPDO map of the servo.
+
+        """
+        self._mc.capture.pdo.remove_rpdo_map(servo=servo, rpdo_map=rpdo_map)
+        self._mc.capture.pdo.remove_tpdo_map(servo=servo, tpdo_map=tpdo_map)
+
+    def _close_sink(self) -> None:
+        """Hand the readings left in the buffer to the sink and close it.
+
+        Raises:
+            Exception: The error raised by the sink while the poller was running.
+
+        """
+        if self.__sink is None:
+            return
+        try:
+            time_stamps, cycle_counts, data = self.__buffer.pop_with_cycle_counts()
+            if self.__sink_error is None and len(time_stamps) > 0:
+                self.__sink.put(time_stamps, data, block=True, cycle_counts=cycle_counts)
+        finally:
+            self.__sink.close()
+        if self.__sink_error is not None:
+            raise self.__sink_error
+
+    def _store_sample(
+        self, sample: Sequence[Union[int, float, bool, bytes]], cycle_count: int
+    ) -> None:
+        """Timestamp a reading and add it to the buffer.
+
+        Once the buffer holds a chunk of readings, they are handed to the sink. If the sink
+        fails, the readings are kept in the buffer and the error is raised when the poller is
+        stopped.
+
+        Args:
+            sample: value of each channel.
+            cycle_count: process data cycle of the reading.
 
         Raises:
             ValueError: If the poller has not been started yet.
@@ -126,44 +293,358 @@ class PDOPoller:
         """
         if self.__start_time is None:
             raise ValueError("The poller has not been started yet.")
-        time_stamp = round(time.time() - self.__start_time, 6)
-        data_sample = [tpdo_map_item.value for tpdo_map_item in self.__tpdo_map.items]
-        self.__buffer.append((time_stamp, data_sample))
+        if self.__monotonic_timestamps:
+            time_stamp: Union[int, float] = time.perf_counter_ns() - self.__start_time_ns
+        else:
+            time_stamp = round(time.time() - self.__start_time, 6)
+        self.__buffer.append(time_stamp, sample, cycle_count)
+        if (
+            self.__sink is not None
+            and self.__sink_error is None
+            and self.__buffer.available_samples >= self.__sink.chunk_size
+        ):
+            time_stamps, cycle_counts, data = self.__buffer.pop_with_cycle_counts()
+            try:
+                self.__sink.put(time_stamps, data, cycle_counts=cycle_counts)
+            except Exception as e:
+                # Do not stop the PDO thread, the error is raised when the poller is stopped
+                logger.error(f"The poller sink failed: {e}")
+                self.__sink_error = e
+
+    @property
+    def available_samples(self) -> int:
+        """Number of samples in the buffer."""
+        return self.__buffer.available_samples
+
+    @property
+    def dropped_samples(self) -> int:
+        """Number of readings discarded because the buffer was full."""
+        return self.__buffer.dropped_samples
+
+    @property
+    def sink(self) -> Optional[PDOSink]:
+        """Sink to which the readings are streamed, if any."""
+        return self.__sink
+
+
+class PDOPoller(_BasePDOPoller):
+    """Poll register values using PDOs."""
+
+    def __init__(
+        self,
+        mc: "MotionController",
+        servo: str,
+        refresh_time: float,
+        watchdog_timeout: Optional[float],
+        buffer_size: int,
+        sink: Optional[PDOSink] = None,
+        monotonic_timestamps: bool = False,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            mc: MotionController instance
+            servo: drive alias.
+            refresh_time: PDO values refresh time.
+            watchdog_timeout: The PDO watchdog time. If not provided it will be set proportional
+             to the refresh rate.
+            buffer_size: Maximum number of register readings to store.
+            sink: If provided, the readings are handed in chunks to the sink, e.g. a
+             PDOStreamSink to write them to disk. The buffer is then only used to gather
+             each chunk.
+            monotonic_timestamps: If ``True``, the readings are timestamped with the
+             nanoseconds elapsed since the poller started, measured with
+             ``time.perf_counter_ns``. If ``False``, they are timestamped with the seconds
+             elapsed since the poller started, measured with ``time.time``.
+
+        """
+        super().__init__(
+            mc, refresh_time, watchdog_timeout, buffer_size, sink, monotonic_timestamps
+        )
+        self.__servo = servo
+        self.__tpdo_map: TPDOMap = TPDOMap()
+        self.__tpdo_map_decoder = TPDOMapDecoder(self.__tpdo_map)
+        self.__rpdo_map: RPDOMap = self._create_rpdo_map()
+
+    def start(self) -> None:
+        """Start the poller."""
+        self.__rpdo_map, tpdo_map = self._set_pdo_maps_to_slave(
+            self.__servo, self.__rpdo_map, self.__tpdo_map
+        )
+        if tpdo_map is not self.__tpdo_map:
+            self.__tpdo_map = tpdo_map
+            self.__tpdo_map_decoder = TPDOMapDecoder(tpdo_map)
+        self._mc.capture.pdo.subscribe_to_process_data_event(
+            self.__tpdo_map, self._new_data_available, servo=self.__servo
+        )
+        self._start_pdos(self.__servo)
+
+    def stop(self) -> None:
+        """Stop the poller."""
+        self._stop_pdos(self.__servo)
+        self._mc.capture.pdo.unsubscribe_to_process_data_event(
+            self.__tpdo_map, self._new_data_available, servo=self.__servo
+        )
+        self._remove_pdo_maps(self.__servo, self.__rpdo_map, self.__tpdo_map)
+        self._close_sink()
+
+    def add_channels(self, registers: list[dict[str, Union[int, str]]]) -> None:
+        """Configure the PDOs with the registers to be read.
+
+        Args:
+            registers : list of registers to add to the Poller.
+
+        """
+        for register in registers:
+            name, axis = self._parse_register(register)
+            tpdo_map_item = self._mc.capture.pdo.create_pdo_item(
+                register_uid=name, axis=axis, servo=self.__servo
+            )
+            self.__tpdo_map.add_item(tpdo_map_item)
+            self._channel_names.append(name)
+        self.__tpdo_map_decoder = TPDOMapDecoder(self.__tpdo_map)
+        self._set_channel_dtypes(self.__tpdo_map_decoder.channel_dtypes)
+
+    def _new_data_available(self) -> None:
+        """Add readings to the buffers."""
+        cycle_count = self._mc.capture.pdo.get_cycle_count(servo=self.__servo)
+        self._store_sample(self.__tpdo_map_decoder.decode_map(), cycle_count)
 
-    def __fill_rpdo_map(self) -> None:
-        """Fill the RPDO Map with padding."""
-        padding_rpdo_item = RPDOMapItem(size_bits=8)
-        padding_rpdo_item.raw_data_bytes = int.to_bytes(0, 1, "little")
-        self.__rpdo_map.add_item(padding_rpdo_item)
 
-    def __fill_tpdo_map(self, registers: list[dict[str, Union[int, str]]]) -> None:
-        """Fill the TPDO Map with the registers to be polled.
+class PDONetworkPoller(_BasePDOPoller):
+    """Poll register values of several servos connected to the same network using PDOs.
+
+    All the channels are recorded in a single receive process data callback, so each reading
+    holds the values of all the servos from the same process data cycle and a single timestamp.
+    """
+
+    def __init__(
+        self,
+        mc: "MotionController",
+        refresh_time: float,
+        watchdog_timeout: Optional[float],
+        buffer_size: int,
+        sink: Optional[PDOSink] = None,
+        monotonic_timestamps: bool = False,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            mc: MotionController instance
+            refresh_time: PDO values refresh time.
+            watchdog_timeout: The PDO watchdog time. If not provided it will be set proportional
+             to the refresh rate.
+            buffer_size: Maximum number of register readings to store.
+            sink: If provided, the readings are handed in chunks to the sink, e.g. a
+             PDOStreamSink to write them to disk. The buffer is then only used to gather
+             each chunk.
+            monotonic_timestamps: If ``True``, the readings are timestamped with the
+             nanoseconds elapsed since the poller started, measured with
+             ``time.perf_counter_ns``. If ``False``, they are timestamped with the seconds
+             elapsed since the poller started, measured with ``time.time``.
+
+        """
+        super().__init__(
+            mc, refresh_time, watchdog_timeout, buffer_size, sink, monotonic_timestamps
+        )
+        self.__tpdo_maps: dict[str, TPDOMap] = {}
+        self.__rpdo_maps: dict[str, RPDOMap] = {}
+        self.__tpdo_map_decoders: dict[str, TPDOMapDecoder] = {}
+        # Position of each TPDO map item in the readings
+        self.__channel_indexes: dict[str, list[int]] = {}
+        self.__sample: list[Union[int, float, bool, bytes]] = []
+
+    def start(self) -> None:
+        """Start the poller.
 
         Raises:
-            ValueError: If there is a type mismatch when retrieving the register UID.
-            ValueError: If there is a type mismatch when retrieving the register axis.
+            ValueError: If no channels have been added.
+        """
+        if not self.__tpdo_maps:
+            raise ValueError("No channels have been added to the poller.")
+        for servo in self.__tpdo_maps:
+            self.__rpdo_maps[servo], tpdo_map = self._set_pdo_maps_to_slave(
+                servo, self.__rpdo_maps[servo], self.__tpdo_maps[servo]
+            )
+            if tpdo_map is not self.__tpdo_maps[servo]:
+                self.__tpdo_maps[servo] = tpdo_map
+                self.__tpdo_map_decoders[servo] = TPDOMapDecoder(tpdo_map)
+        self._start_pdos(self.__reference_servo)
+        # Subscribe once the network is active, so the callback is added to it right away
+        self._mc.capture.pdo.subscribe_to_receive_process_data(
+            self._new_data_available, servo=self.__reference_servo
+        )
+
+    def stop(self) -> None:
+        """Stop the poller."""
+        self._mc.capture.pdo.unsubscribe_to_receive_process_data(
+            self._new_data_available, servo=self.__reference_servo
+        )
+        self._stop_pdos(self.__reference_servo)
+        for servo, tpdo_map in self.__tpdo_maps.items():
+            self._remove_pdo_maps(servo, self.__rpdo_maps[servo], tpdo_map)
+        self._close_sink()
+
+    def add_channels(self, registers: list[dict[str, Union[int, str]]]) -> None:
+        """Configure the PDOs with the registers to be read.
+
+        The readings channels keep the order of the registers, regardless of their servo.
+
+        Args:
+            registers: list of registers to add to the poller. Each register is described by
+                a dict with the ``name``, ``axis`` and ``servo`` fields. If the ``axis`` or
+                ``servo`` fields are missing, ``DEFAULT_AXIS`` and ``DEFAULT_SERVO`` are used.
+
+        Raises:
+            ValueError: If there is a type mismatch when retrieving the register servo.
 
         """
         for register in registers:
-            name = register.get("name", DEFAULT_SERVO)
-            if not isinstance(name, str):
+            name, axis = self._parse_register(register)
+            servo = register.get("servo", DEFAULT_SERVO)
+            if not isinstance(servo, str):
                 raise ValueError(
-                    f"Wrong type for the 'name' field. Expected 'str', got: {type(name)}"
-                )
-            axis = register.get("axis", DEFAULT_AXIS)
-            if not isinstance(axis, int):
-                raise ValueError(
-                    f"Wrong type for the 'axis' field. Expected 'int', got: {type(axis)}"
+                    f"Wrong type for the 'servo' field. Expected 'str', got: {type(servo)}"
                 )
-            tpdo_map_item = self.__mc.capture.pdo.create_pdo_item(
-                register_uid=name, axis=axis, servo=self.__servo
+            if servo not in self.__tpdo_maps:
+                self.__add_servo(servo)
+            tpdo_map_item = self._mc.capture.pdo.create_pdo_item(
+                register_uid=name, axis=axis, servo=servo
             )
-            self.__tpdo_map.add_item(tpdo_map_item)
+            self.__tpdo_maps[servo].add_item(tpdo_map_item)
+            self.__channel_indexes[servo].append(len(self._channel_names))
+            self._channel_names.append(name)
+        channel_dtypes: list[np.dtype[Any]] = [np.dtype(object)] * len(self._channel_names)
+        for servo, tpdo_map in self.__tpdo_maps.items():
+            self.__tpdo_map_decoders[servo] = TPDOMapDecoder(tpdo_map)
+            for channel_index, dtype in zip(
+                self.__channel_indexes[servo], self.__tpdo_map_decoders[servo].channel_dtypes
+            ):
+                channel_dtypes[channel_index] = dtype
+        self.__sample = [0] * len(self._channel_names)
+        self._set_channel_dtypes(channel_dtypes)
+
+    def __add_servo(self, servo: str) -> None:
+        """Create the PDO maps of a servo.
+
+        Args:
+            servo: servo alias.
+
+        Raises:
+            ValueError: If the servo is not connected to the same network as the other servos.
+
+        """
+        if (
+            self.__tpdo_maps
+            and self._mc.servo_net[servo] != self._mc.servo_net[self.__reference_servo]
+        ):
+            raise ValueError(
+                f"Servo {servo} is not connected to the same network as servo"
+                f" {self.__reference_servo}."
+            )
+        self.__rpdo_maps[servo] = self._create_rpdo_map()
+        self.__tpdo_maps[servo] = TPDOMap()
+        self.__channel_indexes[servo] = []
+
+    def _new_data_available(self) -> None:
+        """Add the readings of all the servos to the buffers, with the same timestamp."""
+        cycle_count = self._mc.capture.pdo.get_cycle_count(servo=self.__reference_servo)
+        sample = self.__sample
+        for servo, tpdo_map_decoder in self.__tpdo_map_decoders.items():
+            for channel_index, value in zip(
+                self.__channel_indexes[servo], tpdo_map_decoder.decode_map()
+            ):
+                sample[channel_index] = value
+        self._store_sample(sample, cycle_count)
 
     @property
-    def available_samples(self) -> int:
-        """Number of samples in the buffer."""
-        return len(self.__buffer)
+    def __reference_servo(self) -> str:
+        """Alias of the first servo, used to reference the network."""
+        return next(iter(self.__tpdo_maps))
+
+    @property
+    def servos(self) -> list[str]:
+        """Aliases of the polled servos."""
+        return list(self.__tpdo_maps)
+
+
+@dataclass
+class PDOMappingFingerprint:
+    """Fingerprint of the PDO maps set to a servo.
+
+    A PDO map is written to its mapping object when the PDOs are started, and it is not dirty
+    until it is modified again. Such a map holds the value of its mapping object, so it can be
+    set to the servo again instead of an equal map, and it is not written again.
+    """
+
+    maps: dict[int, PDOMap] = field(default_factory=dict)
+    """Last PDO map set to each mapping object, by index."""
+    in_use: list[PDOMap] = field(default_factory=list)
+    """PDO maps set to the servo and not removed yet."""
+
+    @staticmethod
+    def compare_map(written_map: PDOMap, pdo_map: PDOMap) -> bool:
+        """Compares a PDO map written to the slave with another.
+
+        Args:
+            written_map: The PDO map written to the slave.
+            pdo_map: The PDO map.
+
+        Returns:
+            True if both maps are RPDO or TPDO maps with the same mapping, False otherwise.
+        """
+        return (
+            isinstance(written_map, TPDOMap) == isinstance(pdo_map, TPDOMap)
+            and written_map.to_pdo_value() == pdo_map.to_pdo_value()
+        )
+
+    def find_map(self, pdo_map: PDOMap) -> Optional[PDOMap]:
+        """Find a PDO map written to the slave with the same mapping as another.
+
+        Args:
+            pdo_map: The PDO map.
+
+        Returns:
+            A map that is not in use and has not been modified since it was written, with the
+            same mapping as ``pdo_map``. ``None`` if there is none.
+        """
+        for written_map in self.maps.values():
+            if (
+                written_map is not pdo_map
+                and not written_map.is_dirty
+                and all(written_map is not used_map for used_map in self.in_use)
+                and self.compare_map(written_map, pdo_map)
+            ):
+                return written_map
+        return None
+
+    def add_maps(self, pdo_maps: list[PDOMap]) -> None:
+        """Keep the PDO maps set to the servo.
+
+        Args:
+            pdo_maps: The PDO maps.
+        """
+        for pdo_map in pdo_maps:
+            if pdo_map.map_register_index is not None:
+                self.maps[pdo_map.map_register_index] = pdo_map
+            if all(pdo_map is not used_map for used_map in self.in_use):
+                self.in_use.append(pdo_map)
+
+    def forget_map(self, pdo_map: PDOMap) -> None:
+        """Stop considering a PDO map as written to the slave.
+
+        Args:
+            pdo_map: The PDO map.
+        """
+        self.maps = {index: mapped for index, mapped in self.maps.items() if mapped is not pdo_map}
+
+    def remove_map(self, pdo_map: PDOMap) -> None:
+        """Mark a PDO map as removed from the servo.
+
+        Args:
+            pdo_map: The PDO map.
+        """
+        self.in_use = [used_map for used_map in self.in_use if used_map is not pdo_map]
 
 
 @dataclass
@@ -176,6 +657,8 @@ class PDONetwork:
     watchdog_timeout: Optional[float]
 
     __pdo_thread_status: bool = False
+    __cycle_count: int = 0
+    __last_receive_time: Optional[int] = None
 
     def __pdo_thread_status_callback(self, status: bool) -> None:
         """Callback for PDO thread status changes.
@@ -185,6 +668,31 @@ class PDONetwork:
         """
         self.__pdo_thread_status = status
 
+    def __send_process_data_callback(self) -> None:
+        """Callback called at the beginning of each process data cycle."""
+        self.__cycle_count += 1
+
+    def __receive_process_data_callback(self) -> None:
+        """Callback called when the TPDO values of a process data cycle are received."""
+        self.__last_receive_time = time.perf_counter_ns()
+
+    @property
+    def last_receive_time(self) -> Optional[int]:
+        """Monotonic time at which the last TPDO values were received, in nanoseconds.
+
+        ``None`` if no values have been received yet.
+        """
+        return self.__last_receive_time
+
+    @property
+    def cycle_count(self) -> int:
+        """Number of process data cycles since the PDOs were activated.
+
+        It is increased right before the RPDO values are sent, so it identifies the cycle of
+        the values received next. A gap between consecutive readings means cycles were lost.
+        """
+        return self.__cycle_count
+
     @property
     def is_active(self) -> bool:
         """Check if the PDO thread is active.
@@ -236,11 +744,19 @@ class PDONetwork:
             watchdog_timeout=watchdog_timeout,
         )
         net.network.subscribe_to_pdo_thread_status(callback=net.__pdo_thread_status_callback)
+        net.network.pdo_manager.subscribe_to_send_process_data(net.__send_process_data_callback)
+        net.network.pdo_manager.subscribe_to_receive_process_data(
+            net.__receive_process_data_callback
+        )
         return net
 
     def teardown(self) -> None:
         """Unsubscribes from network exceptions."""
         self.network.unsubscribe_from_pdo_thread_status(callback=self.__pdo_thread_status_callback)
+        self.network.pdo_manager.unsubscribe_to_send_process_data(self.__send_process_data_callback)
+        self.network.pdo_manager.unsubscribe_to_receive_process_data(
+            self.__receive_process_data_callback
+        )
 
 
 class PDONetworksTracker:
@@ -343,6 +859,34 @@ class PDONetworksTracker:
             return self.__networks[alias].is_active
         return False
 
+    def get_cycle_count(self, alias: str) -> int:
+        """Get the number of process data cycles of a specific network.
+
+        Args:
+            alias: The network alias.
+
+        Returns:
+            The number of process data cycles since the PDOs were activated.
+            ``0`` if the PDOs are not active.
+        """
+        if self.is_network_tracked(alias):
+            return self.__networks[alias].cycle_count
+        return 0
+
+    def get_last_receive_time(self, alias: str) -> Optional[int]:
+        """Get the time at which the last TPDO values of a specific network were received.
+
+        Args:
+            alias: The network alias.
+
+        Returns:
+            The monotonic time at which the last TPDO values were received, in nanoseconds.
+            ``None`` if the PDOs are not active or no values have been received yet.
+        """
+        if self.is_network_tracked(alias):
+            return self.__networks[alias].last_receive_time
+        return None
+
 
 class PDONetworkManager:
     """Manage all the PDO functionalities.
@@ -375,18 +919,32 @@ class PDONetworkManager:
         self.__exception_remove_callback: dict[str, list[Callable[[ILError], None]]] = defaultdict(
             list
         )
+        # Fingerprint of the PDO maps set to each servo
+        self.__mapping_fingerprints: dict[str, PDOMappingFingerprint] = {}
+        # Servos whose mapping objects are trusted without reading them back
+        self.__trusted_mappings: set[str] = set()
+        # Cycle statistics of each network, if enabled
+        self.__cycle_stats: dict[str, PDOCycleStats] = {}
+        # Maximum age of the TPDO values served instead of reading the registers, by servo
+        self.__tpdo_read_max_ages: dict[str, Optional[float]] = {}
+        # Items of the TPDO maps mapped into each servo, by register UID and axis
+        self.__tpdo_items: dict[str, dict[tuple[str, int], PDOMapItem]] = {}
 
     def __evaluate_subscriptions(self, net: EthercatNetwork, alias: str) -> None:  # noqa: C901
         for servo, callbacks in self.__send_process_data_add_callback.items():
             if servo != alias:
                 continue
             for callback in callbacks:
-                net.pdo_manager.subscribe_to_send_process_data(callback)
+                net.pdo_manager.subscribe_to_send_process_data(
+                    self.__timed_callback(callback, servo, receive=False)
+                )
         for servo, callbacks in self.__receive_process_data_add_callback.items():
             if servo != alias:
                 continue
             for callback in callbacks:
-                net.pdo_manager.subscribe_to_receive_process_data(callback)
+                net.pdo_manager.subscribe_to_receive_process_data(
+                    self.__timed_callback(callback, servo, receive=True)
+                )
         for servo, exception_callbacks in self.__exception_add_callback.items():
             if servo != alias:
                 continue
@@ -396,18 +954,65 @@ class PDONetworkManager:
             if servo != alias:
                 continue
             for callback in callbacks:
-                net.pdo_manager.unsubscribe_to_send_process_data(callback)
+                net.pdo_manager.unsubscribe_to_send_process_data(
+                    self.__subscribed_callback(callback, servo, receive=False)
+                )
         for servo, callbacks in self.__receive_process_data_remove_callback.items():
             if servo != alias:
                 continue
             for callback in callbacks:
-                net.pdo_manager.unsubscribe_to_receive_process_data(callback)
+                net.pdo_manager.unsubscribe_to_receive_process_data(
+                    self.__subscribed_callback(callback, servo, receive=True)
+                )
         for servo, exception_callbacks in self.__exception_remove_callback.items():
             if servo != alias:
                 continue
             for exception_callback in exception_callbacks:
                 net.pdo_manager.unsubscribe_to_exceptions(exception_callback)
 
+    def __timed_callback(
+        self, callback: Callable[[], None], servo: str, receive: bool
+    ) -> Callable[[], None]:
+        """Get the callback to subscribe to the network of a servo.
+
+        If the cycle statistics are enabled for the network, the callback is timed.
+
+        Args:
+            callback: Callback function.
+            servo: servo alias to reference it.
+            receive: ``True`` for the receive process data notifications, ``False`` for the send
+                process data notifications.
+
+        Returns:
+            The callback to subscribe.
+        """
+        cycle_stats = self.__cycle_stats.get(self.__mc.servo_net[servo])
+        if cycle_stats is None or not cycle_stats.enabled:
+            return callback
+        return cycle_stats.timed_callback(callback, receive=receive)
+
+    def __subscribed_callback(
+        self, callback: Callable[[], None], servo: str, receive: bool
+    ) -> Callable[[], None]:
+        """Get the callback that was subscribed to the network of a servo instead of a callback.
+
+        The callback is released from the cycle statistics, even if they are disabled, since it
+        is about to be unsubscribed.
+
+        Args:
+            callback: Callback function.
+            servo: servo alias to reference it.
+            receive: ``True`` for the receive process data notifications, ``False`` for the send
+                process data notifications.
+
+        Returns:
+            The subscribed callback.
+        """
+        cycle_stats = self.__cycle_stats.get(self.__mc.servo_net[servo])
+        if cycle_stats is None:
+            return callback
+        return cycle_stats.release_callback(callback, receive=receive)
+
     def create_pdo_item(
         self,
         register_uid: str,
@@ -454,6 +1059,78 @@ class PDONetworkManager:
         tpdo_map = TPDOMap.from_pdo_items(tpdo_map_items)
         return rpdo_map, tpdo_map
 
+    def plan_pdo_maps(
+        self,
+        registers: list[dict[str, Union[int, float, str]]],
+        servo: str = DEFAULT_SERVO,
+        max_map_size_bits: Optional[int] = None,
+    ) -> PDOMapPlan:
+        """Distribute registers in the minimum number of RPDO and TPDO maps of a servo.
+
+        The registers are sorted from the largest to the smallest, so they are aligned and the
+        frame is as small as possible, and the maps respect the number of maps and items per map
+        of the servo. The planned maps can be mapped with :func:`set_pdo_maps_to_slave`.
+
+        Args:
+            registers: registers to map. Each register is described by a dict with the
+                ``name`` and ``axis`` fields and, optionally, the initial ``value`` of the RPDO
+                registers. If the ``axis`` field is missing, ``DEFAULT_AXIS`` is used. If the
+                ``value`` field is missing, the RPDO registers are initialized to ``0``.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+            max_map_size_bits: maximum size of each map, in bits. If ``None``, the size of the
+                maps is not limited.
+
+        Returns:
+            The planned maps and the resulting frame size.
+
+        Raises:
+            ValueError: If there is a type mismatch retrieving the drive object.
+            ValueError: If there is a type mismatch when retrieving the register UID or axis.
+            ValueError: If the registers do not fit in the PDO maps of the servo.
+        """
+        drive = self.__mc._get_drive(servo=servo)
+        if not isinstance(drive, EthercatServo):
+            raise ValueError(f"Expected an EthercatServo. Got {type(drive)}")
+        items: list[Union[RPDOMapItem, TPDOMapItem]] = []
+        for register in registers:
+            name = register.get("name")
+            if not isinstance(name, str):
+                raise ValueError(
+                    f"Wrong type for the 'name' field. Expected 'str', got: {type(name)}"
+                )
+            axis = register.get("axis", DEFAULT_AXIS)
+            if not isinstance(axis, int):
+                raise ValueError(
+                    f"Wrong type for the 'axis' field. Expected 'int', got: {type(axis)}"
+                )
+            value = register.get("value")
+            if not isinstance(value, (int, float)):
+                is_bool = self.__mc.info.register_type(name, axis, servo=servo) == RegDtype.BOOL
+                value = False if is_bool else 0
+            items.append(
+                self.create_pdo_item(register_uid=name, axis=axis, servo=servo, value=value)
+            )
+        max_items_per_map = min(
+            len(drive.dictionary.get_object(drive.DEFAULT_RPDO_MAP).registers),
+            len(drive.dictionary.get_object(drive.DEFAULT_TPDO_MAP).registers),
+        )
+        planner = PDOMapPlanner(
+            max_maps=drive.AVAILABLE_PDOS,
+            # The first register of the mapping object is the number of items
+            max_items_per_map=max_items_per_map - 1,
+            max_map_size_bits=max_map_size_bits,
+        )
+        plan = planner.plan(items)
+        for index, rpdo_map in enumerate(plan.rpdo_maps):
+            rpdo_map.map_object = drive.dictionary.get_object(f"ETG_COMMS_RPDO_MAP{index + 1}")
+        for index, tpdo_map in enumerate(plan.tpdo_maps):
+            tpdo_map.map_object = drive.dictionary.get_object(f"ETG_COMMS_TPDO_MAP{index + 1}")
+        logger.info(
+            f"PDO maps planned for {servo}: {len(plan.rpdo_maps)} RPDO maps and"
+            f" {len(plan.tpdo_maps)} TPDO maps, {plan.frame_size_bytes} bytes."
+        )
+        return plan
+
     @staticmethod
     def create_empty_rpdo_map() -> RPDOMap:
         """Create an empty RPDOMap.
@@ -474,6 +1151,23 @@ class PDONetworkManager:
         """
         return TPDOMap()
 
+    @staticmethod
+    def create_tpdo_map_decoder(tpdo_map: TPDOMap) -> TPDOMapDecoder:
+        """Create a decoder that converts the TPDOMap raw data into values in a single call.
+
+        The decoder can be used from any callback subscribed with
+        :func:`subscribe_to_receive_process_data`, instead of reading the value of each item.
+        It has to be created again if the TPDOMap items are modified.
+
+        Args:
+            tpdo_map: The TPDOMap to be decoded.
+
+        Returns:
+            The TPDOMap decoder.
+
+        """
+        return TPDOMapDecoder(tpdo_map)
+
     def set_pdo_maps_to_slave(
         self,
         rpdo_maps: Union[RPDOMap, list[RPDOMap]],
@@ -503,6 +1197,91 @@ class PDONetworkManager:
         if not all(isinstance(tpdo_map, TPDOMap) for tpdo_map in _tpdo_maps):
             raise ValueError("Not all elements of the TPDO map list are instances of a TPDO map")
         drive.set_pdo_map_to_slave(rpdo_maps=_rpdo_maps, tpdo_maps=_tpdo_maps)
+        fingerprint = self.__mapping_fingerprints.setdefault(servo, PDOMappingFingerprint())
+        fingerprint.add_maps([*_rpdo_maps, *_tpdo_maps])
+        self.__update_tpdo_items(servo)
+
+    def reuse_pdo_map(self, pdo_map: PDO_MAP_TYPE, servo: str = DEFAULT_SERVO) -> PDO_MAP_TYPE:
+        """Get a PDO map that the slave already holds, with the same mapping as another.
+
+        The maps set with :func:`set_pdo_maps_to_slave` are written to their mapping objects
+        when the PDOs are started. Once such a map is removed, it can be set again instead of
+        an equal map, and its mapping object is not written again. It can not be reused if it
+        has been modified since it was written.
+
+        The mapping object is read back to check that the slave still holds the map, unless
+        it is disabled with :func:`set_pdo_mapping_read_back`.
+
+        Args:
+            pdo_map: The PDO map to be set to the slave.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+
+        Returns:
+            A PDO map held by the slave with the same mapping as ``pdo_map``, or ``pdo_map``
+            if there is none. The item values of a reused RPDO map are kept.
+
+        Raises:
+            ValueError: If there is a type mismatch retrieving the drive object.
+        """
+        fingerprint = self.__mapping_fingerprints.get(servo)
+        written_map = None if fingerprint is None else fingerprint.find_map(pdo_map)
+        if fingerprint is None or written_map is None:
+            return pdo_map
+        if servo not in self.__trusted_mappings:
+            drive = self.__mc._get_drive(servo=servo)
+            if not isinstance(drive, EthercatServo):
+                raise ValueError(f"Expected an EthercatServo. Got {type(drive)}")
+            if written_map.map_object is None or not drive.read_complete_access(
+                written_map.map_object, subnode=0
+            ).startswith(written_map.to_pdo_value()):
+                # The slave does not hold the map anymore, e.g. after a power cycle
+                fingerprint.forget_map(written_map)
+                return pdo_map
+        return written_map  # type: ignore [return-value]
+
+    def set_pdo_mapping_read_back(self, read_back: bool, servo: str = DEFAULT_SERVO) -> None:
+        """Set whether the mapping objects are read back before a PDO map is reused.
+
+        By default, :func:`reuse_pdo_map` reads the mapping object back from the servo. If the
+        read back is disabled, the maps written to the servo are trusted until the servo is
+        disconnected or :func:`invalidate_pdo_mapping_cache` is called. Then, the mapping
+        written to the servo must not be modified by other means, e.g. by power cycling it.
+
+        Args:
+            read_back: if ``False``, the mapping objects are not read back.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+        """
+        if read_back:
+            self.__trusted_mappings.discard(servo)
+        else:
+            self.__trusted_mappings.add(servo)
+
+    def invalidate_pdo_mapping_cache(self, servo: str = DEFAULT_SERVO) -> None:
+        """Forget the PDO maps written to the servo, e.g. after a power cycle.
+
+        The maps set afterwards are written to the servo when the PDOs are started.
+
+        Args:
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+        """
+        fingerprint = self.__mapping_fingerprints.get(servo)
+        if fingerprint is not None:
+            fingerprint.maps.clear()
+
+    def __update_tpdo_items(self, servo: str) -> None:
+        """Update the items of the TPDO maps set to a servo.
+
+        Args:
+            servo: servo alias to reference it.
+        """
+        fingerprint = self.__mapping_fingerprints.get(servo)
+        self.__tpdo_items[servo] = {
+            (item.register.identifier, item.register.subnode): item
+            for tpdo_map in ([] if fingerprint is None else fingerprint.in_use)
+            if isinstance(tpdo_map, TPDOMap)
+            for item in tpdo_map.items
+            if item.register.identifier is not None
+        }
 
     def clear_pdo_mapping(self, servo: str = DEFAULT_SERVO) -> None:
         """Clear the PDO mapping within the servo.
@@ -517,6 +1296,8 @@ class PDONetworkManager:
         if not isinstance(drive, EthercatServo):
             raise ValueError(f"Expected an EthercatServo. Got {type(drive)}")
         drive.reset_pdo_mapping()
+        self.__mapping_fingerprints.pop(servo, None)
+        self.__tpdo_items.pop(servo, None)
 
     def remove_rpdo_map(
         self,
@@ -541,6 +1322,7 @@ class PDONetworkManager:
         if not isinstance(drive, EthercatServo):
             raise ValueError(f"Expected an EthercatServo. Got {type(drive)}")
         drive.remove_rpdo_map(rpdo_map=rpdo_map, rpdo_map_index=rpdo_map_index)
+        self.__remove_from_fingerprint(servo, rpdo_map, rpdo_map_index)
 
     def remove_tpdo_map(
         self,
@@ -565,6 +1347,26 @@ class PDONetworkManager:
         if not isinstance(drive, EthercatServo):
             raise ValueError(f"Expected an EthercatServo. Got {type(drive)}")
         drive.remove_tpdo_map(tpdo_map=tpdo_map, tpdo_map_index=tpdo_map_index)
+        self.__remove_from_fingerprint(servo, tpdo_map, tpdo_map_index)
+        self.__update_tpdo_items(servo)
+
+    def __remove_from_fingerprint(
+        self, servo: str, pdo_map: Optional[PDOMap], pdo_map_index: Optional[int]
+    ) -> None:
+        """Mark a PDO map as removed from a servo in its fingerprint.
+
+        Args:
+            servo: servo alias to reference it.
+            pdo_map: The removed PDO map.
+            pdo_map_index: The index of the removed PDO map, if the map is not provided.
+        """
+        fingerprint = self.__mapping_fingerprints.get(servo)
+        if fingerprint is None:
+            return
+        if pdo_map is None and pdo_map_index is not None:
+            pdo_map = fingerprint.maps.get(pdo_map_index)
+        if pdo_map is not None:
+            fingerprint.remove_map(pdo_map)
 
     def start_pdos(
         self,
@@ -604,6 +1406,11 @@ class PDONetworkManager:
             raise ValueError(f"Expected EthercatNetwork. Got {type(net)}")
 
         self.__evaluate_subscriptions(net=net, alias=servo)
+        cycle_stats = self.__cycle_stats.get(self.__mc.servo_net[servo])
+        if cycle_stats is not None and not self.__net_tracker.is_network_tracked(
+            self.__mc.servo_net[servo]
+        ):
+            cycle_stats.restart()
         self.__net_tracker.add_network(
             alias=self.__mc.servo_net[servo],
             network=net,
@@ -650,6 +1457,156 @@ class PDONetworkManager:
             return self.__net_tracker.is_active(alias=self.__mc.servo_net[servo])
         raise ValueError("Either servo or net_alias must be provided.")
 
+    def get_cycle_count(
+        self, servo: Optional[str] = DEFAULT_SERVO, net_alias: Optional[str] = None
+    ) -> int:
+        """Get the process data cycle count of the network to which the servo is connected.
+
+        The count is increased at the beginning of each process data cycle, so it can be stored
+        with the received values to detect lost cycles. Alternatively, it can be retrieved for a
+        specific network. If the network alias is provided, the servo will be ignored.
+
+        Args:
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+            net_alias: network alias to reference it. ``None`` by default.
+
+        Returns:
+            The number of process data cycles since the PDOs were started.
+            ``0`` if the PDOs are not active.
+
+        Raises:
+            ValueError: If neither servo nor net_alias is provided.
+        """
+        if net_alias is not None:
+            return self.__net_tracker.get_cycle_count(alias=net_alias)
+        elif servo is not None:
+            return self.__net_tracker.get_cycle_count(alias=self.__mc.servo_net[servo])
+        raise ValueError("Either servo or net_alias must be provided.")
+
+    def enable_cycle_stats(
+        self,
+        servo: str = DEFAULT_SERVO,
+        max_value: int = 10_000_000_000,
+        significant_bits: int = 7,
+    ) -> PDOCycleStats:
+        """Record statistics of the process data cycles of the network of a servo.
+
+        The period and jitter of the cycles, and the duration of each callback subscribed to
+        the send and receive process data notifications, are recorded in histograms. Only the
+        callbacks subscribed after enabling the statistics are timed, so it should be called
+        before creating pollers or subscribing callbacks. If the statistics were disabled, they
+        are enabled again and keep their recorded values.
+
+        The callbacks subscribed to the process data events of a PDO map with
+        :func:`subscribe_to_process_data_event` are timed too, but the ones subscribed directly
+        to the map, e.g. the FSoE master handler requests and replies, are not.
+
+        Args:
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+                The statistics are recorded for the network to which the servo is connected.
+            max_value: highest trackable value of the histograms, in nanoseconds. ``10``
+                seconds by default. Ignored if the statistics were already created.
+            significant_bits: number of significant bits of the histograms. ``7`` by default.
+                Ignored if the statistics were already created.
+
+        Returns:
+            The cycle statistics of the network.
+
+        Raises:
+            ValueError: If there is a type mismatch retrieving the network object.
+        """
+        net_alias = self.__mc.servo_net[servo]
+        cycle_stats = self.__cycle_stats.get(net_alias)
+        if cycle_stats is not None and cycle_stats.enabled:
+            return cycle_stats
+        net = self.__mc._get_network(servo=servo)
+        if not isinstance(net, EthercatNetwork):
+            raise ValueError(f"Expected EthercatNetwork. Got {type(net)}")
+        if cycle_stats is None:
+            cycle_stats = PDOCycleStats(max_value=max_value, significant_bits=significant_bits)
+            self.__cycle_stats[net_alias] = cycle_stats
+        cycle_stats.enabled = True
+        net.pdo_manager.subscribe_to_send_process_data(cycle_stats.record_cycle)
+        return cycle_stats
+
+    def disable_cycle_stats(self, servo: str = DEFAULT_SERVO) -> None:
+        """Stop recording statistics of the process data cycles of the network of a servo.
+
+        The timed callbacks keep being called, but their duration is not recorded anymore. The
+        statistics are kept, so the timed callbacks can still be unsubscribed.
+
+        Args:
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+        """
+        cycle_stats = self.__cycle_stats.get(self.__mc.servo_net[servo])
+        if cycle_stats is None or not cycle_stats.enabled:
+            return
+        cycle_stats.enabled = False
+        net = self.__mc._get_network(servo=servo)
+        if isinstance(net, EthercatNetwork):
+            net.pdo_manager.unsubscribe_to_send_process_data(cycle_stats.record_cycle)
+
+    def get_cycle_stats(self, servo: str = DEFAULT_SERVO) -> PDOCycleStats:
+        """Get the statistics of the process data cycles of the network of a servo.
+
+        Args:
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+
+        Returns:
+            The cycle statistics of the network.
+
+        Raises:
+            IMError: If the cycle statistics are not enabled for the network.
+        """
+        net_alias = self.__mc.servo_net[servo]
+        cycle_stats = self.__cycle_stats.get(net_alias)
+        if cycle_stats is None or not cycle_stats.enabled:
+            raise IMError(f"The cycle statistics are not enabled for network '{net_alias}'.")
+        return cycle_stats
+
+    def set_tpdo_read_max_age(self, max_age: Optional[float], servo: str = DEFAULT_SERVO) -> None:
+        """Set the maximum age of the TPDO values served instead of reading the registers.
+
+        While the PDOs are active, the registers mapped in a TPDO map of the servo are read from
+        the last received TPDO values (see :func:`get_tpdo_value`) instead of accessing the
+        servo, as long as the values are not older than the maximum age. By default, the
+        registers are always read from the servo.
+
+        Args:
+            max_age: maximum age of the TPDO values, in seconds. If ``None``, the registers are
+                always read from the servo.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+        """
+        self.__tpdo_read_max_ages[servo] = max_age
+
+    def get_tpdo_value(
+        self, register: str, servo: str = DEFAULT_SERVO, axis: int = DEFAULT_AXIS
+    ) -> Optional[Union[int, float, bool, bytes]]:
+        """Get the last value of a register received in a TPDO map of the servo.
+
+        Args:
+            register: register UID.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+            axis: servo axis. ``DEFAULT_AXIS`` by default.
+
+        Returns:
+            The last received value of the register. ``None`` if no maximum age is set with
+            :func:`set_tpdo_read_max_age`, the PDOs are not active, the register is not mapped
+            in a TPDO map set with :func:`set_pdo_maps_to_slave` or the last value is older than
+            the maximum age.
+        """
+        max_age = self.__tpdo_read_max_ages.get(servo)
+        net_alias = self.__mc.servo_net.get(servo)
+        if max_age is None or net_alias is None:
+            return None
+        item = self.__tpdo_items.get(servo, {}).get((register, axis))
+        if item is None:
+            return None
+        last_receive_time = self.__net_tracker.get_last_receive_time(net_alias)
+        if last_receive_time is None or time.perf_counter_ns() - last_receive_time > max_age * 1e9:
+            return None
+        return item.value
+
     def subscribe_to_send_process_data(
         self, callback: Callable[[], None], servo: str = DEFAULT_SERVO
     ) -> None:
@@ -663,7 +1620,9 @@ class PDONetworkManager:
         net_alias = self.__mc.servo_net[servo]
         if self.__net_tracker.is_network_tracked(net_alias):
             net = self.__net_tracker.get_il_network(alias=net_alias)
-            net.pdo_manager.subscribe_to_send_process_data(callback)
+            net.pdo_manager.subscribe_to_send_process_data(
+                self.__timed_callback(callback, servo, receive=False)
+            )
         else:
             self.__send_process_data_add_callback[servo].append(callback)
 
@@ -680,7 +1639,9 @@ class PDONetworkManager:
         net_alias = self.__mc.servo_net[servo]
         if self.__net_tracker.is_network_tracked(net_alias):
             net = self.__net_tracker.get_il_network(alias=net_alias)
-            net.pdo_manager.subscribe_to_receive_process_data(callback)
+            net.pdo_manager.subscribe_to_receive_process_data(
+                self.__timed_callback(callback, servo, receive=True)
+            )
         else:
             self.__receive_process_data_add_callback[servo].append(callback)
 
@@ -720,7 +1681,9 @@ class PDONetworkManager:
         net_alias = self.__mc.servo_net[servo]
         if self.__net_tracker.is_network_tracked(net_alias):
             net = self.__net_tracker.get_il_network(alias=net_alias)
-            net.pdo_manager.unsubscribe_to_send_process_data(callback)
+            net.pdo_manager.unsubscribe_to_send_process_data(
+                self.__subscribed_callback(callback, servo, receive=False)
+            )
         else:
             self.__send_process_data_remove_callback[servo].append(callback)
 
@@ -737,10 +1700,102 @@ class PDONetworkManager:
         net_alias = self.__mc.servo_net[servo]
         if self.__net_tracker.is_network_tracked(net_alias):
             net = self.__net_tracker.get_il_network(alias=net_alias)
-            net.pdo_manager.unsubscribe_to_receive_process_data(callback)
+            net.pdo_manager.unsubscribe_to_receive_process_data(
+                self.__subscribed_callback(callback, servo, receive=True)
+            )
         else:
             self.__receive_process_data_remove_callback[servo].append(callback)
 
+    def subscribe_to_process_data_event(
+        self, pdo_map: PDO_MAP_TYPE, callback: Callable[[], None], servo: str = DEFAULT_SERVO
+    ) -> None:
+        """Subscribe to the process data events of a PDO map.
+
+        The event of a TPDO map is notified when its values are received, and the event of an
+        RPDO map before its values are sent. If the cycle statistics are enabled for the
+        network, the callback is timed as a receive or a send callback respectively.
+
+        Args:
+            pdo_map: PDO map mapped to the servo.
+            callback: Callback function.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+        """
+        pdo_map.subscribe_to_process_data_event(
+            self.__timed_callback(callback, servo, receive=isinstance(pdo_map, TPDOMap))
+        )
+
+    def unsubscribe_to_process_data_event(
+        self, pdo_map: PDO_MAP_TYPE, callback: Callable[[], None], servo: str = DEFAULT_SERVO
+    ) -> None:
+        """Unsubscribe from the process data events of a PDO map.
+
+        Args:
+            pdo_map: PDO map mapped to the servo.
+            callback: Subscribed callback function.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+        """
+        pdo_map.unsubscribe_to_process_data_event()
+        self.__subscribed_callback(callback, servo, receive=isinstance(pdo_map, TPDOMap))
+
+    def subscribe_to_tpdo_values(
+        self,
+        callback: Callable[[PDOSample], None],
+        tpdo_map: TPDOMap,
+        servo: str = DEFAULT_SERVO,
+        dispatch: PDODispatchMode = PDODispatchMode.THREAD,
+        max_queued_samples: int = 100,
+    ) -> PDOSubscriber:
+        """Subscribe to the values of a TPDO map received on each process data cycle.
+
+        With the ``THREAD`` dispatch mode, the values are copied into a bounded queue on the PDO
+        thread and the callback is called from a worker thread, so a slow callback (e.g.
+        logging or plotting) does not delay the process data cycle of the network. The
+        ``INLINE`` dispatch mode calls the callback on the PDO thread, which is faster for
+        lightweight callbacks.
+
+        Args:
+            callback: function called with each :class:`PDOSample`.
+            tpdo_map: TPDO map mapped to the servo.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+            dispatch: thread on which the callback is called. ``THREAD`` by default.
+            max_queued_samples: maximum number of samples waiting to be delivered with the
+                ``THREAD`` dispatch mode. The oldest sample is discarded when the queue is full.
+                ``100`` by default.
+
+        Returns:
+            The subscriber, which accounts the discarded samples in its ``overflows``
+            property. It should be passed to :func:`unsubscribe_to_tpdo_values`.
+        """
+        subscriber = PDOSubscriber(
+            callback,
+            self.create_tpdo_map_decoder(tpdo_map),
+            partial(self.get_cycle_count, servo=servo),
+            dispatch=dispatch,
+            max_queued_samples=max_queued_samples,
+        )
+        subscriber.start()
+        self.subscribe_to_receive_process_data(subscriber, servo=servo)
+        return subscriber
+
+    def unsubscribe_to_tpdo_values(
+        self,
+        subscriber: PDOSubscriber,
+        servo: str = DEFAULT_SERVO,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Unsubscribe from the values of a TPDO map.
+
+        The samples already queued are delivered before the worker thread is stopped.
+
+        Args:
+            subscriber: The subscriber returned by :func:`subscribe_to_tpdo_values`.
+            servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+            timeout: maximum time (in seconds) to wait for the queued samples to be delivered.
+                If ``None``, it waits until all of them are delivered.
+        """
+        self.unsubscribe_to_receive_process_data(subscriber, servo=servo)
+        subscriber.stop(timeout)
+
     def create_poller(
         self,
         registers: list[dict[str, Union[int, str]]],
@@ -749,6 +1804,8 @@ class PDONetworkManager:
         buffer_size: int = 100,
         watchdog_timeout: Optional[float] = None,
         start: bool = True,
+        sink: Optional[PDOSink] = None,
+        monotonic_timestamps: bool = False,
     ) -> PDOPoller:
         """Create a register Poller using PDOs.
 
@@ -780,6 +1837,14 @@ class PDONetworkManager:
                 ``100`` by default.
             start: if ``True``, function starts poller, if ``False``
                 poller should be started after. ``True`` by default.
+            sink: if provided, the readings are handed to the sink in chunks of
+                ``sink.chunk_size`` readings, instead of being kept in the poller buffer.
+                Use a PDOStreamSink to stream them to disk. ``None`` by default.
+            monotonic_timestamps: if ``True``, the readings are timestamped in nanoseconds with
+                ``time.perf_counter_ns``. If ``False``, they are timestamped in seconds with
+                ``time.time``. In both cases, the process data cycle count of each reading is
+                stored and can be retrieved with ``data_with_cycle_counts``.
+                ``False`` by default.
 
         Returns:
             The poller instance.
@@ -791,12 +1856,191 @@ class PDONetworkManager:
             refresh_time=sampling_time,
             watchdog_timeout=watchdog_timeout,
             buffer_size=buffer_size,
+            sink=sink,
+            monotonic_timestamps=monotonic_timestamps,
+        )
+        poller.add_channels(registers)
+        if start:
+            poller.start()
+        return poller
+
+    def create_network_poller(
+        self,
+        registers: list[dict[str, Union[int, str]]],
+        sampling_time: float = 0.125,
+        buffer_size: int = 100,
+        watchdog_timeout: Optional[float] = None,
+        start: bool = True,
+        sink: Optional[PDOSink] = None,
+        monotonic_timestamps: bool = False,
+    ) -> PDONetworkPoller:
+        """Create a register Poller for several servos connected to the same network using PDOs.
+
+        All the registers are read in the same process data cycle, so each reading holds the
+        values of all the servos with a single timestamp.
+
+        Args:
+            registers : list of registers to add to the Poller.
+                Dicts should have the follow format:
+
+                .. code-block:: python
+
+                    [
+                        { # Poller register one
+                            "name": "CL_POS_FBK_VALUE",  # Register name.
+                            "axis": 1,  # Register axis.
+                            # If it has no axis field, by default axis 1.
+                            "servo": "servo_1",  # Servo alias.
+                            # If it has no servo field, by default DEFAULT_SERVO.
+                        },
+                        { # Poller register two
+                            "name": "CL_POS_FBK_VALUE",  # Register name.
+                            "axis": 1,  # Register axis.
+                            # If it has no axis field, by default axis 1.
+                            "servo": "servo_2",  # Servo alias.
+                            # If it has no servo field, by default DEFAULT_SERVO.
+                        }
+                    ]
+
+            sampling_time: period of the sampling in seconds.
+                By default ``0.125`` seconds.
+            buffer_size: number maximum of sample for each data read.
+                ``100`` by default.
+            watchdog_timeout: The PDO watchdog time. If not provided it will be set proportional
+             to the refresh rate.
+            start: if ``True``, function starts poller, if ``False``
+                poller should be started after. ``True`` by default.
+            sink: if provided, the readings are handed to the sink in chunks of
+                ``sink.chunk_size`` readings, instead of being kept in the poller buffer.
+                Use a PDOStreamSink to stream them to disk. ``None`` by default.
+            monotonic_timestamps: if ``True``, the readings are timestamped in nanoseconds with
+                ``time.perf_counter_ns``. If ``False``, they are timestamped in seconds with
+                ``time.time``. In both cases, the process data cycle count of each reading is
+                stored and can be retrieved with ``data_with_cycle_counts``.
+                ``False`` by default.
+
+        Returns:
+            The poller instance.
+
+        """
+        poller = PDONetworkPoller(
+            mc=self.__mc,
+            refresh_time=sampling_time,
+            watchdog_timeout=watchdog_timeout,
+            buffer_size=buffer_size,
+            sink=sink,
+            monotonic_timestamps=monotonic_timestamps,
         )
         poller.add_channels(registers)
         if start:
             poller.start()
         return poller
 
+    def stream(
+        self,
+        registers: list[dict[str, Union[int, str]]],
+        servo: str = DEFAULT_SERVO,
+        sampling_time: float = 0.125,
+        batch_size: int = 10,
+        max_queued_batches: int = 16,
+        backpressure: PDOBackpressureMode = PDOBackpressureMode.DROP_OLDEST,
+        watchdog_timeout: Optional[float] = None,
+        monotonic_timestamps: bool = False,
+    ) -> PDOStream:
+        """Create an asynchronous stream of register readings using PDOs.
+
+        The readings are delivered to the event loop in batches:
+
+        .. code-block:: python
+
+            async with mc.capture.pdo.stream(registers, servo=alias, batch_size=100) as stream:
+                async for batch in stream:
+                    print(batch.timestamps, batch.channels)
+
+        Args:
+            registers : list of registers to read. The format is the same as in
+                :func:`create_poller`.
+            servo: servo alias to reference it. ``default`` by default.
+            sampling_time: period of the sampling in seconds.
+                By default ``0.125`` seconds.
+            batch_size: number of readings of each batch. ``10`` by default.
+            max_queued_batches: maximum number of batches waiting to be consumed.
+                ``16`` by default.
+            backpressure: behavior when the queue is full. ``DROP_OLDEST`` by default.
+            watchdog_timeout: The PDO watchdog time. If not provided it will be set proportional
+             to the refresh rate.
+            monotonic_timestamps: if ``True``, the readings are timestamped in nanoseconds with
+                ``time.perf_counter_ns``. If ``False``, they are timestamped in seconds with
+                ``time.time``. ``False`` by default.
+
+        Returns:
+            The stream. The PDOs are started when entering the ``async with`` block and
+            stopped when leaving it.
+
+        """
+
+        def create_poller(sink: PDOSink) -> PDOPoller:
+            poller = PDOPoller(
+                mc=self.__mc,
+                servo=servo,
+                refresh_time=sampling_time,
+                watchdog_timeout=watchdog_timeout,
+                buffer_size=batch_size,
+                sink=sink,
+                monotonic_timestamps=monotonic_timestamps,
+            )
+            poller.add_channels(registers)
+            return poller
+
+        return PDOStream(
+            poller_factory=create_poller,
+            batch_size=batch_size,
+            max_queued_batches=max_queued_batches,
+            backpressure=backpressure,
+        )
+
+    def create_setpoint_streamer(
+        self,
+        registers: list[dict[str, Union[int, str]]],
+        servo: str = DEFAULT_SERVO,
+        sampling_time: float = 0.001,
+        watchdog_timeout: Optional[float] = None,
+    ) -> PDOSetpointStreamer:
+        """Create a streamer that sends precomputed setpoints using RPDOs.
+
+        On each process data cycle, the next setpoint of each register is sent. The setpoints
+        are fed as NumPy arrays with :func:`PDOSetpointStreamer.feed`:
+
+        .. code-block:: python
+
+            streamer = mc.capture.pdo.create_setpoint_streamer(
+                [{"name": "CL_POS_SET_POINT_VALUE", "axis": 1}], servo=alias
+            )
+            streamer.feed([trajectory[:1000]])
+            streamer.start()
+            streamer.feed([trajectory[1000:]])
+
+        Args:
+            registers : list of registers to which the setpoints are written.
+                The format is the same as in :func:`create_poller`.
+            servo: servo alias to reference it. ``default`` by default.
+            sampling_time: period of the process data cycle in seconds.
+                By default ``0.001`` seconds.
+            watchdog_timeout: The PDO watchdog time. If not provided it will be set proportional
+             to the refresh rate.
+
+        Returns:
+            The setpoint streamer. It has to be started once the first setpoints are fed.
+
+        """
+        return PDOSetpointStreamer(
+            mc=self.__mc,
+            registers=registers,
+            servo=servo,
+            refresh_time=sampling_time,
+            watchdog_timeout=watchdog_timeout,
+        )
+
     def unsubscribe_to_exceptions(
         self, callback: Callable[[ILError], None], servo: str = DEFAULT_SERVO
     ) -> None:
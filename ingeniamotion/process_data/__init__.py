@@ -0,0 +1,11 @@
+from .aggregate import *
+from .buffer import *
+from .decoder import *
+from .dispatch import *
+from .loopback import *
+from .planner import *
+from .setpoints import *
+from .sink import *
+from .stats import *
+from .stream import *
+from .trigger import *
@@ -0,0 +1,260 @@
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+from ingeniamotion.process_data.sink import PDOSink
+
+__all__ = ["PDOWindowAggregator", "PDOWindowStats"]
+
+
+@dataclass(frozen=True)
+class PDOWindowStats:
+    """Statistics of the windows aggregated by a :class:`PDOWindowAggregator`.
+
+    The statistics arrays have a row for each window and a column for each channel. The
+    columns of the channels that are not numeric (e.g. ``bytes`` registers) are ``NaN``.
+    """
+
+    channel_names: list[str]
+    """Name of each channel."""
+    start_timestamps: NDArray[Any]
+    """Timestamp of the first sample of each window."""
+    end_timestamps: NDArray[Any]
+    """Timestamp of the last sample of each window."""
+    start_cycle_counts: NDArray[np.uint64]
+    """Process data cycle of the first sample of each window."""
+    samples: NDArray[np.int64]
+    """Number of samples of each window. The last window may hold fewer samples."""
+    min: NDArray[np.float64]
+    """Lowest value of each window."""
+    max: NDArray[np.float64]
+    """Highest value of each window."""
+    mean: NDArray[np.float64]
+    """Mean value of each window."""
+    rms: NDArray[np.float64]
+    """Root mean square value of each window."""
+
+    def __len__(self) -> int:
+        """Get the number of windows.
+
+        Returns:
+            The number of windows.
+        """
+        return len(self.samples)
+
+    def channel(self, name: str) -> dict[str, NDArray[np.float64]]:
+        """Get the statistics of a channel.
+
+        Args:
+            name: name of the channel.
+
+        Returns:
+            The ``min``, ``max``, ``mean`` and ``rms`` of each window.
+
+        Raises:
+            ValueError: If there is no channel with that name.
+        """
+        if name not in self.channel_names:
+            raise ValueError(f"There is no channel named {name}.")
+        index = self.channel_names.index(name)
+        return {
+            "min": self.min[:, index],
+            "max": self.max[:, index],
+            "mean": self.mean[:, index],
+            "rms": self.rms[:, index],
+        }
+
+
+class PDOWindowAggregator(PDOSink):
+    """Reduce the PDO poller readings to the min, max, mean and RMS of windows of samples.
+
+    The aggregator is a sink with a chunk size of ``window_size``: the poller gathers a window
+    of readings in its buffer and hands it to the aggregator, which reduces all the channels at
+    once on the PDO thread. Only the statistics of the last ``max_windows`` windows are stored,
+    in preallocated arrays, so long captures need a fraction of the memory of the raw readings.
+
+    .. code-block:: python
+
+        aggregator = PDOWindowAggregator(window_size=1000)
+        poller = mc.capture.pdo.create_poller(registers, sampling_time=0.001, sink=aggregator)
+        ...
+        window_stats = aggregator.pop()
+
+    The values are reduced as ``float64``, so 64-bit integers above ``2 ** 53`` lose precision.
+
+    Args:
+        window_size: number of samples of each window.
+        max_windows: maximum number of windows to store. When it is exceeded, the oldest
+            window is discarded and accounted in :attr:`dropped_windows`. ``10000`` by default.
+
+    Raises:
+        ValueError: If the window size or the maximum number of windows is lower than 1.
+    """
+
+    def __init__(self, window_size: int, max_windows: int = 10_000) -> None:
+        if window_size < 1:
+            raise ValueError("The window size must be 1 or higher.")
+        if max_windows < 1:
+            raise ValueError("The maximum number of windows must be 1 or higher.")
+        self.__window_size = window_size
+        self.__max_windows = max_windows
+        self.__channel_names: list[str] = []
+        # Position of the numeric channels in the readings
+        self.__numeric_channels: list[int] = []
+        self.__is_open = False
+        self.__lock = threading.Lock()
+        self.__allocate(np.float64)
+
+    def __allocate(self, timestamp_dtype: DTypeLike) -> None:
+        n_windows = self.__max_windows
+        n_channels = len(self.__channel_names)
+        self.__start_timestamps: NDArray[Any] = np.zeros(n_windows, dtype=timestamp_dtype)
+        self.__end_timestamps: NDArray[Any] = np.zeros(n_windows, dtype=timestamp_dtype)
+        self.__start_cycle_counts: NDArray[np.uint64] = np.zeros(n_windows, dtype=np.uint64)
+        self.__samples: NDArray[np.int64] = np.zeros(n_windows, dtype=np.int64)
+        # The min, max, mean and RMS of each window, in this order
+        self.__stats: NDArray[np.float64] = np.full((4, n_windows, n_channels), np.nan)
+        self.__head = 0
+        self.__count = 0
+        self.__dropped_windows = 0
+
+    @property
+    def chunk_size(self) -> int:
+        """Number of samples of each window."""
+        return self.__window_size
+
+    def open(
+        self,
+        channel_names: Sequence[str],
+        channel_dtypes: Sequence[DTypeLike],
+        timestamp_dtype: DTypeLike = np.float64,
+    ) -> None:
+        """Allocate the statistics arrays. Any stored window is discarded.
+
+        Args:
+            channel_names: name of each channel.
+            channel_dtypes: data type of each channel.
+            timestamp_dtype: data type of the timestamps. ``float64`` by default.
+
+        Raises:
+            ValueError: If the number of channel names and data types do not match.
+        """
+        if len(channel_names) != len(channel_dtypes):
+            raise ValueError(
+                f"The number of channel names ({len(channel_names)}) and data types"
+                f" ({len(channel_dtypes)}) do not match."
+            )
+        with self.__lock:
+            self.__channel_names = list(channel_names)
+            self.__numeric_channels = [
+                index
+                for index, dtype in enumerate(channel_dtypes)
+                if np.issubdtype(np.dtype(dtype), np.number)
+                or np.issubdtype(np.dtype(dtype), np.bool_)
+            ]
+            self.__allocate(timestamp_dtype)
+            self.__is_open = True
+
+    def put(
+        self,
+        timestamps: NDArray[Any],
+        channels: Sequence[NDArray[Any]],
+        block: bool = False,  # noqa: ARG002
+        cycle_counts: Optional[NDArray[np.uint64]] = None,
+    ) -> bool:
+        """Reduce a window of samples to its statistics.
+
+        Args:
+            timestamps: samples timestamps.
+            channels: an array of values for each channel.
+            block: not used, the window is always reduced right away.
+            cycle_counts: process data cycle of each sample.
+
+        Returns:
+            True if the window is stored, False if it is empty.
+
+        Raises:
+            ValueError: If the aggregator is not open.
+        """
+        if not self.__is_open:
+            raise ValueError("The aggregator is not open.")
+        n_samples = len(timestamps)
+        if n_samples == 0:
+            return False
+        values = np.empty((n_samples, len(self.__numeric_channels)), dtype=np.float64)
+        for column, index in enumerate(self.__numeric_channels):
+            values[:, column] = channels[index]
+        with self.__lock:
+            index = (self.__head + self.__count) % self.__max_windows
+            self.__start_timestamps[index] = timestamps[0]
+            self.__end_timestamps[index] = timestamps[-1]
+            self.__start_cycle_counts[index] = 0 if cycle_counts is None else cycle_counts[0]
+            self.__samples[index] = n_samples
+            min_stats, max_stats, mean_stats, rms_stats = self.__stats[:, index]
+            min_stats[self.__numeric_channels] = values.min(axis=0)
+            max_stats[self.__numeric_channels] = values.max(axis=0)
+            mean_stats[self.__numeric_channels] = values.mean(axis=0)
+            rms_stats[self.__numeric_channels] = np.sqrt(
+                np.einsum("ij,ij->j", values, values) / n_samples
+            )
+            if self.__count == self.__max_windows:
+                self.__head = (self.__head + 1) % self.__max_windows
+                self.__dropped_windows += 1
+            else:
+                self.__count += 1
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:  # noqa: ARG002
+        """Stop receiving windows. The stored windows are kept.
+
+        Args:
+            timeout: not used, the windows are reduced when they are put.
+        """
+        self.__is_open = False
+
+    def pop(self) -> PDOWindowStats:
+        """Retrieve the statistics of the stored windows and discard them.
+
+        Returns:
+            The statistics of the windows, from the oldest to the newest.
+        """
+        with self.__lock:
+            indexes = (self.__head + np.arange(self.__count)) % self.__max_windows
+            window_stats = PDOWindowStats(
+                channel_names=list(self.__channel_names),
+                start_timestamps=self.__start_timestamps[indexes],
+                end_timestamps=self.__end_timestamps[indexes],
+                start_cycle_counts=self.__start_cycle_counts[indexes],
+                samples=self.__samples[indexes],
+                min=self.__stats[0, indexes],
+                max=self.__stats[1, indexes],
+                mean=self.__stats[2, indexes],
+                rms=self.__stats[3, indexes],
+            )
+            self.__head = 0
+            self.__count = 0
+        return window_stats
+
+    @property
+    def window_size(self) -> int:
+        """Number of samples of each window."""
+        return self.__window_size
+
+    @property
+    def is_open(self) -> bool:
+        """True if the aggregator is receiving windows, False otherwise."""
+        return self.__is_open
+
+    @property
+    def available_windows(self) -> int:
+        """Number of stored windows."""
+        return self.__count
+
+    @property
+    def dropped_windows(self) -> int:
+        """Number of windows discarded because the maximum number of windows was exceeded."""
+        return self.__dropped_windows
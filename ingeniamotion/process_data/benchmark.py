@@ -0,0 +1,534 @@
+"""Benchmarks of the process data path, run on a :class:`PDOLoopbackNetwork`.
+
+They need neither an EtherCAT master nor slaves, so they can be run on any machine to catch
+performance regressions. ``examples/process_data_benchmark.py`` runs them and prints the
+results.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast
+
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.exceptions import ILError
+from ingenialink.pdo import RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
+
+from ingeniamotion.enums import PDODispatchMode
+from ingeniamotion.metaclass import DEFAULT_AXIS, DEFAULT_SERVO
+from ingeniamotion.pdo import PDO_MAP_TYPE, PDOPoller
+from ingeniamotion.process_data.decoder import TPDOMapDecoder
+from ingeniamotion.process_data.dispatch import PDOSubscriber
+from ingeniamotion.process_data.loopback import PDOLoopbackNetwork
+from ingeniamotion.process_data.stats import PDOCycleStats, PDOHistogram
+
+if TYPE_CHECKING:
+    from ingeniamotion.motion_controller import MotionController
+
+__all__ = [
+    "PDOBenchmarkResult",
+    "benchmark_decode",
+    "benchmark_fsoe",
+    "benchmark_subscribers",
+    "create_benchmark_maps",
+    "create_fsoe_benchmark_maps",
+    "find_max_channels",
+    "run_benchmarks",
+]
+
+# Data types of the benchmark channels, used in turns
+BENCHMARK_DTYPES = (RegDtype.S32, RegDtype.FLOAT, RegDtype.U16, RegDtype.S16)
+
+# Data type of the items of an FSoE frame: command, data and CRC of each slot, connection ID
+FSOE_COMMAND_DTYPE = RegDtype.U8
+FSOE_SLOT_DTYPE = RegDtype.U16
+FSOE_CONNECTION_ID_DTYPE = RegDtype.U16
+
+
+@dataclass(frozen=True)
+class PDOBenchmarkResult:
+    """Cost of a process data cycle measured by a benchmark."""
+
+    name: str
+    """Name of the benchmark."""
+    channels: int
+    """Number of TPDO channels."""
+    cycles: int
+    """Number of measured cycles."""
+    mean: float
+    """Mean duration of a cycle, in nanoseconds."""
+    p99: int
+    """99th percentile of the duration of a cycle, in nanoseconds."""
+    max: int
+    """Highest duration of a cycle, in nanoseconds."""
+
+    def __str__(self) -> str:
+        """Get a text representation of the result.
+
+        Returns:
+            The name, channels and durations (in microseconds) of the result.
+        """
+        return (
+            f"{self.name:<32} {self.channels:>5} channels  mean {self.mean / 1e3:8.2f} us"
+            f"  p99 {self.p99 / 1e3:8.2f} us  max {self.max / 1e3:8.2f} us"
+        )
+
+
+def create_benchmark_maps(n_channels: int) -> tuple[RPDOMap, TPDOMap]:
+    """Create the PDO maps of a benchmark.
+
+    Args:
+        n_channels: number of TPDO channels.
+
+    Returns:
+        An RPDO map with a setpoint and a TPDO map with ``n_channels`` channels.
+    """
+    rpdo_map = RPDOMap()
+    rpdo_item = RPDOMapItem(
+        EthercatRegister(
+            idx=0x2000,
+            subidx=0,
+            dtype=RegDtype.S32,
+            access=RegAccess.RW,
+            identifier="BENCHMARK_SET_POINT",
+            pdo_access=RegCyclicType.RX,
+        )
+    )
+    rpdo_item.value = 0
+    rpdo_map.add_item(rpdo_item)
+    tpdo_map = TPDOMap()
+    for channel in range(n_channels):
+        tpdo_map.add_item(
+            TPDOMapItem(
+                EthercatRegister(
+                    idx=0x2100 + channel,
+                    subidx=0,
+                    dtype=BENCHMARK_DTYPES[channel % len(BENCHMARK_DTYPES)],
+                    access=RegAccess.RO,
+                    identifier=f"BENCHMARK_CHANNEL_{channel}",
+                    pdo_access=RegCyclicType.TX,
+                )
+            )
+        )
+    return rpdo_map, tpdo_map
+
+
+def _fsoe_frame_registers(
+    prefix: str, idx: int, access: RegAccess, pdo_access: RegCyclicType, n_slots: int
+) -> list[EthercatRegister]:
+    """Create the registers of the items of an FSoE frame.
+
+    Args:
+        prefix: prefix of the register identifiers.
+        idx: index of the first register.
+        access: access of the registers.
+        pdo_access: PDO access of the registers.
+        n_slots: number of data slots of the frame.
+
+    Returns:
+        The registers of the command, the safe data and the CRC of each data slot, and the
+        connection ID.
+    """
+    elements = [("COMMAND", FSOE_COMMAND_DTYPE)]
+    for slot in range(n_slots):
+        elements += [(f"DATA_{slot}", FSOE_SLOT_DTYPE), (f"CRC_{slot}", FSOE_SLOT_DTYPE)]
+    elements.append(("CONNECTION_ID", FSOE_CONNECTION_ID_DTYPE))
+    return [
+        EthercatRegister(
+            idx=idx + index,
+            subidx=0,
+            dtype=dtype,
+            access=access,
+            identifier=f"{prefix}_{element}",
+            pdo_access=pdo_access,
+        )
+        for index, (element, dtype) in enumerate(elements)
+    ]
+
+
+def create_fsoe_benchmark_maps(n_slots: int) -> tuple[RPDOMap, TPDOMap]:
+    """Create the Safety PDU maps of an FSoE benchmark.
+
+    Args:
+        n_slots: number of data slots of the FSoE frames.
+
+    Returns:
+        The Safety Master PDU map, initialized to zeros, and the Safety Slave PDU map.
+    """
+    rpdo_map = RPDOMap()
+    for register in _fsoe_frame_registers(
+        "BENCHMARK_FSOE_MASTER", 0x2200, RegAccess.RW, RegCyclicType.SAFETY_OUTPUT, n_slots
+    ):
+        rpdo_map.add_item(RPDOMapItem(register))
+    rpdo_map.set_item_bytes(bytes(rpdo_map.data_length_bytes))
+    tpdo_map = TPDOMap()
+    for register in _fsoe_frame_registers(
+        "BENCHMARK_FSOE_SLAVE", 0x2300, RegAccess.RO, RegCyclicType.SAFETY_INPUT, n_slots
+    ):
+        tpdo_map.add_item(TPDOMapItem(register))
+    return rpdo_map, tpdo_map
+
+
+class _LoopbackPDONetworkManager:
+    """Stand-in of the PDO network manager that maps the PDO maps into a loopback network.
+
+    It implements the functions that a :class:`PDOPoller` uses, so a real poller can be run
+    on a :class:`PDOLoopbackNetwork`. The cycles are run by the benchmark, so starting and
+    stopping the PDOs does nothing.
+    """
+
+    def __init__(self, network: PDOLoopbackNetwork, registers: dict[str, EthercatRegister]) -> None:
+        self.__network = network
+        self.__registers = registers
+
+    def create_pdo_item(
+        self,
+        register_uid: str,
+        axis: int = DEFAULT_AXIS,  # noqa: ARG002
+        servo: str = DEFAULT_SERVO,  # noqa: ARG002
+        value: Optional[Union[int, float]] = None,  # noqa: ARG002
+    ) -> TPDOMapItem:
+        return TPDOMapItem(self.__registers[register_uid])
+
+    def reuse_pdo_map(
+        self,
+        pdo_map: PDO_MAP_TYPE,
+        servo: str = DEFAULT_SERVO,  # noqa: ARG002
+    ) -> PDO_MAP_TYPE:
+        return pdo_map
+
+    def set_pdo_maps_to_slave(
+        self,
+        rpdo_maps: Union[RPDOMap, list[RPDOMap]],
+        tpdo_maps: Union[TPDOMap, list[TPDOMap]],
+        servo: str = DEFAULT_SERVO,  # noqa: ARG002
+    ) -> None:
+        self.__network.add_maps(rpdo_maps, tpdo_maps)
+
+    def start_pdos(self, **kwargs: Any) -> None:
+        pass
+
+    def stop_pdos(self, servo: str = DEFAULT_SERVO) -> None:
+        pass
+
+    def remove_rpdo_map(self, **kwargs: Any) -> None:
+        pass
+
+    def remove_tpdo_map(self, **kwargs: Any) -> None:
+        pass
+
+    def subscribe_to_exceptions(
+        self,
+        callback: Callable[[ILError], None],
+        servo: str = DEFAULT_SERVO,  # noqa: ARG002
+    ) -> None:
+        self.__network.subscribe_to_exceptions(callback)
+
+    def unsubscribe_to_exceptions(
+        self,
+        callback: Callable[[ILError], None],
+        servo: str = DEFAULT_SERVO,  # noqa: ARG002
+    ) -> None:
+        self.__network.unsubscribe_to_exceptions(callback)
+
+    def subscribe_to_process_data_event(
+        self,
+        pdo_map: PDO_MAP_TYPE,
+        callback: Callable[[], None],
+        servo: str = DEFAULT_SERVO,  # noqa: ARG002
+    ) -> None:
+        pdo_map.subscribe_to_process_data_event(callback)
+
+    def unsubscribe_to_process_data_event(
+        self,
+        pdo_map: PDO_MAP_TYPE,
+        callback: Callable[[], None],  # noqa: ARG002
+        servo: str = DEFAULT_SERVO,  # noqa: ARG002
+    ) -> None:
+        pdo_map.unsubscribe_to_process_data_event()
+
+    def get_cycle_count(self, servo: str = DEFAULT_SERVO) -> int:  # noqa: ARG002
+        return self.__network.cycle_count
+
+
+class _LoopbackCapture:
+    """Capture of a :class:`_LoopbackMotionController`."""
+
+    def __init__(self, pdo: _LoopbackPDONetworkManager) -> None:
+        self.pdo = pdo
+
+
+class _LoopbackMotionController:
+    """Stand-in of the motion controller passed to the pollers of a loopback network."""
+
+    def __init__(self, network: PDOLoopbackNetwork, registers: dict[str, EthercatRegister]) -> None:
+        self.capture = _LoopbackCapture(_LoopbackPDONetworkManager(network, registers))
+
+
+def _start_loopback_poller(
+    network: PDOLoopbackNetwork, n_channels: int, buffer_size: int
+) -> PDOPoller:
+    """Start a PDO poller that records the channels of a benchmark on a loopback network.
+
+    Args:
+        network: loopback network.
+        n_channels: number of TPDO channels.
+        buffer_size: maximum number of readings stored by the poller.
+
+    Returns:
+        The started poller. Its TPDO map is added to the network.
+    """
+    _, tpdo_map = create_benchmark_maps(n_channels)
+    registers = {
+        str(item.register.identifier): cast("EthercatRegister", item.register)
+        for item in tpdo_map.items
+    }
+    mc = _LoopbackMotionController(network, registers)
+    poller = PDOPoller(
+        cast("MotionController", mc),
+        DEFAULT_SERVO,
+        network.refresh_time,
+        watchdog_timeout=None,
+        buffer_size=buffer_size,
+    )
+    poller.add_channels([{"name": uid, "axis": DEFAULT_AXIS} for uid in registers])
+    poller.start()
+    return poller
+
+
+def _measure(
+    name: str, network: PDOLoopbackNetwork, n_channels: int, cycles: int
+) -> PDOBenchmarkResult:
+    """Run cycles of the loopback network one by one and measure their duration.
+
+    Args:
+        name: name of the benchmark.
+        network: loopback network with the maps and subscribers of the benchmark.
+        n_channels: number of TPDO channels.
+        cycles: number of measured cycles.
+
+    Returns:
+        The measured durations.
+    """
+    histogram = PDOHistogram()
+    # Warm up, so the first cycles do not account for lazy initializations
+    network.run_cycles(min(cycles, 100))
+    for _ in range(cycles):
+        start = time.perf_counter_ns()
+        network.run_cycles(1)
+        histogram.record(time.perf_counter_ns() - start)
+    return PDOBenchmarkResult(
+        name=name,
+        channels=n_channels,
+        cycles=cycles,
+        mean=histogram.mean,
+        p99=histogram.percentile(99),
+        max=histogram.max,
+    )
+
+
+def benchmark_decode(n_channels: int = 16, cycles: int = 10_000) -> list[PDOBenchmarkResult]:
+    """Measure the cost of decoding a TPDO map on each cycle.
+
+    The values are read item by item, as the PDO maps provide them, and with a
+    :class:`TPDOMapDecoder`. The cost of a cycle without decoding is measured as a reference.
+
+    Args:
+        n_channels: number of TPDO channels. ``16`` by default.
+        cycles: number of measured cycles. ``10000`` by default.
+
+    Returns:
+        The result of each decoding method.
+    """
+    rpdo_map, tpdo_map = create_benchmark_maps(n_channels)
+    decoder = TPDOMapDecoder(tpdo_map)
+
+    def read_items() -> None:
+        for item in tpdo_map.items:
+            _ = item.value
+
+    def decode_map() -> None:
+        decoder.decode_map()
+
+    results = []
+    for name, callback in [
+        ("cycle", None),
+        ("decode items", read_items),
+        ("decode map", decode_map),
+    ]:
+        network = PDOLoopbackNetwork()
+        network.add_maps(rpdo_map, tpdo_map)
+        if callback is not None:
+            network.subscribe_to_receive_process_data(callback)
+        results.append(_measure(name, network, n_channels, cycles))
+    return results
+
+
+def benchmark_subscribers(
+    n_channels: int = 16, n_subscribers: int = 4, cycles: int = 10_000
+) -> list[PDOBenchmarkResult]:
+    """Measure the cost that the process data subscribers add to each cycle.
+
+    The pollers are real :class:`PDOPoller` instances, each of them with its own TPDO map, as
+    they map their registers themselves.
+
+    Args:
+        n_channels: number of TPDO channels. ``16`` by default.
+        n_subscribers: number of subscribers of each benchmark. ``4`` by default.
+        cycles: number of measured cycles. ``10000`` by default.
+
+    Returns:
+        The result of each kind of subscriber.
+    """
+    results = []
+
+    def poller(
+        decoder: TPDOMapDecoder, network: PDOLoopbackNetwork
+    ) -> Optional[Union[PDOSubscriber, PDOPoller]]:
+        # The poller records the channels of its own TPDO map
+        return _start_loopback_poller(network, len(decoder.channel_dtypes), cycles)
+
+    def subscriber(
+        dispatch: PDODispatchMode,
+    ) -> Callable[[TPDOMapDecoder, PDOLoopbackNetwork], Optional[Union[PDOSubscriber, PDOPoller]]]:
+        def subscribe(
+            decoder: TPDOMapDecoder, network: PDOLoopbackNetwork
+        ) -> Optional[Union[PDOSubscriber, PDOPoller]]:
+            pdo_subscriber = PDOSubscriber(
+                lambda _: None, decoder, lambda: network.cycle_count, dispatch=dispatch
+            )
+            pdo_subscriber.start()
+            network.subscribe_to_receive_process_data(pdo_subscriber)
+            return pdo_subscriber
+
+        return subscribe
+
+    def timed_callback(
+        decoder: TPDOMapDecoder, network: PDOLoopbackNetwork
+    ) -> Optional[Union[PDOSubscriber, PDOPoller]]:
+        def decode_map() -> None:
+            decoder.decode_map()
+
+        cycle_stats = PDOCycleStats()
+        network.subscribe_to_send_process_data(cycle_stats.record_cycle)
+        network.subscribe_to_receive_process_data(
+            cycle_stats.timed_callback(decode_map, receive=True)
+        )
+        return None
+
+    for name, subscribe in [
+        ("poller", poller),
+        ("subscriber inline", subscriber(PDODispatchMode.INLINE)),
+        ("subscriber thread", subscriber(PDODispatchMode.THREAD)),
+        ("cycle stats", timed_callback),
+    ]:
+        rpdo_map, tpdo_map = create_benchmark_maps(n_channels)
+        decoder = TPDOMapDecoder(tpdo_map)
+        network = PDOLoopbackNetwork()
+        network.add_maps(rpdo_map, tpdo_map)
+        subscribers = [subscribe(decoder, network) for _ in range(n_subscribers)]
+        results.append(_measure(f"{name} x{n_subscribers}", network, n_channels, cycles))
+        for subscriber_or_poller in subscribers:
+            if subscriber_or_poller is not None:
+                subscriber_or_poller.stop()
+    return results
+
+
+def benchmark_fsoe(n_slots: int = 4, cycles: int = 10_000) -> list[PDOBenchmarkResult]:
+    """Measure the cost of exchanging the FSoE frames through the Safety PDUs on each cycle.
+
+    The Safety PDU maps are handled as the FSoE master handler does: the request frame is set
+    to the Safety Master PDU before it is sent, and the reply frame is taken from the Safety
+    Slave PDU when it is received. The frames are not built nor checked, since the FSoE
+    protocol is implemented by the optional ``fsoe_master`` package and its cost does not
+    depend on the process data path. The cost of a cycle without the FSoE callbacks is
+    measured as a reference.
+
+    Args:
+        n_slots: number of data slots of the FSoE frames. ``4`` by default.
+        cycles: number of measured cycles. ``10000`` by default.
+
+    Returns:
+        The result of each benchmark. Their channels are the items of the Safety Slave PDU.
+    """
+    results = []
+    for name, exchange_frames in [("fsoe cycle", False), ("fsoe frames", True)]:
+        rpdo_map, tpdo_map = create_fsoe_benchmark_maps(n_slots)
+        request = bytes(rpdo_map.data_length_bytes)
+
+        def get_request(rpdo_map: RPDOMap = rpdo_map) -> None:
+            rpdo_map.set_item_bytes(request)
+
+        def set_reply(tpdo_map: TPDOMap = tpdo_map) -> None:
+            _ = tpdo_map.get_item_bytes()
+
+        if exchange_frames:
+            rpdo_map.subscribe_to_process_data_event(get_request)
+            tpdo_map.subscribe_to_process_data_event(set_reply)
+        network = PDOLoopbackNetwork()
+        network.add_maps(rpdo_map, tpdo_map)
+        results.append(_measure(name, network, len(tpdo_map.items), cycles))
+    return results
+
+
+def find_max_channels(
+    refresh_time: float = 0.001,
+    load: float = 0.5,
+    max_channels: int = 4096,
+    cycles: int = 1000,
+) -> int:
+    """Find the highest number of channels that the PDO poller can record on each cycle.
+
+    A number of channels is sustainable if the 99th percentile of the cycle duration, with the
+    work of the poller, is within a fraction of the refresh time. The cycle runs on the calling
+    thread, so the result depends on the machine load.
+
+    Args:
+        refresh_time: period of the process data cycles, in seconds. ``0.001`` by default.
+        load: fraction of the refresh time that the cycle can take. ``0.5`` by default.
+        max_channels: highest number of channels to try. ``4096`` by default.
+        cycles: number of measured cycles for each number of channels. ``1000`` by default.
+
+    Returns:
+        The highest sustainable number of channels. ``0`` if a single channel is not
+        sustainable.
+    """
+    budget_ns = refresh_time * load * 1e9
+
+    def is_sustainable(n_channels: int) -> bool:
+        network = PDOLoopbackNetwork(refresh_time)
+        poller = _start_loopback_poller(network, n_channels, cycles)
+        try:
+            return _measure("poller", network, n_channels, cycles).p99 <= budget_ns
+        finally:
+            poller.stop()
+
+    # Double the number of channels until it is not sustainable, then bisect
+    lowest, highest = 0, 1
+    while highest <= max_channels and is_sustainable(highest):
+        lowest, highest = highest, highest * 2
+    highest = min(highest, max_channels + 1)
+    while highest - lowest > 1:
+        middle = (lowest + highest) // 2
+        if is_sustainable(middle):
+            lowest = middle
+        else:
+            highest = middle
+    return lowest
+
+
+def run_benchmarks(n_channels: int = 16, cycles: int = 10_000) -> list[PDOBenchmarkResult]:
+    """Run the decoding, subscribers and FSoE benchmarks.
+
+    Args:
+        n_channels: number of TPDO channels. ``16`` by default.
+        cycles: number of measured cycles of each benchmark. ``10000`` by default.
+
+    Returns:
+        The result of each benchmark.
+    """
+    return (
+        benchmark_decode(n_channels, cycles)
+        + benchmark_subscribers(n_channels, cycles=cycles)
+        + benchmark_fsoe(cycles=cycles)
+    )
@@ -0,0 +1,146 @@
+import threading
+from collections.abc import Sequence
+from typing import Any, Union
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+__all__ = ["PDOBuffer"]
+
+
+class PDOBuffer:
+    """Preallocated columnar ring buffer to store PDO samples.
+
+    Each channel is stored in its own typed array, as well as the timestamps and the process
+    data cycle counts, so appending a sample does not allocate any memory and the stored samples
+    can be retrieved with a single slice per channel.
+
+    When the buffer is full, the oldest sample is overwritten by the new one and it is accounted
+    in :attr:`dropped_samples`.
+
+    Args:
+        dtypes: data type of each channel.
+        size: maximum number of samples to store.
+        timestamp_dtype: data type of the timestamps. ``float64`` by default.
+
+    Raises:
+        ValueError: If the size is lower than 1.
+    """
+
+    def __init__(
+        self, dtypes: Sequence[DTypeLike], size: int, timestamp_dtype: DTypeLike = np.float64
+    ) -> None:
+        if size < 1:
+            raise ValueError("The buffer size must be 1 or higher.")
+        self.__size = size
+        self.__timestamps: NDArray[Any] = np.zeros(size, dtype=timestamp_dtype)
+        self.__cycle_counts: NDArray[np.uint64] = np.zeros(size, dtype=np.uint64)
+        self.__channels: list[NDArray[Any]] = [np.zeros(size, dtype=dtype) for dtype in dtypes]
+        self.__head = 0
+        self.__count = 0
+        self.__dropped_samples = 0
+        self.__lock = threading.Lock()
+
+    def append(
+        self,
+        timestamp: Union[int, float],
+        sample: Sequence[Union[int, float, bool, bytes]],
+        cycle_count: int = 0,
+    ) -> None:
+        """Store a sample.
+
+        Args:
+            timestamp: sample timestamp.
+            sample: value of each channel.
+            cycle_count: process data cycle in which the sample was received. ``0`` by default.
+        """
+        with self.__lock:
+            index = (self.__head + self.__count) % self.__size
+            self.__timestamps[index] = timestamp
+            self.__cycle_counts[index] = cycle_count
+            for channel, value in zip(self.__channels, sample):
+                channel[index] = value
+            if self.__count == self.__size:
+                self.__head = (self.__head + 1) % self.__size
+                self.__dropped_samples += 1
+            else:
+                self.__count += 1
+
+    def pop(self, copy: bool = True) -> tuple[NDArray[Any], list[NDArray[Any]]]:
+        """Retrieve all the stored samples and empty the buffer.
+
+        Args:
+            copy: if ``True`` the returned arrays are copies of the buffer. If ``False``, views of
+                the buffer are returned when the samples are contiguous in memory. Views are
+                overwritten once the buffer wraps around, so they should be consumed before
+                ``size`` new samples are stored. ``True`` by default.
+
+        Returns:
+            The samples timestamps and a list with an array of values for each channel.
+        """
+        timestamps, _, channels = self.pop_with_cycle_counts(copy=copy)
+        return timestamps, channels
+
+    def pop_with_cycle_counts(
+        self, copy: bool = True
+    ) -> tuple[NDArray[Any], NDArray[np.uint64], list[NDArray[Any]]]:
+        """Retrieve all the stored samples, with their cycle counts, and empty the buffer.
+
+        Args:
+            copy: if ``True`` the returned arrays are copies of the buffer. If ``False``, views of
+                the buffer are returned when the samples are contiguous in memory. Views are
+                overwritten once the buffer wraps around, so they should be consumed before
+                ``size`` new samples are stored. ``True`` by default.
+
+        Returns:
+            The samples timestamps, the samples cycle counts and a list with an array of values
+            for each channel.
+        """
+        with self.__lock:
+            start = self.__head
+            stop = self.__head + self.__count
+            timestamps = self.__slice(self.__timestamps, start, stop, copy)
+            cycle_counts = self.__slice(self.__cycle_counts, start, stop, copy)
+            channels = [self.__slice(channel, start, stop, copy) for channel in self.__channels]
+            # Keep writing after the retrieved samples, so views stay valid as long as possible
+            self.__head = stop % self.__size
+            self.__count = 0
+        return timestamps, cycle_counts, channels
+
+    def clear(self) -> None:
+        """Discard the stored samples and reset the dropped samples counter."""
+        with self.__lock:
+            self.__head = 0
+            self.__count = 0
+            self.__dropped_samples = 0
+
+    def __slice(self, array: NDArray[Any], start: int, stop: int, copy: bool) -> NDArray[Any]:
+        if stop <= self.__size:
+            array_slice = array[start:stop]
+            return array_slice.copy() if copy else array_slice
+        return np.concatenate((array[start:], array[: stop - self.__size]))
+
+    @property
+    def size(self) -> int:
+        """Maximum number of samples that can be stored."""
+        return self.__size
+
+    @property
+    def available_samples(self) -> int:
+        """Number of samples in the buffer."""
+        return self.__count
+
+    @property
+    def dropped_samples(self) -> int:
+        """Number of samples overwritten before being retrieved."""
+        return self.__dropped_samples
+
+    @property
+    def timestamp_dtype(self) -> np.dtype[Any]:
+        """Data type of the timestamps."""
+        return self.__timestamps.dtype
+
+    @property
+    def channel_dtypes(self) -> list[np.dtype[Any]]:
+        """Data type of each channel."""
+        return [channel.dtype for channel in self.__channels]
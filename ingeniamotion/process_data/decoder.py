@@ -0,0 +1,327 @@
+import struct
+from dataclasses import dataclass
+from typing import Any, Union
+
+import numpy as np
+from ingenialink.enums.register import RegDtype
+from ingenialink.pdo import PADDING_REGISTER_IDENTIFIER, PDOMapItem, TPDOMap
+from numpy.typing import NDArray
+
+from ingeniamotion._utils import reg_dtype_to_numpy
+
+__all__ = ["TPDOMapDecoder"]
+
+PDO_VALUE = Union[int, float, bool, bytes]
+
+
+@dataclass(frozen=True)
+class _BitField:
+    """Channel that is not byte aligned within the TPDO payload."""
+
+    channel: int
+    """Index of the channel in the decoded sample."""
+    value_index: int
+    """Index of the struct value that contains the bytes of the bit group."""
+    group_offset: int
+    """Offset (in bytes) of the bit group within the payload."""
+    shift: int
+    """Position (in bits) of the channel within the bit group."""
+    size_bits: int
+    """Number of bits mapped in the payload."""
+    value_bits: int
+    """Number of mapped bits that are part of the value."""
+    sign_bits: int
+    """Width (in bits) used to interpret the sign of the value. 0 for unsigned values."""
+    dtype: RegDtype
+
+
+class TPDOMapDecoder:
+    """Decode the raw data of a TPDO map in a single call.
+
+    The layout of the map (item sizes, bit offsets and padding) is compiled once into a
+    :class:`struct.Struct` and a structured NumPy data type, so decoding a received payload does
+    not require to convert each item separately.
+
+    Note that the decoder has to be created again if the TPDO map items are modified.
+
+    Args:
+        tpdo_map: TPDO map to decode.
+
+    Raises:
+        ValueError: If the map contains an item that cannot be decoded.
+    """
+
+    __STRUCT_FORMATS = {
+        RegDtype.U8: "B",
+        RegDtype.S8: "b",
+        RegDtype.U16: "H",
+        RegDtype.S16: "h",
+        RegDtype.U32: "I",
+        RegDtype.S32: "i",
+        RegDtype.U64: "Q",
+        RegDtype.S64: "q",
+        RegDtype.FLOAT: "f",
+    }
+    __SIGNED_DTYPES = (RegDtype.S8, RegDtype.S16, RegDtype.S32, RegDtype.S64)
+    __MAX_BIT_FIELD_BYTES = 8
+
+    def __init__(self, tpdo_map: TPDOMap) -> None:
+        self.__tpdo_map = tpdo_map
+        self.__items: list[PDOMapItem] = []
+        self.__format = "<"
+        self.__value_channels: list[int] = []
+        self.__bit_fields: list[_BitField] = []
+        self.__numpy_fields: dict[str, tuple[np.dtype[Any], int]] = {}
+        self.__compile(tpdo_map)
+        self.__struct = struct.Struct(self.__format)
+        self.__is_direct = not self.__bit_fields
+        self.__dtype = np.dtype({
+            "names": list(self.__numpy_fields),
+            "formats": [numpy_dtype for numpy_dtype, _ in self.__numpy_fields.values()],
+            "offsets": [offset for _, offset in self.__numpy_fields.values()],
+            "itemsize": self.__struct.size,
+        })
+
+    def __compile(self, tpdo_map: TPDOMap) -> None:
+        items = tpdo_map.items
+        offset_bits = 0
+        item_index = 0
+        while item_index < len(items):
+            item = items[item_index]
+            if offset_bits % 8 == 0 and self.__is_byte_aligned(item):
+                self.__add_aligned_item(item, offset_bits // 8)
+                offset_bits += item.size_bits
+                item_index += 1
+                continue
+            # Group the consecutive items that are not byte aligned
+            group_offset_bits = offset_bits
+            group_items: list[tuple[PDOMapItem, int]] = []
+            while item_index < len(items) and (
+                offset_bits % 8 != 0 or not self.__is_byte_aligned(items[item_index])
+            ):
+                group_items.append((items[item_index], offset_bits - group_offset_bits))
+                offset_bits += items[item_index].size_bits
+                item_index += 1
+            self.__add_bit_group(group_items, group_offset_bits // 8, offset_bits)
+
+    def __is_byte_aligned(self, item: PDOMapItem) -> bool:
+        if item.size_bits % 8 != 0:
+            return False
+        if item.register.identifier == PADDING_REGISTER_IDENTIFIER:
+            return True
+        if item.register.dtype in self.__STRUCT_FORMATS:
+            numpy_dtype = reg_dtype_to_numpy(item.register.dtype)
+            return bool(item.size_bits == numpy_dtype.itemsize * 8)
+        return item.register.dtype in (RegDtype.STR, RegDtype.BYTE_ARRAY_512)
+
+    def __add_aligned_item(self, item: PDOMapItem, offset: int) -> None:
+        size_bytes = item.size_bits // 8
+        if item.register.identifier == PADDING_REGISTER_IDENTIFIER:
+            self.__format += f"{size_bytes}x"
+            return
+        channel = self.__add_channel(item)
+        self.__value_channels.append(channel)
+        if item.register.dtype in self.__STRUCT_FORMATS:
+            self.__format += self.__STRUCT_FORMATS[item.register.dtype]
+            numpy_dtype = reg_dtype_to_numpy(item.register.dtype)
+        else:
+            self.__format += f"{size_bytes}s"
+            numpy_dtype = np.dtype(f"S{size_bytes}")
+        self.__numpy_fields[self.__field_name(channel)] = (numpy_dtype, offset)
+
+    def __add_bit_group(
+        self, group_items: list[tuple[PDOMapItem, int]], offset: int, end_offset_bits: int
+    ) -> None:
+        group_size_bytes = -(-(end_offset_bits - offset * 8) // 8)
+        value_index = len(self.__value_channels)
+        self.__format += f"{group_size_bytes}s"
+        self.__value_channels.append(-1)
+        for item, shift in group_items:
+            if item.register.identifier == PADDING_REGISTER_IDENTIFIER:
+                continue
+            if item.register.dtype not in self.__STRUCT_FORMATS and (
+                item.register.dtype != RegDtype.BOOL
+            ):
+                raise ValueError(
+                    f"Register {item.register.identifier} of type {item.register.dtype} cannot "
+                    "be decoded if it is not byte aligned."
+                )
+            if item.register.dtype == RegDtype.FLOAT and item.size_bits != 32:
+                raise ValueError(
+                    f"Register {item.register.identifier} is a float and must be 32 bits long."
+                )
+            first_byte, last_byte = shift // 8, (shift + item.size_bits - 1) // 8
+            if last_byte - first_byte + 1 > self.__MAX_BIT_FIELD_BYTES:
+                raise ValueError(
+                    f"Register {item.register.identifier} is not byte aligned and spans more "
+                    f"than {self.__MAX_BIT_FIELD_BYTES} bytes."
+                )
+            # Values are truncated and their sign interpreted as ingenialink does
+            dtype_bits = (
+                item.size_bits
+                if item.register.dtype == RegDtype.BOOL
+                else reg_dtype_to_numpy(item.register.dtype).itemsize * 8
+            )
+            sign_bits = (
+                min(-(-item.size_bits // 8) * 8, dtype_bits)
+                if item.register.dtype in self.__SIGNED_DTYPES
+                else 0
+            )
+            channel = self.__add_channel(item)
+            self.__bit_fields.append(
+                _BitField(
+                    channel=channel,
+                    value_index=value_index,
+                    group_offset=offset,
+                    shift=shift,
+                    size_bits=item.size_bits,
+                    value_bits=min(item.size_bits, dtype_bits),
+                    sign_bits=sign_bits,
+                    dtype=item.register.dtype,
+                )
+            )
+        self.__numpy_fields[f"_group_{value_index}"] = (
+            np.dtype((np.uint8, (group_size_bytes,))),
+            offset,
+        )
+
+    def __add_channel(self, item: PDOMapItem) -> int:
+        self.__items.append(item)
+        return len(self.__items) - 1
+
+    @staticmethod
+    def __field_name(channel: int) -> str:
+        return f"channel_{channel}"
+
+    def decode(self, payload: bytes) -> tuple[PDO_VALUE, ...]:
+        """Decode the raw data of the TPDO map.
+
+        Args:
+            payload: raw data of the TPDO map.
+
+        Returns:
+            Value of each item of the map, padding items excluded.
+
+        Raises:
+            ValueError: If the payload length does not match the map length.
+        """
+        if len(payload) != self.__struct.size:
+            raise ValueError(
+                f"The length of the payload is incorrect. Expected {self.__struct.size},"
+                f" obtained {len(payload)}"
+            )
+        values = self.__struct.unpack(payload)
+        if self.__is_direct:
+            return values
+        sample: list[PDO_VALUE] = [0] * len(self.__items)
+        for value, channel in zip(values, self.__value_channels):
+            if channel >= 0:
+                sample[channel] = value
+        for bit_field in self.__bit_fields:
+            group = int.from_bytes(values[bit_field.value_index], "little")
+            raw_value = (group >> bit_field.shift) & ((1 << bit_field.value_bits) - 1)
+            sample[bit_field.channel] = self.__convert_raw_value(raw_value, bit_field)
+        return tuple(sample)
+
+    def __convert_raw_value(self, raw_value: int, bit_field: _BitField) -> PDO_VALUE:
+        if bit_field.dtype == RegDtype.BOOL:
+            return bool(raw_value)
+        if bit_field.dtype == RegDtype.FLOAT:
+            return float(struct.unpack("<f", raw_value.to_bytes(4, "little"))[0])
+        if bit_field.sign_bits and raw_value >> (bit_field.sign_bits - 1):
+            return raw_value - (1 << bit_field.sign_bits)
+        return raw_value
+
+    def decode_map(self) -> tuple[PDO_VALUE, ...]:
+        """Decode the last data received by the TPDO map.
+
+        It can be used from any callback subscribed to the receive process data notifications.
+
+        Returns:
+            Value of each item of the map, padding items excluded.
+        """
+        return self.decode(self.__tpdo_map.get_item_bytes())
+
+    def decode_frames(self, payloads: Union[bytes, NDArray[np.uint8]]) -> list[NDArray[Any]]:
+        """Decode several consecutive payloads of the TPDO map at once.
+
+        Args:
+            payloads: concatenated raw data of the TPDO map.
+
+        Returns:
+            An array with the values of each item of the map, padding items excluded.
+
+        Raises:
+            ValueError: If the payloads length is not a multiple of the map length.
+        """
+        if len(payloads) % self.__struct.size != 0:
+            raise ValueError(
+                f"The length of the payloads ({len(payloads)}) is not a multiple of the map"
+                f" length ({self.__struct.size})."
+            )
+        frames = np.frombuffer(payloads, dtype=self.__dtype)
+        channels: list[NDArray[Any]] = [np.empty(0)] * len(self.__items)
+        for channel in self.__value_channels:
+            if channel >= 0:
+                channels[channel] = frames[self.__field_name(channel)].copy()
+        for bit_field in self.__bit_fields:
+            channels[bit_field.channel] = self.__decode_bit_field_frames(frames, bit_field)
+        return channels
+
+    def __decode_bit_field_frames(self, frames: NDArray[Any], bit_field: _BitField) -> NDArray[Any]:
+        group = frames[f"_group_{bit_field.value_index}"]
+        first_byte = bit_field.shift // 8
+        last_byte = (bit_field.shift + bit_field.size_bits - 1) // 8
+        raw_values = np.zeros(len(frames), dtype=np.uint64)
+        for byte_index in range(first_byte, last_byte + 1):
+            raw_values |= group[:, byte_index].astype(np.uint64) << np.uint64(
+                8 * (byte_index - first_byte)
+            )
+        raw_values >>= np.uint64(bit_field.shift % 8)
+        if bit_field.value_bits < 64:
+            raw_values &= np.uint64((1 << bit_field.value_bits) - 1)
+        if bit_field.dtype == RegDtype.BOOL:
+            return np.not_equal(raw_values, 0)
+        if bit_field.dtype == RegDtype.FLOAT:
+            return raw_values.astype(np.uint32).view(np.float32)
+        numpy_dtype = reg_dtype_to_numpy(bit_field.dtype)
+        if bit_field.sign_bits:
+            signed_values = raw_values.view(np.int64)
+            if bit_field.sign_bits < 64:
+                sign_bit = np.int64(1 << (bit_field.sign_bits - 1))
+                signed_values = (signed_values ^ sign_bit) - sign_bit
+            return signed_values.astype(numpy_dtype)
+        return raw_values.astype(numpy_dtype)
+
+    @property
+    def size_bytes(self) -> int:
+        """Length of the TPDO map payload in bytes."""
+        return self.__struct.size
+
+    @property
+    def items(self) -> tuple[PDOMapItem, ...]:
+        """Decoded items of the map, padding items excluded."""
+        return tuple(self.__items)
+
+    @property
+    def channel_dtypes(self) -> list[np.dtype[Any]]:
+        """NumPy data type of each decoded item."""
+        return [
+            np.dtype(f"S{item.size_bits // 8}")
+            if item.register.dtype in (RegDtype.STR, RegDtype.BYTE_ARRAY_512)
+            else reg_dtype_to_numpy(item.register.dtype)
+            for item in self.__items
+        ]
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Structured NumPy data type of the TPDO map payload.
+
+        Bit aligned items are grouped in ``_group_<n>`` byte fields.
+        """
+        return self.__dtype
+
+    @property
+    def payload_struct(self) -> struct.Struct:
+        """Struct used to unpack the TPDO map payload."""
+        return self.__struct
@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ingenialogger import get_logger
+
+from ingeniamotion.enums import PDODispatchMode
+from ingeniamotion.process_data.decoder import PDO_VALUE, TPDOMapDecoder
+
+__all__ = ["PDOSample", "PDOSubscriber"]
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PDOSample:
+    """Values of a TPDO map received in a process data cycle."""
+
+    cycle_count: int
+    """Process data cycle in which the values were received."""
+    timestamp: int
+    """Monotonic time at which the values were received, in nanoseconds."""
+    values: tuple[PDO_VALUE, ...]
+    """Value of each item of the map, padding items excluded."""
+
+
+class PDOSubscriber:
+    """Deliver the values of a TPDO map to a callback on each process data cycle.
+
+    The subscriber is notified on the PDO thread, where it decodes the map into a
+    :class:`PDOSample`. With the ``INLINE`` dispatch mode the callback is called right away, so
+    it should be lightweight, as it delays the process data cycle of every servo of the network.
+    With the ``THREAD`` dispatch mode the sample is queued in a bounded queue and the callback
+    is called from a worker thread of the subscriber, so a slow callback does not delay the
+    cycle. When the queue is full, the oldest sample is discarded and accounted in
+    :attr:`overflows`.
+
+    Args:
+        callback: function called with each sample.
+        decoder: decoder of the TPDO map.
+        cycle_count: function that returns the current process data cycle count.
+        dispatch: thread on which the callback is called. ``THREAD`` by default.
+        max_queued_samples: maximum number of samples waiting to be delivered with the
+            ``THREAD`` dispatch mode. ``100`` by default.
+
+    Raises:
+        ValueError: If the maximum number of queued samples is lower than 1.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[PDOSample], None],
+        decoder: TPDOMapDecoder,
+        cycle_count: Callable[[], int],
+        dispatch: PDODispatchMode = PDODispatchMode.THREAD,
+        max_queued_samples: int = 100,
+    ) -> None:
+        if max_queued_samples < 1:
+            raise ValueError("The maximum number of queued samples must be 1 or higher.")
+        self.__callback = callback
+        self.__decoder = decoder
+        self.__cycle_count = cycle_count
+        self.__dispatch = dispatch
+        # Appending to and popping from a deque are atomic, no lock is needed for them
+        self.__queue: deque[PDOSample] = deque(maxlen=max_queued_samples)
+        self.__sample_available = threading.Event()
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__overflows = 0
+        self.__delivered_samples = 0
+        self.__name = getattr(callback, "__qualname__", repr(callback))
+
+    def start(self) -> None:
+        """Start the worker thread, if the dispatch mode is ``THREAD``."""
+        if self.__dispatch != PDODispatchMode.THREAD or self.__thread is not None:
+            return
+        self.__stop.clear()
+        self.__thread = threading.Thread(
+            target=self.__worker_loop, name=f"PDOSubscriber-{self.__name}", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Deliver the queued samples and stop the worker thread.
+
+        Args:
+            timeout: maximum time (in seconds) to wait for the queued samples to be delivered.
+                If ``None``, it waits until all of them are delivered.
+        """
+        if self.__thread is None:
+            return
+        self.__stop.set()
+        self.__sample_available.set()
+        self.__thread.join(timeout)
+        self.__thread = None
+
+    def __call__(self) -> None:
+        """Decode the TPDO map and deliver the sample. Called on each process data cycle."""
+        sample = PDOSample(
+            cycle_count=self.__cycle_count(),
+            timestamp=time.perf_counter_ns(),
+            values=self.__decoder.decode_map(),
+        )
+        if self.__dispatch == PDODispatchMode.INLINE:
+            self.__deliver(sample)
+            return
+        if len(self.__queue) == self.__queue.maxlen:
+            # The deque discards the oldest sample by itself
+            self.__overflows += 1
+        self.__queue.append(sample)
+        self.__sample_available.set()
+
+    def __worker_loop(self) -> None:
+        while True:
+            self.__sample_available.wait()
+            self.__sample_available.clear()
+            while self.__queue:
+                self.__deliver(self.__queue.popleft())
+            if self.__stop.is_set():
+                return
+
+    def __deliver(self, sample: PDOSample) -> None:
+        try:
+            self.__callback(sample)
+        except Exception:
+            # A failing callback must not stop the PDO thread nor the worker thread
+            logger.exception(f"PDO subscriber {self.__name} raised an exception.")
+        self.__delivered_samples += 1
+
+    @property
+    def name(self) -> str:
+        """Name of the callback."""
+        return self.__name
+
+    @property
+    def dispatch(self) -> PDODispatchMode:
+        """Thread on which the callback is called."""
+        return self.__dispatch
+
+    @property
+    def queued_samples(self) -> int:
+        """Number of samples waiting to be delivered."""
+        return len(self.__queue)
+
+    @property
+    def overflows(self) -> int:
+        """Number of samples discarded because the queue was full."""
+        return self.__overflows
+
+    @property
+    def delivered_samples(self) -> int:
+        """Number of samples delivered to the callback."""
+        return self.__delivered_samples
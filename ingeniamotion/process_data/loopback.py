@@ -0,0 +1,308 @@
+import threading
+import time
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+from ingenialink.enums.register import RegDtype
+from ingenialink.exceptions import ILError
+from ingenialink.pdo import PADDING_REGISTER_IDENTIFIER, RPDOMap, TPDOMap
+from ingenialogger import get_logger
+from numpy.typing import NDArray
+
+from ingeniamotion._utils import reg_dtype_to_numpy
+
+__all__ = ["PDOLoopbackNetwork", "synthetic_tpdo_frames"]
+
+logger = get_logger(__name__)
+
+
+def synthetic_tpdo_frames(tpdo_map: TPDOMap, cycles: int = 1000) -> NDArray[np.uint8]:
+    """Generate the raw data of a TPDO map for a number of cycles.
+
+    Each item gets a periodic signal that depends on its position in the map: a sine for the
+    floating point registers, a sawtooth for the integer registers and a square wave for the
+    boolean registers. Padding items, and items that are neither byte aligned nor boolean, are
+    left as ``0``.
+
+    Args:
+        tpdo_map: TPDO map.
+        cycles: number of cycles. ``1000`` by default.
+
+    Returns:
+        The raw data of each cycle, as an array of ``cycles`` rows of
+        ``tpdo_map.data_length_bytes`` bytes.
+
+    Raises:
+        ValueError: If the number of cycles is lower than 1.
+    """
+    if cycles < 1:
+        raise ValueError("The number of cycles must be 1 or higher.")
+    frames = np.zeros((cycles, tpdo_map.data_length_bytes), dtype=np.uint8)
+    cycle = np.arange(cycles)
+    offset_bits = 0
+    for index, item in enumerate(tpdo_map.items):
+        item_offset_bits, offset_bits = offset_bits, offset_bits + item.size_bits
+        if item.register.identifier == PADDING_REGISTER_IDENTIFIER:
+            continue
+        period = 10 * (index + 1)
+        if item.register.dtype == RegDtype.BOOL:
+            bits = ((cycle // period) % 2) << (item_offset_bits % 8)
+            frames[:, item_offset_bits // 8] |= bits.astype(np.uint8)
+            continue
+        dtype = reg_dtype_to_numpy(item.register.dtype)
+        if (
+            dtype == np.dtype(object)
+            or item_offset_bits % 8
+            or item.size_bits != dtype.itemsize * 8
+        ):
+            continue
+        if np.issubdtype(dtype, np.floating):
+            values: NDArray[Any] = (index + 1) * np.sin(2 * np.pi * cycle / period)
+        else:
+            values = (cycle % period) * (index + 1)
+        start = item_offset_bits // 8
+        frames[:, start : start + dtype.itemsize] = (
+            values.astype(dtype.newbyteorder("<")).reshape(cycles, 1).view(np.uint8)
+        )
+    return frames
+
+
+class PDOLoopbackNetwork:
+    """Local stand-in of a process data network, to run the PDO maps without an EtherCAT master.
+
+    On each process data cycle, it notifies the send process data subscribers, collects the
+    raw data of the RPDO maps, fills the TPDO maps with synthetic data and notifies the receive
+    process data subscribers, in the same order as the PDO thread of a real network. The process
+    data events of the maps are notified too, so the PDO pollers, subscribers and FSoE handlers
+    can be attached to it through their maps.
+
+    The synthetic data of the TPDO maps is generated with :func:`synthetic_tpdo_frames` when the
+    maps are added, so a cycle only copies the raw data to the maps.
+
+    Args:
+        refresh_time: period of the process data cycles, in seconds. ``0.001`` by default.
+        synthetic_cycles: number of cycles of synthetic data generated for each TPDO map. The
+            data is repeated after that number of cycles. ``1000`` by default.
+
+    Raises:
+        ValueError: If the refresh time is not positive.
+    """
+
+    def __init__(self, refresh_time: float = 0.001, synthetic_cycles: int = 1000) -> None:
+        if refresh_time <= 0:
+            raise ValueError("The refresh time must be positive.")
+        self.__refresh_time = refresh_time
+        self.__synthetic_cycles = synthetic_cycles
+        self.__rpdo_maps: list[RPDOMap] = []
+        self.__tpdo_maps: list[TPDOMap] = []
+        self.__tpdo_frames: list[list[bytes]] = []
+        self.__rpdo_data: list[bytes] = []
+        self.__send_callbacks: list[Callable[[], None]] = []
+        self.__receive_callbacks: list[Callable[[], None]] = []
+        self.__exception_callbacks: list[Callable[[ILError], None]] = []
+        self.__thread: Optional[threading.Thread] = None
+        self.__stop = threading.Event()
+        self.__cycle_count = 0
+        self.__late_cycles = 0
+
+    def add_maps(
+        self,
+        rpdo_maps: Union[RPDOMap, list[RPDOMap]],
+        tpdo_maps: Union[TPDOMap, list[TPDOMap]],
+    ) -> None:
+        """Add PDO maps to the network, as if they were mapped to a slave.
+
+        Args:
+            rpdo_maps: RPDO maps. Their items must have a value.
+            tpdo_maps: TPDO maps.
+
+        Raises:
+            ValueError: If the network is active.
+        """
+        if self.is_active:
+            raise ValueError("The maps can not be modified while the network is active.")
+        if isinstance(rpdo_maps, RPDOMap):
+            rpdo_maps = [rpdo_maps]
+        if isinstance(tpdo_maps, TPDOMap):
+            tpdo_maps = [tpdo_maps]
+        self.__rpdo_maps.extend(rpdo_maps)
+        self.__rpdo_data.extend(b"" for _ in rpdo_maps)
+        for tpdo_map in tpdo_maps:
+            frames = synthetic_tpdo_frames(tpdo_map, self.__synthetic_cycles)
+            self.__tpdo_maps.append(tpdo_map)
+            self.__tpdo_frames.append([frame.tobytes() for frame in frames])
+
+    def clear_maps(self) -> None:
+        """Remove all the PDO maps.
+
+        Raises:
+            ValueError: If the network is active.
+        """
+        if self.is_active:
+            raise ValueError("The maps can not be modified while the network is active.")
+        self.__rpdo_maps.clear()
+        self.__rpdo_data.clear()
+        self.__tpdo_maps.clear()
+        self.__tpdo_frames.clear()
+
+    def subscribe_to_send_process_data(self, callback: Callable[[], None]) -> None:
+        """Subscribe to the send process data notifications.
+
+        Args:
+            callback: Function to be called before the RPDO maps are collected.
+        """
+        self.__send_callbacks.append(callback)
+
+    def subscribe_to_receive_process_data(self, callback: Callable[[], None]) -> None:
+        """Subscribe to the receive process data notifications.
+
+        Args:
+            callback: Function to be called after the TPDO maps are filled.
+        """
+        self.__receive_callbacks.append(callback)
+
+    def subscribe_to_exceptions(self, callback: Callable[[ILError], None]) -> None:
+        """Get notified when an exception stops the cycle thread.
+
+        Args:
+            callback: Function to be called with the exception.
+        """
+        self.__exception_callbacks.append(callback)
+
+    def unsubscribe_to_send_process_data(self, callback: Callable[[], None]) -> None:
+        """Unsubscribe from the send process data notifications.
+
+        Args:
+            callback: Subscribed callback.
+        """
+        if callback in self.__send_callbacks:
+            self.__send_callbacks.remove(callback)
+
+    def unsubscribe_to_receive_process_data(self, callback: Callable[[], None]) -> None:
+        """Unsubscribe from the receive process data notifications.
+
+        Args:
+            callback: Subscribed callback.
+        """
+        if callback in self.__receive_callbacks:
+            self.__receive_callbacks.remove(callback)
+
+    def unsubscribe_to_exceptions(self, callback: Callable[[ILError], None]) -> None:
+        """Unsubscribe from the exceptions.
+
+        Args:
+            callback: Subscribed callback.
+        """
+        if callback in self.__exception_callbacks:
+            self.__exception_callbacks.remove(callback)
+
+    def run_cycles(self, cycles: int) -> None:
+        """Run process data cycles back to back on the calling thread, without waiting.
+
+        Args:
+            cycles: number of cycles.
+
+        Raises:
+            ValueError: If the network is active.
+        """
+        if self.is_active:
+            raise ValueError("The network is already active.")
+        for _ in range(cycles):
+            self.__cycle()
+
+    def start(self) -> None:
+        """Start running the process data cycles on a thread, once every refresh time.
+
+        Raises:
+            ValueError: If the network is active.
+        """
+        if self.is_active:
+            raise ValueError("The network is already active.")
+        self.__stop.clear()
+        self.__thread = threading.Thread(
+            target=self.__cycle_loop, name="PDOLoopbackNetwork", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the process data cycles.
+
+        Args:
+            timeout: maximum time (in seconds) to wait for the current cycle to finish.
+        """
+        if self.__thread is None:
+            return
+        self.__stop.set()
+        self.__thread.join(timeout)
+        self.__thread = None
+
+    def __cycle_loop(self) -> None:
+        refresh_time_ns = int(self.__refresh_time * 1e9)
+        deadline = time.perf_counter_ns()
+        while not self.__stop.is_set():
+            try:
+                self.__cycle()
+            except ILError as e:
+                logger.error(f"Loopback process data cycle failed: {e}")
+                for callback in self.__exception_callbacks:
+                    callback(e)
+                return
+            deadline += refresh_time_ns
+            remaining_time_ns = deadline - time.perf_counter_ns()
+            if remaining_time_ns < 0:
+                # Skip the missed deadlines instead of running the late cycles back to back
+                self.__late_cycles += 1
+                deadline = time.perf_counter_ns()
+            else:
+                self.__stop.wait(remaining_time_ns / 1e9)
+
+    def __cycle(self) -> None:
+        # The process data events of the maps are notified as PDOServo._process_rpdo and
+        # PDOServo._process_tpdo do, as ingenialink has no public function to notify them
+        for callback in self.__send_callbacks:
+            callback()
+        for index, rpdo_map in enumerate(self.__rpdo_maps):
+            rpdo_map._notify_process_data_event()
+            self.__rpdo_data[index] = rpdo_map.get_item_bytes()
+        frame_index = self.__cycle_count % self.__synthetic_cycles
+        for tpdo_map, frames in zip(self.__tpdo_maps, self.__tpdo_frames):
+            tpdo_map.set_item_bytes(frames[frame_index])
+            tpdo_map._notify_process_data_event()
+        self.__cycle_count += 1
+        for callback in self.__receive_callbacks:
+            callback()
+
+    @property
+    def refresh_time(self) -> float:
+        """Period of the process data cycles, in seconds."""
+        return self.__refresh_time
+
+    @property
+    def is_active(self) -> bool:
+        """True if the cycle thread is running, False otherwise."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @property
+    def cycle_count(self) -> int:
+        """Number of process data cycles run."""
+        return self.__cycle_count
+
+    @property
+    def late_cycles(self) -> int:
+        """Number of cycles that finished after the start of the next one."""
+        return self.__late_cycles
+
+    @property
+    def rpdo_data(self) -> list[bytes]:
+        """Raw data of each RPDO map collected in the last cycle."""
+        return list(self.__rpdo_data)
+
+    @property
+    def rpdo_maps(self) -> list[RPDOMap]:
+        """RPDO maps of the network."""
+        return list(self.__rpdo_maps)
+
+    @property
+    def tpdo_maps(self) -> list[TPDOMap]:
+        """TPDO maps of the network."""
+        return list(self.__tpdo_maps)
@@ -0,0 +1,160 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Optional, TypeVar, Union
+
+from ingenialink.pdo import PDOMapItem, RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
+
+__all__ = ["PDOMapPlan", "PDOMapPlanner"]
+
+_PDO_MAP_ITEM = TypeVar("_PDO_MAP_ITEM", bound=PDOMapItem)
+
+
+@dataclass
+class PDOMapPlan:
+    """PDO maps planned by a :class:`PDOMapPlanner`."""
+
+    rpdo_maps: list[RPDOMap] = field(default_factory=list)
+    """RPDO maps, with the items sorted to keep them aligned."""
+    tpdo_maps: list[TPDOMap] = field(default_factory=list)
+    """TPDO maps, with the items sorted to keep them aligned."""
+
+    @property
+    def rpdo_size_bytes(self) -> int:
+        """Size of the RPDO data of the frame, in bytes."""
+        return sum(rpdo_map.data_length_bytes for rpdo_map in self.rpdo_maps)
+
+    @property
+    def tpdo_size_bytes(self) -> int:
+        """Size of the TPDO data of the frame, in bytes."""
+        return sum(tpdo_map.data_length_bytes for tpdo_map in self.tpdo_maps)
+
+    @property
+    def frame_size_bytes(self) -> int:
+        """Size of the process data of the servo in the frame, in bytes."""
+        return self.rpdo_size_bytes + self.tpdo_size_bytes
+
+
+class PDOMapPlanner:
+    """Pack PDO items into the minimum number of PDO maps.
+
+    The items are sorted from the largest to the smallest and each one is placed in the first
+    map with room for it, so every item starts at an offset multiple of its size and the bit
+    items (e.g. booleans) are packed together at the end of the map. Each map is padded to a
+    multiple of ``alignment_bits``, so the next map starts aligned too.
+
+    Args:
+        max_maps: maximum number of RPDO maps and of TPDO maps. ``2`` by default.
+        max_items_per_map: maximum number of items of each map, padding items included.
+            ``15`` by default.
+        max_map_size_bits: maximum size of each map, in bits. If ``None``, the size of the maps
+            is not limited.
+        alignment_bits: the size of each map is padded to a multiple of it. ``8`` by default.
+
+    Raises:
+        ValueError: If any of the limits is lower than 1.
+    """
+
+    def __init__(
+        self,
+        max_maps: int = 2,
+        max_items_per_map: int = 15,
+        max_map_size_bits: Optional[int] = None,
+        alignment_bits: int = 8,
+    ) -> None:
+        if min(max_maps, max_items_per_map, alignment_bits) < 1 or (
+            max_map_size_bits is not None and max_map_size_bits < 1
+        ):
+            raise ValueError("The PDO map limits must be 1 or higher.")
+        self.__max_maps = max_maps
+        self.__max_items_per_map = max_items_per_map
+        self.__max_map_size_bits = max_map_size_bits
+        self.__alignment_bits = alignment_bits
+
+    def plan(self, items: Sequence[Union[RPDOMapItem, TPDOMapItem]]) -> PDOMapPlan:
+        """Pack the items into RPDO and TPDO maps.
+
+        Args:
+            items: RPDO and TPDO items to map. Items of the same size keep their order.
+
+        Returns:
+            The planned PDO maps.
+
+        Raises:
+            ValueError: If an item does not fit in an empty map.
+            ValueError: If the items do not fit in the maximum number of maps.
+        """
+        rpdo_items = [item for item in items if isinstance(item, RPDOMapItem)]
+        tpdo_items = [item for item in items if isinstance(item, TPDOMapItem)]
+        return PDOMapPlan(
+            rpdo_maps=[
+                RPDOMap.from_pdo_items(map_items)
+                for map_items in self.__pack(rpdo_items, RPDOMapItem)
+            ],
+            tpdo_maps=[
+                TPDOMap.from_pdo_items(map_items)
+                for map_items in self.__pack(tpdo_items, TPDOMapItem)
+            ],
+        )
+
+    def __pack(
+        self, items: Sequence[_PDO_MAP_ITEM], padding_class: type[_PDO_MAP_ITEM]
+    ) -> list[list[_PDO_MAP_ITEM]]:
+        """Distribute the items in maps, first fit decreasing.
+
+        Args:
+            items: items to distribute.
+            padding_class: class of the padding items.
+
+        Returns:
+            The items of each map, padding included.
+
+        Raises:
+            ValueError: If an item does not fit in an empty map.
+            ValueError: If the items do not fit in the maximum number of maps.
+        """
+        maps_items: list[list[_PDO_MAP_ITEM]] = []
+        maps_sizes: list[int] = []
+        for item in sorted(items, key=lambda item: item.size_bits, reverse=True):
+            if not self.__fits(0, item.size_bits):
+                raise ValueError(
+                    f"The PDO item of {item.register.identifier} does not fit in a PDO map."
+                )
+            for index, size_bits in enumerate(maps_sizes):
+                if self.__fits(len(maps_items[index]), size_bits + item.size_bits):
+                    maps_items[index].append(item)
+                    maps_sizes[index] += item.size_bits
+                    break
+            else:
+                if len(maps_items) == self.__max_maps:
+                    raise ValueError(
+                        f"The PDO items do not fit in {self.__max_maps} maps of"
+                        f" {self.__max_items_per_map} items."
+                    )
+                maps_items.append([item])
+                maps_sizes.append(item.size_bits)
+        for map_items, size_bits in zip(maps_items, maps_sizes):
+            padding_bits = self.__aligned(size_bits) - size_bits
+            if padding_bits:
+                map_items.append(padding_class(size_bits=padding_bits))
+        return maps_items
+
+    def __aligned(self, size_bits: int) -> int:
+        return -(-size_bits // self.__alignment_bits) * self.__alignment_bits
+
+    def __fits(self, n_items: int, size_bits: int) -> bool:
+        """Check if a map fits after adding an item.
+
+        Args:
+            n_items: number of items of the map before adding the item.
+            size_bits: size of the map after adding the item.
+
+        Returns:
+            True if the map with the item and its padding respects the limits.
+        """
+        n_padding_items = int(self.__aligned(size_bits) != size_bits)
+        if n_items + 1 + n_padding_items > self.__max_items_per_map:
+            return False
+        return (
+            self.__max_map_size_bits is None
+            or self.__aligned(size_bits) <= self.__max_map_size_bits
+        )
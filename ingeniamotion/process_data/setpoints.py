@@ -0,0 +1,290 @@
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+import numpy as np
+from ingenialink.pdo import RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
+from ingenialogger import get_logger
+from numpy.typing import ArrayLike, NDArray
+
+from ingeniamotion._utils import reg_dtype_to_numpy
+from ingeniamotion.metaclass import DEFAULT_AXIS, DEFAULT_SERVO
+
+if TYPE_CHECKING:
+    from ingeniamotion.motion_controller import MotionController
+
+__all__ = ["PDOSetpointStreamer"]
+
+logger = get_logger(__name__)
+
+
+class PDOSetpointStreamer:
+    """Stream precomputed setpoints to a servo using RPDOs.
+
+    The setpoints of each register are mapped in an RPDO and, on each process data cycle, the
+    next setpoint of every register is written to the RPDO map in a single call.
+
+    The setpoints are fed in blocks with :func:`feed`. The streamer holds two blocks: the one
+    being sent and the next one, so a producer can keep refilling the streamer while the current
+    block is sent, without gaps between blocks. If both blocks are consumed before a new one is
+    fed, the streamer underruns: the last setpoints are sent again on each cycle until a new
+    block is fed, and the cycles are accounted in :attr:`underrun_cycles`.
+
+    Args:
+        mc: MotionController instance.
+        registers: registers to which the setpoints are written. Each register is described by
+            a dict with the ``name`` and ``axis`` fields. If the ``axis`` field is missing,
+            ``DEFAULT_AXIS`` is used.
+        servo: servo alias to reference it. ``DEFAULT_SERVO`` by default.
+        refresh_time: PDO values refresh time. ``0.001`` seconds by default.
+        watchdog_timeout: The PDO watchdog time. If not provided it will be set proportional
+            to the refresh rate.
+
+    Raises:
+        ValueError: If there is a type mismatch when retrieving the register UID or axis.
+        ValueError: If a register data type is not numeric or its PDO item size does not match
+            its data type size.
+    """
+
+    def __init__(
+        self,
+        mc: "MotionController",
+        registers: list[dict[str, Union[int, str]]],
+        servo: str = DEFAULT_SERVO,
+        refresh_time: float = 0.001,
+        watchdog_timeout: Optional[float] = None,
+    ) -> None:
+        self.__mc = mc
+        self.__servo = servo
+        self.__refresh_time = refresh_time
+        self.__watchdog_timeout = watchdog_timeout
+        self.__rpdo_map = RPDOMap()
+        fields: list[tuple[str, np.dtype[Any]]] = []
+        for register in registers:
+            rpdo_map_item = self.__create_rpdo_item(register)
+            dtype = reg_dtype_to_numpy(rpdo_map_item.register.dtype)
+            if dtype == np.dtype(object) or dtype == np.bool_:
+                raise ValueError(
+                    f"The data type of {rpdo_map_item.register.identifier} is not supported."
+                )
+            if rpdo_map_item.size_bits != dtype.itemsize * 8:
+                raise ValueError(
+                    f"The PDO item of {rpdo_map_item.register.identifier} is not "
+                    f"{dtype.itemsize * 8} bits long."
+                )
+            self.__rpdo_map.add_item(rpdo_map_item)
+            fields.append((f"channel_{len(fields)}", dtype))
+        self.__frame_dtype = np.dtype(fields)
+        self.__tpdo_map = TPDOMap()
+        self.__tpdo_map.add_item(TPDOMapItem(size_bits=8))
+        self.__lock = threading.Lock()
+        self.__free_slot = threading.Event()
+        self.__free_slot.set()
+        self.__current_block: Optional[bytes] = None
+        self.__next_block: Optional[bytes] = None
+        self.__position = 0
+        self.__last_frame: Optional[bytes] = None
+        self.__sent_samples = 0
+        self.__underrun_cycles = 0
+        self.__underruns = 0
+        self.__is_underrun = False
+        self.__underrun_callbacks: list[Callable[[], None]] = []
+
+    def __create_rpdo_item(self, register: dict[str, Union[int, str]]) -> RPDOMapItem:
+        name = register.get("name", DEFAULT_SERVO)
+        if not isinstance(name, str):
+            raise ValueError(f"Wrong type for the 'name' field. Expected 'str', got: {type(name)}")
+        axis = register.get("axis", DEFAULT_AXIS)
+        if not isinstance(axis, int):
+            raise ValueError(f"Wrong type for the 'axis' field. Expected 'int', got: {type(axis)}")
+        rpdo_map_item = self.__mc.capture.pdo.create_pdo_item(
+            register_uid=name, axis=axis, servo=self.__servo, value=0
+        )
+        if not isinstance(rpdo_map_item, RPDOMapItem):
+            raise ValueError(f"Register {name} can not be mapped to an RPDO.")
+        return rpdo_map_item
+
+    def start(self) -> None:
+        """Start sending the setpoints.
+
+        The setpoints should be fed before starting the streamer. The first setpoints are
+        written to the RPDO map before the PDOs are started, so they are sent until the
+        streamer is notified of the first process data cycle. Otherwise, ``0`` is sent until
+        setpoints are fed.
+        """
+        with self.__lock:
+            if self.__current_block is not None:
+                self.__rpdo_map.set_item_bytes(self.__next_frame(self.__current_block))
+                self.__sent_samples += 1
+        self.__mc.capture.pdo.set_pdo_maps_to_slave(
+            rpdo_maps=self.__rpdo_map, tpdo_maps=self.__tpdo_map, servo=self.__servo
+        )
+        self.__mc.capture.pdo.start_pdos(
+            refresh_rate=self.__refresh_time,
+            watchdog_timeout=self.__watchdog_timeout,
+            servo=self.__servo,
+        )
+        # Subscribe once the network is active, so the callback is added to it right away
+        self.__mc.capture.pdo.subscribe_to_send_process_data(
+            self._send_next_setpoints, servo=self.__servo
+        )
+
+    def stop(self) -> None:
+        """Stop sending the setpoints."""
+        self.__mc.capture.pdo.unsubscribe_to_send_process_data(
+            self._send_next_setpoints, servo=self.__servo
+        )
+        self.__mc.capture.pdo.stop_pdos(servo=self.__servo)
+        self.__mc.capture.pdo.remove_rpdo_map(servo=self.__servo, rpdo_map=self.__rpdo_map)
+        self.__mc.capture.pdo.remove_tpdo_map(servo=self.__servo, tpdo_map=self.__tpdo_map)
+
+    def feed(self, setpoints: Sequence[ArrayLike], timeout: Optional[float] = None) -> bool:
+        """Queue a block of setpoints to be sent after the already fed ones.
+
+        The setpoints are converted once to the data type of each register. If the streamer
+        already holds two blocks, it waits until the current block is sent.
+
+        Args:
+            setpoints: an array of setpoints for each register. All the arrays must have the
+                same length.
+            timeout: maximum time (in seconds) to wait for the streamer to have room for the
+                block. If ``None``, it waits until there is room.
+
+        Returns:
+            True if the block is queued, False if the timeout expired.
+
+        Raises:
+            ValueError: If the number of arrays does not match the number of registers.
+            ValueError: If the arrays do not have the same length or are empty.
+        """
+        frames = self.__to_frames(setpoints)
+        while True:
+            if not self.__free_slot.wait(timeout):
+                return False
+            with self.__lock:
+                if self.__current_block is None:
+                    self.__current_block = frames
+                    self.__position = 0
+                elif self.__next_block is None:
+                    self.__next_block = frames
+                else:
+                    self.__free_slot.clear()
+                    continue
+                if self.__next_block is not None:
+                    self.__free_slot.clear()
+                return True
+
+    def __to_frames(self, setpoints: Sequence[ArrayLike]) -> bytes:
+        if len(setpoints) != len(self.__frame_dtype.names or ()):
+            raise ValueError(
+                f"Expected {len(self.__frame_dtype.names or ())} setpoint arrays, got"
+                f" {len(setpoints)}."
+            )
+        arrays = [np.asarray(channel_setpoints).ravel() for channel_setpoints in setpoints]
+        length = len(arrays[0])
+        if length == 0 or any(len(array) != length for array in arrays):
+            raise ValueError("The setpoint arrays must have the same length and not be empty.")
+        frames = np.empty(length, dtype=self.__frame_dtype)
+        for field, array in zip(self.__frame_dtype.names or (), arrays):
+            frames[field] = array
+        return frames.tobytes()
+
+    def __next_frame(self, block: bytes) -> bytes:
+        """Get the next frame of the current block and advance the position.
+
+        The lock must be held.
+
+        Args:
+            block: the current block.
+
+        Returns:
+            The setpoints of the next cycle.
+        """
+        frame_size = self.__frame_dtype.itemsize
+        frame = block[self.__position : self.__position + frame_size]
+        self.__position += frame_size
+        if self.__position >= len(block):
+            # Switch to the next block and let the producer refill the free one
+            self.__current_block = self.__next_block
+            self.__next_block = None
+            self.__position = 0
+            self.__free_slot.set()
+        self.__last_frame = frame
+        return frame
+
+    def _send_next_setpoints(self) -> None:
+        """Write the next setpoints to the RPDO map. Called before each process data cycle."""
+        with self.__lock:
+            if self.__current_block is not None:
+                self.__rpdo_map.set_item_bytes(self.__next_frame(self.__current_block))
+                self.__sent_samples += 1
+                self.__is_underrun = False
+                return
+            self.__underrun_cycles += 1
+            if self.__is_underrun:
+                return
+            self.__is_underrun = True
+            self.__underruns += 1
+        logger.warning("Setpoint streamer underrun. The last setpoints are sent again.")
+        for callback in self.__underrun_callbacks:
+            callback()
+
+    def subscribe_to_underruns(self, callback: Callable[[], None]) -> None:
+        """Get notified when the streamer runs out of setpoints.
+
+        The callback is called from the PDO thread.
+
+        Args:
+            callback: Function to be called when an underrun starts.
+        """
+        self.__underrun_callbacks.append(callback)
+
+    def clear(self) -> None:
+        """Discard the setpoints that have not been sent yet."""
+        with self.__lock:
+            self.__current_block = None
+            self.__next_block = None
+            self.__position = 0
+            self.__free_slot.set()
+
+    @property
+    def rpdo_map(self) -> RPDOMap:
+        """RPDO map with the setpoint registers."""
+        return self.__rpdo_map
+
+    @property
+    def frame_dtype(self) -> np.dtype[Any]:
+        """Structured data type of the setpoints sent on each cycle."""
+        return self.__frame_dtype
+
+    @property
+    def pending_samples(self) -> int:
+        """Number of setpoint samples fed that have not been sent yet."""
+        with self.__lock:
+            pending_bytes = (
+                0 if self.__current_block is None else len(self.__current_block) - self.__position
+            )
+            pending_bytes += 0 if self.__next_block is None else len(self.__next_block)
+        return pending_bytes // self.__frame_dtype.itemsize
+
+    @property
+    def last_setpoints(self) -> Optional[NDArray[Any]]:
+        """Last sent setpoints, as a structured array with a field per register."""
+        if self.__last_frame is None:
+            return None
+        return np.frombuffer(self.__last_frame, dtype=self.__frame_dtype)
+
+    @property
+    def sent_samples(self) -> int:
+        """Number of setpoint samples sent."""
+        return self.__sent_samples
+
+    @property
+    def underruns(self) -> int:
+        """Number of times the streamer ran out of setpoints."""
+        return self.__underruns
+
+    @property
+    def underrun_cycles(self) -> int:
+        """Number of process data cycles without new setpoints."""
+        return self.__underrun_cycles
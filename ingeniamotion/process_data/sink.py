@@ -0,0 +1,513 @@
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Empty, Full, Queue
+from typing import Any, Optional, Union
+
+import numpy as np
+from ingenialogger import get_logger
+from numpy.typing import DTypeLike, NDArray
+
+__all__ = ["PDOChunkStats", "PDOSink", "PDOStreamReader", "PDOStreamSink"]
+
+logger = get_logger(__name__)
+
+TIMESTAMP_FIELD = "timestamp"
+CYCLE_COUNT_FIELD = "cycle_count"
+METADATA_FILE_NAME = "metadata.json"
+CHUNK_FILE_NAME = "chunk_{:06d}.npy"
+CHUNK_FILE_PATTERN = "chunk_*.npy"
+# Time (in seconds) the writer thread waits for a chunk before checking if the sink is closed
+WRITER_POLL_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class PDOChunkStats:
+    """Statistics of a chunk written to disk."""
+
+    index: int
+    """Index of the chunk."""
+    samples: int
+    """Number of samples in the chunk."""
+    dropped_samples: int
+    """Number of samples discarded right before the chunk because the writer queue was full."""
+    latency: float
+    """Time (in seconds) since the chunk was queued until it was written to disk."""
+    write_duration: float
+    """Time (in seconds) spent writing the chunk to disk."""
+
+
+class PDOSink(ABC):
+    """Destination to which a PDO poller hands its readings in chunks.
+
+    The poller opens the sink when it starts, puts a chunk each time it gathers
+    :attr:`chunk_size` readings from the PDO thread and closes the sink when it stops.
+    """
+
+    @property
+    @abstractmethod
+    def chunk_size(self) -> int:
+        """Number of samples of each chunk."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def open(
+        self,
+        channel_names: Sequence[str],
+        channel_dtypes: Sequence[DTypeLike],
+        timestamp_dtype: DTypeLike = np.float64,
+    ) -> None:
+        """Prepare the sink to receive chunks.
+
+        Args:
+            channel_names: name of each channel.
+            channel_dtypes: data type of each channel.
+            timestamp_dtype: data type of the timestamps. ``float64`` by default.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(
+        self,
+        timestamps: NDArray[Any],
+        channels: Sequence[NDArray[Any]],
+        block: bool = False,
+        cycle_counts: Optional[NDArray[np.uint64]] = None,
+    ) -> bool:
+        """Hand a chunk of samples to the sink.
+
+        Args:
+            timestamps: samples timestamps.
+            channels: an array of values for each channel.
+            block: if ``True``, the chunk should not be discarded if the sink is busy.
+                ``False`` by default.
+            cycle_counts: process data cycle of each sample.
+
+        Returns:
+            True if the chunk is accepted, False if it is discarded.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop receiving chunks.
+
+        Args:
+            timeout: maximum time (in seconds) to wait for the pending chunks to be processed.
+        """
+        raise NotImplementedError
+
+
+@dataclass
+class _Chunk:
+    timestamps: NDArray[Any]
+    cycle_counts: Optional[NDArray[np.uint64]]
+    channels: list[NDArray[Any]]
+    queued_time: float
+
+
+class PDOStreamSink(PDOSink):
+    """Stream PDO samples to disk from a background thread.
+
+    The samples are handed in chunks, which are queued and written by a writer thread to the
+    ``directory`` as NPY files, so the memory usage stays bounded regardless of the capture
+    length. Each chunk file holds a structured array with a ``timestamp`` field, a
+    ``cycle_count`` field and a field for each channel. The channels names and data types and
+    the number of written chunks are stored in a ``metadata.json`` file, which is updated after
+    each chunk is written. The files can be read with :class:`PDOStreamReader`.
+
+    The chunk files of a previous capture in the ``directory`` are removed when the sink is
+    opened.
+
+    If the writer thread can not keep up and the queue is full, the chunk is discarded and its
+    samples are accounted in the statistics of the next written chunk.
+
+    If a chunk can not be written, e.g. because the disk is full, the writer thread discards
+    the following chunks and the error is raised by :func:`put` and :func:`close`.
+
+    Args:
+        directory: directory where the chunk files are written. It is created if it does
+            not exist.
+        chunk_size: number of samples of each chunk.
+        max_queued_chunks: maximum number of chunks waiting to be written.
+        metadata: additional JSON serializable metadata to store in the metadata file. It can
+            be read with :attr:`PDOStreamReader.metadata`.
+
+    Raises:
+        ValueError: If the chunk size or the maximum number of queued chunks is lower than 1.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        chunk_size: int = 1000,
+        max_queued_chunks: int = 8,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be 1 or higher.")
+        if max_queued_chunks < 1:
+            raise ValueError("The maximum number of queued chunks must be 1 or higher.")
+        self.__directory = Path(directory)
+        self.__chunk_size = chunk_size
+        self.__metadata = {} if metadata is None else metadata
+        self.__queue: Queue[_Chunk] = Queue(max_queued_chunks)
+        self.__thread: Optional[threading.Thread] = None
+        self.__stop_writer = threading.Event()
+        self.__writer_error: Optional[Exception] = None
+        self.__dtype: Optional[np.dtype[Any]] = None
+        self.__file_metadata: dict[str, Any] = {}
+        self.__chunk_stats: list[PDOChunkStats] = []
+        self.__pending_dropped_samples = 0
+        self.__dropped_samples = 0
+        self.__written_samples = 0
+        self.__lock = threading.Lock()
+
+    def open(
+        self,
+        channel_names: Sequence[str],
+        channel_dtypes: Sequence[DTypeLike],
+        timestamp_dtype: DTypeLike = np.float64,
+    ) -> None:
+        """Create the metadata file and start the writer thread.
+
+        The chunk files of a previous capture in the directory are removed.
+
+        Args:
+            channel_names: name of each channel.
+            channel_dtypes: data type of each channel.
+            timestamp_dtype: data type of the timestamps. ``float64`` by default.
+
+        Raises:
+            ValueError: If the sink is already open.
+            ValueError: If the number of channel names and data types do not match.
+        """
+        if self.is_open:
+            raise ValueError("The sink is already open.")
+        if len(channel_names) != len(channel_dtypes):
+            raise ValueError(
+                f"The number of channel names ({len(channel_names)}) and data types"
+                f" ({len(channel_dtypes)}) do not match."
+            )
+        self.__dtype = np.dtype(
+            [(TIMESTAMP_FIELD, timestamp_dtype), (CYCLE_COUNT_FIELD, np.uint64)]
+            + [(f"channel_{index}", dtype) for index, dtype in enumerate(channel_dtypes)]
+        )
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        for chunk_path in self.__directory.glob(CHUNK_FILE_PATTERN):
+            chunk_path.unlink()
+        self.__file_metadata = {
+            "chunk_size": self.__chunk_size,
+            "chunks": 0,
+            "timestamp_dtype": np.dtype(timestamp_dtype).str,
+            "channels": [
+                {"name": name, "dtype": np.dtype(dtype).str}
+                for name, dtype in zip(channel_names, channel_dtypes)
+            ],
+            "metadata": self.__metadata,
+        }
+        self.__write_metadata()
+        self.__chunk_stats = []
+        self.__pending_dropped_samples = 0
+        self.__dropped_samples = 0
+        self.__written_samples = 0
+        self.__writer_error = None
+        self.__stop_writer.clear()
+        self.__thread = threading.Thread(target=self.__writer_loop, daemon=True)
+        self.__thread.start()
+
+    def put(
+        self,
+        timestamps: NDArray[Any],
+        channels: Sequence[NDArray[Any]],
+        block: bool = False,
+        cycle_counts: Optional[NDArray[np.uint64]] = None,
+    ) -> bool:
+        """Queue a chunk of samples to be written.
+
+        The arrays must not be modified after being queued.
+
+        Args:
+            timestamps: samples timestamps.
+            channels: an array of values for each channel.
+            block: if ``True``, wait until there is room in the queue instead of discarding
+                the chunk. ``False`` by default.
+            cycle_counts: process data cycle of each sample. If not provided, the cycle counts
+                are stored as ``0``.
+
+        Returns:
+            True if the chunk is queued, False if it is discarded because the queue is full.
+
+        Raises:
+            ValueError: If the sink is not open.
+            Exception: The error of the writer thread, if a chunk could not be written.
+        """
+        if not self.is_open:
+            raise ValueError("The sink is not open.")
+        self.__raise_writer_error()
+        try:
+            self.__queue.put(
+                _Chunk(
+                    timestamps=timestamps,
+                    cycle_counts=cycle_counts,
+                    channels=list(channels),
+                    queued_time=time.perf_counter(),
+                ),
+                block=block,
+            )
+        except Full:
+            with self.__lock:
+                self.__pending_dropped_samples += len(timestamps)
+                self.__dropped_samples += len(timestamps)
+            return False
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write the queued chunks and stop the writer thread.
+
+        Args:
+            timeout: maximum time (in seconds) to wait for the queued chunks to be written.
+                If ``None``, it waits until all of them are written.
+
+        Raises:
+            Exception: The error of the writer thread, if a chunk could not be written.
+        """
+        if self.__thread is None:
+            return
+        self.__stop_writer.set()
+        self.__thread.join(timeout)
+        if self.__thread.is_alive():
+            logger.warning("The sink writer thread did not finish in time.")
+        self.__thread = None
+        self.__raise_writer_error()
+
+    def __raise_writer_error(self) -> None:
+        """Raise the error of the writer thread, if any.
+
+        Raises:
+            Exception: The error of the writer thread, if a chunk could not be written.
+        """
+        if self.__writer_error is not None:
+            raise self.__writer_error
+
+    def __writer_loop(self) -> None:
+        while True:
+            try:
+                chunk = self.__queue.get(timeout=WRITER_POLL_INTERVAL)
+            except Empty:
+                if self.__stop_writer.is_set():
+                    return
+                continue
+            if self.__writer_error is not None:
+                # Keep emptying the queue, so that a blocking put does not wait forever
+                with self.__lock:
+                    self.__dropped_samples += len(chunk.timestamps)
+                continue
+            try:
+                self.__write_chunk(chunk)
+            except Exception as e:
+                logger.error(f"The sink could not write chunk {len(self.__chunk_stats)}: {e}")
+                with self.__lock:
+                    self.__dropped_samples += len(chunk.timestamps)
+                self.__writer_error = e
+
+    def __write_chunk(self, chunk: _Chunk) -> None:
+        index = len(self.__chunk_stats)
+        write_start = time.perf_counter()
+        data = np.empty(len(chunk.timestamps), dtype=self.__dtype)
+        data[TIMESTAMP_FIELD] = chunk.timestamps
+        data[CYCLE_COUNT_FIELD] = 0 if chunk.cycle_counts is None else chunk.cycle_counts
+        for channel_index, channel in enumerate(chunk.channels):
+            data[f"channel_{channel_index}"] = channel
+        np.save(self.__directory / CHUNK_FILE_NAME.format(index), data)
+        self.__file_metadata["chunks"] = index + 1
+        self.__write_metadata()
+        write_end = time.perf_counter()
+        with self.__lock:
+            dropped_samples, self.__pending_dropped_samples = self.__pending_dropped_samples, 0
+        self.__written_samples += len(data)
+        self.__chunk_stats.append(
+            PDOChunkStats(
+                index=index,
+                samples=len(data),
+                dropped_samples=dropped_samples,
+                latency=write_end - chunk.queued_time,
+                write_duration=write_end - write_start,
+            )
+        )
+
+    def __write_metadata(self) -> None:
+        # Replace the file at once, so that a reader never finds it half written
+        metadata_path = self.__directory / METADATA_FILE_NAME
+        temporary_path = metadata_path.with_suffix(".tmp")
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(self.__file_metadata, file, indent=4)
+        os.replace(temporary_path, metadata_path)
+
+    @property
+    def directory(self) -> Path:
+        """Directory where the chunk files are written."""
+        return self.__directory
+
+    @property
+    def chunk_size(self) -> int:
+        """Number of samples of each chunk."""
+        return self.__chunk_size
+
+    @property
+    def is_open(self) -> bool:
+        """True if the writer thread is running, False otherwise."""
+        return self.__thread is not None
+
+    @property
+    def chunk_stats(self) -> list[PDOChunkStats]:
+        """Statistics of each written chunk."""
+        return list(self.__chunk_stats)
+
+    @property
+    def queued_chunks(self) -> int:
+        """Number of chunks waiting to be written."""
+        return self.__queue.qsize()
+
+    @property
+    def written_samples(self) -> int:
+        """Number of samples written to disk."""
+        return self.__written_samples
+
+    @property
+    def dropped_samples(self) -> int:
+        """Number of samples discarded because the writer queue was full or failed."""
+        return self.__dropped_samples
+
+
+class PDOStreamReader:
+    """Read the chunk files written by a :class:`PDOStreamSink`.
+
+    The chunks are memory-mapped, so only the accessed data is loaded from disk. Only the
+    number of chunks stored in the metadata file is read.
+
+    Args:
+        directory: directory where the chunk files were written.
+
+    Raises:
+        FileNotFoundError: If the directory does not contain a metadata file.
+        FileNotFoundError: If a chunk file is missing.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.__directory = Path(directory)
+        metadata_path = self.__directory / METADATA_FILE_NAME
+        if not metadata_path.is_file():
+            raise FileNotFoundError(f"There is no metadata file in {self.__directory}.")
+        with open(metadata_path, encoding="utf-8") as file:
+            metadata = json.load(file)
+        self.__channel_names: list[str] = [channel["name"] for channel in metadata["channels"]]
+        self.__channel_dtypes = [np.dtype(channel["dtype"]) for channel in metadata["channels"]]
+        self.__timestamp_dtype = np.dtype(metadata["timestamp_dtype"])
+        self.__metadata: dict[str, Any] = metadata.get("metadata", {})
+        self.__chunk_paths = [
+            self.__directory / CHUNK_FILE_NAME.format(index) for index in range(metadata["chunks"])
+        ]
+        for chunk_path in self.__chunk_paths:
+            if not chunk_path.is_file():
+                raise FileNotFoundError(f"The chunk file {chunk_path} is missing.")
+
+    def __len__(self) -> int:
+        """Get the number of chunks.
+
+        Returns:
+            The number of chunks.
+        """
+        return len(self.__chunk_paths)
+
+    def __iter__(self) -> Iterator[NDArray[Any]]:
+        """Iterate over the chunks.
+
+        Yields:
+            Each memory-mapped chunk.
+        """
+        for index in range(len(self)):
+            yield self.chunk(index)
+
+    def chunk(self, index: int) -> NDArray[Any]:
+        """Get a memory-mapped chunk.
+
+        Args:
+            index: index of the chunk.
+
+        Returns:
+            A structured array with a ``timestamp`` field, a ``cycle_count`` field and a
+            ``channel_<n>`` field for each channel.
+        """
+        chunk: NDArray[Any] = np.load(self.__chunk_paths[index], mmap_mode="r")
+        return chunk
+
+    def timestamps(self) -> NDArray[Any]:
+        """Get the timestamps of all the samples.
+
+        Returns:
+            The samples timestamps.
+        """
+        return self.__concatenate(TIMESTAMP_FIELD, self.__timestamp_dtype)
+
+    def cycle_counts(self) -> NDArray[np.uint64]:
+        """Get the process data cycle counts of all the samples.
+
+        Returns:
+            The samples cycle counts.
+        """
+        return self.__concatenate(CYCLE_COUNT_FIELD, np.dtype(np.uint64))
+
+    def channel(self, channel: Union[int, str]) -> NDArray[Any]:
+        """Get the values of all the samples of a channel.
+
+        Args:
+            channel: channel index or name. If a name is repeated, the first channel with
+                that name is returned.
+
+        Returns:
+            The channel values.
+
+        Raises:
+            ValueError: If there is no channel with that name.
+        """
+        if isinstance(channel, str):
+            if channel not in self.__channel_names:
+                raise ValueError(f"There is no channel named {channel}.")
+            channel = self.__channel_names.index(channel)
+        return self.__concatenate(f"channel_{channel}", self.__channel_dtypes[channel])
+
+    def __concatenate(self, field: str, dtype: np.dtype[Any]) -> NDArray[Any]:
+        if len(self) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate([chunk[field] for chunk in self])
+
+    @property
+    def directory(self) -> Path:
+        """Directory where the chunk files were written."""
+        return self.__directory
+
+    @property
+    def channel_names(self) -> list[str]:
+        """Name of each channel."""
+        return list(self.__channel_names)
+
+    @property
+    def channel_dtypes(self) -> list[np.dtype[Any]]:
+        """Data type of each channel."""
+        return list(self.__channel_dtypes)
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Additional metadata stored by the sink."""
+        return dict(self.__metadata)
+
+    @property
+    def samples(self) -> int:
+        """Total number of samples."""
+        return sum(len(chunk) for chunk in self)
@@ -0,0 +1,348 @@
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ["PDOCycleStats", "PDOHistogram"]
+
+
+class PDOHistogram:
+    """Fixed-size histogram of durations in nanoseconds, in the style of HDR histograms.
+
+    Values lower than ``2 ** significant_bits`` have a bucket each. Above that, each power of
+    two is split in ``2 ** (significant_bits - 1)`` buckets, so any value is recorded with a
+    relative error lower than ``2 ** (1 - significant_bits)`` while the number of buckets only
+    grows with the logarithm of the highest trackable value. Recording a value does not allocate
+    any memory.
+
+    Args:
+        max_value: highest trackable value, in nanoseconds. Higher values are recorded as
+            ``max_value``. ``10`` seconds by default.
+        significant_bits: number of significant bits of the recorded values. ``7`` by default,
+            which is a relative error lower than 1.6 %.
+
+    Raises:
+        ValueError: If the highest trackable value is lower than 1.
+        ValueError: If the number of significant bits is lower than 1.
+    """
+
+    def __init__(self, max_value: int = 10_000_000_000, significant_bits: int = 7) -> None:
+        if max_value < 1:
+            raise ValueError("The highest trackable value must be 1 or higher.")
+        if significant_bits < 1:
+            raise ValueError("The number of significant bits must be 1 or higher.")
+        self.__max_value = max_value
+        self.__significant_bits = significant_bits
+        self.__half_bucket_count = 1 << (significant_bits - 1)
+        self.__counts = [0] * (self.__bucket_index(max_value) + 1)
+        self.__count = 0
+        self.__total = 0
+        self.__min: Optional[int] = None
+        self.__max: Optional[int] = None
+
+    def __bucket_index(self, value: int) -> int:
+        shift = value.bit_length() - self.__significant_bits
+        if shift <= 0:
+            return value
+        return shift * self.__half_bucket_count + (value >> shift)
+
+    def __bucket_lowest_value(self, index: int) -> int:
+        shift = index // self.__half_bucket_count - 1
+        if shift <= 0:
+            return index
+        return (index - shift * self.__half_bucket_count) << shift
+
+    def record(self, value: int) -> None:
+        """Record a value.
+
+        Args:
+            value: value in nanoseconds. Negative values are recorded as ``0``.
+        """
+        value = min(max(value, 0), self.__max_value)
+        self.__counts[self.__bucket_index(value)] += 1
+        self.__count += 1
+        self.__total += value
+        if self.__min is None or value < self.__min:
+            self.__min = value
+        if self.__max is None or value > self.__max:
+            self.__max = value
+
+    def percentile(self, percentile: float) -> int:
+        """Get the value below which a percentage of the recorded values fall.
+
+        Args:
+            percentile: percentage, from ``0`` to ``100``.
+
+        Returns:
+            The highest value of the bucket that holds the percentile, in nanoseconds.
+            ``0`` if no value has been recorded.
+
+        Raises:
+            ValueError: If the percentage is not between 0 and 100.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("The percentile must be between 0 and 100.")
+        if self.__count == 0 or self.__max is None:
+            return 0
+        target = max(1, int(np.ceil(percentile / 100 * self.__count)))
+        index = int(np.searchsorted(np.cumsum(self.__counts), target))
+        highest_value = self.__bucket_lowest_value(index + 1) - 1
+        return min(highest_value, self.__max)
+
+    def reset(self) -> None:
+        """Discard the recorded values."""
+        self.__counts = [0] * len(self.__counts)
+        self.__count = 0
+        self.__total = 0
+        self.__min = None
+        self.__max = None
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self.__count
+
+    @property
+    def min(self) -> int:
+        """Lowest recorded value, in nanoseconds. ``0`` if no value has been recorded."""
+        return 0 if self.__min is None else self.__min
+
+    @property
+    def max(self) -> int:
+        """Highest recorded value, in nanoseconds. ``0`` if no value has been recorded."""
+        return 0 if self.__max is None else self.__max
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values, in nanoseconds. ``0`` if no value has been recorded."""
+        return self.__total / self.__count if self.__count else 0.0
+
+    @property
+    def counts(self) -> NDArray[np.int64]:
+        """Number of values recorded in each bucket."""
+        return np.array(self.__counts, dtype=np.int64)
+
+    @property
+    def bucket_values(self) -> NDArray[np.int64]:
+        """Lowest value of each bucket, in nanoseconds."""
+        return np.array(
+            [self.__bucket_lowest_value(index) for index in range(len(self.__counts))],
+            dtype=np.int64,
+        )
+
+
+class _TimedCallback:
+    """Process data callback that records its duration.
+
+    Args:
+        callback: the subscribed callback.
+        name: name of the histogram.
+        histogram: histogram in which the durations are recorded.
+        stats: statistics to which the histogram belongs.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[], None],
+        name: str,
+        histogram: PDOHistogram,
+        stats: "PDOCycleStats",
+    ) -> None:
+        self.callback = callback
+        self.name = name
+        self.__histogram = histogram
+        self.__stats = stats
+
+    def __call__(self) -> None:
+        """Call the subscribed callback and record its duration."""
+        if not self.__stats.enabled:
+            self.callback()
+            return
+        start = time.perf_counter_ns()
+        try:
+            self.callback()
+        finally:
+            self.__histogram.record(time.perf_counter_ns() - start)
+
+
+class PDOCycleStats:
+    """Process data cycle statistics of a network.
+
+    It records the period of the process data cycles, their jitter (the difference between
+    consecutive periods) and the duration of each callback subscribed to the send and receive
+    process data notifications, so slow subscribers that delay the cycle can be spotted.
+
+    Args:
+        max_value: highest trackable value of the histograms, in nanoseconds. ``10`` seconds
+            by default.
+        significant_bits: number of significant bits of the histograms. ``7`` by default.
+    """
+
+    def __init__(self, max_value: int = 10_000_000_000, significant_bits: int = 7) -> None:
+        self.__max_value = max_value
+        self.__significant_bits = significant_bits
+        self.__period = PDOHistogram(max_value, significant_bits)
+        self.__jitter = PDOHistogram(max_value, significant_bits)
+        self.__send_callbacks: dict[str, PDOHistogram] = {}
+        self.__receive_callbacks: dict[str, PDOHistogram] = {}
+        self.__timed_callbacks: dict[tuple[Callable[[], None], bool], _TimedCallback] = {}
+        self.__lock = threading.Lock()
+        self.__last_cycle_time: Optional[int] = None
+        self.__last_period: Optional[int] = None
+        self.__cycles = 0
+        self.__enabled = True
+
+    def record_cycle(self) -> None:
+        """Record the start of a process data cycle. Subscribed to the send process data."""
+        if not self.__enabled:
+            return
+        now = time.perf_counter_ns()
+        self.__cycles += 1
+        if self.__last_cycle_time is not None:
+            period = now - self.__last_cycle_time
+            self.__period.record(period)
+            if self.__last_period is not None:
+                self.__jitter.record(abs(period - self.__last_period))
+            self.__last_period = period
+        self.__last_cycle_time = now
+
+    def restart(self) -> None:
+        """Forget the last cycle, so the time the PDOs were stopped is not taken as a period."""
+        self.__last_cycle_time = None
+        self.__last_period = None
+
+    def timed_callback(
+        self, callback: Callable[[], None], receive: bool = False
+    ) -> Callable[[], None]:
+        """Get the callback to subscribe instead of a callback to record its duration.
+
+        Args:
+            callback: the process data callback.
+            receive: ``True`` if it is subscribed to the receive process data notifications,
+                ``False`` if it is subscribed to the send process data notifications.
+
+        Returns:
+            A callback that calls the original one and records its duration.
+        """
+        with self.__lock:
+            timed_callback = self.__timed_callbacks.get((callback, receive))
+            if timed_callback is not None:
+                return timed_callback
+            histograms = self.__receive_callbacks if receive else self.__send_callbacks
+            # The histograms of the released callbacks are reused, so restarting a subscriber
+            # does not add a histogram each time
+            names_in_use = {
+                timed.name
+                for (_, timed_receive), timed in self.__timed_callbacks.items()
+                if timed_receive == receive
+            }
+            name = base_name = getattr(callback, "__qualname__", repr(callback))
+            index = 1
+            while name in names_in_use:
+                index += 1
+                name = f"{base_name} ({index})"
+            if name not in histograms:
+                histograms[name] = PDOHistogram(self.__max_value, self.__significant_bits)
+            timed_callback = _TimedCallback(callback, name, histograms[name], self)
+            self.__timed_callbacks[callback, receive] = timed_callback
+            return timed_callback
+
+    def get_subscribed_callback(
+        self, callback: Callable[[], None], receive: bool = False
+    ) -> Callable[[], None]:
+        """Get the callback that was subscribed instead of a callback.
+
+        Args:
+            callback: the process data callback.
+            receive: ``True`` if it is subscribed to the receive process data notifications,
+                ``False`` if it is subscribed to the send process data notifications.
+
+        Returns:
+            The timed callback, or the original callback if it is not timed.
+        """
+        return self.__timed_callbacks.get((callback, receive), callback)
+
+    def release_callback(
+        self, callback: Callable[[], None], receive: bool = False
+    ) -> Callable[[], None]:
+        """Forget a callback that is unsubscribed and get the callback to unsubscribe instead.
+
+        The histogram of the callback is kept, and it is reused by the next callback with
+        the same name.
+
+        Args:
+            callback: the process data callback.
+            receive: ``True`` if it is subscribed to the receive process data notifications,
+                ``False`` if it is subscribed to the send process data notifications.
+
+        Returns:
+            The timed callback, or the original callback if it is not timed.
+        """
+        with self.__lock:
+            return self.__timed_callbacks.pop((callback, receive), callback)
+
+    def reset(self) -> None:
+        """Discard the recorded values of all the histograms."""
+        self.__cycles = 0
+        self.__period.reset()
+        self.__jitter.reset()
+        for histogram in [*self.__send_callbacks.values(), *self.__receive_callbacks.values()]:
+            histogram.reset()
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Get the count, mean, maximum and 99th percentile of each histogram.
+
+        Returns:
+            The statistics of each histogram, in nanoseconds, by name. The callback histograms
+            are named after the callback, prefixed by ``send:`` or ``receive:``.
+        """
+        histograms = {"period": self.__period, "jitter": self.__jitter}
+        histograms.update({f"send:{name}": h for name, h in self.__send_callbacks.items()})
+        histograms.update({f"receive:{name}": h for name, h in self.__receive_callbacks.items()})
+        return {
+            name: {
+                "count": histogram.count,
+                "mean": histogram.mean,
+                "max": histogram.max,
+                "p99": histogram.percentile(99),
+            }
+            for name, histogram in histograms.items()
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """If ``False``, nothing is recorded, but the timed callbacks are still called."""
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self.__enabled = enabled
+        if not enabled:
+            self.restart()
+
+    @property
+    def cycles(self) -> int:
+        """Number of recorded process data cycles."""
+        return self.__cycles
+
+    @property
+    def period(self) -> PDOHistogram:
+        """Period of the process data cycles."""
+        return self.__period
+
+    @property
+    def jitter(self) -> PDOHistogram:
+        """Difference between the periods of consecutive process data cycles."""
+        return self.__jitter
+
+    @property
+    def send_callbacks(self) -> dict[str, PDOHistogram]:
+        """Duration of each callback subscribed to the send process data, by name."""
+        return dict(self.__send_callbacks)
+
+    @property
+    def receive_callbacks(self) -> dict[str, PDOHistogram]:
+        """Duration of each callback subscribed to the receive process data, by name."""
+        return dict(self.__receive_callbacks)
@@ -0,0 +1,278 @@
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+from ingeniamotion.enums import PDOBackpressureMode
+from ingeniamotion.process_data.sink import PDOSink
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from ingeniamotion.pdo import PDONetworkPoller, PDOPoller
+
+__all__ = ["PDOBatch", "PDOStream"]
+
+
+@dataclass(frozen=True)
+class PDOBatch:
+    """Batch of PDO readings delivered by a :class:`PDOStream`."""
+
+    timestamps: NDArray[Any]
+    """Readings timestamps."""
+    cycle_counts: NDArray[np.uint64]
+    """Process data cycle of each reading."""
+    channels: list[NDArray[Any]]
+    """An array of readings values for each channel."""
+
+
+class PDOStream(PDOSink):
+    """Asynchronous iterator over batches of PDO readings.
+
+    The poller gathers the readings on the PDO thread and hands them in batches to the stream,
+    which queues them in a bounded queue and wakes up the event loop. The batches are consumed
+    with ``async for``. When the queue is full, the ``backpressure`` mode determines whether the
+    oldest batch is discarded, the newest batch is discarded or the PDO thread is blocked until
+    the event loop consumes a batch.
+
+    The poller is started when entering the ``async with`` block, and it is stopped when
+    leaving it, even if the iteration is interrupted by a ``break``, an exception or a
+    cancellation. The stream must be started before it is iterated, so the PDOs are never left
+    running without an owner that stops them. If it is started with :func:`start` instead, it
+    must be closed with :func:`aclose`. The stream can only be iterated once.
+
+    .. code-block:: python
+
+        async with mc.capture.pdo.stream(registers, servo=alias, batch_size=100) as stream:
+            async for batch in stream:
+                process(batch.timestamps, batch.channels)
+
+    Args:
+        poller_factory: function that creates the poller that feeds the stream.
+        batch_size: number of readings of each batch.
+        max_queued_batches: maximum number of batches waiting to be consumed.
+        backpressure: behavior when the queue is full.
+
+    Raises:
+        ValueError: If the batch size or the maximum number of queued batches is lower than 1.
+    """
+
+    def __init__(
+        self,
+        poller_factory: Callable[[PDOSink], Union["PDOPoller", "PDONetworkPoller"]],
+        batch_size: int,
+        max_queued_batches: int,
+        backpressure: PDOBackpressureMode = PDOBackpressureMode.DROP_OLDEST,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("The batch size must be 1 or higher.")
+        if max_queued_batches < 1:
+            raise ValueError("The maximum number of queued batches must be 1 or higher.")
+        self.__batch_size = batch_size
+        self.__max_queued_batches = max_queued_batches
+        self.__backpressure = backpressure
+        # Appending to and popping from a deque are atomic, no lock is needed for them
+        self.__queue: deque[PDOBatch] = deque()
+        self.__free_slots = threading.Semaphore(max_queued_batches)
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__batch_available: Optional[asyncio.Event] = None
+        self.__started = False
+        self.__closing = False
+        self.__closed = False
+        self.__dropped_batches = 0
+        self.__dropped_samples = 0
+        self.__poller = poller_factory(self)
+
+    async def start(self) -> None:
+        """Start the poller that feeds the stream.
+
+        Raises:
+            ValueError: If the stream has already been started.
+        """
+        if self.__started:
+            raise ValueError("The stream has already been started.")
+        self.__started = True
+        self.__loop = asyncio.get_running_loop()
+        self.__batch_available = asyncio.Event()
+        await self.__loop.run_in_executor(None, self.__poller.start)
+
+    async def aclose(self) -> None:
+        """Stop the poller and end the iteration once the queued batches are consumed.
+
+        The batches flushed by the poller when it stops are queued even if the queue is full
+        and the backpressure mode is ``BLOCK``, as the poller can not wait for them to be
+        consumed.
+        """
+        if not self.__started or self.__closing:
+            return
+        self.__closing = True
+        await asyncio.get_running_loop().run_in_executor(None, self.__poller.stop)
+
+    async def __aenter__(self) -> "PDOStream":
+        """Start the stream.
+
+        Returns:
+            The stream.
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional["TracebackType"],
+    ) -> None:
+        """Close the stream."""
+        await self.aclose()
+
+    def __aiter__(self) -> "PDOStream":
+        """Get the asynchronous iterator.
+
+        Returns:
+            The stream.
+        """
+        return self
+
+    async def __anext__(self) -> PDOBatch:
+        """Wait for the next batch.
+
+        Returns:
+            The next batch.
+
+        Raises:
+            ValueError: If the stream has not been started.
+            StopAsyncIteration: If the stream is closed and all the batches have been consumed.
+        """
+        if not self.__started:
+            raise ValueError(
+                "The stream has not been started. Iterate it inside an 'async with' block."
+            )
+        while True:
+            try:
+                batch = self.__queue.popleft()
+            except IndexError:
+                if self.__closed or self.__batch_available is None:
+                    raise StopAsyncIteration
+                self.__batch_available.clear()
+                # A batch could have been queued before clearing the event
+                if not self.__queue and not self.__closed:
+                    await self.__batch_available.wait()
+                continue
+            if self.__backpressure == PDOBackpressureMode.BLOCK:
+                self.__free_slots.release()
+            return batch
+
+    @property
+    def chunk_size(self) -> int:
+        """Number of readings of each batch."""
+        return self.__batch_size
+
+    def open(
+        self,
+        channel_names: Sequence[str],  # noqa: ARG002
+        channel_dtypes: Sequence[DTypeLike],  # noqa: ARG002
+        timestamp_dtype: DTypeLike = np.float64,  # noqa: ARG002
+    ) -> None:
+        """Called by the poller when it starts.
+
+        Args:
+            channel_names: name of each channel.
+            channel_dtypes: data type of each channel.
+            timestamp_dtype: data type of the timestamps. ``float64`` by default.
+        """
+        self.__closed = False
+
+    def put(
+        self,
+        timestamps: NDArray[Any],
+        channels: Sequence[NDArray[Any]],
+        block: bool = False,  # noqa: ARG002
+        cycle_counts: Optional[NDArray[np.uint64]] = None,
+    ) -> bool:
+        """Queue a batch. Called by the poller from the PDO thread.
+
+        The backpressure mode determines what happens when the queue is full, regardless of
+        the ``block`` argument.
+
+        Args:
+            timestamps: readings timestamps.
+            channels: an array of values for each channel.
+            block: ignored, the backpressure mode is used instead.
+            cycle_counts: process data cycle of each reading. If not provided, the cycle counts
+                are set to ``0``.
+
+        Returns:
+            True if the batch is queued, False if it is discarded.
+        """
+        if self.__closed:
+            return False
+        if cycle_counts is None:
+            cycle_counts = np.zeros(len(timestamps), dtype=np.uint64)
+        batch = PDOBatch(timestamps=timestamps, cycle_counts=cycle_counts, channels=list(channels))
+        if self.__backpressure == PDOBackpressureMode.BLOCK:
+            # Wake up periodically so the poller can be stopped while waiting. Nothing is
+            # consumed until the poller stops, so it must not wait once the stream is closing
+            while not self.__closing and not self.__free_slots.acquire(timeout=0.1):
+                pass
+        elif len(self.__queue) >= self.__max_queued_batches:
+            if self.__backpressure == PDOBackpressureMode.DROP_NEWEST:
+                self.__dropped_batches += 1
+                self.__dropped_samples += len(batch.timestamps)
+                return False
+            try:
+                oldest_batch = self.__queue.popleft()
+            except IndexError:
+                # The queued batches have been consumed in the meantime
+                pass
+            else:
+                self.__dropped_batches += 1
+                self.__dropped_samples += len(oldest_batch.timestamps)
+        self.__queue.append(batch)
+        self.__notify()
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:  # noqa: ARG002
+        """Called by the poller when it stops. Ends the iteration.
+
+        Args:
+            timeout: ignored.
+        """
+        self.__closed = True
+        self.__notify()
+
+    def __notify(self) -> None:
+        """Wake up the event loop waiting for a batch."""
+        if self.__loop is None or self.__batch_available is None or self.__loop.is_closed():
+            return
+        self.__loop.call_soon_threadsafe(self.__batch_available.set)
+
+    @property
+    def poller(self) -> Union["PDOPoller", "PDONetworkPoller"]:
+        """Poller that feeds the stream."""
+        return self.__poller
+
+    @property
+    def backpressure(self) -> PDOBackpressureMode:
+        """Behavior when the queue is full."""
+        return self.__backpressure
+
+    @property
+    def queued_batches(self) -> int:
+        """Number of batches waiting to be consumed."""
+        return len(self.__queue)
+
+    @property
+    def dropped_batches(self) -> int:
+        """Number of batches discarded because the queue was full."""
+        return self.__dropped_batches
+
+    @property
+    def dropped_samples(self) -> int:
+        """Number of readings discarded because the queue was full."""
+        return self.__dropped_samples
@@ -0,0 +1,463 @@
+import threading
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+from ingenialogger import get_logger
+from numpy.typing import DTypeLike, NDArray
+
+from ingeniamotion.enums import PDOTriggerMode
+from ingeniamotion.process_data.sink import CYCLE_COUNT_FIELD, TIMESTAMP_FIELD, PDOSink
+
+__all__ = ["PDOTrigger", "PDOTriggerCapture"]
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PDOTriggerCapture:
+    """Window of samples captured around a PDO trigger."""
+
+    channel_names: list[str]
+    """Name of each channel."""
+    timestamps: NDArray[Any]
+    """Samples timestamps."""
+    cycle_counts: NDArray[np.uint64]
+    """Process data cycle of each sample."""
+    channels: list[NDArray[Any]]
+    """An array of values for each channel."""
+    trigger_index: int
+    """Index of the sample that fired the trigger. It is also the number of pre-trigger
+    samples, which can be lower than requested if the trigger fired right after arming it."""
+
+    @property
+    def trigger_timestamp(self) -> Union[int, float]:
+        """Timestamp of the sample that fired the trigger."""
+        return self.timestamps[self.trigger_index].item()  # type: ignore[no-any-return]
+
+    @property
+    def trigger_cycle_count(self) -> int:
+        """Process data cycle of the sample that fired the trigger."""
+        return int(self.cycle_counts[self.trigger_index])
+
+
+class PDOTrigger(PDOSink):
+    """Capture windows of PDO samples around a trigger condition, like the drive monitoring.
+
+    The trigger is a sink for the PDO pollers: it receives the readings in chunks of
+    :attr:`chunk_size` samples and evaluates the trigger condition of the whole chunk at once.
+    The condition is either an edge or a level of a channel, or an ``expression`` that gets
+    an array of values for each channel and returns an array of booleans, one per sample, e.g.
+    ``lambda channels: (channels[0] > 1000) & (channels[2] > 1000)``.
+
+    While it is armed, the last ``pre_trigger_samples`` samples are kept in a ring. When the
+    condition is met, the pre-trigger samples and the next ``post_trigger_samples`` samples
+    (the trigger sample included) are handed back as a :class:`PDOTriggerCapture`. The trigger
+    is then rearmed if ``auto_rearm`` is ``True``, so consecutive windows can be captured.
+
+    With a :class:`~ingeniamotion.pdo.PDONetworkPoller`, the window holds the registers of
+    several servos of the network, captured in the same process data cycles.
+
+    .. code-block:: python
+
+        trigger = PDOTrigger(
+            pre_trigger_samples=100,
+            post_trigger_samples=900,
+            channel="CL_POS_FBK_VALUE",
+            mode=PDOTriggerMode.RISING_EDGE,
+            level=1000,
+        )
+        poller = mc.capture.pdo.create_poller(registers, sampling_time=0.001, sink=trigger)
+        if trigger.wait_for_capture(timeout=5):
+            [capture] = trigger.pop_captures()
+
+    Args:
+        pre_trigger_samples: number of samples before the trigger sample.
+        post_trigger_samples: number of samples from the trigger sample, included.
+        channel: index or name of the trigger channel. If it is a name shared by several
+            channels, the first one is used.
+        mode: trigger condition on the channel. ``RISING_EDGE`` by default.
+        level: trigger level of the channel. ``0`` by default.
+        expression: trigger condition, instead of a channel condition.
+        auto_rearm: if ``True``, the trigger is rearmed after each capture. ``False`` by
+            default.
+        chunk_size: number of samples evaluated at once. Higher values reduce the load of the
+            PDO thread, but the captures are completed up to ``chunk_size`` cycles later.
+            ``1`` by default.
+        max_captures: maximum number of captures waiting to be retrieved. When it is exceeded,
+            the oldest capture is discarded and accounted in :attr:`dropped_captures`.
+            ``16`` by default.
+
+    Raises:
+        ValueError: If neither or both a trigger channel and an expression are provided.
+        ValueError: If the number of pre-trigger samples is negative or any of the other
+            sizes is lower than 1.
+    """
+
+    def __init__(
+        self,
+        pre_trigger_samples: int,
+        post_trigger_samples: int,
+        channel: Union[int, str, None] = None,
+        mode: PDOTriggerMode = PDOTriggerMode.RISING_EDGE,
+        level: float = 0,
+        expression: Optional[Callable[[list[NDArray[Any]]], NDArray[np.bool_]]] = None,
+        auto_rearm: bool = False,
+        chunk_size: int = 1,
+        max_captures: int = 16,
+    ) -> None:
+        if (channel is None) == (expression is None):
+            raise ValueError("Either a trigger channel or an expression must be provided.")
+        if pre_trigger_samples < 0:
+            raise ValueError("The number of pre-trigger samples must be 0 or higher.")
+        if min(post_trigger_samples, chunk_size, max_captures) < 1:
+            raise ValueError(
+                "The number of post-trigger samples, the chunk size and the maximum number of"
+                " captures must be 1 or higher."
+            )
+        self.__pre_trigger_samples = pre_trigger_samples
+        self.__post_trigger_samples = post_trigger_samples
+        self.__channel = channel
+        self.__mode = mode
+        self.__level = level
+        self.__expression = expression
+        self.__auto_rearm = auto_rearm
+        self.__chunk_size = chunk_size
+        self.__channel_names: list[str] = []
+        self.__channel_fields: list[str] = []
+        self.__trigger_field = ""
+        self.__dtype: Optional[np.dtype[Any]] = None
+        self.__history: NDArray[Any] = np.empty(0)
+        self.__history_end = 0
+        self.__history_count = 0
+        self.__last_value = np.nan
+        self.__capture: Optional[NDArray[Any]] = None
+        self.__capture_length = 0
+        self.__trigger_index = 0
+        self.__is_armed = False
+        self.__is_forced = False
+        self.__trigger_count = 0
+        self.__captures: deque[PDOTriggerCapture] = deque(maxlen=max_captures)
+        self.__dropped_captures = 0
+        self.__capture_available = threading.Event()
+        self.__capture_callbacks: list[Callable[[PDOTriggerCapture], None]] = []
+        self.__lock = threading.Lock()
+
+    @property
+    def chunk_size(self) -> int:
+        """Number of samples evaluated at once."""
+        return self.__chunk_size
+
+    def open(
+        self,
+        channel_names: Sequence[str],
+        channel_dtypes: Sequence[DTypeLike],
+        timestamp_dtype: DTypeLike = np.float64,
+    ) -> None:
+        """Allocate the pre-trigger ring and arm the trigger.
+
+        Args:
+            channel_names: name of each channel.
+            channel_dtypes: data type of each channel.
+            timestamp_dtype: data type of the timestamps. ``float64`` by default.
+
+        Raises:
+            ValueError: If the number of channel names and data types do not match.
+            ValueError: If the trigger channel is not one of the channels or is not numeric.
+        """
+        if len(channel_names) != len(channel_dtypes):
+            raise ValueError(
+                f"The number of channel names ({len(channel_names)}) and data types"
+                f" ({len(channel_dtypes)}) do not match."
+            )
+        trigger_channel = 0
+        if isinstance(self.__channel, str):
+            if self.__channel not in channel_names:
+                raise ValueError(f"There is no channel named {self.__channel}.")
+            trigger_channel = list(channel_names).index(self.__channel)
+        elif self.__channel is not None:
+            if not 0 <= self.__channel < len(channel_names):
+                raise ValueError(f"There is no channel with index {self.__channel}.")
+            trigger_channel = self.__channel
+        if self.__channel is not None and not (
+            np.issubdtype(np.dtype(channel_dtypes[trigger_channel]), np.number)
+            or np.issubdtype(np.dtype(channel_dtypes[trigger_channel]), np.bool_)
+        ):
+            raise ValueError(f"The trigger channel {self.__channel} is not numeric.")
+        with self.__lock:
+            self.__channel_names = list(channel_names)
+            self.__channel_fields = [f"channel_{index}" for index in range(len(channel_names))]
+            if self.__channel is not None:
+                self.__trigger_field = self.__channel_fields[trigger_channel]
+            self.__dtype = np.dtype([
+                (TIMESTAMP_FIELD, timestamp_dtype),
+                (CYCLE_COUNT_FIELD, np.uint64),
+                *zip(self.__channel_fields, channel_dtypes),
+            ])
+            self.__history = np.empty(self.__pre_trigger_samples, dtype=self.__dtype)
+            self.__history_end = 0
+            self.__history_count = 0
+            self.__last_value = np.nan
+            self.__capture = None
+            self.__is_armed = True
+            self.__is_forced = False
+
+    def put(
+        self,
+        timestamps: NDArray[Any],
+        channels: Sequence[NDArray[Any]],
+        block: bool = False,  # noqa: ARG002
+        cycle_counts: Optional[NDArray[np.uint64]] = None,
+    ) -> bool:
+        """Evaluate the trigger condition on a chunk of samples.
+
+        The capture callbacks are called from this method, so from the PDO thread when the
+        chunk is put by a poller.
+
+        Args:
+            timestamps: samples timestamps.
+            channels: an array of values for each channel.
+            block: not used, the chunk is always evaluated right away.
+            cycle_counts: process data cycle of each sample.
+
+        Returns:
+            Always True, the chunks are never discarded.
+
+        Raises:
+            ValueError: If the trigger is not open.
+        """
+        if self.__dtype is None:
+            raise ValueError("The trigger is not open.")
+        chunk = np.empty(len(timestamps), dtype=self.__dtype)
+        chunk[TIMESTAMP_FIELD] = timestamps
+        chunk[CYCLE_COUNT_FIELD] = 0 if cycle_counts is None else cycle_counts
+        for field, channel in zip(self.__channel_fields, channels):
+            chunk[field] = channel
+        with self.__lock:
+            captures = self.__process(chunk)
+        for capture in captures:
+            for callback in self.__capture_callbacks:
+                callback(capture)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:  # noqa: ARG002
+        """Stop evaluating the trigger. A capture in progress is discarded.
+
+        Args:
+            timeout: not used, the chunks are evaluated when they are put.
+        """
+        with self.__lock:
+            if self.__capture is not None:
+                logger.warning("The PDO trigger was closed before completing a capture.")
+            self.__dtype = None
+            self.__capture = None
+            self.__is_armed = False
+
+    def __process(self, chunk: NDArray[Any]) -> list[PDOTriggerCapture]:
+        """Evaluate the trigger on a chunk and fill the capture in progress.
+
+        The lock must be held.
+
+        Args:
+            chunk: samples as a structured array.
+
+        Returns:
+            The completed captures.
+        """
+        captures = []
+        start = 0
+        while start < len(chunk):
+            if self.__capture is not None:
+                start, capture = self.__fill_capture(chunk, start)
+                if capture is not None:
+                    captures.append(capture)
+                continue
+            trigger_index = self.__find_trigger(chunk, start) if self.__is_armed else None
+            if trigger_index is None:
+                self.__push_history(chunk[start:])
+                break
+            self.__start_capture(chunk[start:trigger_index])
+            start = trigger_index
+        if self.__trigger_field and len(chunk):
+            self.__last_value = float(chunk[self.__trigger_field][-1])
+        return captures
+
+    def __find_trigger(self, chunk: NDArray[Any], start: int) -> Optional[int]:
+        if self.__is_forced:
+            self.__is_forced = False
+            return start
+        segment = chunk[start:]
+        if self.__expression is not None:
+            conditions = np.asarray(
+                self.__expression([segment[field] for field in self.__channel_fields]),
+                dtype=np.bool_,
+            )
+        else:
+            values = segment[self.__trigger_field].astype(np.float64)
+            previous_value = (
+                float(chunk[self.__trigger_field][start - 1]) if start else self.__last_value
+            )
+            previous_values = np.empty_like(values)
+            previous_values[0] = previous_value
+            previous_values[1:] = values[:-1]
+            rising = (previous_values < self.__level) & (values >= self.__level)
+            falling = (previous_values > self.__level) & (values <= self.__level)
+            conditions = {
+                PDOTriggerMode.RISING_EDGE: rising,
+                PDOTriggerMode.FALLING_EDGE: falling,
+                PDOTriggerMode.RISING_OR_FALLING_EDGE: rising | falling,
+                PDOTriggerMode.ABOVE_LEVEL: values > self.__level,
+                PDOTriggerMode.BELOW_LEVEL: values < self.__level,
+            }[self.__mode]
+        triggers = np.flatnonzero(conditions)
+        return start + int(triggers[0]) if len(triggers) else None
+
+    def __start_capture(self, pre_trigger_segment: NDArray[Any]) -> None:
+        pre_trigger = np.concatenate((self.__history_samples(), pre_trigger_segment))
+        pre_trigger = pre_trigger[max(len(pre_trigger) - self.__pre_trigger_samples, 0) :]
+        self.__capture = np.empty(
+            len(pre_trigger) + self.__post_trigger_samples, dtype=pre_trigger.dtype
+        )
+        self.__capture[: len(pre_trigger)] = pre_trigger
+        self.__capture_length = self.__trigger_index = len(pre_trigger)
+        self.__is_armed = False
+        self.__trigger_count += 1
+
+    def __fill_capture(
+        self, chunk: NDArray[Any], start: int
+    ) -> tuple[int, Optional[PDOTriggerCapture]]:
+        if self.__capture is None:
+            return start, None
+        samples = chunk[start : start + len(self.__capture) - self.__capture_length]
+        self.__capture[self.__capture_length : self.__capture_length + len(samples)] = samples
+        self.__capture_length += len(samples)
+        if self.__capture_length < len(self.__capture):
+            return start + len(samples), None
+        capture = PDOTriggerCapture(
+            channel_names=list(self.__channel_names),
+            timestamps=self.__capture[TIMESTAMP_FIELD].copy(),
+            cycle_counts=self.__capture[CYCLE_COUNT_FIELD].copy(),
+            channels=[self.__capture[field].copy() for field in self.__channel_fields],
+            trigger_index=self.__trigger_index,
+        )
+        if len(self.__captures) == self.__captures.maxlen:
+            self.__dropped_captures += 1
+        self.__captures.append(capture)
+        self.__capture_available.set()
+        # The pre-trigger samples of the next capture follow this one
+        self.__history_count = 0
+        self.__push_history(self.__capture)
+        self.__capture = None
+        self.__is_armed = self.__auto_rearm
+        return start + len(samples), capture
+
+    def __push_history(self, samples: NDArray[Any]) -> None:
+        size = self.__pre_trigger_samples
+        if size == 0:
+            return
+        samples = samples[len(samples) - size :] if len(samples) > size else samples
+        indexes = (self.__history_end + np.arange(len(samples))) % size
+        self.__history[indexes] = samples
+        self.__history_end = (self.__history_end + len(samples)) % size
+        self.__history_count = min(self.__history_count + len(samples), size)
+
+    def __history_samples(self) -> NDArray[Any]:
+        size = self.__pre_trigger_samples
+        if size == 0:
+            return self.__history
+        indexes = (
+            self.__history_end - self.__history_count + np.arange(self.__history_count)
+        ) % size
+        samples: NDArray[Any] = self.__history[indexes]
+        return samples
+
+    def arm(self) -> None:
+        """Arm the trigger, if it is not capturing."""
+        with self.__lock:
+            if self.__capture is None:
+                self.__is_armed = True
+
+    def disarm(self) -> None:
+        """Disarm the trigger. A capture in progress is discarded."""
+        with self.__lock:
+            self.__capture = None
+            self.__is_armed = False
+            self.__is_forced = False
+
+    def force(self) -> None:
+        """Fire the trigger on the next sample, regardless of the trigger condition."""
+        with self.__lock:
+            if self.__capture is None:
+                self.__is_armed = True
+                self.__is_forced = True
+
+    def subscribe_to_captures(self, callback: Callable[[PDOTriggerCapture], None]) -> None:
+        """Get notified when a capture is completed.
+
+        The callback is called from the PDO thread, so it should be lightweight.
+
+        Args:
+            callback: Function to be called with each capture.
+        """
+        self.__capture_callbacks.append(callback)
+
+    def wait_for_capture(self, timeout: Optional[float] = None) -> bool:
+        """Wait until there is a capture to retrieve.
+
+        Args:
+            timeout: maximum time (in seconds) to wait. If ``None``, it waits until there is a
+                capture.
+
+        Returns:
+            True if there is a capture to retrieve, False if the timeout expired.
+        """
+        return self.__capture_available.wait(timeout)
+
+    def pop_captures(self) -> list[PDOTriggerCapture]:
+        """Retrieve the completed captures.
+
+        Returns:
+            The captures, from the oldest to the newest.
+        """
+        with self.__lock:
+            captures = list(self.__captures)
+            self.__captures.clear()
+            self.__capture_available.clear()
+        return captures
+
+    @property
+    def pre_trigger_samples(self) -> int:
+        """Number of samples before the trigger sample."""
+        return self.__pre_trigger_samples
+
+    @property
+    def post_trigger_samples(self) -> int:
+        """Number of samples from the trigger sample, included."""
+        return self.__post_trigger_samples
+
+    @property
+    def is_armed(self) -> bool:
+        """True if the trigger condition is being evaluated, False otherwise."""
+        return self.__is_armed
+
+    @property
+    def is_capturing(self) -> bool:
+        """True if the trigger fired and the post-trigger samples are being captured."""
+        return self.__capture is not None
+
+    @property
+    def trigger_count(self) -> int:
+        """Number of times the trigger fired."""
+        return self.__trigger_count
+
+    @property
+    def available_captures(self) -> int:
+        """Number of completed captures waiting to be retrieved."""
+        return len(self.__captures)
+
+    @property
+    def dropped_captures(self) -> int:
+        """Number of captures discarded because they were not retrieved in time."""
+        return self.__dropped_captures
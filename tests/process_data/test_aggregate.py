@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from ingeniamotion.process_data.aggregate import PDOWindowAggregator
+
+
+@pytest.fixture
+def aggregator():
+    aggregator = PDOWindowAggregator(window_size=4, max_windows=3)
+    aggregator.open(
+        ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE", "DRV_ID_SERIAL_NUMBER"],
+        [np.int32, np.float32, object],
+    )
+    return aggregator
+
+
+def _window(start: int, n_samples: int = 4):
+    values = np.arange(start, start + n_samples)
+    channels = [
+        values.astype(np.int32),
+        (-values / 2).astype(np.float32),
+        np.array([b"\x00"] * n_samples, dtype=object),
+    ]
+    return values * 0.001, channels, values.astype(np.uint64)
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "window_size, max_windows, message",
+    [
+        (0, 1, "The window size must be 1 or higher."),
+        (1, 0, "The maximum number of windows must be 1 or higher."),
+    ],
+)
+def test_aggregator_arguments_exception(window_size, max_windows, message):
+    with pytest.raises(ValueError, match=message):
+        PDOWindowAggregator(window_size, max_windows)
+
+
+@pytest.mark.virtual
+def test_aggregator_put_not_open_exception():
+    aggregator = PDOWindowAggregator(window_size=4)
+    with pytest.raises(ValueError, match="The aggregator is not open."):
+        aggregator.put(*_window(0)[:2])
+
+
+@pytest.mark.virtual
+def test_aggregator_window_stats(aggregator):
+    timestamps, channels, cycle_counts = _window(1)
+    assert aggregator.chunk_size == 4
+    assert aggregator.put(timestamps, channels, cycle_counts=cycle_counts)
+    timestamps, channels, cycle_counts = _window(5, n_samples=2)
+    assert aggregator.put(timestamps, channels, cycle_counts=cycle_counts)
+    assert aggregator.available_windows == 2
+    window_stats = aggregator.pop()
+    assert aggregator.available_windows == 0
+    assert len(window_stats) == 2
+    assert window_stats.samples.tolist() == [4, 2]
+    assert window_stats.start_timestamps.tolist() == [0.001, 0.005]
+    assert window_stats.end_timestamps.tolist() == [0.004, 0.006]
+    assert window_stats.start_cycle_counts.tolist() == [1, 5]
+    position_stats = window_stats.channel("CL_POS_FBK_VALUE")
+    assert position_stats["min"].tolist() == [1, 5]
+    assert position_stats["max"].tolist() == [4, 6]
+    assert position_stats["mean"].tolist() == [2.5, 5.5]
+    assert position_stats["rms"] == pytest.approx([np.sqrt(30 / 4), np.sqrt(61 / 2)])
+    velocity_stats = window_stats.channel("CL_VEL_FBK_VALUE")
+    assert velocity_stats["min"].tolist() == [-2, -3]
+    assert velocity_stats["max"].tolist() == [-0.5, -2.5]
+    # Channels that are not numeric are not aggregated
+    assert np.isnan(window_stats.channel("DRV_ID_SERIAL_NUMBER")["mean"]).all()
+    with pytest.raises(ValueError, match="There is no channel named CL_CUR_Q_VALUE."):
+        window_stats.channel("CL_CUR_Q_VALUE")
+
+
+@pytest.mark.virtual
+def test_aggregator_dropped_windows(aggregator):
+    for start in range(0, 20, 4):
+        aggregator.put(*_window(start)[:2])
+    assert not aggregator.put(*_window(20, n_samples=0)[:2])
+    assert aggregator.dropped_windows == 2
+    window_stats = aggregator.pop()
+    assert window_stats.min[:, 0].tolist() == [8, 12, 16]
+    aggregator.close()
+    assert not aggregator.is_open
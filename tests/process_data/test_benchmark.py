@@ -0,0 +1,75 @@
+import pytest
+
+from ingeniamotion.process_data.benchmark import (
+    _start_loopback_poller,
+    benchmark_decode,
+    benchmark_fsoe,
+    benchmark_subscribers,
+    create_fsoe_benchmark_maps,
+    find_max_channels,
+)
+from ingeniamotion.process_data.loopback import PDOLoopbackNetwork
+
+
+@pytest.mark.virtual
+def test_benchmark_decode():
+    cycle, decode_items, decode_map = benchmark_decode(n_channels=8, cycles=500)
+    assert [cycle.name, decode_items.name, decode_map.name] == [
+        "cycle",
+        "decode items",
+        "decode map",
+    ]
+    assert all(result.channels == 8 and result.cycles == 500 for result in [cycle, decode_map])
+    assert 0 < cycle.mean <= cycle.max
+    # The map decoder must stay cheaper than reading the items one by one
+    assert decode_map.mean - cycle.mean < decode_items.mean - cycle.mean
+
+
+@pytest.mark.virtual
+def test_benchmark_subscribers():
+    results = benchmark_subscribers(n_channels=8, n_subscribers=2, cycles=200)
+    assert [result.name for result in results] == [
+        "poller x2",
+        "subscriber inline x2",
+        "subscriber thread x2",
+        "cycle stats x2",
+    ]
+    assert all(result.p99 > 0 for result in results)
+    assert "channels" in str(results[0])
+
+
+@pytest.mark.virtual
+def test_benchmark_fsoe():
+    cycle, frames = benchmark_fsoe(n_slots=2, cycles=200)
+    assert [cycle.name, frames.name] == ["fsoe cycle", "fsoe frames"]
+    # Command, data and CRC of each slot, and connection ID
+    assert cycle.channels == frames.channels == 6
+    assert all(result.cycles == 200 and result.p99 > 0 for result in [cycle, frames])
+
+
+@pytest.mark.virtual
+def test_fsoe_benchmark_maps():
+    rpdo_map, tpdo_map = create_fsoe_benchmark_maps(n_slots=1)
+    # 1 byte command, 2 bytes data, 2 bytes CRC and 2 bytes connection ID
+    assert rpdo_map.data_length_bytes == tpdo_map.data_length_bytes == 7
+    assert rpdo_map.get_item_bytes() == bytes(7)
+
+
+@pytest.mark.virtual
+def test_find_max_channels():
+    # Sustainable with any decent machine
+    assert find_max_channels(refresh_time=0.01, max_channels=16, cycles=100) == 16
+    assert find_max_channels(refresh_time=1e-9, cycles=10) == 0
+
+
+@pytest.mark.virtual
+def test_loopback_poller():
+    network = PDOLoopbackNetwork()
+    poller = _start_loopback_poller(network, n_channels=4, buffer_size=10)
+    network.run_cycles(5)
+    poller.stop()
+    timestamps, cycle_counts, data = poller.data_with_cycle_counts()
+    assert len(timestamps) == 5
+    assert cycle_counts.tolist() == [0, 1, 2, 3, 4]
+    assert len(data) == 4
+    assert data[0].tolist() == [0, 1, 2, 3, 4]
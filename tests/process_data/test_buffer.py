@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from ingeniamotion.process_data.buffer import PDOBuffer
+
+
+def _fill(buffer: PDOBuffer, n_samples: int, offset: int = 0) -> None:
+    for idx in range(offset, offset + n_samples):
+        buffer.append(idx * 0.001, [idx, float(idx) / 2, idx % 2 == 0])
+
+
+@pytest.mark.virtual
+def test_buffer_size_exception():
+    with pytest.raises(ValueError, match="The buffer size must be 1 or higher."):
+        PDOBuffer(dtypes=[np.int32], size=0)
+
+
+@pytest.mark.virtual
+def test_buffer_pop():
+    buffer = PDOBuffer(dtypes=[np.int32, np.float32, np.bool_], size=10)
+    _fill(buffer, 4)
+    assert buffer.available_samples == 4
+    timestamps, channels = buffer.pop()
+    assert buffer.available_samples == 0
+    assert buffer.dropped_samples == 0
+    assert timestamps.dtype == np.float64
+    assert [channel.dtype for channel in channels] == [np.int32, np.float32, np.bool_]
+    np.testing.assert_array_equal(timestamps, [0, 0.001, 0.002, 0.003])
+    np.testing.assert_array_equal(channels[0], [0, 1, 2, 3])
+    np.testing.assert_array_equal(channels[1], [0, 0.5, 1, 1.5])
+    np.testing.assert_array_equal(channels[2], [True, False, True, False])
+
+
+@pytest.mark.virtual
+def test_buffer_overflow():
+    size = 5
+    buffer = PDOBuffer(dtypes=[np.int32, np.float32, np.bool_], size=size)
+    _fill(buffer, 8)
+    assert buffer.available_samples == size
+    assert buffer.dropped_samples == 3
+    _, channels = buffer.pop()
+    np.testing.assert_array_equal(channels[0], [3, 4, 5, 6, 7])
+    buffer.clear()
+    assert buffer.dropped_samples == 0
+
+
+@pytest.mark.virtual
+def test_buffer_pop_wrapped_samples():
+    buffer = PDOBuffer(dtypes=[np.int32, np.float32, np.bool_], size=5)
+    _fill(buffer, 3)
+    buffer.pop()
+    _fill(buffer, 4, offset=3)
+    _, channels = buffer.pop(copy=False)
+    np.testing.assert_array_equal(channels[0], [3, 4, 5, 6])
+
+
+@pytest.mark.virtual
+def test_buffer_pop_views():
+    buffer = PDOBuffer(dtypes=[np.int32, np.float32, np.bool_], size=10)
+    _fill(buffer, 3)
+    _, views = buffer.pop(copy=False)
+    _, copies = PDOBuffer(dtypes=[np.int32], size=1).pop()
+    assert views[0].base is not None
+    assert copies[0].base is None
+    # New samples are written after the retrieved ones
+    _fill(buffer, 3, offset=3)
+    np.testing.assert_array_equal(views[0], [0, 1, 2])
+
+
+@pytest.mark.virtual
+def test_buffer_cycle_counts():
+    buffer = PDOBuffer(dtypes=[np.int32], size=4, timestamp_dtype=np.int64)
+    for cycle_count in range(1, 7):
+        buffer.append(cycle_count * 1_000_000, [cycle_count], cycle_count)
+    assert buffer.timestamp_dtype == np.int64
+    timestamps, cycle_counts, channels = buffer.pop_with_cycle_counts()
+    assert timestamps.dtype == np.int64
+    assert cycle_counts.dtype == np.uint64
+    np.testing.assert_array_equal(timestamps, [3_000_000, 4_000_000, 5_000_000, 6_000_000])
+    np.testing.assert_array_equal(cycle_counts, [3, 4, 5, 6])
+    np.testing.assert_array_equal(channels[0], [3, 4, 5, 6])
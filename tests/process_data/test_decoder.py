@@ -0,0 +1,106 @@
+import struct
+
+import numpy as np
+import pytest
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.pdo import TPDOMap, TPDOMapItem
+
+from ingeniamotion.process_data.decoder import TPDOMapDecoder
+
+
+def _tpdo_item(dtype: RegDtype, size_bits=None, identifier="REGISTER") -> TPDOMapItem:
+    register = EthercatRegister(
+        idx=0x2000,
+        subidx=0,
+        dtype=dtype,
+        access=RegAccess.RO,
+        identifier=identifier,
+        pdo_access=RegCyclicType.TX,
+    )
+    return TPDOMapItem(register, size_bits)
+
+
+def _item_values(tpdo_map: TPDOMap) -> list:
+    return [item.value for item in tpdo_map.items if item.register.identifier != "PADDING"]
+
+
+@pytest.mark.virtual
+def test_decode_byte_aligned_map():
+    tpdo_map = TPDOMap.from_pdo_items([
+        _tpdo_item(RegDtype.S32),
+        _tpdo_item(RegDtype.FLOAT),
+        _tpdo_item(RegDtype.U16),
+        TPDOMapItem(size_bits=8),
+        _tpdo_item(RegDtype.S8),
+        _tpdo_item(RegDtype.U64),
+    ])
+    decoder = TPDOMapDecoder(tpdo_map)
+    payload = struct.pack("<ifHxbQ", -1234, 1.5, 65000, -3, 2**40)
+    tpdo_map.set_item_bytes(payload)
+    assert decoder.size_bytes == tpdo_map.data_length_bytes
+    assert decoder.decode(payload) == (-1234, 1.5, 65000, -3, 2**40)
+    assert list(decoder.decode_map()) == _item_values(tpdo_map)
+
+
+@pytest.mark.virtual
+def test_decode_bit_fields():
+    tpdo_map = TPDOMap.from_pdo_items([
+        _tpdo_item(RegDtype.BOOL),
+        _tpdo_item(RegDtype.BOOL),
+        _tpdo_item(RegDtype.S16, size_bits=10),
+        TPDOMapItem(size_bits=4),
+        _tpdo_item(RegDtype.U32),
+        _tpdo_item(RegDtype.BOOL),
+        _tpdo_item(RegDtype.FLOAT),
+        TPDOMapItem(size_bits=7),
+    ])
+    decoder = TPDOMapDecoder(tpdo_map)
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        payload = rng.integers(0, 256, tpdo_map.data_length_bytes, dtype=np.uint8).tobytes()
+        tpdo_map.set_item_bytes(payload)
+        decoded = decoder.decode(payload)
+        expected = _item_values(tpdo_map)
+        assert decoded[:5] == tuple(expected[:5])
+        assert decoded[5] == pytest.approx(expected[5], nan_ok=True)
+
+
+@pytest.mark.virtual
+def test_decode_frames():
+    tpdo_map = TPDOMap.from_pdo_items([
+        _tpdo_item(RegDtype.BOOL),
+        _tpdo_item(RegDtype.S16, size_bits=15),
+        _tpdo_item(RegDtype.S32),
+        _tpdo_item(RegDtype.FLOAT),
+    ])
+    decoder = TPDOMapDecoder(tpdo_map)
+    rng = np.random.default_rng(1)
+    n_frames = 50
+    payloads = rng.integers(0, 256, n_frames * decoder.size_bytes, dtype=np.uint8).tobytes()
+    channels = decoder.decode_frames(payloads)
+    assert [channel.dtype for channel in channels] == decoder.channel_dtypes
+    for frame_idx in range(n_frames):
+        payload = payloads[frame_idx * decoder.size_bytes : (frame_idx + 1) * decoder.size_bytes]
+        expected = decoder.decode(payload)
+        assert [channel[frame_idx] for channel in channels[:3]] == list(expected[:3])
+        np.testing.assert_equal(channels[3][frame_idx], np.float32(expected[3]))
+
+
+@pytest.mark.virtual
+def test_decode_wrong_payload_length():
+    decoder = TPDOMapDecoder(TPDOMap.from_pdo_items(_tpdo_item(RegDtype.U32)))
+    with pytest.raises(ValueError, match="The length of the payload is incorrect"):
+        decoder.decode(b"\x00")
+    with pytest.raises(ValueError, match="is not a multiple of the map length"):
+        decoder.decode_frames(b"\x00" * 6)
+
+
+@pytest.mark.virtual
+def test_decoder_unaligned_string_exception():
+    tpdo_map = TPDOMap.from_pdo_items([
+        _tpdo_item(RegDtype.BOOL),
+        _tpdo_item(RegDtype.STR, size_bits=16),
+    ])
+    with pytest.raises(ValueError, match="cannot be decoded if it is not byte aligned"):
+        TPDOMapDecoder(tpdo_map)
@@ -0,0 +1,120 @@
+import struct
+import threading
+
+import pytest
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.pdo import TPDOMap, TPDOMapItem
+
+from ingeniamotion.enums import PDODispatchMode
+from ingeniamotion.process_data.decoder import TPDOMapDecoder
+from ingeniamotion.process_data.dispatch import PDOSubscriber
+
+
+def _tpdo_map() -> TPDOMap:
+    items = []
+    for index, dtype in enumerate([RegDtype.S32, RegDtype.FLOAT]):
+        register = EthercatRegister(
+            idx=0x2000 + index,
+            subidx=0,
+            dtype=dtype,
+            access=RegAccess.RO,
+            identifier=f"REGISTER_{index}",
+            pdo_access=RegCyclicType.TX,
+        )
+        items.append(TPDOMapItem(register))
+    return TPDOMap.from_pdo_items(items)
+
+
+def _create_subscriber(callback, dispatch, max_queued_samples=100):
+    tpdo_map = _tpdo_map()
+    cycle_count = iter(range(1, 1000))
+    subscriber = PDOSubscriber(
+        callback,
+        TPDOMapDecoder(tpdo_map),
+        lambda: next(cycle_count),
+        dispatch=dispatch,
+        max_queued_samples=max_queued_samples,
+    )
+    return subscriber, tpdo_map
+
+
+def _receive(subscriber, tpdo_map, position, velocity):
+    tpdo_map.set_item_bytes(struct.pack("<if", position, velocity))
+    subscriber()
+
+
+@pytest.mark.virtual
+def test_subscriber_arguments_exception():
+    with pytest.raises(ValueError, match="The maximum number of queued samples must be 1"):
+        _create_subscriber(print, PDODispatchMode.THREAD, max_queued_samples=0)
+
+
+@pytest.mark.virtual
+def test_subscriber_inline():
+    samples = []
+    subscriber, tpdo_map = _create_subscriber(samples.append, PDODispatchMode.INLINE)
+    subscriber.start()
+    _receive(subscriber, tpdo_map, 10, 0.5)
+    _receive(subscriber, tpdo_map, 20, 1.5)
+    subscriber.stop()
+    assert [sample.values for sample in samples] == [(10, 0.5), (20, 1.5)]
+    assert [sample.cycle_count for sample in samples] == [1, 2]
+    assert samples[0].timestamp <= samples[1].timestamp
+    assert subscriber.delivered_samples == 2
+
+
+@pytest.mark.virtual
+def test_subscriber_thread():
+    samples = []
+    pdo_thread = threading.current_thread()
+    callback_threads = set()
+
+    def callback(sample):
+        callback_threads.add(threading.current_thread())
+        samples.append(sample)
+
+    subscriber, tpdo_map = _create_subscriber(callback, PDODispatchMode.THREAD)
+    subscriber.start()
+    for position in range(50):
+        _receive(subscriber, tpdo_map, position, position / 2)
+    subscriber.stop()
+    assert [sample.values[0] for sample in samples] == list(range(50))
+    assert pdo_thread not in callback_threads
+    assert subscriber.overflows == 0
+    assert subscriber.queued_samples == 0
+
+
+@pytest.mark.virtual
+def test_subscriber_overflow():
+    release_callback = threading.Event()
+    samples = []
+
+    def slow_callback(sample):
+        release_callback.wait()
+        samples.append(sample)
+
+    subscriber, tpdo_map = _create_subscriber(
+        slow_callback, PDODispatchMode.THREAD, max_queued_samples=3
+    )
+    subscriber.start()
+    _receive(subscriber, tpdo_map, 0, 0)
+    # Wait for the worker to take the first sample
+    while subscriber.queued_samples:
+        pass
+    for position in range(1, 8):
+        _receive(subscriber, tpdo_map, position, 0)
+    assert subscriber.overflows == 4
+    release_callback.set()
+    subscriber.stop()
+    assert [sample.values[0] for sample in samples] == [0, 5, 6, 7]
+
+
+@pytest.mark.virtual
+def test_subscriber_callback_exception():
+    def failing_callback(_):
+        raise RuntimeError
+
+    subscriber, tpdo_map = _create_subscriber(failing_callback, PDODispatchMode.INLINE)
+    _receive(subscriber, tpdo_map, 0, 0)
+    assert subscriber.delivered_samples == 1
@@ -0,0 +1,111 @@
+import time
+
+import numpy as np
+import pytest
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.exceptions import ILError
+from ingenialink.pdo import RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
+
+from ingeniamotion.process_data.decoder import TPDOMapDecoder
+from ingeniamotion.process_data.loopback import PDOLoopbackNetwork, synthetic_tpdo_frames
+
+
+def _register(identifier: str, dtype: RegDtype, rpdo: bool = False) -> EthercatRegister:
+    return EthercatRegister(
+        idx=0x2000,
+        subidx=0,
+        dtype=dtype,
+        access=RegAccess.RW if rpdo else RegAccess.RO,
+        identifier=identifier,
+        pdo_access=RegCyclicType.RX if rpdo else RegCyclicType.TX,
+    )
+
+
+@pytest.fixture
+def pdo_maps():
+    rpdo_map = RPDOMap()
+    rpdo_item = RPDOMapItem(_register("CL_POS_SET_POINT_VALUE", RegDtype.S32, rpdo=True))
+    rpdo_item.value = 0
+    rpdo_map.add_item(rpdo_item)
+    tpdo_map = TPDOMap()
+    tpdo_map.add_item(TPDOMapItem(_register("CL_POS_FBK_VALUE", RegDtype.S32)))
+    tpdo_map.add_item(TPDOMapItem(_register("CL_VEL_FBK_VALUE", RegDtype.FLOAT)))
+    tpdo_map.add_item(TPDOMapItem(_register("IO_IN_VALUE", RegDtype.BOOL)))
+    tpdo_map.add_item(TPDOMapItem(size_bits=7))
+    return rpdo_map, tpdo_map
+
+
+@pytest.mark.virtual
+def test_synthetic_tpdo_frames(pdo_maps):
+    _, tpdo_map = pdo_maps
+    with pytest.raises(ValueError, match="The number of cycles must be 1 or higher."):
+        synthetic_tpdo_frames(tpdo_map, cycles=0)
+    frames = synthetic_tpdo_frames(tpdo_map, cycles=100)
+    assert frames.shape == (100, tpdo_map.data_length_bytes)
+    positions, velocities, inputs = TPDOMapDecoder(tpdo_map).decode_frames(frames.tobytes())
+    assert positions.tolist() == list(range(10)) * 10
+    assert velocities == pytest.approx(2 * np.sin(2 * np.pi * np.arange(100) / 20), abs=1e-6)
+    assert inputs.tolist() == ([False] * 30 + [True] * 30) + [False] * 30 + [True] * 10
+
+
+@pytest.mark.virtual
+def test_loopback_run_cycles(pdo_maps):
+    rpdo_map, tpdo_map = pdo_maps
+    network = PDOLoopbackNetwork(synthetic_cycles=10)
+    network.add_maps(rpdo_map, tpdo_map)
+    decoder = TPDOMapDecoder(tpdo_map)
+    events = []
+    positions = []
+    network.subscribe_to_send_process_data(lambda: events.append("send"))
+    rpdo_map.subscribe_to_process_data_event(lambda: events.append("rpdo"))
+    tpdo_map.subscribe_to_process_data_event(lambda: events.append("tpdo"))
+
+    def receive():
+        events.append("receive")
+        positions.append(decoder.decode_map()[0])
+        rpdo_map.items[0].value = positions[-1]
+
+    network.subscribe_to_receive_process_data(receive)
+    network.run_cycles(12)
+    assert events[:4] == ["send", "rpdo", "tpdo", "receive"]
+    assert network.cycle_count == 12
+    # The synthetic data is repeated after the synthetic cycles
+    assert positions == [*range(10), 0, 1]
+    # The value written on the receive notification is sent on the next cycle
+    assert network.rpdo_data == [(0).to_bytes(4, "little")]
+    network.unsubscribe_to_receive_process_data(receive)
+    network.run_cycles(1)
+    assert len(positions) == 12
+
+
+@pytest.mark.virtual
+def test_loopback_start_stop(pdo_maps):
+    network = PDOLoopbackNetwork(refresh_time=0.001)
+    network.add_maps(*pdo_maps)
+    network.start()
+    assert network.is_active
+    with pytest.raises(ValueError, match="The network is already active."):
+        network.start()
+    with pytest.raises(ValueError, match="The maps can not be modified"):
+        network.clear_maps()
+    time.sleep(0.1)
+    network.stop()
+    assert not network.is_active
+    assert network.cycle_count > 10
+
+
+@pytest.mark.virtual
+def test_loopback_exception():
+    rpdo_map = RPDOMap()
+    rpdo_map.add_item(RPDOMapItem(_register("CL_POS_SET_POINT_VALUE", RegDtype.S32, rpdo=True)))
+    network = PDOLoopbackNetwork()
+    network.add_maps(rpdo_map, [])
+    exceptions = []
+    network.subscribe_to_exceptions(exceptions.append)
+    network.start()
+    time.sleep(0.1)
+    assert not network.is_active
+    [exception] = exceptions
+    assert isinstance(exception, ILError)
+    network.stop()
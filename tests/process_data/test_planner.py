@@ -0,0 +1,81 @@
+import pytest
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.pdo import RPDOMapItem, TPDOMapItem
+
+from ingeniamotion.process_data.planner import PDOMapPlanner
+
+
+def _item(identifier: str, dtype: RegDtype, rpdo: bool = False):
+    register = EthercatRegister(
+        idx=0x2000,
+        subidx=0,
+        dtype=dtype,
+        access=RegAccess.RW if rpdo else RegAccess.RO,
+        identifier=identifier,
+        pdo_access=RegCyclicType.RX if rpdo else RegCyclicType.TX,
+    )
+    if rpdo:
+        item = RPDOMapItem(register)
+        item.value = False if dtype == RegDtype.BOOL else 0
+        return item
+    return TPDOMapItem(register)
+
+
+def _identifiers(pdo_map):
+    return [item.register.identifier for item in pdo_map.items]
+
+
+@pytest.mark.virtual
+def test_planner_arguments_exception():
+    with pytest.raises(ValueError, match="The PDO map limits must be 1 or higher."):
+        PDOMapPlanner(max_items_per_map=0)
+
+
+@pytest.mark.virtual
+def test_planner_aligns_items():
+    items = [
+        _item("BOOL_0", RegDtype.BOOL),
+        _item("U16", RegDtype.U16),
+        _item("S32", RegDtype.S32),
+        _item("BOOL_1", RegDtype.BOOL),
+        _item("U8", RegDtype.U8),
+        _item("FLOAT", RegDtype.FLOAT),
+        _item("SET_POINT", RegDtype.S32, rpdo=True),
+    ]
+    plan = PDOMapPlanner().plan(items)
+    [rpdo_map] = plan.rpdo_maps
+    [tpdo_map] = plan.tpdo_maps
+    assert _identifiers(rpdo_map) == ["SET_POINT"]
+    # Same size items keep their order and the bits are padded to a byte
+    assert _identifiers(tpdo_map) == ["S32", "FLOAT", "U16", "U8", "BOOL_0", "BOOL_1", "PADDING"]
+    assert tpdo_map.items[-1].size_bits == 6
+    assert plan.tpdo_size_bytes == 12
+    assert plan.rpdo_size_bytes == 4
+    assert plan.frame_size_bytes == 16
+
+
+@pytest.mark.virtual
+def test_planner_splits_maps():
+    items = [_item(f"S32_{index}", RegDtype.S32) for index in range(5)]
+    items.append(_item("U16", RegDtype.U16))
+    plan = PDOMapPlanner(max_items_per_map=4).plan(items)
+    assert [_identifiers(tpdo_map) for tpdo_map in plan.tpdo_maps] == [
+        ["S32_0", "S32_1", "S32_2", "S32_3"],
+        ["S32_4", "U16"],
+    ]
+    plan = PDOMapPlanner(max_map_size_bits=64).plan(items[3:])
+    assert [_identifiers(tpdo_map) for tpdo_map in plan.tpdo_maps] == [
+        ["S32_3", "S32_4"],
+        ["U16"],
+    ]
+    assert plan.tpdo_size_bytes == 10
+
+
+@pytest.mark.virtual
+def test_planner_does_not_fit_exception():
+    items = [_item(f"S32_{index}", RegDtype.S32) for index in range(5)]
+    with pytest.raises(ValueError, match="The PDO items do not fit in 2 maps of 2 items."):
+        PDOMapPlanner(max_items_per_map=2).plan(items)
+    with pytest.raises(ValueError, match="The PDO item of S32_0 does not fit in a PDO map."):
+        PDOMapPlanner(max_map_size_bits=16).plan(items)
@@ -0,0 +1,124 @@
+import threading
+
+import numpy as np
+import pytest
+from ingenialink.enums.register import RegAccess, RegCyclicType, RegDtype
+from ingenialink.ethercat.register import EthercatRegister
+from ingenialink.pdo import RPDOMapItem
+
+from ingeniamotion.process_data.setpoints import PDOSetpointStreamer
+
+REGISTERS = {
+    "CL_POS_SET_POINT_VALUE": RegDtype.S32,
+    "CL_VEL_SET_POINT_VALUE": RegDtype.FLOAT,
+    "DRV_OP_CMD": RegDtype.U16,
+    "IO_OUT_VALUE": RegDtype.BOOL,
+}
+
+
+def _create_pdo_item(register_uid, axis, **_):
+    register = EthercatRegister(
+        idx=0x2000 + list(REGISTERS).index(register_uid),
+        subidx=0,
+        dtype=REGISTERS[register_uid],
+        access=RegAccess.RW,
+        identifier=register_uid,
+        pdo_access=RegCyclicType.RX,
+        subnode=axis,
+    )
+    return RPDOMapItem(register)
+
+
+@pytest.fixture
+def streamer(mocker):
+    mc = mocker.MagicMock()
+    mc.capture.pdo.create_pdo_item.side_effect = _create_pdo_item
+    return PDOSetpointStreamer(
+        mc,
+        [
+            {"name": "CL_POS_SET_POINT_VALUE", "axis": 1},
+            {"name": "CL_VEL_SET_POINT_VALUE", "axis": 1},
+            {"name": "DRV_OP_CMD", "axis": 1},
+        ],
+    )
+
+
+def _sent_setpoints(streamer):
+    return [item.value for item in streamer.rpdo_map.items]
+
+
+@pytest.mark.virtual
+def test_setpoint_streamer_unsupported_register(mocker):
+    mc = mocker.MagicMock()
+    mc.capture.pdo.create_pdo_item.side_effect = _create_pdo_item
+    with pytest.raises(ValueError, match="The data type of IO_OUT_VALUE is not supported."):
+        PDOSetpointStreamer(mc, [{"name": "IO_OUT_VALUE", "axis": 1}])
+
+
+@pytest.mark.virtual
+def test_setpoint_streamer_feed_exceptions(streamer):
+    with pytest.raises(ValueError, match="Expected 3 setpoint arrays, got 1."):
+        streamer.feed([np.arange(3)])
+    with pytest.raises(ValueError, match="The setpoint arrays must have the same length"):
+        streamer.feed([np.arange(3), np.arange(3), np.arange(2)])
+
+
+@pytest.mark.virtual
+def test_setpoint_streamer_send(streamer):
+    streamer.feed([np.arange(3), np.arange(3) / 2, np.arange(3) + 10])
+    streamer.feed([np.array([-5]), np.array([0.25]), np.array([20])])
+    assert streamer.pending_samples == 4
+    # Both blocks are held, there is no room for another one
+    assert not streamer.feed([[0], [0], [0]], timeout=0)
+    streamer.start()
+    assert _sent_setpoints(streamer) == [0, 0.0, 10]
+    sent_setpoints = []
+    for _ in range(3):
+        streamer._send_next_setpoints()
+        sent_setpoints.append(_sent_setpoints(streamer))
+    assert sent_setpoints == [[1, 0.5, 11], [2, 1.0, 12], [-5, 0.25, 20]]
+    assert streamer.sent_samples == 4
+    assert streamer.pending_samples == 0
+    assert streamer.underruns == 0
+    assert streamer.last_setpoints["channel_0"][0] == -5
+
+
+@pytest.mark.virtual
+def test_setpoint_streamer_underrun(streamer):
+    underruns = []
+    streamer.subscribe_to_underruns(lambda: underruns.append(streamer.underrun_cycles))
+    streamer.feed([[1], [1.5], [2]])
+    streamer._send_next_setpoints()
+    for _ in range(3):
+        streamer._send_next_setpoints()
+    assert streamer.underruns == 1
+    assert streamer.underrun_cycles == 3
+    assert underruns == [1]
+    # The last setpoints are kept
+    assert _sent_setpoints(streamer) == [1, 1.5, 2]
+    streamer.feed([[3], [3.5], [4]])
+    streamer._send_next_setpoints()
+    streamer._send_next_setpoints()
+    assert streamer.underruns == 2
+    assert _sent_setpoints(streamer) == [3, 3.5, 4]
+
+
+@pytest.mark.virtual
+def test_setpoint_streamer_refill(streamer):
+    n_blocks = 20
+    block_size = 5
+
+    def producer():
+        for block in range(n_blocks):
+            values = np.arange(block * block_size, (block + 1) * block_size)
+            streamer.feed([values, values, values])
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    sent_positions = []
+    while len(sent_positions) < n_blocks * block_size:
+        if streamer.pending_samples:
+            streamer._send_next_setpoints()
+            sent_positions.append(_sent_setpoints(streamer)[0])
+    thread.join()
+    assert sent_positions == list(range(n_blocks * block_size))
@@ -0,0 +1,157 @@
+import json
+
+import numpy as np
+import pytest
+
+from ingeniamotion.process_data.sink import PDOStreamReader, PDOStreamSink
+
+
+def _chunk(start: int, n_samples: int) -> tuple[np.ndarray, list[np.ndarray]]:
+    values = np.arange(start, start + n_samples)
+    return values * 0.001, [values.astype(np.int32), (values / 2).astype(np.float32)]
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "chunk_size, max_queued_chunks, message",
+    [
+        (0, 1, "The chunk size must be 1 or higher."),
+        (1, 0, "The maximum number of queued chunks must be 1 or higher."),
+    ],
+)
+def test_sink_arguments_exception(tmp_path, chunk_size, max_queued_chunks, message):
+    with pytest.raises(ValueError, match=message):
+        PDOStreamSink(tmp_path, chunk_size=chunk_size, max_queued_chunks=max_queued_chunks)
+
+
+@pytest.mark.virtual
+def test_sink_put_not_open_exception(tmp_path):
+    sink = PDOStreamSink(tmp_path)
+    with pytest.raises(ValueError, match="The sink is not open."):
+        sink.put(*_chunk(0, 10))
+
+
+@pytest.mark.virtual
+def test_sink_write_and_read(tmp_path):
+    sink = PDOStreamSink(tmp_path, chunk_size=10)
+    sink.open(["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"], [np.int32, np.float32])
+    assert sink.is_open
+    for start in range(0, 30, 10):
+        assert sink.put(*_chunk(start, 10))
+    sink.put(*_chunk(30, 5), cycle_counts=np.arange(31, 36, dtype=np.uint64))
+    sink.close()
+    assert not sink.is_open
+    assert sink.written_samples == 35
+    assert sink.dropped_samples == 0
+    stats = sink.chunk_stats
+    assert [chunk_stats.index for chunk_stats in stats] == [0, 1, 2, 3]
+    assert [chunk_stats.samples for chunk_stats in stats] == [10, 10, 10, 5]
+    assert all(chunk_stats.latency >= chunk_stats.write_duration >= 0 for chunk_stats in stats)
+    with open(tmp_path / "metadata.json", encoding="utf-8") as file:
+        metadata = json.load(file)
+    assert metadata["chunk_size"] == 10
+
+    reader = PDOStreamReader(tmp_path)
+    assert len(reader) == 4
+    assert reader.samples == 35
+    assert reader.channel_names == ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"]
+    assert reader.channel_dtypes == [np.int32, np.float32]
+    assert isinstance(reader.chunk(0), np.memmap)
+    expected_timestamps, expected_channels = _chunk(0, 35)
+    np.testing.assert_array_equal(reader.timestamps(), expected_timestamps)
+    np.testing.assert_array_equal(reader.cycle_counts(), [0] * 30 + [31, 32, 33, 34, 35])
+    np.testing.assert_array_equal(reader.channel(0), expected_channels[0])
+    np.testing.assert_array_equal(reader.channel("CL_VEL_FBK_VALUE"), expected_channels[1])
+    with pytest.raises(ValueError, match="There is no channel named WRONG_CHANNEL."):
+        reader.channel("WRONG_CHANNEL")
+
+
+@pytest.mark.virtual
+def test_sink_queue_full(tmp_path, mocker):
+    sink = PDOStreamSink(tmp_path, chunk_size=10, max_queued_chunks=1)
+    # Keep the writer thread from consuming the queue
+    mocker.patch.object(sink, "_PDOStreamSink__writer_loop")
+    sink.open(["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"], [np.int32, np.float32])
+    assert sink.put(*_chunk(0, 10))
+    assert not sink.put(*_chunk(10, 10))
+    assert sink.dropped_samples == 10
+    assert sink.queued_chunks == 1
+
+
+@pytest.mark.virtual
+def test_reader_no_metadata_exception(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        PDOStreamReader(tmp_path)
+
+
+@pytest.mark.virtual
+def test_sink_timestamp_dtype(tmp_path):
+    sink = PDOStreamSink(tmp_path, chunk_size=10)
+    sink.open(["CL_POS_FBK_VALUE"], [np.int32], timestamp_dtype=np.int64)
+    sink.put(np.arange(10, dtype=np.int64) * 1000, [np.arange(10, dtype=np.int32)])
+    sink.close()
+    timestamps = PDOStreamReader(tmp_path).timestamps()
+    assert timestamps.dtype == np.int64
+    np.testing.assert_array_equal(timestamps, np.arange(10) * 1000)
+
+
+@pytest.mark.virtual
+def test_sink_metadata(tmp_path):
+    sink = PDOStreamSink(tmp_path, metadata={"sampling_freq": 1000.0})
+    sink.open(["CL_POS_FBK_VALUE"], [np.int32])
+    sink.close()
+    assert PDOStreamReader(tmp_path).metadata == {"sampling_freq": 1000.0}
+
+
+@pytest.mark.virtual
+def test_sink_removes_previous_capture(tmp_path):
+    sink = PDOStreamSink(tmp_path, chunk_size=10)
+    sink.open(["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"], [np.int32, np.float32])
+    for start in range(0, 50, 10):
+        sink.put(*_chunk(start, 10), block=True)
+    sink.close()
+    sink.open(["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"], [np.int32, np.float32])
+    sink.put(*_chunk(100, 10), block=True)
+    sink.put(*_chunk(110, 10), block=True)
+    sink.close()
+    assert sorted(path.name for path in tmp_path.glob("chunk_*.npy")) == [
+        "chunk_000000.npy",
+        "chunk_000001.npy",
+    ]
+    with open(tmp_path / "metadata.json", encoding="utf-8") as file:
+        assert json.load(file)["chunks"] == 2
+    reader = PDOStreamReader(tmp_path)
+    assert len(reader) == 2
+    np.testing.assert_array_equal(reader.channel(0), np.arange(100, 120))
+
+
+@pytest.mark.virtual
+def test_reader_chunk_count(tmp_path):
+    sink = PDOStreamSink(tmp_path, chunk_size=10)
+    sink.open(["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"], [np.int32, np.float32])
+    sink.put(*_chunk(0, 10), block=True)
+    sink.put(*_chunk(10, 10), block=True)
+    sink.close()
+    # A chunk file that is not accounted in the metadata is not read
+    np.save(tmp_path / "chunk_000002.npy", PDOStreamReader(tmp_path).chunk(0))
+    assert PDOStreamReader(tmp_path).samples == 20
+    (tmp_path / "chunk_000001.npy").unlink()
+    with pytest.raises(FileNotFoundError, match="chunk_000001.npy"):
+        PDOStreamReader(tmp_path)
+
+
+@pytest.mark.virtual
+def test_sink_writer_error(tmp_path, mocker):
+    sink = PDOStreamSink(tmp_path, chunk_size=10, max_queued_chunks=1)
+    sink.open(["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"], [np.int32, np.float32])
+    mocker.patch("numpy.save", side_effect=OSError("No space left on device"))
+    assert sink.put(*_chunk(0, 10))
+    # The writer thread keeps emptying the queue, so the blocking puts do not wait forever
+    with pytest.raises(OSError, match="No space left on device"):
+        for start in range(10, 100, 10):
+            sink.put(*_chunk(start, 10), block=True)
+    with pytest.raises(OSError, match="No space left on device"):
+        sink.close()
+    assert not sink.is_open
+    assert sink.written_samples == 0
+    assert sink.dropped_samples > 0
@@ -0,0 +1,123 @@
+import pytest
+
+from ingeniamotion.process_data.stats import PDOCycleStats, PDOHistogram
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "max_value, significant_bits, message",
+    [
+        (0, 7, "The highest trackable value must be 1 or higher."),
+        (100, 0, "The number of significant bits must be 1 or higher."),
+    ],
+)
+def test_histogram_arguments_exception(max_value, significant_bits, message):
+    with pytest.raises(ValueError, match=message):
+        PDOHistogram(max_value=max_value, significant_bits=significant_bits)
+
+
+@pytest.mark.virtual
+def test_histogram_record():
+    histogram = PDOHistogram(significant_bits=7)
+    for value in range(1, 101):
+        histogram.record(value)
+    assert histogram.count == 100
+    assert histogram.min == 1
+    assert histogram.max == 100
+    assert histogram.mean == 50.5
+    # Values lower than 2 ** significant_bits are exact
+    assert histogram.percentile(50) == 50
+    assert histogram.percentile(100) == 100
+    assert histogram.counts.sum() == 100
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize("value", [1_000, 123_456, 1_000_000, 9_876_543_210])
+def test_histogram_relative_error(value):
+    histogram = PDOHistogram(significant_bits=7)
+    histogram.record(value)
+    histogram.record(value * 2)
+    assert abs(histogram.percentile(50) - value) / value < 2**-6
+    bucket_values = histogram.bucket_values
+    lowest_value = bucket_values[histogram.counts.nonzero()[0][0]]
+    assert lowest_value <= value
+    assert (value - lowest_value) / value < 2**-6
+
+
+@pytest.mark.virtual
+def test_histogram_max_value():
+    histogram = PDOHistogram(max_value=1_000)
+    histogram.record(5_000)
+    histogram.record(-1)
+    assert histogram.max == 1_000
+    assert histogram.min == 0
+    with pytest.raises(ValueError, match="The percentile must be between 0 and 100."):
+        histogram.percentile(101)
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.percentile(99) == 0
+
+
+@pytest.mark.virtual
+def test_cycle_stats_period_and_jitter(mocker):
+    cycle_times = [0, 1_000_000, 2_100_000, 3_000_000]
+    mocker.patch("time.perf_counter_ns", side_effect=cycle_times)
+    stats = PDOCycleStats()
+    for _ in cycle_times:
+        stats.record_cycle()
+    assert stats.cycles == 4
+    assert stats.period.count == 3
+    assert stats.period.min == 900_000
+    assert stats.jitter.count == 2
+    assert stats.jitter.max == 200_000
+    # The time between runs is not taken as a period
+    stats.restart()
+    mocker.patch("time.perf_counter_ns", return_value=10_000_000)
+    stats.record_cycle()
+    assert stats.period.count == 3
+
+
+@pytest.mark.virtual
+def test_cycle_stats_timed_callbacks(mocker):
+    stats = PDOCycleStats()
+    calls = []
+
+    def callback():
+        calls.append(1)
+
+    timed_callback = stats.timed_callback(callback)
+    assert stats.timed_callback(callback) is timed_callback
+    assert stats.get_subscribed_callback(callback) is timed_callback
+    assert stats.get_subscribed_callback(callback, receive=True) is callback
+    other_timed_callback = stats.timed_callback(callback, receive=True)
+    assert other_timed_callback is not timed_callback
+    mocker.patch("time.perf_counter_ns", side_effect=[0, 5_000])
+    timed_callback()
+    assert calls == [1]
+    [(name, histogram)] = stats.send_callbacks.items()
+    assert name.endswith("callback")
+    assert histogram.max == 5_000
+    assert stats.summary()[f"send:{name}"]["count"] == 1
+    # Disabled statistics do not record, but the callback is still called
+    stats.enabled = False
+    timed_callback()
+    assert calls == [1, 1]
+    assert histogram.count == 1
+
+
+@pytest.mark.virtual
+def test_cycle_stats_release_callback():
+    stats = PDOCycleStats()
+
+    def callback():
+        pass
+
+    timed_callback = stats.timed_callback(callback, receive=True)
+    assert stats.release_callback(callback, receive=True) is timed_callback
+    assert stats.release_callback(callback, receive=True) is callback
+    assert stats.get_subscribed_callback(callback, receive=True) is callback
+    # A released callback does not add a histogram when it is subscribed again
+    assert stats.timed_callback(callback, receive=True) is not timed_callback
+    assert len(stats.receive_callbacks) == 1
+    stats.timed_callback(lambda: None, receive=True)
+    assert len(stats.receive_callbacks) == 2
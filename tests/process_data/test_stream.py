@@ -0,0 +1,209 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from ingeniamotion.enums import PDOBackpressureMode
+from ingeniamotion.process_data.stream import PDOStream
+
+
+class _FakePoller:
+    """Hand batches to the stream from a thread, as the PDO thread does."""
+
+    def __init__(self, sink, n_batches, flush_size=0):
+        self.sink = sink
+        self.n_batches = n_batches
+        self.flush_size = flush_size
+        self.thread = None
+        self.batches_put = threading.Event()
+
+    def start(self):
+        self.sink.open(["CL_POS_FBK_VALUE"], [np.int32])
+        self.thread = threading.Thread(target=self.__put_batches)
+        self.thread.start()
+
+    def stop(self):
+        self.thread.join()
+        if self.flush_size:
+            # The readings left are flushed when the poller stops
+            values = np.arange(self.flush_size) + self.n_batches * self.sink.chunk_size
+            self.sink.put(values * 0.001, [values.astype(np.int32)], block=True)
+        self.sink.close()
+
+    def __put_batches(self):
+        size = self.sink.chunk_size
+        for index in range(self.n_batches):
+            values = np.arange(index * size, (index + 1) * size)
+            self.sink.put(
+                values * 0.001,
+                [values.astype(np.int32)],
+                cycle_counts=values.astype(np.uint64),
+            )
+        self.batches_put.set()
+
+
+def _create_stream(n_batches, max_queued_batches, backpressure, flush_size=0):
+    return PDOStream(
+        poller_factory=lambda sink: _FakePoller(sink, n_batches, flush_size),
+        batch_size=4,
+        max_queued_batches=max_queued_batches,
+        backpressure=backpressure,
+    )
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "batch_size, max_queued_batches, message",
+    [
+        (0, 1, "The batch size must be 1 or higher."),
+        (1, 0, "The maximum number of queued batches must be 1 or higher."),
+    ],
+)
+def test_stream_arguments_exception(batch_size, max_queued_batches, message):
+    with pytest.raises(ValueError, match=message):
+        PDOStream(
+            poller_factory=lambda sink: _FakePoller(sink, 0),
+            batch_size=batch_size,
+            max_queued_batches=max_queued_batches,
+        )
+
+
+@pytest.mark.virtual
+def test_stream_block():
+    stream = _create_stream(20, 2, PDOBackpressureMode.BLOCK)
+
+    async def consume():
+        batches = []
+        async with stream:
+            async for batch in stream:
+                batches.append(batch)
+                if len(batches) == 20:
+                    break
+        return batches
+
+    batches = asyncio.run(consume())
+    assert stream.dropped_batches == 0
+    np.testing.assert_array_equal(
+        np.concatenate([batch.channels[0] for batch in batches]), np.arange(80)
+    )
+    np.testing.assert_array_equal(
+        np.concatenate([batch.cycle_counts for batch in batches]), np.arange(80)
+    )
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "backpressure, first_value",
+    [(PDOBackpressureMode.DROP_OLDEST, 32), (PDOBackpressureMode.DROP_NEWEST, 0)],
+)
+def test_stream_drop(backpressure, first_value):
+    stream = _create_stream(10, 2, backpressure)
+
+    async def consume():
+        await stream.start()
+        # Let the queue overflow before consuming it
+        await asyncio.get_running_loop().run_in_executor(None, stream.poller.batches_put.wait)
+        await stream.aclose()
+        return [batch async for batch in stream]
+
+    batches = asyncio.run(consume())
+    assert len(batches) == 2
+    assert stream.dropped_batches == 8
+    assert stream.dropped_samples == 32
+    assert batches[0].channels[0][0] == first_value
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "backpressure, max_queued_batches",
+    [(PDOBackpressureMode.DROP_OLDEST, 20), (PDOBackpressureMode.BLOCK, 2)],
+)
+def test_stream_flush_on_close(backpressure, max_queued_batches):
+    stream = _create_stream(10, max_queued_batches, backpressure, flush_size=2)
+
+    async def consume():
+        await stream.start()
+        await asyncio.sleep(0.05)
+        await stream.aclose()
+        return [batch async for batch in stream]
+
+    batches = asyncio.run(consume())
+    # The readings flushed while closing are not lost
+    assert stream.dropped_batches == 0
+    np.testing.assert_array_equal(
+        np.concatenate([batch.channels[0] for batch in batches]), np.arange(42)
+    )
+
+
+@pytest.mark.virtual
+def test_stream_drop_oldest_samples():
+    stream = _create_stream(0, 1, PDOBackpressureMode.DROP_OLDEST)
+    for size in [3, 4, 2]:
+        values = np.arange(size)
+        assert stream.put(values * 0.001, [values.astype(np.int32)])
+    # The readings of the discarded batches are counted, whatever their size
+    assert stream.queued_batches == 1
+    assert stream.dropped_batches == 2
+    assert stream.dropped_samples == 7
+
+
+@pytest.mark.virtual
+def test_stream_start_twice_exception():
+    stream = _create_stream(0, 1, PDOBackpressureMode.DROP_OLDEST)
+
+    async def start_twice():
+        await stream.start()
+        try:
+            await stream.start()
+        finally:
+            await stream.aclose()
+
+    with pytest.raises(ValueError, match="The stream has already been started."):
+        asyncio.run(start_twice())
+
+
+@pytest.mark.virtual
+def test_stream_not_started_exception():
+    stream = _create_stream(1, 1, PDOBackpressureMode.DROP_OLDEST)
+
+    async def iterate():
+        return [batch async for batch in stream]
+
+    with pytest.raises(ValueError, match="The stream has not been started."):
+        asyncio.run(iterate())
+    # The poller is not started
+    assert stream.poller.thread is None
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize("interruption", ["break", "exception", "cancellation"])
+def test_stream_stopped_on_interruption(interruption):
+    stream = _create_stream(100, 2, PDOBackpressureMode.BLOCK)
+
+    async def consume():
+        async with stream:
+            async for _ in stream:
+                if interruption == "break":
+                    break
+                if interruption == "exception":
+                    raise RuntimeError("Consumer error")
+                await asyncio.Event().wait()
+
+    async def run():
+        if interruption != "cancellation":
+            await consume()
+            return
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    if interruption == "exception":
+        with pytest.raises(RuntimeError, match="Consumer error"):
+            asyncio.run(run())
+    else:
+        asyncio.run(run())
+    # The poller blocked by the full queue is stopped
+    assert not stream.poller.thread.is_alive()
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from ingeniamotion.enums import PDOTriggerMode
+from ingeniamotion.process_data.trigger import PDOTrigger
+
+CHANNEL_NAMES = ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"]
+CHANNEL_DTYPES = [np.int32, np.float32]
+
+
+def _open_trigger(**kwargs):
+    trigger = PDOTrigger(**kwargs)
+    trigger.open(CHANNEL_NAMES, CHANNEL_DTYPES)
+    return trigger
+
+
+def _put(trigger, positions, start=0):
+    positions = np.asarray(positions, dtype=np.int32)
+    cycle_counts = np.arange(start, start + len(positions), dtype=np.uint64)
+    trigger.put(cycle_counts * 0.001, [positions, positions / 2], cycle_counts=cycle_counts)
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({}, "Either a trigger channel or an expression must be provided."),
+        (
+            {"channel": 0, "expression": lambda channels: channels[0] > 0},
+            "Either a trigger channel or an expression must be provided.",
+        ),
+        (
+            {"channel": 0, "pre_trigger_samples": -1},
+            "The number of pre-trigger samples must be 0 or higher.",
+        ),
+        ({"channel": 0, "chunk_size": 0}, "The number of post-trigger samples"),
+    ],
+)
+def test_trigger_arguments_exception(kwargs, message):
+    kwargs = {"pre_trigger_samples": 2, "post_trigger_samples": 3, **kwargs}
+    with pytest.raises(ValueError, match=message):
+        PDOTrigger(**kwargs)
+
+
+@pytest.mark.virtual
+def test_trigger_open_exceptions():
+    with pytest.raises(ValueError, match="There is no channel named DRV_OP_CMD."):
+        _open_trigger(pre_trigger_samples=2, post_trigger_samples=3, channel="DRV_OP_CMD")
+    with pytest.raises(ValueError, match="There is no channel with index 2."):
+        _open_trigger(pre_trigger_samples=2, post_trigger_samples=3, channel=2)
+    trigger = PDOTrigger(pre_trigger_samples=2, post_trigger_samples=3, channel=0)
+    with pytest.raises(ValueError, match="The trigger is not open."):
+        _put(trigger, [0])
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "mode, trigger_cycle_count",
+    [
+        (PDOTriggerMode.RISING_EDGE, 4),
+        (PDOTriggerMode.FALLING_EDGE, 7),
+        (PDOTriggerMode.RISING_OR_FALLING_EDGE, 4),
+        (PDOTriggerMode.ABOVE_LEVEL, 4),
+        (PDOTriggerMode.BELOW_LEVEL, 0),
+    ],
+)
+def test_trigger_modes(mode, trigger_cycle_count):
+    trigger = _open_trigger(
+        pre_trigger_samples=2,
+        post_trigger_samples=2,
+        channel="CL_POS_FBK_VALUE",
+        mode=mode,
+        level=10,
+    )
+    positions = [0, 0, 5, 5, 20, 20, 20, 0, 0, 0]
+    # The samples are put one by one, so the edges span several chunks
+    for cycle_count, position in enumerate(positions):
+        _put(trigger, [position], start=cycle_count)
+    [capture] = trigger.pop_captures()
+    assert capture.trigger_cycle_count == trigger_cycle_count
+    assert capture.trigger_timestamp == pytest.approx(trigger_cycle_count * 0.001)
+    first_cycle_count = max(trigger_cycle_count - 2, 0)
+    assert capture.cycle_counts.tolist() == list(range(first_cycle_count, trigger_cycle_count + 2))
+    assert capture.trigger_index == trigger_cycle_count - first_cycle_count
+    assert capture.channels[0].tolist() == positions[first_cycle_count : trigger_cycle_count + 2]
+    assert capture.channels[1].dtype == np.float32
+    assert not trigger.is_armed
+    assert trigger.trigger_count == 1
+
+
+@pytest.mark.virtual
+def test_trigger_expression_auto_rearm():
+    captures = []
+    trigger = _open_trigger(
+        pre_trigger_samples=1,
+        post_trigger_samples=2,
+        expression=lambda channels: (channels[0] > 5) & (channels[1] < 5),
+        auto_rearm=True,
+        max_captures=2,
+    )
+    trigger.subscribe_to_captures(captures.append)
+    _put(trigger, [0, 6, 7, 8, 9, 0, 0, 6, 7, 20, 6], start=0)
+    assert trigger.wait_for_capture(timeout=0)
+    assert [capture.trigger_cycle_count for capture in captures] == [1, 3, 7]
+    assert trigger.trigger_count == 4
+    assert trigger.is_capturing
+    assert trigger.dropped_captures == 1
+    assert [capture.trigger_cycle_count for capture in trigger.pop_captures()] == [3, 7]
+    assert not trigger.wait_for_capture(timeout=0)
+    # The pre-trigger sample of a rearmed capture is the last sample of the previous one
+    assert captures[1].cycle_counts.tolist() == [2, 3, 4]
+
+
+@pytest.mark.virtual
+def test_trigger_force_and_disarm():
+    trigger = _open_trigger(pre_trigger_samples=3, post_trigger_samples=1, channel=0, level=100)
+    trigger.disarm()
+    _put(trigger, [200, 200, 0, 0, 200])
+    assert trigger.trigger_count == 0
+    trigger.force()
+    _put(trigger, [1, 2], start=5)
+    [capture] = trigger.pop_captures()
+    assert capture.cycle_counts.tolist() == [2, 3, 4, 5]
+    assert capture.trigger_index == 3
+    trigger.arm()
+    _put(trigger, [300], start=7)
+    assert trigger.available_captures == 1
+    trigger.close()
+    assert not trigger.is_armed
@@ -11,6 +11,7 @@ from ingeniamotion.enums import (
     OperationMode,
 )
 from ingeniamotion.exceptions import IMMonitoringError, IMStatusWordError
+from ingeniamotion.monitoring.monitoring_group import MonitoringGroup
 
 
 def __compare_signals(expected_signal, received_signal, fft_tol=0.05):
@@ -315,11 +316,24 @@ def test_create_poller_exceptions(mc, alias, name, axis):
 
 @pytest.mark.virtual
 def test_create_empty_monitoring_exception(mocker, mc, alias):
+    mc.capture.clear_monitoring_config_cache(servo=alias)
     mocker.patch.object(mc.capture, "_check_version", return_value=MonitoringVersion.MONITORING_V2)
     with pytest.raises(NotImplementedError):
         mc.capture.create_empty_monitoring(servo=alias)
 
 
+@pytest.mark.virtual
+def test_create_empty_monitoring_reuses_version(mocker, mc, alias):
+    mc.capture.clear_monitoring_config_cache(servo=alias)
+    check_version = mocker.spy(mc.capture, "_check_version")
+    mc.capture.create_empty_monitoring(servo=alias)
+    mc.capture.create_empty_monitoring(servo=alias)
+    assert check_version.call_count == 1
+    mc.capture.clear_monitoring_config_cache(servo=alias)
+    mc.capture.create_empty_monitoring(servo=alias)
+    assert check_version.call_count == 2
+
+
 @pytest.mark.virtual
 def test_check_monitoring_version_v3(mc, alias):
     version = mc.capture._check_version(servo=alias)
@@ -454,3 +468,64 @@ def test_get_frequency_exception(mocker, mc, alias):
     mocker.patch.object(mc.communication, "get_register", return_value="invalid_value")
     with pytest.raises(TypeError):
         mc.capture.get_frequency(servo=alias)
+
+
+@pytest.mark.virtual
+def test_create_monitoring_group_exception(mc):
+    with pytest.raises(ValueError):
+        mc.capture.create_monitoring_group([], [{"name": "CL_POS_FBK_VALUE", "axis": 1}], 10, 0.5)
+
+
+@pytest.mark.virtual
+def test_monitoring_group_polls_network_servos_together(mocker):
+    def poll_data_ready(ready_polls):
+        def polls(timeout):  # noqa: ARG001
+            for _ in range(ready_polls):
+                yield 0.01
+            return time.time()
+
+        return polls
+
+    def read_monitoring_arrays(timeout, progress_callback):  # noqa: ARG001
+        # The readout of a servo takes much longer than its polls
+        time.sleep(0.3)
+        monitoring_data = mocker.Mock(trigger_delay_samples=0, sampling_freq=1000)
+        monitoring_data.__len__ = mocker.Mock(return_value=0)
+        return monitoring_data, time.time()
+
+    monitorings = {}
+    for servo, ready_polls in [("servo_0", 2), ("servo_1", 3)]:
+        monitoring = mocker.Mock()
+        monitoring._poll_data_ready.side_effect = poll_data_ready(ready_polls)
+        monitoring._read_monitoring_arrays.side_effect = read_monitoring_arrays
+        monitorings[servo] = monitoring
+    mc = mocker.Mock(servo_net={"servo_0": "ifname", "servo_1": "ifname"})
+    group_data = MonitoringGroup(mc, monitorings).read_monitoring_data()
+    # The readiness of the second servo is not delayed by the readout of the first one
+    assert group_data.trigger_offsets()["servo_1"] == pytest.approx(0.01, abs=0.05)
+
+
+@pytest.mark.soem_multislave
+def test_create_monitoring_group(mc, alias):
+    registers = [{"name": "CL_POS_FBK_VALUE", "axis": 1}]
+    for a in alias:
+        mc.capture.disable_monitoring_disturbance(servo=a)
+    monitoring_group = mc.capture.create_monitoring_group(
+        alias,
+        registers,
+        prescaler=10,
+        sample_time=0.5,
+        trigger_mode=MonitoringSoCType.TRIGGER_EVENT_FORCED,
+        start=True,
+    )
+    try:
+        assert monitoring_group.raise_forced_trigger(blocking=True, timeout=2)
+        group_data = monitoring_group.read_monitoring_data(timeout=2)
+    finally:
+        monitoring_group.disable()
+    assert list(group_data.data) == alias
+    assert list(group_data.trigger_timestamps) == alias
+    for a in alias:
+        assert len(group_data.data[a]) == monitoring_group.monitorings[a].samples_number
+    trigger_offsets = group_data.trigger_offsets()
+    assert min(trigger_offsets.values()) == 0
@@ -1,6 +1,13 @@
+import math
+
+import numpy as np
 import pytest
+from ingenialink.enums.register import RegDtype
+from ingenialink.exceptions import ILValueError
+from ingenialink.utils._utils import convert_dtype_to_bytes
 
 from ingeniamotion.disturbance import Disturbance
+from ingeniamotion.enums import MonitoringVersion
 from ingeniamotion.exceptions import IMDisturbanceError
 
 
@@ -148,3 +155,267 @@ def test_write_disturbance_data_wrong_data_type(mocker, mc, disturbance):
     mocker.patch.object(disturbance, "sampling_freq", return_value=1000)
     with pytest.raises(TypeError):
         disturbance.write_disturbance_data(["wrong", "input", "value"])
+
+
+@pytest.mark.virtual
+def test_write_disturbance_data_arrays(mocker, mc, alias, disturbance):
+    mocker.patch.object(mc.capture, "is_disturbance_enabled", return_value=False)
+    registers = [
+        {"axis": 1, "name": "CL_POS_SET_POINT_VALUE"},
+        {"axis": 1, "name": "CL_VEL_SET_POINT_VALUE"},
+    ]
+    disturbance.map_registers(registers)
+    mocker.patch.object(disturbance, "sampling_freq", return_value=1000)
+    position = np.arange(-50, 50)
+    velocity = np.linspace(-1, 1, 100)
+    disturbance_write_data = mocker.spy(mc.servos[alias], "disturbance_write_data")
+    disturbance.write_disturbance_data(np.vstack([position, velocity]))
+    disturbance_write_data.assert_called_once()
+    expected_data = b"".join(
+        convert_dtype_to_bytes(int(position_value), RegDtype.S32)
+        + convert_dtype_to_bytes(float(velocity_value), RegDtype.FLOAT)
+        for position_value, velocity_value in zip(position, velocity)
+    )
+    assert mc.servos[alias].disturbance_data == expected_data
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "data",
+    [
+        [np.arange(100)],
+        [np.arange(100), np.arange(50)],
+        [np.arange(100) + 0.5, np.arange(100)],
+        [np.full(100, 2**31), np.arange(100)],
+    ],
+)
+def test_write_disturbance_data_arrays_exception(mocker, mc, disturbance, data):
+    mocker.patch.object(mc.capture, "is_disturbance_enabled", return_value=False)
+    registers = [
+        {"axis": 1, "name": "CL_POS_SET_POINT_VALUE"},
+        {"axis": 1, "name": "CL_VEL_SET_POINT_VALUE"},
+    ]
+    disturbance.map_registers(registers)
+    mocker.patch.object(disturbance, "sampling_freq", return_value=1000)
+    with pytest.raises(IMDisturbanceError):
+        disturbance.write_disturbance_data(data)
+
+
+@pytest.mark.virtual
+def test_write_disturbance_data_arrays_write_exception(mocker, mc, alias, disturbance):
+    mocker.patch.object(mc.capture, "is_disturbance_enabled", return_value=False)
+    disturbance.map_registers([{"axis": 1, "name": "CL_POS_SET_POINT_VALUE"}])
+    mocker.patch.object(disturbance, "sampling_freq", return_value=1000)
+    mocker.patch.object(
+        mc.servos[alias], "disturbance_write_data", side_effect=ILValueError("Wrong data")
+    )
+    with pytest.raises(IMDisturbanceError):
+        disturbance.write_disturbance_data(np.arange(100))
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize("chunk_samples", [0, "max"])
+def test_stream_disturbance_data_chunk_samples_exception(mocker, mc, disturbance, chunk_samples):
+    mocker.patch.object(mc.capture, "is_disturbance_enabled", return_value=False)
+    if disturbance._version < MonitoringVersion.MONITORING_V3:
+        pytest.skip("Disturbance streaming is only available for monitoring V3")
+    disturbance.map_registers([{"axis": 1, "name": "CL_POS_SET_POINT_VALUE"}])
+    mocker.patch.object(disturbance, "sampling_freq", return_value=1000)
+    if chunk_samples == "max":
+        chunk_samples = disturbance.max_sample_number // 4 + 1
+    with pytest.raises(IMDisturbanceError):
+        disturbance.stream_disturbance_data(np.arange(100), chunk_samples=chunk_samples)
+
+
+class FakeStreamClock:
+    """Host clock and stop event of a disturbance stream that only advance when waited on."""
+
+    RELOAD_TIME = 0.01
+
+    def __init__(self):
+        self.now = 0.0
+        self.is_stopped = False
+        self.is_enabled = False
+        self.events = []
+
+    def perf_counter(self):
+        return self.now
+
+    def set(self):
+        self.is_stopped = True
+
+    def clear(self):
+        self.is_stopped = False
+
+    def wait(self, timeout):
+        if not self.is_stopped:
+            self.now += timeout
+        return self.is_stopped
+
+    def record(self, event):
+        self.events.append((event, self.now, self.is_enabled))
+
+    def play_times(self):
+        """Time between each enable of the disturbance and the next disable.
+
+        Returns:
+            The time each chunk played.
+        """
+        times = [(event, now) for event, now, _ in self.events if event in ("enable", "disable")]
+        return [
+            disable_time - enable_time
+            for (event, enable_time), (_, disable_time) in zip(times, times[1:])
+            if event == "enable"
+        ]
+
+
+@pytest.fixture
+def stream_clock(mocker):
+    clock = FakeStreamClock()
+    mocker.patch("ingeniamotion.disturbance.time", clock)
+    mocker.patch("ingeniamotion.disturbance.threading").Event.return_value = clock
+    return clock
+
+
+@pytest.fixture
+def stream_disturbance(mocker, mc, alias, stream_clock, skip_if_monitoring_not_available):  # noqa: ARG001
+    disturbance = Disturbance(mc, alias)
+    if disturbance._version < MonitoringVersion.MONITORING_V3:
+        pytest.skip("Disturbance streaming is only available for monitoring V3")
+
+    def set_enabled(is_enabled):
+        stream_clock.is_enabled = is_enabled
+        stream_clock.record("enable" if is_enabled else "disable")
+
+    def write_data(channels, dtypes, data):  # noqa: ARG001
+        stream_clock.now += stream_clock.RELOAD_TIME
+        stream_clock.record("write")
+
+    mocker.patch.object(
+        mc.capture, "is_disturbance_enabled", side_effect=lambda **_: stream_clock.is_enabled
+    )
+    mocker.patch.object(mc.capture, "enable_disturbance", side_effect=lambda **_: set_enabled(True))
+    mocker.patch.object(
+        mc.capture, "disable_disturbance", side_effect=lambda **_: set_enabled(False)
+    )
+    disturbance.map_registers([{"axis": 1, "name": "CL_POS_SET_POINT_VALUE"}])
+    mocker.patch.object(
+        mc.servos[alias],
+        "disturbance_remove_data",
+        side_effect=lambda: stream_clock.record("remove"),
+    )
+    mocker.patch.object(mc.servos[alias], "disturbance_write_data", side_effect=write_data)
+    # Each chunk of 100 samples plays for 0.1 s
+    disturbance.sampling_freq = 1000
+    return disturbance
+
+
+@pytest.mark.virtual
+def test_stream_disturbance_data_reloads(mc, alias, stream_disturbance, stream_clock):
+    result = stream_disturbance.stream_disturbance_data(np.arange(400), chunk_samples=100)
+    # The disturbance is disabled while each chunk is written
+    assert [event for event, _, _ in stream_clock.events] == [
+        "remove",
+        "write",
+        "enable",
+        *["disable", "remove", "write", "enable"] * 3,
+        "disable",
+    ]
+    assert not any(
+        is_enabled for event, _, is_enabled in stream_clock.events if event in ("remove", "write")
+    )
+    # Each chunk plays for a single pass of the buffer
+    assert stream_clock.play_times() == pytest.approx([0.1] * 4)
+    written_data = mc.servos[alias].disturbance_write_data.call_args_list
+    assert [call.args[2] for call in written_data] == [
+        [list(range(start, start + 100))] for start in range(0, 400, 100)
+    ]
+    assert result.chunks == 4
+    assert result.samples == 400
+    assert result.reload_times == pytest.approx([stream_clock.RELOAD_TIME] * 3)
+    assert not result.stopped
+    assert not stream_clock.is_enabled
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "number_samples, last_play_time",
+    [
+        (350, 0.05),
+        (310, 0.01),
+        (40, 0.04),
+    ],
+)
+def test_stream_disturbance_data_short_last_chunk(
+    stream_disturbance, stream_clock, number_samples, last_play_time
+):
+    result = stream_disturbance.stream_disturbance_data(
+        np.arange(number_samples), chunk_samples=100
+    )
+    # The disturbance is disabled after a single pass of the last chunk, which is shorter
+    number_chunks = math.ceil(number_samples / 100)
+    assert stream_clock.play_times() == pytest.approx(
+        [0.1] * (number_chunks - 1) + [last_play_time]
+    )
+    assert result.chunks == number_chunks
+    assert result.samples == number_samples
+    assert not stream_clock.is_enabled
+
+
+@pytest.mark.virtual
+def test_stream_disturbance_data_keep_last_chunk(stream_disturbance, stream_clock):
+    result = stream_disturbance.stream_disturbance_data(
+        np.arange(300), chunk_samples=100, disable=False
+    )
+    # The drive keeps playing the last chunk
+    assert stream_clock.events[-1][0] == "enable"
+    assert stream_clock.is_enabled
+    assert result.samples == 300
+    assert not result.stopped
+
+
+@pytest.mark.virtual
+def test_stream_disturbance_data_stop(mocker, mc, stream_disturbance, stream_clock):
+    def enable_disturbance(**_):
+        stream_clock.is_enabled = True
+        stream_clock.record("enable")
+        if len(stream_clock.play_times()) == 1:
+            stream_disturbance.stop_streaming()
+
+    mocker.patch.object(mc.capture, "enable_disturbance", side_effect=enable_disturbance)
+    result = stream_disturbance.stream_disturbance_data(
+        np.arange(1000), chunk_samples=100, disable=False
+    )
+    assert result.stopped
+    assert result.chunks == 10
+    assert result.samples == 200
+    # The disturbance is disabled when the stream is stopped
+    assert stream_clock.events[-1][0] == "disable"
+
+
+@pytest.mark.virtual
+def test_stream_disturbance_data_disabled_by_drive(mocker, mc, stream_disturbance, stream_clock):
+    mocker.patch.object(mc.capture, "is_disturbance_enabled", side_effect=[False, True, False])
+    with pytest.raises(IMDisturbanceError, match="disabled while streaming"):
+        stream_disturbance.stream_disturbance_data(np.arange(1000), chunk_samples=100)
+    assert stream_clock.events[-1][0] == "disable"
+    assert len(stream_clock.play_times()) == 2
+
+
+@pytest.mark.ethernet
+@pytest.mark.soem
+@pytest.mark.canopen
+@pytest.mark.usefixtures("disable_monitoring_disturbance")
+@pytest.mark.usefixtures("disturbance_map_registers")
+def test_stream_disturbance_data(mc, alias, disturbance):
+    if disturbance._version < MonitoringVersion.MONITORING_V3:
+        pytest.skip("Disturbance streaming is only available for monitoring V3")
+    disturbance.set_frequency_divider(10)
+    chunk_samples = 500
+    data = np.linspace(-0.1, 0.1, 3 * chunk_samples + 100)
+    result = disturbance.stream_disturbance_data(data, chunk_samples=chunk_samples)
+    assert result.chunks == 4
+    assert result.samples == len(data)
+    assert len(result.reload_times) == 3
+    assert not result.stopped
+    assert not mc.capture.is_disturbance_enabled(servo=alias)
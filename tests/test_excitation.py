@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+from ingenialink.enums.register import RegDtype
+
+from ingeniamotion.exceptions import IMDisturbanceError
+from ingeniamotion.excitation import PRBS_TAPS, ExcitationGenerator, crest_factor
+
+SAMPLING_FREQ = 1000.0
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "sampling_freq, dtype",
+    [(0, RegDtype.FLOAT), (SAMPLING_FREQ, RegDtype.STR), (SAMPLING_FREQ, RegDtype.BOOL)],
+)
+def test_excitation_generator_exception(sampling_freq, dtype):
+    with pytest.raises(ValueError):
+        ExcitationGenerator(sampling_freq, dtype)
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize("logarithmic", [False, True])
+def test_chirp(logarithmic):
+    generator = ExcitationGenerator(SAMPLING_FREQ)
+    signal = generator.chirp(2, 1, 100, amplitude=3, offset=1, logarithmic=logarithmic)
+    assert len(signal) == 2 * SAMPLING_FREQ
+    assert signal.dtype == np.float32
+    assert signal[0] == 1
+    assert np.max(np.abs(signal - 1)) == pytest.approx(3, rel=1e-3)
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize("frequency", [0, SAMPLING_FREQ])
+def test_chirp_frequency_exception(frequency):
+    generator = ExcitationGenerator(SAMPLING_FREQ)
+    with pytest.raises(ValueError):
+        generator.chirp(1, frequency, 10, amplitude=1)
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize("order", list(PRBS_TAPS))
+def test_prbs(order):
+    generator = ExcitationGenerator(SAMPLING_FREQ)
+    signal = generator.prbs(order, amplitude=2)
+    length = 2**order - 1
+    assert len(signal) == length
+    # A maximum length sequence has one more high bit than low bits
+    assert np.count_nonzero(signal == 2) == 2 ** (order - 1)
+    assert np.count_nonzero(signal == -2) == 2 ** (order - 1) - 1
+
+
+@pytest.mark.virtual
+def test_prbs_samples_per_bit_and_periods():
+    generator = ExcitationGenerator(SAMPLING_FREQ, RegDtype.S32)
+    signal = generator.prbs(5, amplitude=100, offset=50, samples_per_bit=3, periods=2)
+    assert signal.dtype == np.int32
+    assert len(signal) == 2 * 3 * 31
+    np.testing.assert_array_equal(signal[: 3 * 31], signal[3 * 31 :])
+    assert set(np.unique(signal)) == {-50, 150}
+
+
+@pytest.mark.virtual
+def test_multisine():
+    generator = ExcitationGenerator(SAMPLING_FREQ)
+    frequencies = np.arange(1, 50) * 2.0
+    schroeder_signal = generator.multisine(
+        frequencies, amplitude=1, period=1, crest_factor_iterations=0
+    )
+    signal = generator.multisine(frequencies, amplitude=1, period=1, periods=2)
+    assert len(signal) == 2 * SAMPLING_FREQ
+    assert np.max(np.abs(signal)) == pytest.approx(1)
+    assert crest_factor(signal) < crest_factor(schroeder_signal)
+    spectrum = np.abs(np.fft.rfft(signal[: int(SAMPLING_FREQ)]))
+    excited_bins = np.flatnonzero(spectrum > 1e-3 * spectrum.max())
+    np.testing.assert_array_equal(excited_bins, frequencies.astype(int))
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize("frequencies", [[], [0.5], [500]])
+def test_multisine_frequencies_exception(frequencies):
+    generator = ExcitationGenerator(SAMPLING_FREQ)
+    with pytest.raises(ValueError):
+        generator.multisine(frequencies, amplitude=1, period=1)
+
+
+@pytest.mark.virtual
+def test_steps():
+    generator = ExcitationGenerator(SAMPLING_FREQ, RegDtype.S16)
+    signal = generator.steps([0, 100.4, -100.6], step_duration=0.01)
+    np.testing.assert_array_equal(signal, np.repeat([0, 100, -101], 10))
+    assert signal.dtype == np.int16
+
+
+@pytest.mark.virtual
+def test_sine_sweep():
+    generator = ExcitationGenerator(SAMPLING_FREQ)
+    signal = generator.sine_sweep([1, 2, 5], amplitude=1, cycles=2)
+    assert len(signal) == 2000 + 1000 + 400
+    np.testing.assert_allclose(signal[[0, 2000, 3000]], 0, atol=1e-6)
+
+
+@pytest.mark.virtual
+def test_buffer_footprint_exception():
+    generator = ExcitationGenerator(SAMPLING_FREQ, RegDtype.S16, max_size=2000)
+    assert generator.max_samples == 1000
+    assert generator.buffer_footprint(1000) == 2000
+    assert len(generator.steps([0], step_duration=1)) == 1000
+    with pytest.raises(IMDisturbanceError):
+        generator.steps([0, 1], step_duration=1)
+    with pytest.raises(IMDisturbanceError):
+        generator.prbs(10, amplitude=1)
+
+
+@pytest.mark.virtual
+def test_quantize_exception():
+    generator = ExcitationGenerator(SAMPLING_FREQ, RegDtype.U8)
+    with pytest.raises(ValueError):
+        generator.quantize([0, 256])
+    with pytest.raises(ValueError):
+        generator.quantize([-1])
+
+
+@pytest.mark.virtual
+def test_from_disturbance_config(mc, alias):
+    register = "CL_POS_SET_POINT_VALUE"
+    divider = 10
+    generator = ExcitationGenerator.from_disturbance_config(mc, register, divider, servo=alias)
+    loop_rate = mc.configuration.get_position_and_velocity_loop_rate(servo=alias)
+    assert generator.sampling_freq == round(loop_rate / divider, 2)
+    assert generator.dtype == mc.info.register_info(register, servo=alias).dtype
+    assert generator.max_samples == mc.capture.disturbance_max_sample_size(alias) // 4
@@ -1,11 +1,17 @@
+import asyncio
 import time
 from functools import partial
 from threading import Thread
 
+import numpy as np
 import pytest
+from ingenialink.enums.register import RegDtype
 
 from ingeniamotion.enums import MonitoringSoCConfig, MonitoringSoCType
 from ingeniamotion.exceptions import IMMonitoringError
+from ingeniamotion.monitoring.monitoring_data import MonitoringData
+from ingeniamotion.monitoring.monitoring_v3 import MonitoringV3
+from ingeniamotion.process_data.sink import PDOStreamSink
 
 MONITOR_START_CONDITION_TYPE_REGISTER = "MON_CFG_SOC_TYPE"
 
@@ -56,6 +62,105 @@ def test_get_trigger_type(mc, alias, monitoring, trigger_type):
     assert test_trigger == trigger_type
 
 
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "min_interval, max_interval",
+    [
+        (-0.001, 0.1),
+        (0.1, 0.001),
+    ],
+)
+def test_configure_readiness_polling_exception(monitoring, min_interval, max_interval):
+    with pytest.raises(ValueError):
+        monitoring.configure_readiness_polling(min_interval, max_interval)
+
+
+@pytest.mark.virtual
+@pytest.mark.parametrize(
+    "samples_number, expected_interval",
+    [
+        (0, 0.1),
+        (10, 0.002),
+        (100, 0.02),
+        (10000, 0.1),
+    ],
+)
+def test_max_poll_interval(monitoring, samples_number, expected_interval):
+    monitoring.configure_readiness_polling(min_interval=0.002, max_interval=0.1)
+    monitoring.sampling_freq = 500.0
+    monitoring.samples_number = samples_number
+    assert monitoring._max_poll_interval() == pytest.approx(expected_interval)
+
+
+@pytest.mark.virtual
+def test_monitoring_config_cache_skips_unchanged_writes(mocker, mc, alias, monitoring):
+    mc.capture.clear_monitoring_config_cache(alias)
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_FORCED)
+    set_register = mocker.spy(mc.communication, "set_register")
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_FORCED)
+    set_register.assert_not_called()
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_AUTO)
+    set_register.assert_called_once()
+
+
+@pytest.mark.virtual
+def test_monitoring_config_cache_follows_register_updates(mocker, mc, alias, monitoring):
+    mc.capture.clear_monitoring_config_cache(alias)
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_FORCED)
+    mc.communication.set_register(
+        MONITOR_START_CONDITION_TYPE_REGISTER,
+        MonitoringSoCType.TRIGGER_EVENT_AUTO,
+        servo=alias,
+        axis=0,
+    )
+    set_register = mocker.spy(mc.communication, "set_register")
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_FORCED)
+    set_register.assert_called_once()
+    assert monitoring.get_trigger_type() == MonitoringSoCType.TRIGGER_EVENT_FORCED
+
+
+@pytest.mark.virtual
+def test_monitoring_config_cache_mapping(mocker, mc, alias, monitoring):
+    registers = [{"axis": 1, "name": "CL_POS_FBK_VALUE"}]
+    mc.capture.clear_monitoring_config_cache(alias)
+    monitoring.map_registers(registers)
+    drive = mc._get_drive(alias)
+    remove_mapped_registers = mocker.spy(drive, "monitoring_remove_all_mapped_registers")
+    monitoring.map_registers([{"axis": 1, "name": "CL_POS_FBK_VALUE"}])
+    remove_mapped_registers.assert_not_called()
+    assert monitoring.mapped_registers[0]["name"] == "CL_POS_FBK_VALUE"
+    mc.capture.clean_monitoring(alias)
+    remove_mapped_registers.reset_mock()
+    monitoring.map_registers([{"axis": 1, "name": "CL_POS_FBK_VALUE"}])
+    remove_mapped_registers.assert_called_once()
+
+
+@pytest.mark.virtual
+def test_monitoring_config_cache_mapping_register_write(mocker, mc, alias, monitoring):
+    registers = [{"axis": 1, "name": "CL_POS_FBK_VALUE"}]
+    mc.capture.clear_monitoring_config_cache(alias)
+    monitoring.map_registers(registers)
+    drive = mc._get_drive(alias)
+    remove_mapped_registers = mocker.spy(drive, "monitoring_remove_all_mapped_registers")
+    # Reading a mapping register does not discard the cached mapping
+    mapping_value = mc.communication.get_register("MON_CFG_REG0_MAP", servo=alias, axis=0)
+    monitoring.map_registers(registers)
+    remove_mapped_registers.assert_not_called()
+    # Writing it with another value does, even if the number of mapped registers is the same
+    mc.communication.set_register("MON_CFG_REG0_MAP", mapping_value + 1, servo=alias, axis=0)
+    monitoring.map_registers(registers)
+    remove_mapped_registers.assert_called_once()
+
+
+@pytest.mark.virtual
+def test_monitoring_version_is_cached(mocker, mc, alias):
+    mc.capture.clear_monitoring_config_cache(alias)
+    check_version = mocker.spy(mc.capture, "_check_version")
+    for _ in range(3):
+        mc.capture.is_frame_available(alias)
+    check_version.assert_called_once()
+
+
 @pytest.mark.ethernet
 @pytest.mark.soem
 @pytest.mark.canopen
@@ -171,6 +276,23 @@ def test_monitoring_map_registers_wrong_cyclic(monitoring):
         monitoring.map_registers(registers)
 
 
+@pytest.mark.virtual
+def test_monitoring_read_frame_samples(mc, alias, monitoring, mocker):
+    monitoring.mapped_registers = [
+        {"axis": 1, "name": "CL_POS_FBK_VALUE", "dtype": RegDtype.S32},
+        {"axis": 1, "name": "CL_CUR_Q_VALUE", "dtype": RegDtype.U16},
+    ]
+    drive = mc.servos[alias]
+    monitoring_read_data = mocker.patch.object(drive, "monitoring_read_data")
+    mocker.patch.object(drive, "monitoring_channel_data", side_effect=[[-1, 2, 3, 7], [4, 5, 6, 8]])
+    samples = monitoring._read_frame_samples(monitoring._frame_dtype(), 3)
+    monitoring_read_data.assert_called_once()
+    assert samples["channel_0"].dtype == np.int32
+    assert samples["channel_1"].dtype == np.uint16
+    assert samples["channel_0"].tolist() == [-1, 2, 3]
+    assert samples["channel_1"].tolist() == [4, 5, 6]
+
+
 @pytest.mark.ethernet
 @pytest.mark.soem
 @pytest.mark.canopen
@@ -378,6 +500,159 @@ def test_rearm_monitoring(mc, alias, monitoring):
         time.sleep(wait // 2)
 
 
+@pytest.mark.ethernet
+@pytest.mark.soem
+@pytest.mark.canopen
+@pytest.mark.usefixtures("mon_set_freq")
+@pytest.mark.usefixtures("mon_map_registers")
+@pytest.mark.usefixtures("disable_monitoring_disturbance")
+def test_read_monitoring_data_as_arrays(mc, alias, monitoring):
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_FORCED)
+    monitoring.configure_sample_time(0.8, 0)
+    mc.capture.enable_monitoring_disturbance(servo=alias)
+    time.sleep(2)
+    assert monitoring.raise_forced_trigger(True, 2)
+    monitoring_data = monitoring.read_monitoring_data_as_arrays()
+    assert len(monitoring_data) == monitoring.samples_number
+    assert monitoring_data.sampling_freq == monitoring.sampling_freq
+    assert monitoring_data.time[monitoring.trigger_delay_samples] == 0
+    assert np.diff(monitoring_data.time) == pytest.approx(1 / monitoring.sampling_freq)
+    channel = monitoring_data.channel("CL_POS_FBK_VALUE")
+    assert channel.dtype == np.int32
+    assert len(channel) == monitoring.samples_number
+
+
+@pytest.mark.ethernet
+@pytest.mark.soem
+@pytest.mark.canopen
+@pytest.mark.usefixtures("mon_set_freq")
+@pytest.mark.usefixtures("mon_map_registers")
+@pytest.mark.usefixtures("disable_monitoring_disturbance")
+def test_read_monitoring_data_to_file(mc, alias, monitoring, tmp_path):
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_FORCED)
+    monitoring.configure_sample_time(0.8, 0)
+    mc.capture.enable_monitoring_disturbance(servo=alias)
+    time.sleep(2)
+    assert monitoring.raise_forced_trigger(True, 2)
+    reader = monitoring.read_monitoring_data_to_file(tmp_path)
+    assert reader.samples == monitoring.samples_number
+    assert reader.channel_names == [register["name"] for register in monitoring.mapped_registers]
+    monitoring_data = MonitoringData.load(tmp_path)
+    assert len(monitoring_data) == monitoring.samples_number
+    assert monitoring_data.sampling_freq == monitoring.sampling_freq
+    assert monitoring_data.trigger_delay_samples == monitoring.trigger_delay_samples
+    assert monitoring_data.units == [
+        mc.info.register_info(register["name"], register["axis"], servo=alias).units
+        for register in monitoring.mapped_registers
+    ]
+    np.testing.assert_array_equal(monitoring_data.time, reader.timestamps())
+
+
+@pytest.mark.ethernet
+@pytest.mark.soem
+@pytest.mark.canopen
+@pytest.mark.usefixtures("mon_set_freq")
+@pytest.mark.usefixtures("mon_map_registers")
+@pytest.mark.usefixtures("disable_monitoring_disturbance")
+def test_read_continuous_frames(mc, alias, monitoring):
+    if not isinstance(monitoring, MonitoringV3):
+        pytest.skip("Continuous acquisition is only available in monitoring V3")
+    n_frames = 3
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_AUTO)
+    monitoring.configure_sample_time(0.1, 0)
+    mc.capture.enable_monitoring_disturbance(servo=alias)
+    frames = list(monitoring.read_continuous_frames(n_frames, timeout=2))
+    assert [frame.sequence_number for frame in frames] == list(range(n_frames))
+    assert frames[0].dead_time == 0
+    for frame in frames:
+        assert frame.dead_time >= 0
+        assert len(frame.data) == monitoring.samples_number
+
+
+@pytest.mark.ethernet
+@pytest.mark.soem
+@pytest.mark.canopen
+@pytest.mark.usefixtures("mon_set_freq")
+@pytest.mark.usefixtures("mon_map_registers")
+@pytest.mark.usefixtures("disable_monitoring_disturbance")
+def test_stop_continuous_acquisition(mc, alias, monitoring):
+    if not isinstance(monitoring, MonitoringV3):
+        pytest.skip("Continuous acquisition is only available in monitoring V3")
+    frames = []
+
+    def callback(frame):
+        frames.append(frame)
+        if frame.sequence_number == 1:
+            monitoring.stop_continuous_acquisition()
+
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_AUTO)
+    monitoring.configure_sample_time(0.1, 0)
+    mc.capture.enable_monitoring_disturbance(servo=alias)
+    assert monitoring.run_continuous_acquisition(callback, timeout=2) == 2
+    assert len(frames) == 2
+
+
+@pytest.mark.ethernet
+@pytest.mark.soem
+@pytest.mark.canopen
+@pytest.mark.usefixtures("mon_set_freq")
+@pytest.mark.usefixtures("mon_map_registers")
+@pytest.mark.usefixtures("disable_monitoring_disturbance")
+@pytest.mark.parametrize("use_register_updates", [False, True])
+def test_read_monitoring_data_readiness_polling(mc, alias, monitoring, use_register_updates):
+    monitoring.configure_readiness_polling(use_register_updates=use_register_updates)
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_AUTO)
+    monitoring.configure_sample_time(0.8, 0)
+    mc.capture.enable_monitoring_disturbance(servo=alias)
+    test_output = monitoring.read_monitoring_data(timeout=2)
+    assert len(test_output[0]) == monitoring.samples_number
+    drive = mc._get_drive(alias)
+    assert drive not in mc.communication.register_update_observers
+
+
+@pytest.mark.ethernet
+@pytest.mark.soem
+@pytest.mark.canopen
+@pytest.mark.usefixtures("mon_set_freq")
+@pytest.mark.usefixtures("mon_map_registers")
+@pytest.mark.usefixtures("disable_monitoring_disturbance")
+def test_read_monitoring_data_async(mc, alias, monitoring):
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_FORCED)
+    monitoring.configure_sample_time(0.8, 0)
+    mc.capture.enable_monitoring_disturbance(servo=alias)
+
+    async def capture():
+        read_task = asyncio.create_task(monitoring.read_monitoring_data_async(timeout=5))
+        trigger_raised = await monitoring.raise_forced_trigger_async(blocking=True, timeout=2)
+        return trigger_raised, await read_task
+
+    trigger_raised, monitoring_data = asyncio.run(capture())
+    assert trigger_raised
+    assert len(monitoring_data) == monitoring.samples_number
+
+
+@pytest.mark.ethernet
+@pytest.mark.soem
+@pytest.mark.canopen
+@pytest.mark.usefixtures("mon_set_freq")
+@pytest.mark.usefixtures("mon_map_registers")
+@pytest.mark.usefixtures("disable_monitoring_disturbance")
+def test_read_monitoring_data_async_cancel(mc, alias, monitoring):
+    monitoring.set_trigger(MonitoringSoCType.TRIGGER_EVENT_FORCED)
+    monitoring.configure_sample_time(0.8, 0)
+    mc.capture.enable_monitoring_disturbance(servo=alias)
+
+    async def cancel_capture():
+        read_task = asyncio.create_task(monitoring.read_monitoring_data_async())
+        await asyncio.sleep(0.5)
+        read_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await read_task
+
+    asyncio.run(cancel_capture())
+    assert monitoring._read_process_finished
+
+
 def run_read_monitoring_data_and_stop(monitoring, timeout):
     # Set the flag to true to check that the read_monitoring_data
     # clears it
@@ -474,3 +749,38 @@ def test_get_trigger_type_exception(mocker, mc, monitoring):
 @pytest.mark.skip("Check INGM-584")
 def test_dummy():
     pass
+
+
+@pytest.mark.virtual
+def test_monitoring_data_save_and_load(tmp_path):
+    monitoring_data = MonitoringData(
+        mapped_registers=[
+            {"name": "CL_POS_FBK_VALUE", "axis": 1, "dtype": RegDtype.S32},
+            {"name": "CL_VEL_FBK_VALUE", "axis": 1, "dtype": RegDtype.FLOAT},
+        ],
+        time=(np.arange(10) - 2) / 1000,
+        channels=[np.arange(10, dtype=np.int32), np.arange(10, dtype=np.float32) / 2],
+        sampling_freq=1000,
+        trigger_delay_samples=2,
+        units=["cnt", "rev/s"],
+    )
+    monitoring_data.save(tmp_path)
+    loaded_data = MonitoringData.load(tmp_path)
+    assert loaded_data.mapped_registers == monitoring_data.mapped_registers
+    assert loaded_data.sampling_freq == monitoring_data.sampling_freq
+    assert loaded_data.trigger_delay_samples == monitoring_data.trigger_delay_samples
+    assert loaded_data.units == monitoring_data.units
+    assert isinstance(loaded_data.channels[0], np.memmap)
+    np.testing.assert_array_equal(loaded_data.time, monitoring_data.time)
+    for loaded_channel, channel in zip(loaded_data.channels, monitoring_data.channels):
+        assert loaded_channel.dtype == channel.dtype
+        np.testing.assert_array_equal(loaded_channel, channel)
+
+
+@pytest.mark.virtual
+def test_monitoring_data_load_exception(tmp_path):
+    sink = PDOStreamSink(tmp_path)
+    sink.open(["CL_POS_FBK_VALUE"], [np.int32])
+    sink.close()
+    with pytest.raises(ValueError, match="There is no monitoring capture"):
+        MonitoringData.load(tmp_path)
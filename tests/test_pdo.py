@@ -1,3 +1,4 @@
+import asyncio
 import random
 import re
 import threading
@@ -5,19 +6,29 @@ import time
 from collections import defaultdict
 from functools import partial
 
+import numpy as np
 import pytest
 from ingenialink.ethercat.network import EthercatNetwork
+from ingenialink.ethercat.servo import EthercatServo
 from ingenialink.exceptions import ILWrongWorkingCountError
 from ingenialink.network import Network
 from ingenialink.pdo import RPDOMap, RPDOMapItem, TPDOMap, TPDOMapItem
 from ingenialink.pdo_network_manager import PDONetworkManager as ILPDONetworkManager
 from packaging import version
 
-from ingeniamotion.enums import CommunicationType, OperationMode
+from ingeniamotion.enums import (
+    CommunicationType,
+    OperationMode,
+    PDODispatchMode,
+    PDOTriggerMode,
+)
 from ingeniamotion.exceptions import IMError
 from ingeniamotion.metaclass import DEFAULT_AXIS
 from ingeniamotion.motion_controller import MotionController
-from ingeniamotion.pdo import PDONetworksTracker
+from ingeniamotion.pdo import PDONetworksTracker, PDOPoller
+from ingeniamotion.process_data.aggregate import PDOWindowAggregator
+from ingeniamotion.process_data.sink import PDOStreamReader, PDOStreamSink
+from ingeniamotion.process_data.trigger import PDOTrigger
 
 
 @pytest.mark.soem
@@ -285,6 +296,44 @@ def test_start_pdos_wrong_network_type_exception(mc: "MotionController", alias:
         mc.capture.pdo.start_pdos(servo=alias)
 
 
+@pytest.mark.virtual
+def test_get_tpdo_value_pdos_not_active(mc: "MotionController", alias: str) -> None:
+    assert mc.capture.pdo.get_tpdo_value("CL_POS_FBK_VALUE", servo=alias) is None
+
+
+@pytest.mark.soem
+def test_get_register_from_tpdo(mc: "MotionController", alias: str, mocker) -> None:
+    rpdo_map = mc.capture.pdo.create_empty_rpdo_map()
+    rpdo_map.add_item(
+        mc.capture.pdo.create_pdo_item("CL_POS_SET_POINT_VALUE", servo=alias, value=0)
+    )
+    tpdo_map = mc.capture.pdo.create_empty_tpdo_map()
+    tpdo_map.add_item(mc.capture.pdo.create_pdo_item("CL_POS_FBK_VALUE", servo=alias))
+    mc.capture.pdo.set_pdo_maps_to_slave(rpdo_map, tpdo_map, servo=alias)
+    mc.capture.pdo.start_pdos(refresh_rate=0.01, servo=alias)
+    time.sleep(0.1)
+    read = mocker.spy(mc.servos[alias], "read")
+    try:
+        # The registers are read from the servo unless a maximum age is set
+        mc.motion.get_actual_position(servo=alias)
+        assert read.call_count == 1
+        read.reset_mock()
+        mc.capture.pdo.set_tpdo_read_max_age(0.1, servo=alias)
+        actual_position = mc.motion.get_actual_position(servo=alias)
+        assert actual_position == tpdo_map.items[0].value
+        read.assert_not_called()
+        # The registers that are not mapped are read from the servo
+        mc.motion.get_actual_velocity(servo=alias)
+        assert read.call_count == 1
+        mc.capture.pdo.set_tpdo_read_max_age(None, servo=alias)
+        mc.motion.get_actual_position(servo=alias)
+        assert read.call_count == 2
+    finally:
+        mc.capture.pdo.set_tpdo_read_max_age(None, servo=alias)
+        mc.capture.pdo.stop_pdos(servo=alias)
+        mc.capture.pdo.clear_pdo_mapping(servo=alias)
+
+
 @pytest.mark.soem
 def test_start_pdos_for_multiple_networks(mocker, mc: "MotionController") -> None:
     mock_net = {"ifname1": EthercatNetwork("ifname1"), "ifname2": EthercatNetwork("ifname2")}
@@ -372,6 +421,451 @@ def test_create_poller(mc: "MotionController", alias: str) -> None:
     assert len(timestamps) == len(channel_0_data)
 
 
+@pytest.mark.soem
+def test_restart_poller_skips_unchanged_mapping(mc: "MotionController", alias: str, mocker) -> None:
+    skip_if_pdo_padding_is_not_available(mc, alias)
+    registers = [{"name": "CL_POS_FBK_VALUE", "axis": 1}, {"name": "CL_VEL_FBK_VALUE", "axis": 1}]
+    drive = mc.servos[alias]
+    set_pdo_map_to_slave = mocker.spy(drive, "set_pdo_map_to_slave")
+    mc.capture.pdo.create_poller(registers=registers, servo=alias, sampling_time=0.1).stop()
+    map_objects = [
+        pdo_map.map_object
+        for pdo_maps in set_pdo_map_to_slave.call_args.kwargs.values()
+        for pdo_map in pdo_maps
+    ]
+    write_complete_access = mocker.spy(drive, "write_complete_access")
+    read_complete_access = mocker.spy(drive, "read_complete_access")
+    poller = mc.capture.pdo.create_poller(registers=registers, servo=alias, sampling_time=0.1)
+    time.sleep(0.35)
+    poller.stop()
+    # The slave already holds the mapping, it is read back but not written again
+    assert not any(call.args[0] in map_objects for call in write_complete_access.call_args_list)
+    assert read_complete_access.call_count == 2
+    _, data = poller.data
+    assert len(data[0]) > 0
+    # The mapping is trusted if the read back is disabled
+    mc.capture.pdo.set_pdo_mapping_read_back(False, servo=alias)
+    read_complete_access.reset_mock()
+    mc.capture.pdo.create_poller(registers=registers, servo=alias, sampling_time=0.1).stop()
+    read_complete_access.assert_not_called()
+    mc.capture.pdo.set_pdo_mapping_read_back(True, servo=alias)
+    write_complete_access.reset_mock()
+    mc.capture.pdo.invalidate_pdo_mapping_cache(alias)
+    mc.capture.pdo.create_poller(registers=registers, servo=alias, sampling_time=0.1).stop()
+    assert write_complete_access.call_count > 0
+
+
+@pytest.mark.virtual
+def test_reuse_pdo_map(mocker) -> None:
+    mc = MotionController()
+    mc.servos["servo"] = mocker.MagicMock(spec=EthercatServo)
+    read_complete_access = mc.servos["servo"].read_complete_access
+
+    def create_tpdo_map(pdo_value: bytes) -> TPDOMap:
+        tpdo_map = mocker.MagicMock(
+            spec=TPDOMap, is_dirty=True, items=[], map_register_index=0x1A00, map_object="MAP"
+        )
+        tpdo_map.to_pdo_value.return_value = pdo_value
+        return tpdo_map
+
+    written_map = create_tpdo_map(b"\x01tpdo")
+    tpdo_map = create_tpdo_map(b"\x01tpdo")
+    assert mc.capture.pdo.reuse_pdo_map(tpdo_map, servo="servo") is tpdo_map
+    mc.capture.pdo.set_pdo_maps_to_slave([], written_map, servo="servo")
+    # The map is written when the PDOs are started
+    written_map.is_dirty = False
+    # A map in use is not reused
+    assert mc.capture.pdo.reuse_pdo_map(tpdo_map, servo="servo") is tpdo_map
+    mc.capture.pdo.remove_tpdo_map(servo="servo", tpdo_map=written_map)
+    # The mapping object is read back by default
+    read_complete_access.return_value = b"\x01tpdo\x00\x00"
+    assert mc.capture.pdo.reuse_pdo_map(tpdo_map, servo="servo") is written_map
+    read_complete_access.assert_called_once_with("MAP", subnode=0)
+    other_map = create_tpdo_map(b"\x01other")
+    assert mc.capture.pdo.reuse_pdo_map(other_map, servo="servo") is other_map
+    rpdo_map = mocker.MagicMock(spec=RPDOMap)
+    rpdo_map.to_pdo_value.return_value = b"\x01tpdo"
+    assert mc.capture.pdo.reuse_pdo_map(rpdo_map, servo="servo") is rpdo_map
+    # A map that the slave does not hold anymore is forgotten
+    read_complete_access.return_value = b"\x00\x00"
+    assert mc.capture.pdo.reuse_pdo_map(tpdo_map, servo="servo") is tpdo_map
+    read_complete_access.reset_mock(return_value=True)
+    assert mc.capture.pdo.reuse_pdo_map(tpdo_map, servo="servo") is tpdo_map
+    read_complete_access.assert_not_called()
+    # The written maps are trusted if the read back is disabled
+    mc.capture.pdo.set_pdo_maps_to_slave([], written_map, servo="servo")
+    mc.capture.pdo.remove_tpdo_map(servo="servo", tpdo_map=written_map)
+    mc.capture.pdo.set_pdo_mapping_read_back(False, servo="servo")
+    assert mc.capture.pdo.reuse_pdo_map(tpdo_map, servo="servo") is written_map
+    read_complete_access.assert_not_called()
+    # A map modified since it was written is not reused
+    written_map.is_dirty = True
+    assert mc.capture.pdo.reuse_pdo_map(tpdo_map, servo="servo") is tpdo_map
+    written_map.is_dirty = False
+    mc.capture.pdo.invalidate_pdo_mapping_cache("servo")
+    assert mc.capture.pdo.reuse_pdo_map(tpdo_map, servo="servo") is tpdo_map
+
+
+@pytest.mark.virtual
+def test_poller_sink_error(mocker) -> None:
+    mc = mocker.MagicMock()
+    mc.capture.pdo.reuse_pdo_map.side_effect = lambda pdo_map, **_: pdo_map
+    mc.capture.pdo.get_cycle_count.return_value = 0
+    sink = mocker.MagicMock(spec=PDOStreamSink, chunk_size=2)
+    sink.put.side_effect = OSError("No space left on device")
+    poller = PDOPoller(mc, "servo", 0.1, None, 10, sink=sink)
+    poller.start()
+    # The error is not raised on the PDO thread, and the readings are kept in the buffer
+    for _ in range(3):
+        poller._new_data_available()
+    sink.put.assert_called_once()
+    assert poller.available_samples == 1
+    with pytest.raises(OSError, match="No space left on device"):
+        poller.stop()
+    sink.close.assert_called_once()
+    mc.capture.pdo.remove_tpdo_map.assert_called_once()
+
+
+@pytest.mark.virtual
+def test_get_tpdo_value_opt_in(mocker) -> None:
+    mc = MotionController()
+    mc.net["ifname1"] = TestsPDONetworksTracker.FakeNetwork("ifname1")
+    mc.servo_net["servo"] = "ifname1"
+    mc.servos["servo"] = mocker.MagicMock(spec=EthercatServo)
+    item = mocker.MagicMock(value=5)
+    item.register.identifier = "CL_POS_FBK_VALUE"
+    item.register.subnode = 1
+    tpdo_map = mocker.MagicMock(spec=TPDOMap, items=[item], map_register_index=0x1A00)
+    mc.capture.pdo.set_pdo_maps_to_slave([], tpdo_map, servo="servo")
+    mc.capture.pdo.start_pdos(servo="servo")
+    try:
+        time.sleep(0.2)
+        # The TPDO values are not served unless a maximum age is set
+        assert mc.capture.pdo.get_tpdo_value("CL_POS_FBK_VALUE", servo="servo") is None
+        mc.capture.pdo.set_tpdo_read_max_age(1, servo="servo")
+        assert mc.capture.pdo.get_tpdo_value("CL_POS_FBK_VALUE", servo="servo") == 5
+        assert mc.capture.pdo.get_tpdo_value("CL_POS_FBK_VALUE", servo="servo", axis=2) is None
+        assert mc.capture.pdo.get_tpdo_value("CL_VEL_FBK_VALUE", servo="servo") is None
+    finally:
+        mc.capture.pdo.stop_pdos(servo="servo")
+
+
+@pytest.mark.soem
+def test_cycle_stats(mc: "MotionController", alias: str) -> None:
+    skip_if_pdo_padding_is_not_available(mc, alias)
+    with pytest.raises(IMError):
+        mc.capture.pdo.get_cycle_stats(alias)
+    mc.capture.pdo.enable_cycle_stats(alias)
+    registers = [{"name": "CL_POS_FBK_VALUE", "axis": 1}]
+    sampling_time = 0.01
+    poller = mc.capture.pdo.create_poller(
+        registers=registers, servo=alias, sampling_time=sampling_time
+    )
+    time.sleep(0.5)
+    poller.stop()
+    cycle_stats = mc.capture.pdo.get_cycle_stats(alias)
+    assert cycle_stats.cycles > 0
+    assert cycle_stats.period.percentile(50) == pytest.approx(sampling_time * 1e9, rel=0.5)
+    [(name, histogram)] = cycle_stats.receive_callbacks.items()
+    assert "PDOPoller" in name
+    assert histogram.count > 0
+    mc.capture.pdo.disable_cycle_stats(alias)
+    with pytest.raises(IMError):
+        mc.capture.pdo.get_cycle_stats(alias)
+
+
+@pytest.mark.virtual
+def test_unsubscribe_after_disabling_cycle_stats() -> None:
+    mc = MotionController()
+    net = TestsPDONetworksTracker.FakeNetwork("ifname1")
+    mc.net["ifname1"] = net
+    mc.servo_net["servo"] = "ifname1"
+    calls = []
+
+    def callback():
+        calls.append(1)
+
+    mc.capture.pdo.enable_cycle_stats("servo")
+    mc.capture.pdo.start_pdos(servo="servo")
+    mc.capture.pdo.subscribe_to_receive_process_data(callback, servo="servo")
+    time.sleep(0.2)
+    mc.capture.pdo.disable_cycle_stats("servo")
+    # The timed callback is unsubscribed even though the statistics are disabled
+    mc.capture.pdo.unsubscribe_to_receive_process_data(callback, servo="servo")
+    time.sleep(0.1)
+    received_calls = len(calls)
+    assert received_calls > 0
+    time.sleep(0.2)
+    assert len(calls) == received_calls
+    mc.capture.pdo.stop_pdos(servo="servo")
+    # Enabling the statistics again keeps the recorded values
+    cycle_stats = mc.capture.pdo.enable_cycle_stats("servo")
+    [histogram] = cycle_stats.receive_callbacks.values()
+    assert histogram.count > 0
+
+
+@pytest.mark.virtual
+def test_cycle_stats_of_process_data_events() -> None:
+    mc = MotionController()
+    mc.net["ifname1"] = TestsPDONetworksTracker.FakeNetwork("ifname1")
+    mc.servo_net["servo"] = "ifname1"
+    rpdo_map = RPDOMap()
+    tpdo_map = TPDOMap()
+    calls = []
+
+    def rpdo_callback():
+        calls.append("rpdo")
+
+    def tpdo_callback():
+        calls.append("tpdo")
+
+    cycle_stats = mc.capture.pdo.enable_cycle_stats("servo")
+    mc.capture.pdo.subscribe_to_process_data_event(rpdo_map, rpdo_callback, servo="servo")
+    mc.capture.pdo.subscribe_to_process_data_event(tpdo_map, tpdo_callback, servo="servo")
+    rpdo_map._notify_process_data_event()
+    tpdo_map._notify_process_data_event()
+    tpdo_map._notify_process_data_event()
+    assert calls == ["rpdo", "tpdo", "tpdo"]
+    [(send_name, send_histogram)] = cycle_stats.send_callbacks.items()
+    assert "rpdo_callback" in send_name
+    assert send_histogram.count == 1
+    [(receive_name, receive_histogram)] = cycle_stats.receive_callbacks.items()
+    assert "tpdo_callback" in receive_name
+    assert receive_histogram.count == 2
+    mc.capture.pdo.unsubscribe_to_process_data_event(tpdo_map, tpdo_callback, servo="servo")
+    tpdo_map._notify_process_data_event()
+    assert receive_histogram.count == 2
+    # The histogram of the released callback is reused
+    mc.capture.pdo.subscribe_to_process_data_event(tpdo_map, tpdo_callback, servo="servo")
+    tpdo_map._notify_process_data_event()
+    assert list(cycle_stats.receive_callbacks.values()) == [receive_histogram]
+    assert receive_histogram.count == 3
+
+
+@pytest.mark.soem
+@pytest.mark.parametrize("dispatch", [PDODispatchMode.INLINE, PDODispatchMode.THREAD])
+def test_subscribe_to_tpdo_values(mc: "MotionController", alias: str, dispatch) -> None:
+    rpdo_map = mc.capture.pdo.create_empty_rpdo_map()
+    rpdo_map.add_item(
+        mc.capture.pdo.create_pdo_item("CL_POS_SET_POINT_VALUE", servo=alias, value=0)
+    )
+    tpdo_map = mc.capture.pdo.create_empty_tpdo_map()
+    tpdo_map.add_item(mc.capture.pdo.create_pdo_item("CL_POS_FBK_VALUE", servo=alias))
+    mc.capture.pdo.set_pdo_maps_to_slave(rpdo_map, tpdo_map, servo=alias)
+    samples = []
+    mc.capture.pdo.start_pdos(refresh_rate=0.01, servo=alias)
+    subscriber = mc.capture.pdo.subscribe_to_tpdo_values(
+        samples.append, tpdo_map, servo=alias, dispatch=dispatch
+    )
+    time.sleep(0.5)
+    mc.capture.pdo.unsubscribe_to_tpdo_values(subscriber, servo=alias)
+    mc.capture.pdo.stop_pdos(servo=alias)
+    mc.capture.pdo.clear_pdo_mapping(servo=alias)
+    assert len(samples) == subscriber.delivered_samples > 0
+    assert subscriber.overflows == 0
+    assert all(isinstance(sample.values[0], int) for sample in samples)
+    cycle_counts = [sample.cycle_count for sample in samples]
+    assert cycle_counts == sorted(cycle_counts)
+
+
+@pytest.mark.soem
+def test_plan_pdo_maps(mc: "MotionController", alias: str) -> None:
+    plan = mc.capture.pdo.plan_pdo_maps(
+        [
+            {"name": "DRV_OP_CMD", "axis": 1},
+            {"name": "CL_POS_SET_POINT_VALUE", "axis": 1},
+            {"name": "DRV_STATE_STATUS", "axis": 1},
+            {"name": "CL_POS_FBK_VALUE", "axis": 1},
+            {"name": "CL_VEL_FBK_VALUE", "axis": 1},
+        ],
+        servo=alias,
+    )
+    [rpdo_map] = plan.rpdo_maps
+    [tpdo_map] = plan.tpdo_maps
+    assert [item.register.identifier for item in rpdo_map.items] == [
+        "CL_POS_SET_POINT_VALUE",
+        "DRV_OP_CMD",
+    ]
+    assert [item.register.identifier for item in tpdo_map.items] == [
+        "CL_POS_FBK_VALUE",
+        "CL_VEL_FBK_VALUE",
+        "DRV_STATE_STATUS",
+    ]
+    assert plan.frame_size_bytes == 16
+    mc.capture.pdo.set_pdo_maps_to_slave(plan.rpdo_maps, plan.tpdo_maps, servo=alias)
+    mc.capture.pdo.start_pdos(servo=alias)
+    time.sleep(0.1)
+    mc.capture.pdo.stop_pdos(servo=alias)
+    mc.capture.pdo.clear_pdo_mapping(servo=alias)
+
+
+@pytest.mark.soem
+def test_create_poller_data_as_arrays(mc: "MotionController", alias: str) -> None:
+    skip_if_pdo_padding_is_not_available(mc, alias)
+    registers = [{"name": "CL_POS_FBK_VALUE", "axis": 1}, {"name": "CL_VEL_FBK_VALUE", "axis": 1}]
+    sampling_time = 0.1
+    buffer_size = 4
+    poller = mc.capture.pdo.create_poller(
+        registers=registers, servo=alias, sampling_time=sampling_time, buffer_size=buffer_size
+    )
+    time.sleep((buffer_size + 2.5) * sampling_time)
+    poller.stop()
+    assert poller.available_samples == buffer_size
+    assert poller.dropped_samples > 0
+    timestamps, data = poller.data_as_arrays()
+    assert poller.available_samples == 0
+    assert timestamps.dtype == np.float64
+    assert data[0].dtype == np.int32
+    assert data[1].dtype == np.float32
+    assert len(timestamps) == len(data[0]) == len(data[1]) == buffer_size
+    assert np.all(np.diff(timestamps) > 0)
+
+
+@pytest.mark.soem
+def test_create_poller_with_sink(mc: "MotionController", alias: str, tmp_path) -> None:
+    skip_if_pdo_padding_is_not_available(mc, alias)
+    registers = [{"name": "CL_POS_FBK_VALUE", "axis": 1}, {"name": "CL_VEL_FBK_VALUE", "axis": 1}]
+    sampling_time = 0.05
+    sink = PDOStreamSink(tmp_path, chunk_size=5)
+    poller = mc.capture.pdo.create_poller(
+        registers=registers, servo=alias, sampling_time=sampling_time, buffer_size=2, sink=sink
+    )
+    time.sleep(12.5 * sampling_time)
+    poller.stop()
+    assert not sink.is_open
+    assert poller.available_samples == 0
+    assert sink.dropped_samples == 0
+    assert [stats.samples for stats in sink.chunk_stats][:2] == [5, 5]
+    reader = PDOStreamReader(tmp_path)
+    assert reader.samples == sink.written_samples
+    assert reader.channel_names == ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"]
+    assert reader.channel(0).dtype == np.int32
+    assert np.all(np.diff(reader.timestamps()) > 0)
+
+
+@pytest.mark.soem
+def test_create_poller_with_aggregator(mc: "MotionController", alias: str) -> None:
+    window_size = 10
+    aggregator = PDOWindowAggregator(window_size=window_size)
+    poller = mc.capture.pdo.create_poller(
+        [{"name": "CL_POS_FBK_VALUE", "axis": 1}, {"name": "CL_VEL_FBK_VALUE", "axis": 1}],
+        alias,
+        sampling_time=0.01,
+        sink=aggregator,
+    )
+    time.sleep(0.5)
+    poller.stop()
+    assert poller.available_samples == 0
+    window_stats = aggregator.pop()
+    assert window_stats.channel_names == ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"]
+    assert len(window_stats) > 0
+    assert all(window_stats.samples[:-1] == window_size)
+    assert 0 < window_stats.samples[-1] <= window_size
+    assert (window_stats.min <= window_stats.mean).all()
+    assert (window_stats.mean <= window_stats.max).all()
+    assert (np.abs(window_stats.mean) <= window_stats.rms + 1e-9).all()
+
+
+@pytest.mark.soem
+def test_create_poller_with_trigger(mc: "MotionController", alias: str) -> None:
+    trigger = PDOTrigger(
+        pre_trigger_samples=5,
+        post_trigger_samples=10,
+        channel="CL_POS_FBK_VALUE",
+        mode=PDOTriggerMode.ABOVE_LEVEL,
+        level=-(2**31),
+        auto_rearm=True,
+    )
+    poller = mc.capture.pdo.create_poller(
+        [{"name": "CL_POS_FBK_VALUE", "axis": 1}, {"name": "CL_VEL_FBK_VALUE", "axis": 1}],
+        alias,
+        sampling_time=0.01,
+        sink=trigger,
+    )
+    assert trigger.wait_for_capture(timeout=5)
+    poller.stop()
+    captures = trigger.pop_captures()
+    assert len(captures) > 0
+    for capture in captures:
+        assert len(capture.timestamps) == capture.trigger_index + 10
+        assert capture.channel_names == ["CL_POS_FBK_VALUE", "CL_VEL_FBK_VALUE"]
+        assert all(np.diff(capture.timestamps) > 0)
+
+
+@pytest.mark.soem
+def test_create_network_poller(mc: "MotionController", alias: str) -> None:
+    skip_if_pdo_padding_is_not_available(mc, alias)
+    registers = [
+        {"name": "CL_POS_FBK_VALUE", "axis": 1, "servo": alias},
+        {"name": "CL_VEL_FBK_VALUE", "axis": 1, "servo": alias},
+    ]
+    sampling_time = 0.1
+    poller = mc.capture.pdo.create_network_poller(
+        registers=registers, sampling_time=sampling_time, buffer_size=10
+    )
+    time.sleep(5.5 * sampling_time)
+    poller.stop()
+    assert poller.servos == [alias]
+    assert not mc.capture.pdo.is_active(servo=alias)
+    timestamps, data = poller.data_as_arrays()
+    assert len(timestamps) == len(data[0]) == len(data[1]) > 0
+    assert data[0].dtype == np.int32
+    assert data[1].dtype == np.float32
+    assert np.all(np.diff(timestamps) > 0)
+
+
+@pytest.mark.soem
+def test_create_poller_monotonic_timestamps(mc: "MotionController", alias: str) -> None:
+    skip_if_pdo_padding_is_not_available(mc, alias)
+    registers = [{"name": "CL_POS_FBK_VALUE", "axis": 1}]
+    sampling_time = 0.1
+    poller = mc.capture.pdo.create_poller(
+        registers=registers,
+        servo=alias,
+        sampling_time=sampling_time,
+        buffer_size=10,
+        monotonic_timestamps=True,
+    )
+    time.sleep(5.5 * sampling_time)
+    assert mc.capture.pdo.get_cycle_count(servo=alias) > 0
+    poller.stop()
+    assert mc.capture.pdo.get_cycle_count(servo=alias) == 0
+    timestamps, cycle_counts, data = poller.data_with_cycle_counts()
+    assert timestamps.dtype == np.int64
+    assert len(timestamps) == len(cycle_counts) == len(data[0]) > 0
+    assert np.all(np.diff(timestamps) > 0)
+    assert np.all(np.diff(cycle_counts) == 1)
+
+
+@pytest.mark.soem
+def test_stream(mc: "MotionController", alias: str) -> None:
+    skip_if_pdo_padding_is_not_available(mc, alias)
+    registers = [{"name": "CL_POS_FBK_VALUE", "axis": 1}, {"name": "CL_VEL_FBK_VALUE", "axis": 1}]
+    batch_size = 3
+    n_batches = 4
+
+    async def consume():
+        batches = []
+        async with mc.capture.pdo.stream(
+            registers, servo=alias, sampling_time=0.05, batch_size=batch_size
+        ) as stream:
+            async for batch in stream:
+                batches.append(batch)
+                if len(batches) == n_batches:
+                    break
+        return batches
+
+    batches = asyncio.run(consume())
+    assert not mc.capture.pdo.is_active(servo=alias)
+    assert len(batches) == n_batches
+    for batch in batches:
+        assert len(batch.timestamps) == len(batch.channels[0]) == batch_size
+        assert batch.channels[0].dtype == np.int32
+        assert batch.channels[1].dtype == np.float32
+    cycle_counts = np.concatenate([batch.cycle_counts for batch in batches])
+    assert np.all(np.diff(cycle_counts) == 1)
+
+
 @pytest.mark.soem
 def test_subscribe_exceptions(mc: "MotionController", alias: str, mocker) -> None:
     error_msg = "Test error"